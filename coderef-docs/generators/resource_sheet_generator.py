@@ -11,8 +11,10 @@ Orchestrates the complete resource sheet generation workflow:
 5. Compose documentation
 """
 
+import asyncio
+import time
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
 
 from resource_sheet.types import GenerationMode, CodeCharacteristics, ResourceSheetMetadata
@@ -43,6 +45,9 @@ from resource_sheet.modules.conditional import (
     hook_side_effects_module,
 )
 
+# Default number of elements analyzed/composed concurrently in generate_batch()
+BATCH_CONCURRENCY = 8
+
 
 def convert_subject_to_filename(subject: str) -> str:
     """
@@ -338,6 +343,28 @@ class ResourceSheetGenerator:
         filename: str,
     ) -> Dict[str, str]:
         """Step 3: Compose and save documentation in all formats."""
+        markdown, schema, jsdoc = self._render_documentation(element_name, modules, analysis, mode)
+
+        # Save all outputs using the proper filename
+        output_paths = self.composer.save_outputs(
+            element_name,
+            markdown,
+            schema,
+            jsdoc,
+            output_path,
+            filename,
+        )
+
+        return output_paths
+
+    def _render_documentation(
+        self,
+        element_name: str,
+        modules: List,
+        analysis: Dict[str, Any],
+        mode: GenerationMode,
+    ) -> Tuple[str, Dict[str, Any], List[str]]:
+        """Compose markdown, schema and JSDoc in memory (no file I/O)."""
         # Extract module-specific data
         extracted_data = self._extract_module_data(modules, analysis["scan_data"])
 
@@ -364,17 +391,147 @@ class ResourceSheetGenerator:
             extracted_data,
         )
 
-        # Save all outputs using the proper filename
-        output_paths = self.composer.save_outputs(
-            element_name,
-            markdown,
-            schema,
-            jsdoc,
-            output_path,
-            filename,
-        )
+        return markdown, schema, jsdoc
 
-        return output_paths
+    def _render_element(
+        self,
+        element_name: str,
+        project_path: str,
+        mode: GenerationMode,
+        auto_analyze: bool,
+        file_index: Dict[str, str] | None,
+    ) -> Dict[str, Any]:
+        """Analyze, select and compose one element of a batch (runs in a worker thread)."""
+        if auto_analyze:
+            analysis = self.analyzer.analyze_element_sync(element_name, project_path, file_index)
+        else:
+            analysis = {
+                "element_name": element_name,
+                "scan_data": {},
+                "characteristics": {},
+                "analysis_method": "manual",
+            }
+
+        modules = self._select_modules(analysis["characteristics"])
+        markdown, schema, jsdoc = self._render_documentation(element_name, modules, analysis, mode)
+
+        return {
+            "element_name": element_name,
+            "filename": convert_subject_to_filename(element_name),
+            "analysis": analysis,
+            "modules": modules,
+            "markdown": markdown,
+            "schema": schema,
+            "jsdoc": jsdoc,
+        }
+
+    async def generate_batch(
+        self,
+        element_names: List[str],
+        project_path: str,
+        mode: GenerationMode = "reverse-engineer",
+        auto_analyze: bool = True,
+        output_path: str | None = None,
+        concurrency: int = BATCH_CONCURRENCY,
+    ) -> Dict[str, Any]:
+        """
+        Generate resource sheets for many elements with shared analysis context.
+
+        The project is walked once (file index); per-element analysis and
+        composition then run concurrently in worker threads, and all outputs
+        are written at the end in a single pass. An element whose output
+        filename was already written by an earlier element of the batch is
+        reported as a failure instead of overwriting it.
+
+        Args:
+            element_names: Elements to document (duplicates are ignored)
+            project_path: Path to project root
+            mode: Generation mode (reverse-engineer, template, refresh)
+            auto_analyze: Analyze source files for characteristics (default: True)
+            output_path: Where to save output (default: coderef/resources-sheets/)
+            concurrency: Max elements composed at once (at least 1)
+
+        Returns:
+            Batch summary with per-element results and failures
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+        started = time.perf_counter()
+
+        if output_path is None:
+            output_path = f"{project_path}/coderef/resources-sheets"
+
+        # Shared context: one directory walk for the whole batch
+        file_index = self.analyzer.build_file_index(project_path) if auto_analyze else None
+
+        unique_names = list(dict.fromkeys(name for name in element_names if name))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def render(name: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(
+                        self._render_element, name, project_path, mode, auto_analyze, file_index
+                    )
+                except Exception as e:
+                    return {"element_name": name, "error": str(e)}
+
+        rendered = await asyncio.gather(*(render(name) for name in unique_names))
+
+        # Bulk write
+        results: List[Dict[str, Any]] = []
+        failures: List[Dict[str, str]] = []
+        written: Dict[str, str] = {}
+        for item in rendered:
+            if "error" in item:
+                failures.append({"element_name": item["element_name"], "error": item["error"]})
+                continue
+            if item["filename"] in written:
+                failures.append({
+                    "element_name": item["element_name"],
+                    "error": f"{item['filename']} is already generated for '{written[item['filename']]}' in this batch",
+                })
+                continue
+            try:
+                outputs = self.composer.save_outputs(
+                    item["element_name"],
+                    item["markdown"],
+                    item["schema"],
+                    item["jsdoc"],
+                    output_path,
+                    item["filename"],
+                )
+            except OSError as e:
+                failures.append({"element_name": item["element_name"], "error": str(e)})
+                continue
+            written[item["filename"]] = item["element_name"]
+
+            modules = item["modules"]
+            results.append({
+                "element_name": item["element_name"],
+                "generated_filename": item["filename"],
+                "selected_modules": [m.id for m in modules],
+                "auto_fill_rate": self._calculate_auto_fill_rate(modules),
+                "characteristics_detected": len([k for k, v in item["analysis"]["characteristics"].items() if v]),
+                "outputs": outputs,
+            })
+
+        return {
+            "project_path": project_path,
+            "output_directory": output_path,
+            "mode": mode,
+            "requested": len(unique_names),
+            "generated": len(results),
+            "failed": len(failures),
+            "results": results,
+            "failures": failures,
+            "duration_seconds": round(time.perf_counter() - started, 3),
+            "generated_at": datetime.now().isoformat(),
+        }
 
     def _extract_module_data(self, modules: List, scan_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract module-specific data from scan results."""
@@ -11,37 +11,69 @@ Date: 2026-01-03
 """
 
 import re
-import json
+import sys
 from dataclasses import dataclass
-from typing import Dict, List, Optional
 from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add parent directory to path for resource_sheet import
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from resource_sheet.module_registry import ElementTypeSpec, load_element_type_index
+
+
+# Gate patterns, compiled once per process
+_HEADER_AGENT = re.compile(r'^Agent:', re.MULTILINE)
+_HEADER_DATE = re.compile(r'^Date:', re.MULTILINE)
+_HEADER_TASK = re.compile(r'^Task:', re.MULTILINE)
+_EXEC_SUMMARY = re.compile(r'## Executive Summary\s+(.*?)(?=\n##|\Z)', re.DOTALL)
+_SENTENCE_SPLIT = re.compile(r'[.!?]+')
+_STATE_TABLE = re.compile(r'\|\s*State\s*\|.*\|')
+_TODO_MARKERS = re.compile(r'(?:TODO|FIXME|PLACEHOLDER|XXX|HACK)', re.IGNORECASE)
+_EMPTY_SECTIONS = re.compile(r'##\s+([^\n]+)\s*\n\s*(?:##|$)')
+_HEDGING = re.compile(
+    r'\bshould probably\b|\bmight want to\b|\bcould consider\b|\bperhaps\b|\bmaybe\b',
+    re.IGNORECASE
+)
+_TABLE_ROWS = re.compile(r'\|.*\|')
+_PLACEHOLDERS = re.compile(r'(?:TODO|FIXME|PLACEHOLDER|XXX|\[.*?\]|\.\.\.|TBD)')
+_SUBSECTIONS = re.compile(r'^#{2,4}\s+', re.MULTILINE)
+
+BASE_SECTIONS = (
+    "Executive Summary",
+    "Audience & Intent",
+    "Architecture Overview",
+    "State Ownership",
+    "Behaviors",
+    "Testing Strategy",
+    "Common Pitfalls"
+)
 
 
-# Load module registry data directly to avoid import conflicts
 def load_module_registry():
-    """Load element type mapping directly from JSON file."""
-    mapping_file = Path(__file__).parent.parent / "resource_sheet" / "mapping" / "element-type-mapping.json"
-    with open(mapping_file, 'r', encoding='utf-8') as f:
-        mapping = json.load(f)
-    return {e["element_type"]: e for e in mapping.get("element_types", [])}
+    """Load element type mapping (shared, mtime-invalidated process-wide cache)."""
+    return load_element_type_index().element_types
 
 
 class SimpleModuleRegistry:
-    """Simplified module registry for validation (avoids import conflicts)."""
+    """Simplified module registry for validation, backed by the shared mapping cache."""
 
     def __init__(self):
-        self.element_types = load_module_registry()
+        self.index = load_element_type_index()
+        self.element_types = self.index.element_types
+
+    def get_spec(self, element_type: str) -> Optional[ElementTypeSpec]:
+        return self.index.get_spec(element_type)
 
     def get_element_info(self, element_type: str) -> Optional[Dict]:
         return self.element_types.get(element_type)
 
     def get_checklist(self, element_type: str) -> List[str]:
-        element_def = self.element_types.get(element_type)
-        return element_def.get("checklist_items", []) if element_def else []
+        spec = self.index.get_spec(element_type)
+        return list(spec.checklist) if spec else []
 
     def get_required_sections(self, element_type: str) -> List[str]:
-        element_def = self.element_types.get(element_type)
-        return element_def.get("required_sections", []) if element_def else []
+        spec = self.index.get_spec(element_type)
+        return list(spec.required_sections) if spec else []
 
 
 @dataclass
@@ -131,9 +163,9 @@ class ValidationPipeline:
         checks_passed = 0
 
         # Check 1: Header metadata
-        has_agent = re.search(r'^Agent:', resource_sheet, re.MULTILINE)
-        has_date = re.search(r'^Date:', resource_sheet, re.MULTILINE)
-        has_task = re.search(r'^Task:', resource_sheet, re.MULTILINE)
+        has_agent = _HEADER_AGENT.search(resource_sheet)
+        has_date = _HEADER_DATE.search(resource_sheet)
+        has_task = _HEADER_TASK.search(resource_sheet)
 
         if has_agent and has_date and has_task:
             checks_passed += 1
@@ -148,10 +180,10 @@ class ValidationPipeline:
             failures.append(f"Missing header metadata: {', '.join(missing)}")
 
         # Check 2: Executive summary (2-4 sentences)
-        exec_summary_match = re.search(r'## Executive Summary\s+(.*?)(?=\n##|\Z)', resource_sheet, re.DOTALL)
+        exec_summary_match = _EXEC_SUMMARY.search(resource_sheet)
         if exec_summary_match:
             summary_text = exec_summary_match.group(1).strip()
-            sentences = re.split(r'[.!?]+', summary_text)
+            sentences = _SENTENCE_SPLIT.split(summary_text)
             sentences = [s.strip() for s in sentences if s.strip()]
             if 2 <= len(sentences) <= 4:
                 checks_passed += 1
@@ -161,16 +193,7 @@ class ValidationPipeline:
             failures.append("Executive summary section missing")
 
         # Check 3: Required base sections (at least 8 of 13 core sections should be present)
-        base_sections = [
-            "Executive Summary",
-            "Audience & Intent",
-            "Architecture Overview",
-            "State Ownership",
-            "Behaviors",
-            "Testing Strategy",
-            "Common Pitfalls"
-        ]
-        sections_found = sum(1 for section in base_sections if f"## {section}" in resource_sheet or f"# {section}" in resource_sheet)
+        sections_found = sum(1 for section in BASE_SECTIONS if f"## {section}" in resource_sheet or f"# {section}" in resource_sheet)
 
         if sections_found >= 5:  # At least 5/7 critical sections
             checks_passed += 1
@@ -179,7 +202,7 @@ class ValidationPipeline:
 
         # Check 4: State ownership table (if mentions "state" in content)
         if "state" in resource_sheet.lower():
-            has_state_table = bool(re.search(r'\|\s*State\s*\|.*\|', resource_sheet))
+            has_state_table = bool(_STATE_TABLE.search(resource_sheet))
             if has_state_table:
                 checks_passed += 1
             else:
@@ -214,32 +237,21 @@ class ValidationPipeline:
         checks_passed = 0
 
         # Check 1: No TODO/FIXME/PLACEHOLDER markers
-        todo_markers = re.findall(r'(?:TODO|FIXME|PLACEHOLDER|XXX|HACK)', resource_sheet, re.IGNORECASE)
+        todo_markers = _TODO_MARKERS.findall(resource_sheet)
         if not todo_markers:
             checks_passed += 1
         else:
             warnings.append(f"Found {len(todo_markers)} TODO/FIXME markers")
 
         # Check 2: Exhaustiveness (check for empty sections)
-        empty_sections = re.findall(r'##\s+([^\n]+)\s*\n\s*(?:##|$)', resource_sheet)
+        empty_sections = _EMPTY_SECTIONS.findall(resource_sheet)
         if len(empty_sections) <= 2:  # Allow up to 2 empty sections
             checks_passed += 1
         else:
             warnings.append(f"{len(empty_sections)} sections appear to be empty")
 
         # Check 3: Voice compliance (check for hedging language)
-        hedging_patterns = [
-            r'\bshould probably\b',
-            r'\bmight want to\b',
-            r'\bcould consider\b',
-            r'\bperhaps\b',
-            r'\bmaybe\b'
-        ]
-        hedging_found = []
-        for pattern in hedging_patterns:
-            matches = re.findall(pattern, resource_sheet, re.IGNORECASE)
-            if matches:
-                hedging_found.extend(matches)
+        hedging_found = _HEDGING.findall(resource_sheet)
 
         if len(hedging_found) <= 2:  # Allow minimal hedging
             checks_passed += 1
@@ -247,7 +259,7 @@ class ValidationPipeline:
             warnings.append(f"Found {len(hedging_found)} instances of hedging language")
 
         # Check 4: Tables used for structured data
-        table_count = len(re.findall(r'\|.*\|', resource_sheet))
+        table_count = len(_TABLE_ROWS.findall(resource_sheet))
         if table_count >= 2:  # At least 2 markdown tables
             checks_passed += 1
         else:
@@ -278,9 +290,9 @@ class ValidationPipeline:
         warnings = []
         checks_passed = 0
 
-        # Get element-specific requirements
-        element_info = self.registry.get_element_info(element_type)
-        if not element_info:
+        # Get element-specific requirements (pre-built per element type)
+        spec = self.registry.get_spec(element_type)
+        if not spec:
             # Element type not found, skip validation
             return GateResult(
                 gate_name="Gate 3: Element-Specific Validation",
@@ -292,29 +304,29 @@ class ValidationPipeline:
                 warnings=[f"Element type '{element_type}' not found in registry, skipping validation"]
             )
 
+        content_lower = resource_sheet.lower()
+
         # Check 1: Focus areas (checklist items) present
-        checklist_items = self.registry.get_checklist(element_type)
-        if checklist_items:
-            items_found = sum(1 for item in checklist_items if any(keyword in resource_sheet.lower() for keyword in item.lower().split()[:3]))
-            coverage = items_found / len(checklist_items)
+        if spec.checklist:
+            items_found = spec.count_checklist_items(content_lower)
+            coverage = items_found / len(spec.checklist)
 
             if coverage >= 0.5:  # At least 50% of focus areas mentioned
                 checks_passed += 1
             else:
-                warnings.append(f"Only {items_found}/{len(checklist_items)} focus areas found")
+                warnings.append(f"Only {items_found}/{len(spec.checklist)} focus areas found")
         else:
             checks_passed += 1  # No checklist defined, pass
 
         # Check 2: Required sections present
-        required_sections = self.registry.get_required_sections(element_type)
-        if required_sections:
-            sections_found = sum(1 for section in required_sections if section.lower() in resource_sheet.lower())
-            coverage = sections_found / len(required_sections)
+        if spec.required_sections:
+            sections_found = spec.count_required_sections(content_lower)
+            coverage = sections_found / len(spec.required_sections)
 
             if coverage >= 0.6:  # At least 60% of required sections
                 checks_passed += 1
             else:
-                failures.append(f"Only {sections_found}/{len(required_sections)} required sections found")
+                failures.append(f"Only {sections_found}/{len(spec.required_sections)} required sections found")
         else:
             checks_passed += 1  # No required sections defined, pass
 
@@ -348,10 +360,10 @@ class ValidationPipeline:
         warnings = []
 
         # Count placeholders
-        placeholder_count = len(re.findall(r'(?:TODO|FIXME|PLACEHOLDER|XXX|\[.*?\]|\.\.\.|TBD)', resource_sheet))
+        placeholder_count = len(_PLACEHOLDERS.findall(resource_sheet))
 
         # Count total sections/subsections (estimate total fields)
-        total_sections = len(re.findall(r'^#{2,4}\s+', resource_sheet, re.MULTILINE))
+        total_sections = len(_SUBSECTIONS.findall(resource_sheet))
 
         # Estimate completion rate (rough heuristic)
         if total_sections > 0:
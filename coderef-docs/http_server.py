@@ -3,6 +3,15 @@ HTTP wrapper for coderef-docs MCP server enabling ChatGPT integration via MCP pr
 
 Simplified version that works without importing server.py (MCP server).
 Provides /health and /mcp endpoints. /tools endpoint disabled until we solve the server.py import issue.
+/sse + /messages implement the MCP SSE transport with streamed progress (see sse_transport.py).
+
+Deployment constraint: open SSE sessions live in this process (SSE_SESSIONS),
+so the server must run as ONE process with threaded workers, e.g.
+    gunicorn http_server:app --worker-class gthread --workers 1 --threads 16 --timeout 0
+With several processes a POST to /messages can land on a worker that does
+not own the session (404); with sync workers each open /sse stream blocks a
+whole worker; and a request timeout would cut long-lived streams. Each open
+stream holds one thread, so --threads bounds concurrent SSE clients.
 """
 
 print("=" * 80)
@@ -15,6 +24,7 @@ import logging
 import os
 import sys
 import importlib.util
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
@@ -97,6 +107,17 @@ except ImportError as e:
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger('http_server')
 
+from sse_transport import (
+    SessionRegistry,
+    SSESession,
+    ProgressReporter,
+    bind_reporter,
+    get_progress_token
+)
+
+# Open SSE sessions: {session_id: SSESession}
+SSE_SESSIONS = SessionRegistry()
+
 print("All imports complete")
 
 # ============================================================================
@@ -574,6 +595,196 @@ def _build_openrpc_spec(tools: list) -> Dict[str, Any]:
     return spec
 
 
+def _dispatch_jsonrpc(data: dict) -> Tuple[Optional[Dict[str, Any]], int]:
+    """
+    Dispatch one parsed JSON-RPC 2.0 message to MCP protocol methods or tools.
+
+    Shared by the /mcp (request/response) and /messages (SSE) transports.
+
+    Returns:
+        Tuple of (response payload or None for notifications, HTTP status)
+    """
+    request_id = data.get('id')
+    method = data.get('method')
+    params = data.get('params', {})
+
+    if not method:
+        return {
+            'jsonrpc': '2.0',
+            'id': request_id,
+            'error': {'code': -32600, 'message': 'Missing method'}
+        }, 200
+
+    # ================================================================
+    # MCP PROTOCOL METHODS (Required by ChatGPT)
+    # ================================================================
+
+    # Handle initialize method
+    if method == 'initialize':
+        logger.info("MCP initialize request received")
+        return {
+            'jsonrpc': '2.0',
+            'id': request_id,
+            'result': {
+                'protocolVersion': '2025-03-26',
+                'capabilities': {
+                    'tools': {'listChanged': True},
+                    'resources': {}
+                },
+                'serverInfo': {
+                    'name': 'coderef-docs',
+                    'version': '2.0.0'
+                },
+                'instructions': 'coderef-docs provides 23 tools for documentation generation, changelog management, standards auditing, implementation planning, and project inventory analysis.'
+            }
+        }, 200
+
+    # Handle notifications/initialized (client ready signal)
+    if method == 'notifications/initialized':
+        logger.info("Client initialized notification received")
+        return None, 204  # No content response for notifications
+
+    # Handle tools/list method
+    if method == 'tools/list':
+        logger.info("MCP tools/list request received")
+        tools_list = _build_mcp_tools_list()
+        return {
+            'jsonrpc': '2.0',
+            'id': request_id,
+            'result': {'tools': tools_list}
+        }, 200
+
+    # Handle search method (required by ChatGPT connector)
+    if method == 'search':
+        logger.info(f"MCP search request: {params}")
+        query = params.get('query', '')
+        search_results = _handle_search(query)
+        return {
+            'jsonrpc': '2.0',
+            'id': request_id,
+            'result': search_results
+        }, 200
+
+    # Handle fetch method (required by ChatGPT connector)
+    if method == 'fetch':
+        logger.info(f"MCP fetch request: {params}")
+        uri = params.get('uri', '')
+        fetch_result = _handle_fetch(uri)
+        return {
+            'jsonrpc': '2.0',
+            'id': request_id,
+            'result': fetch_result
+        }, 200
+
+    # ================================================================
+    # TOOL EXECUTION
+    # ================================================================
+
+    # Handle tools/call method (MCP protocol standard)
+    if method == 'tools/call':
+        tool_name = params.get('name')
+        arguments = params.get('arguments', {})
+
+        if not tool_name:
+            return {
+                'jsonrpc': '2.0',
+                'id': request_id,
+                'error': {'code': -32602, 'message': 'Missing tool name'}
+            }, 200
+
+        # Check if tool exists in unified registry
+        if tool_name not in ALL_TOOL_HANDLERS:
+            return {
+                'jsonrpc': '2.0',
+                'id': request_id,
+                'error': {
+                    'code': -32601,
+                    'message': f'Tool not found: {tool_name}'
+                }
+            }, 200
+
+        # Route tool call to appropriate server
+        try:
+            logger.info(f"Routing tool call: {tool_name} (from {TOOL_REGISTRY.get(tool_name, 'unknown')})")
+            result = _route_tool_call(tool_name, arguments)
+            response_data = _format_tool_response(result)
+
+            return {
+                'jsonrpc': '2.0',
+                'id': request_id,
+                'result': {'content': response_data} if not isinstance(response_data, dict) or 'content' not in response_data else response_data
+            }, 200
+        except Exception as e:
+            logger.error(f"Tool execution error for {tool_name}: {e}")
+            return {
+                'jsonrpc': '2.0',
+                'id': request_id,
+                'error': {
+                    'code': -32603,
+                    'message': f'Tool execution failed: {str(e)}'
+                }
+            }, 200
+
+    # Legacy support: Direct method name as tool (backward compatibility)
+    # Check if method exists in unified tool handlers
+    if method in ALL_TOOL_HANDLERS:
+        try:
+            # Normalize request for MCP Server pattern compatibility
+            normalized = _normalize_mcp_request({'method': method, 'params': params})
+            logger.info(f"Legacy tool call: {method} (from {TOOL_REGISTRY.get(method, 'unknown')})")
+            result = _route_tool_call(method, normalized['arguments'])
+            response_data = _format_tool_response(result)
+
+            return {
+                'jsonrpc': '2.0',
+                'id': request_id,
+                'result': response_data
+            }, 200
+        except Exception as e:
+            logger.error(f"Tool execution error for {method}: {e}")
+            return {
+                'jsonrpc': '2.0',
+                'id': request_id,
+                'error': {
+                    'code': -32603,
+                    'message': f'Tool execution failed: {str(e)}'
+                }
+            }, 200
+
+    # Method not found
+    return {
+        'jsonrpc': '2.0',
+        'id': request_id,
+        'error': {
+            'code': -32601,
+            'message': f'Method not found: {method}'
+        }
+    }, 200
+
+
+def _run_streamed_message(session: SSESession, data: dict) -> None:
+    """Dispatch a JSON-RPC message and push the response onto an SSE session."""
+    reporter = ProgressReporter(session, get_progress_token(data))
+    try:
+        with bind_reporter(reporter):
+            payload, _ = _dispatch_jsonrpc(data)
+    except Exception as e:
+        logger.error(f"SSE message dispatch error: {e}")
+        payload = {
+            'jsonrpc': '2.0',
+            'id': data.get('id'),
+            'error': {
+                'code': -32603,
+                'message': 'Internal error',
+                'data': {'details': str(e)}
+            }
+        }
+
+    # Notifications (no id) get no response
+    if payload is not None and 'id' in data:
+        session.send(payload)
+
+
 # ============================================================================
 # APPLICATION FACTORY
 # ============================================================================
@@ -659,7 +870,8 @@ def create_app() -> Flask:
                 'health': '/health',
                 'openapi': '/openapi.json (OpenAPI 3.0 - ChatGPT compatible)',
                 'tools': '/tools (OpenRPC 1.3.2 - MCP compatible)',
-                'sse': '/sse (Server-Sent Events)',
+                'sse': '/sse (MCP SSE transport - event stream)',
+                'messages': '/messages?session_id=... (MCP SSE transport - JSON-RPC in)',
                 'mcp': '/mcp (JSON-RPC 2.0 invocation)',
                 'api': '/api/{tool_name} (REST - ChatGPT compatible)'
             },
@@ -906,21 +1118,27 @@ def create_app() -> Flask:
     @app.route('/sse', methods=['GET'])
     def sse_endpoint():
         """
-        Server-Sent Events (SSE) endpoint for ChatGPT MCP connector.
+        MCP SSE transport stream.
 
-        ChatGPT expects a text/event-stream response for SSE transport.
-        Returns streaming response with proper SSE headers.
+        Registers a session and streams its events. The first event is
+        `endpoint` (where to POST JSON-RPC messages); after that, responses and
+        `notifications/progress` for that session are flushed as produced.
         """
-        logger.info("SSE endpoint accessed by ChatGPT connector")
+        from flask import Response, stream_with_context
+
+        session = SSE_SESSIONS.create()
+        endpoint_url = f"{request.script_root}/messages?session_id={session.session_id}"
+        logger.info(f"SSE session opened: {session.session_id} ({len(SSE_SESSIONS)} active)")
 
         def generate():
-            # Send initial connection event
-            yield 'event: connected\n'
-            yield 'data: {"status":"ok","transport":"sse"}\n\n'
+            try:
+                yield from session.stream(endpoint_url)
+            finally:
+                SSE_SESSIONS.remove(session.session_id)
+                logger.info(f"SSE session closed: {session.session_id}")
 
-        from flask import Response
         return Response(
-            generate(),
+            stream_with_context(generate()),
             mimetype='text/event-stream',
             headers={
                 'Cache-Control': 'no-cache',
@@ -929,6 +1147,41 @@ def create_app() -> Flask:
             }
         )
 
+    @app.route('/messages', methods=['POST'])
+    def sse_messages_endpoint():
+        """
+        Accept a JSON-RPC message for an open SSE session.
+
+        Returns 202 immediately; the response is delivered on the session's
+        event stream. tools/call runs on a worker thread with a progress
+        reporter bound, so handlers calling report_progress() stream partial
+        output before the final result.
+        """
+        session = SSE_SESSIONS.get(request.args.get('session_id'))
+        if session is None:
+            return jsonify({'error': 'Unknown or expired session_id'}), 404
+
+        data = request.get_json(force=True, silent=True)
+        if not isinstance(data, dict):
+            return jsonify({
+                'jsonrpc': '2.0',
+                'id': None,
+                'error': {'code': -32600, 'message': 'Invalid Request'}
+            }), 400
+
+        if data.get('method') == 'tools/call':
+            worker = threading.Thread(
+                target=_run_streamed_message,
+                args=(session, data),
+                name=f"sse-{session.session_id[:8]}-{data.get('id')}",
+                daemon=True
+            )
+            worker.start()
+        else:
+            _run_streamed_message(session, data)
+
+        return 'Accepted', 202
+
     @app.route('/api/hello', methods=['GET', 'POST'])
     def hello_world():
         """Simple hello world test endpoint for ChatGPT."""
@@ -1010,162 +1263,10 @@ def create_app() -> Flask:
                     'error': {'code': -32600, 'message': 'Invalid Request'}
                 }), 200
 
-            request_id = data.get('id')
-            method = data.get('method')
-            params = data.get('params', {})
-
-            if not method:
-                return jsonify({
-                    'jsonrpc': '2.0',
-                    'id': request_id,
-                    'error': {'code': -32600, 'message': 'Missing method'}
-                }), 200
-
-            # ================================================================
-            # MCP PROTOCOL METHODS (Required by ChatGPT)
-            # ================================================================
-
-            # Handle initialize method
-            if method == 'initialize':
-                logger.info("MCP initialize request received")
-                return jsonify({
-                    'jsonrpc': '2.0',
-                    'id': request_id,
-                    'result': {
-                        'protocolVersion': '2025-03-26',
-                        'capabilities': {
-                            'tools': {'listChanged': True},
-                            'resources': {}
-                        },
-                        'serverInfo': {
-                            'name': 'coderef-docs',
-                            'version': '2.0.0'
-                        },
-                        'instructions': 'coderef-docs provides 23 tools for documentation generation, changelog management, standards auditing, implementation planning, and project inventory analysis.'
-                    }
-                }), 200
-
-            # Handle notifications/initialized (client ready signal)
-            if method == 'notifications/initialized':
-                logger.info("Client initialized notification received")
-                return '', 204  # No content response for notifications
-
-            # Handle tools/list method
-            if method == 'tools/list':
-                logger.info("MCP tools/list request received")
-                tools_list = _build_mcp_tools_list()
-                return jsonify({
-                    'jsonrpc': '2.0',
-                    'id': request_id,
-                    'result': {'tools': tools_list}
-                }), 200
-
-            # Handle search method (required by ChatGPT connector)
-            if method == 'search':
-                logger.info(f"MCP search request: {params}")
-                query = params.get('query', '')
-                search_results = _handle_search(query)
-                return jsonify({
-                    'jsonrpc': '2.0',
-                    'id': request_id,
-                    'result': search_results
-                }), 200
-
-            # Handle fetch method (required by ChatGPT connector)
-            if method == 'fetch':
-                logger.info(f"MCP fetch request: {params}")
-                uri = params.get('uri', '')
-                fetch_result = _handle_fetch(uri)
-                return jsonify({
-                    'jsonrpc': '2.0',
-                    'id': request_id,
-                    'result': fetch_result
-                }), 200
-
-            # ================================================================
-            # TOOL EXECUTION
-            # ================================================================
-
-            # Handle tools/call method (MCP protocol standard)
-            if method == 'tools/call':
-                tool_name = params.get('name')
-                arguments = params.get('arguments', {})
-
-                if not tool_name:
-                    return jsonify({
-                        'jsonrpc': '2.0',
-                        'id': request_id,
-                        'error': {'code': -32602, 'message': 'Missing tool name'}
-                    }), 200
-
-                # Check if tool exists in unified registry
-                if tool_name not in ALL_TOOL_HANDLERS:
-                    return jsonify({
-                        'jsonrpc': '2.0',
-                        'id': request_id,
-                        'error': {
-                            'code': -32601,
-                            'message': f'Tool not found: {tool_name}'
-                        }
-                    }), 200
-
-                # Route tool call to appropriate server
-                try:
-                    logger.info(f"Routing tool call: {tool_name} (from {TOOL_REGISTRY.get(tool_name, 'unknown')})")
-                    result = _route_tool_call(tool_name, arguments)
-                    response_data = _format_tool_response(result)
-
-                    return jsonify({
-                        'jsonrpc': '2.0',
-                        'id': request_id,
-                        'result': {'content': response_data} if not isinstance(response_data, dict) or 'content' not in response_data else response_data
-                    }), 200
-                except Exception as e:
-                    logger.error(f"Tool execution error for {tool_name}: {e}")
-                    return jsonify({
-                        'jsonrpc': '2.0',
-                        'id': request_id,
-                        'error': {
-                            'code': -32603,
-                            'message': f'Tool execution failed: {str(e)}'
-                        }
-                    }), 200
-
-            # Legacy support: Direct method name as tool (backward compatibility)
-            # Check if method exists in unified tool handlers
-            if method in ALL_TOOL_HANDLERS:
-                try:
-                    # Normalize request for MCP Server pattern compatibility
-                    normalized = _normalize_mcp_request({'method': method, 'params': params})
-                    logger.info(f"Legacy tool call: {method} (from {TOOL_REGISTRY.get(method, 'unknown')})")
-                    result = _route_tool_call(method, normalized['arguments'])
-                    response_data = _format_tool_response(result)
-
-                    return jsonify({
-                        'jsonrpc': '2.0',
-                        'id': request_id,
-                        'result': response_data
-                    }), 200
-                except Exception as e:
-                    logger.error(f"Tool execution error for {method}: {e}")
-                    return jsonify({
-                        'jsonrpc': '2.0',
-                        'id': request_id,
-                        'error': {
-                            'code': -32603,
-                            'message': f'Tool execution failed: {str(e)}'
-                        }
-                    }), 200
-
-            # Method not found
-            return jsonify({
-                'jsonrpc': '2.0',
-                'id': request_id,
-                'error': {
-                    'code': -32601,
-                    'message': f'Method not found: {method}'
-                }
-            }), 200
+            payload, status = _dispatch_jsonrpc(data)
+            if payload is None:
+                return '', status
+            return jsonify(payload), status
 
         except Exception as e:
             logger.error(f"MCP endpoint error: {str(e)}")
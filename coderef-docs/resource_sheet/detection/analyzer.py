@@ -7,11 +7,13 @@ High-level analyzer that coordinates between coderef_scan,
 AST parsing, characteristics detection, and graph queries.
 
 Phase 3B integrates coderef query CLI for dependency/consumer/import analysis.
+Graph queries run against a cached, indexed copy of graph.json (GraphIndex).
 """
 
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Union
 import json
+import os
 import subprocess
 import shlex
 
@@ -19,6 +21,106 @@ from ..types import CodeCharacteristics
 from .characteristics import CharacteristicsDetector
 
 
+# Directories skipped when indexing source files for batch generation
+EXCLUDED_DIRS = {".git", "node_modules", "__pycache__", ".venv", "venv", "dist", "build", ".next", "coverage"}
+
+# Extensions that _find_element_file can resolve
+SOURCE_EXTENSIONS = {".ts", ".tsx", ".js", ".jsx", ".py"}
+
+# Loaded-graph cache keyed by graph.json path: {path: (mtime_ns, size, GraphIndex)}
+# Invalidated when graph.json changes on disk (e.g. after coderef_scan).
+_graph_cache: Dict[str, Tuple[int, int, "GraphIndex"]] = {}
+
+# relationship_type -> (edge direction, required edge type or None for any)
+_RELATIONSHIPS: Dict[str, Tuple[str, Optional[str]]] = {
+    "depends-on": ("outgoing", None),
+    "depends-on-me": ("incoming", None),
+    "imports": ("outgoing", "imports"),
+    "calls-me": ("incoming", "calls"),
+}
+
+
+class GraphIndex:
+    """
+    Indexed view over a loaded dependency graph.
+
+    Builds id->node and source/target adjacency maps once, so relationship
+    queries are O(degree) instead of O(edges x nodes).
+    """
+
+    def __init__(self, graph: Dict[str, Any]):
+        self.nodes: List[Dict[str, Any]] = graph.get("nodes", []) or []
+        self.edges: List[Dict[str, Any]] = graph.get("edges", []) or []
+        self.nodes_by_id: Dict[Any, Dict[str, Any]] = {}
+        self.outgoing: Dict[Any, List[Dict[str, Any]]] = {}
+        self.incoming: Dict[Any, List[Dict[str, Any]]] = {}
+        self._name_lookup: Dict[str, Optional[Dict[str, Any]]] = {}
+
+        for node in self.nodes:
+            self.nodes_by_id.setdefault(node.get("id"), node)
+
+        for edge in self.edges:
+            self.outgoing.setdefault(edge.get("source"), []).append(edge)
+            self.incoming.setdefault(edge.get("target"), []).append(edge)
+
+    def find_node(self, element_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the first node whose name contains element_name (memoized).
+
+        Matches the original substring semantics, but scans nodes at most
+        once per distinct element name.
+        """
+        if element_name not in self._name_lookup:
+            self._name_lookup[element_name] = next(
+                (node for node in self.nodes if element_name in node.get("name", "")),
+                None,
+            )
+        return self._name_lookup[element_name]
+
+    def related(self, element_name: str, relationship_type: str) -> List[Dict[str, Any]]:
+        """
+        Return related node summaries for an element.
+
+        Args:
+            element_name: Element name to query
+            relationship_type: Key of _RELATIONSHIPS (depends-on, depends-on-me, imports, calls-me)
+
+        Returns:
+            List of {name, file, type} dicts, one per matching edge
+        """
+        if relationship_type not in _RELATIONSHIPS:
+            return []
+
+        target_node = self.find_node(element_name)
+        if not target_node:
+            return []
+
+        direction, edge_type = _RELATIONSHIPS[relationship_type]
+        target_id = target_node.get("id")
+        if direction == "outgoing":
+            edges, other_end = self.outgoing.get(target_id, []), "target"
+        else:
+            edges, other_end = self.incoming.get(target_id, []), "source"
+
+        results = []
+        for edge in edges:
+            if edge_type is not None and edge.get("type", "") != edge_type:
+                continue
+            node = self.nodes_by_id.get(edge.get(other_end))
+            if node is not None:
+                results.append({
+                    "name": node.get("name", ""),
+                    "file": node.get("file", ""),
+                    "type": node.get("type", "")
+                })
+        return results
+
+
+def _clear_graph_cache() -> None:
+    """Clear the loaded-graph cache (useful for testing)."""
+    _graph_cache.clear()
+
+
 class CodeAnalyzer:
     """
     Orchestrates code analysis for resource sheet generation.
@@ -30,29 +132,55 @@ class CodeAnalyzer:
     def __init__(self):
         self.detector = CharacteristicsDetector()
 
-    async def _load_dependency_graph(self, project_path: str) -> Optional[Dict[str, Any]]:
+    async def _load_graph_index(self, project_path: str) -> Optional[GraphIndex]:
         """
-        Load dependency graph from .coderef/exports/graph.json.
+        Load the indexed dependency graph for a project, reusing the cached copy.
+
+        The cache entry is reused while graph.json's mtime and size are unchanged.
 
         Args:
             project_path: Project root path
 
         Returns:
-            Graph data or None if unavailable
+            GraphIndex or None if unavailable
         """
         try:
             graph_path = Path(project_path) / ".coderef" / "exports" / "graph.json"
-            if graph_path.exists():
-                with open(graph_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            return None
+            if not graph_path.exists():
+                return None
+
+            stat = graph_path.stat()
+            cache_key = str(graph_path.resolve())
+            cached = _graph_cache.get(cache_key)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                return cached[2]
+
+            with open(graph_path, "r", encoding="utf-8") as f:
+                index = GraphIndex(json.load(f))
+            _graph_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, index)
+            return index
         except Exception as e:
             print(f"Warning: Failed to load dependency graph: {e}")
             return None
 
+    async def _load_dependency_graph(self, project_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Load dependency graph from .coderef/exports/graph.json.
+
+        Args:
+            project_path: Project root path
+
+        Returns:
+            Graph data or None if unavailable
+        """
+        index = await self._load_graph_index(project_path)
+        if index is None:
+            return None
+        return {"nodes": index.nodes, "edges": index.edges}
+
     async def _query_graph_relationships(
         self,
-        graph: Dict[str, Any],
+        graph: Union[GraphIndex, Dict[str, Any], None],
         target_element: str,
         relationship_type: str
     ) -> List[Dict[str, Any]]:
@@ -60,7 +188,7 @@ class CodeAnalyzer:
         Query relationships from dependency graph.
 
         Args:
-            graph: Loaded graph data
+            graph: GraphIndex, or raw graph data (indexed on the fly)
             target_element: Element name to query
             relationship_type: Type of relationship (depends-on, imports, etc.)
 
@@ -69,50 +197,9 @@ class CodeAnalyzer:
         """
         if not graph:
             return []
-
-        nodes = graph.get("nodes", [])
-        edges = graph.get("edges", [])
-
-        # Find target node
-        target_node = None
-        for node in nodes:
-            if target_element in node.get("name", ""):
-                target_node = node
-                break
-
-        if not target_node:
-            return []
-
-        target_id = target_node.get("id")
-        results = []
-
-        # Query edges based on relationship type
-        for edge in edges:
-            source = edge.get("source")
-            target = edge.get("target")
-            edge_type = edge.get("type", "")
-
-            if relationship_type == "depends-on" and source == target_id:
-                # Find target node details
-                for node in nodes:
-                    if node.get("id") == target:
-                        results.append({
-                            "name": node.get("name", ""),
-                            "file": node.get("file", ""),
-                            "type": node.get("type", "")
-                        })
-
-            elif relationship_type == "depends-on-me" and target == target_id:
-                # Find source node details
-                for node in nodes:
-                    if node.get("id") == source:
-                        results.append({
-                            "name": node.get("name", ""),
-                            "file": node.get("file", ""),
-                            "type": node.get("type", "")
-                        })
-
-        return results
+        if not isinstance(graph, GraphIndex):
+            graph = GraphIndex(graph)
+        return graph.related(target_element, relationship_type)
 
     async def query_dependencies(self, element_name: str, project_path: str) -> List[Dict[str, Any]]:
         """
@@ -127,7 +214,7 @@ class CodeAnalyzer:
         Returns:
             List of dependencies (elements this code depends on/imports/calls)
         """
-        graph = await self._load_dependency_graph(project_path)
+        graph = await self._load_graph_index(project_path)
         if graph:
             return await self._query_graph_relationships(graph, element_name, "depends-on")
         return []
@@ -145,7 +232,7 @@ class CodeAnalyzer:
         Returns:
             List of consumers (elements that use/import/call this code)
         """
-        graph = await self._load_dependency_graph(project_path)
+        graph = await self._load_graph_index(project_path)
         if graph:
             return await self._query_graph_relationships(graph, element_name, "depends-on-me")
         return []
@@ -163,7 +250,7 @@ class CodeAnalyzer:
         Returns:
             List of imported modules/symbols
         """
-        graph = await self._load_dependency_graph(project_path)
+        graph = await self._load_graph_index(project_path)
         if graph:
             return await self._query_graph_relationships(graph, element_name, "imports")
         return []
@@ -181,7 +268,7 @@ class CodeAnalyzer:
         Returns:
             List of callers (functions/methods that invoke this code)
         """
-        graph = await self._load_dependency_graph(project_path)
+        graph = await self._load_graph_index(project_path)
         if graph:
             return await self._query_graph_relationships(graph, element_name, "calls-me")
         return []
@@ -191,6 +278,7 @@ class CodeAnalyzer:
         element_name: str,
         project_path: str,
         use_coderef_scan: bool = False,
+        file_index: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """
         Analyze a code element to extract structure and characteristics.
@@ -199,23 +287,41 @@ class CodeAnalyzer:
             element_name: Name of element to analyze (e.g., "AuthService")
             project_path: Path to project root
             use_coderef_scan: DEPRECATED - always False
+            file_index: Optional filename -> path index from build_file_index()
+
+        Returns:
+            Analysis result with scan_data, characteristics, and metadata
+        """
+        return self.analyze_element_sync(element_name, project_path, file_index)
+
+    def analyze_element_sync(
+        self,
+        element_name: str,
+        project_path: str,
+        file_index: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Synchronous core of analyze_element (safe to run in a worker thread).
+
+        Args:
+            element_name: Name of element to analyze
+            project_path: Path to project root
+            file_index: Optional filename -> path index from build_file_index()
 
         Returns:
             Analysis result with scan_data, characteristics, and metadata
         """
-        scan_data = {}
         characteristics: CodeCharacteristics = {}
 
         # Always use file-based detection (coderef CLI removed)
         scan_data = None
 
         # File-based detection
-        if not characteristics:
-            file_path = self._find_element_file(element_name, project_path)
-            if file_path:
-                code = Path(file_path).read_text(encoding="utf-8")
-                language = file_path.suffix.lstrip(".")
-                characteristics = self.detector.detect_from_file_content(code, language)
+        file_path = self._find_element_file(element_name, project_path, file_index)
+        if file_path:
+            code = Path(file_path).read_text(encoding="utf-8")
+            language = Path(file_path).suffix.lstrip(".")
+            characteristics = self.detector.detect_from_file_content(code, language)
 
         return {
             "element_name": element_name,
@@ -224,32 +330,68 @@ class CodeAnalyzer:
             "analysis_method": "file_content",
         }
 
-    def _find_element_file(self, element_name: str, project_path: str) -> Optional[str]:
+    @staticmethod
+    def _candidate_filenames(element_name: str) -> List[str]:
+        """Filenames that may hold an element, in lookup priority order."""
+        return [
+            f"{element_name}.ts",
+            f"{element_name}.tsx",
+            f"{element_name}.js",
+            f"{element_name}.jsx",
+            f"{element_name}.py",
+            f"{element_name.lower()}.ts",
+            f"{element_name.lower()}.tsx",
+        ]
+
+    def build_file_index(self, project_path: str) -> Dict[str, str]:
+        """
+        Walk the project once and map each source filename to its first path.
+
+        Used by batch generation so N elements cost one directory walk instead
+        of N x 7 recursive globs. Skips EXCLUDED_DIRS.
+
+        Args:
+            project_path: Project root
+
+        Returns:
+            Dict of filename -> absolute path string
+        """
+        index: Dict[str, str] = {}
+        for root, dirs, files in os.walk(project_path):
+            dirs[:] = sorted(d for d in dirs if d not in EXCLUDED_DIRS)
+            for name in sorted(files):
+                if Path(name).suffix in SOURCE_EXTENSIONS:
+                    index.setdefault(name, os.path.join(root, name))
+        return index
+
+    def _find_element_file(
+        self,
+        element_name: str,
+        project_path: str,
+        file_index: Optional[Dict[str, str]] = None,
+    ) -> Optional[str]:
         """
         Find file containing the element.
 
         Args:
             element_name: Element name to find
             project_path: Project root
+            file_index: Optional prebuilt index (skips globbing)
 
         Returns:
             File path if found, None otherwise
         """
-        project = Path(project_path)
+        candidates = self._candidate_filenames(element_name)
 
-        # Common patterns for file names
-        patterns = [
-            f"**/{element_name}.ts",
-            f"**/{element_name}.tsx",
-            f"**/{element_name}.js",
-            f"**/{element_name}.jsx",
-            f"**/{element_name}.py",
-            f"**/{element_name.lower()}.ts",
-            f"**/{element_name.lower()}.tsx",
-        ]
+        if file_index is not None:
+            for filename in candidates:
+                if filename in file_index:
+                    return file_index[filename]
+            return None
 
-        for pattern in patterns:
-            matches = list(project.glob(pattern))
+        project = Path(project_path)
+        for filename in candidates:
+            matches = list(project.glob(f"**/{filename}"))
             if matches:
                 return str(matches[0])
 
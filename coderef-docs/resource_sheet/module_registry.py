@@ -11,8 +11,104 @@ Date: 2026-01-03
 """
 
 import json
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_MAPPING_FILE = Path(__file__).parent / "mapping" / "element-type-mapping.json"
+
+# Process-wide cache of parsed mappings: resolved path -> (mtime_ns, size, ElementTypeIndex)
+_registry_cache: Dict[str, Tuple[int, int, "ElementTypeIndex"]] = {}
+
+
+@dataclass(frozen=True)
+class ElementTypeSpec:
+    """Pre-built lookup structures for one element type."""
+    element_type: str
+    definition: Dict
+    checklist: Tuple[str, ...]
+    checklist_keywords: Tuple[Tuple[str, ...], ...]  # First 3 lowercase words per item
+    required_sections: Tuple[str, ...]
+    required_sections_lower: Tuple[str, ...]
+    checklist_markdown: str
+
+    @classmethod
+    def from_definition(cls, definition: Dict) -> "ElementTypeSpec":
+        checklist = tuple(definition.get("checklist_items", []))
+        required_sections = tuple(definition.get("required_sections", []))
+        markdown = ""
+        if checklist:
+            markdown = "\n".join(["#### Checklist"] + [f"- [ ] {item}" for item in checklist])
+
+        return cls(
+            element_type=definition["element_type"],
+            definition=definition,
+            checklist=checklist,
+            checklist_keywords=tuple(tuple(item.lower().split()[:3]) for item in checklist),
+            required_sections=required_sections,
+            required_sections_lower=tuple(section.lower() for section in required_sections),
+            checklist_markdown=markdown
+        )
+
+    def count_checklist_items(self, content_lower: str) -> int:
+        """Count checklist items with at least one keyword present in lowercased content."""
+        return sum(
+            1 for keywords in self.checklist_keywords
+            if any(keyword in content_lower for keyword in keywords)
+        )
+
+    def count_required_sections(self, content_lower: str) -> int:
+        """Count required sections whose title appears in lowercased content."""
+        return sum(1 for section in self.required_sections_lower if section in content_lower)
+
+
+class ElementTypeIndex:
+    """Parsed element-type-mapping.json with per-type specs built once."""
+
+    def __init__(self, mapping: Dict):
+        self.mapping = mapping
+        self.element_types: Dict[str, Dict] = {
+            e["element_type"]: e for e in mapping.get("element_types", [])
+        }
+        self.specs: Dict[str, ElementTypeSpec] = {
+            name: ElementTypeSpec.from_definition(definition)
+            for name, definition in self.element_types.items()
+        }
+
+    def get_spec(self, element_type: str) -> Optional[ElementTypeSpec]:
+        return self.specs.get(element_type)
+
+
+def load_element_type_index(mapping_file: Optional[Path] = None) -> ElementTypeIndex:
+    """
+    Load the element type mapping, reusing the process-wide cached copy.
+
+    The cached index is reused while the mapping file's mtime and size are
+    unchanged, so constructing a registry per resource sheet costs one stat().
+
+    Args:
+        mapping_file: Path to element-type-mapping.json (defaults to the bundled mapping)
+
+    Returns:
+        ElementTypeIndex shared by every registry loaded from the same file
+    """
+    mapping_file = Path(mapping_file) if mapping_file is not None else DEFAULT_MAPPING_FILE
+    stat = mapping_file.stat()
+    cache_key = str(mapping_file.resolve())
+
+    cached = _registry_cache.get(cache_key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    with open(mapping_file, 'r', encoding='utf-8') as f:
+        index = ElementTypeIndex(json.load(f))
+    _registry_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, index)
+    return index
+
+
+def _clear_registry_cache() -> None:
+    """Clear the element type mapping cache (useful for testing)."""
+    _registry_cache.clear()
 
 
 class ModuleRegistry:
@@ -29,17 +125,9 @@ class ModuleRegistry:
             mapping_file: Path to element-type-mapping.json
                          Defaults to mapping/element-type-mapping.json
         """
-        if mapping_file is None:
-            current_dir = Path(__file__).parent
-            mapping_file = current_dir / "mapping" / "element-type-mapping.json"
-
-        self.mapping = self._load_mapping(mapping_file)
-        self.element_types = {e["element_type"]: e for e in self.mapping.get("element_types", [])}
-
-    def _load_mapping(self, mapping_file: Path) -> Dict:
-        """Load element type mapping from JSON file."""
-        with open(mapping_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        self.index = load_element_type_index(mapping_file)
+        self.mapping = self.index.mapping
+        self.element_types = self.index.element_types
 
     def get_checklist(self, element_type: str) -> List[str]:
         """Get checklist items for element type.
@@ -60,11 +148,11 @@ class ModuleRegistry:
                 ...
             ]
         """
-        element_def = self.element_types.get(element_type)
-        if not element_def:
+        spec = self.index.get_spec(element_type)
+        if not spec:
             return []
 
-        return element_def.get("checklist_items", [])
+        return list(spec.checklist)
 
     def get_conditional_modules(self, element_type: str) -> List[str]:
         """Get conditional modules for element type.
@@ -85,7 +173,7 @@ class ModuleRegistry:
         if not element_def:
             return []
 
-        return element_def.get("conditional_modules", [])
+        return list(element_def.get("conditional_modules", []))
 
     def get_additional_sections(self, element_type: str) -> List[str]:
         """Get additional sections required for element type.
@@ -106,7 +194,7 @@ class ModuleRegistry:
         if not element_def:
             return []
 
-        return element_def.get("additional_sections", [])
+        return list(element_def.get("additional_sections", []))
 
     def get_required_sections(self, element_type: str) -> List[str]:
         """Get required sections for element type.
@@ -123,11 +211,11 @@ class ModuleRegistry:
             >>> print(sections)
             ["Endpoint Reference", "Auth Flow Diagram", "Error Taxonomy", ...]
         """
-        element_def = self.element_types.get(element_type)
-        if not element_def:
+        spec = self.index.get_spec(element_type)
+        if not spec:
             return []
 
-        return element_def.get("required_sections", [])
+        return list(spec.required_sections)
 
     def get_element_info(self, element_type: str) -> Optional[Dict]:
         """Get complete element definition.
@@ -164,15 +252,8 @@ class ModuleRegistry:
             - [ ] Cleanup guarantees - What happens on unmount
             ...
         """
-        checklist = self.get_checklist(element_type)
-        if not checklist:
-            return ""
-
-        lines = ["#### Checklist"]
-        for item in checklist:
-            lines.append(f"- [ ] {item}")
-
-        return "\n".join(lines)
+        spec = self.index.get_spec(element_type)
+        return spec.checklist_markdown if spec else ""
 
     def get_all_element_types(self) -> List[str]:
         """Get list of all available element types.
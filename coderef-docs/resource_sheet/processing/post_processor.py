@@ -10,7 +10,8 @@ Violations are returned as structured warnings, with optional auto-fix mode.
 """
 
 import re
-from typing import List, Dict, Optional
+from bisect import bisect_right
+from typing import List, Optional, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -31,6 +32,34 @@ class Violation:
     text: str              # Problematic text
     message: str           # Human-readable explanation
     suggestion: Optional[str] = None  # Recommended fix
+    column: Optional[int] = None      # 0-indexed offset within the line
+
+
+def _single_line(pattern: str) -> str:
+    """Restrict whitespace in a pattern to one line (document is scanned as a whole)."""
+    return pattern.replace(r'\s', r'[^\S\n]')
+
+
+@dataclass(frozen=True)
+class _Rule:
+    """One compiled writing-standards pattern."""
+    index: int
+    category: str
+    severity: ViolationSeverity
+    regex: "re.Pattern[str]"
+    message: str           # Template; may use {verb} and {text}
+    suggestion: Optional[str]
+
+
+@dataclass
+class _LineInfo:
+    """Per-line context used to decide which rules apply."""
+    start: int             # Offset of the line in the document
+    fence: bool            # ``` fence line
+    in_code: bool          # Inside a fenced code block
+    header: bool           # Markdown header
+    quote: bool            # Blockquote
+    pipe: bool             # Contains '|' (table row)
 
 
 class DocumentPostProcessor:
@@ -44,6 +73,10 @@ class DocumentPostProcessor:
     4. Table Usage - Structured data in tables
     5. Ambiguity - "Must" vs "Should" clarity
 
+    All regex rules are compiled once per class and merged into a single
+    alternation, so a document is scanned once regardless of how many
+    rules exist. Line numbers come from a precomputed line-offset index.
+
     Usage:
         processor = DocumentPostProcessor()
         violations = processor.check_all(markdown_content)
@@ -56,42 +89,164 @@ class DocumentPostProcessor:
         fixed_markdown = processor.apply_fixes(markdown_content, violations)
     """
 
+    # Conversational patterns to avoid
+    conversational_patterns = [
+        (r'\bwe\s+(\w+)', "Use imperative: 'Component {verb}' not 'We {verb}'"),
+        (r'\byou\s+can\s+(\w+)', "Use imperative: 'Users can {verb}' or 'Component allows {verb}'"),
+        (r'\blet\'s\s+', "Use imperative, not conversational"),
+    ]
+
+    # Hedging and filler words that weaken precision
+    hedging_patterns = [
+        r'\bshould probably\b',
+        r'\bmight want to\b',
+        r'\bcould consider\b',
+        r'\bperhaps\b',
+        r'\bmaybe\b',
+        r'\bkind of\b',
+        r'\bsort of\b',
+        r'\bsomewhat\b',
+        r'\bpossibly\b',
+        r'\bpotentially\b',
+        r'\bbasically\b',
+        r'\bokay\b',
+    ]
+
+    # Passive voice patterns
+    passive_voice_patterns = [
+        (r'is\s+(\w+ed)\s+by', "Passive voice: 'is {verb} by' → Use active voice"),
+        (r'was\s+(\w+ed)\s+by', "Passive voice: 'was {verb} by' → Use active voice"),
+        (r'are\s+(\w+ed)\s+by', "Passive voice: 'are {verb} by' → Use active voice"),
+        (r'were\s+(\w+ed)\s+by', "Passive voice: 'were {verb} by' → Use active voice"),
+        (r'been\s+(\w+ed)', "Passive voice: 'been {verb}' → Consider active alternative"),
+    ]
+
+    # Ambiguous "should" usage (should be "must" or "may")
+    ambiguous_should_pattern = r'\bshould\b'
+
+    # Words apply_fixes may delete (with a trailing comma/space)
+    AUTO_FIX_WORDS = frozenset({"basically", "okay", "perhaps", "maybe"})
+
+    # Check order used by check_all (matches the per-category methods)
+    CATEGORY_ORDER = ("voice_tone", "precision", "active_voice", "table_usage", "ambiguity")
+
+    _rules: Tuple[_Rule, ...] = ()
+    _combined: Optional["re.Pattern[str]"] = None
+    _fix_tail = re.compile(r'[^\S\n]*,?[^\S\n]*')
+
     def __init__(self):
-        """Initialize post-processor with pattern definitions."""
-        # Conversational patterns to avoid
-        self.conversational_patterns = [
-            (r'\bwe\s+(\w+)', "Use imperative: 'Component {verb}' not 'We {verb}'"),
-            (r'\byou\s+can\s+(\w+)', "Use imperative: 'Users can {verb}' or 'Component allows {verb}'"),
-            (r'\blet\'s\s+', "Use imperative, not conversational"),
-            (r'\bokay\b', "Remove conversational filler"),
-            (r'\bbasically\b', "Remove conversational filler"),
-        ]
-
-        # Hedging words that weaken precision
-        self.hedging_patterns = [
-            r'\bshould probably\b',
-            r'\bmight want to\b',
-            r'\bcould consider\b',
-            r'\bperhaps\b',
-            r'\bmaybe\b',
-            r'\bkind of\b',
-            r'\bsort of\b',
-            r'\bsomewhat\b',
-            r'\bpossibly\b',
-            r'\bpotentially\b',
-        ]
-
-        # Passive voice patterns
-        self.passive_voice_patterns = [
-            (r'is\s+(\w+ed)\s+by', "Passive voice: 'is {verb} by' → Use active voice"),
-            (r'was\s+(\w+ed)\s+by', "Passive voice: 'was {verb} by' → Use active voice"),
-            (r'are\s+(\w+ed)\s+by', "Passive voice: 'are {verb} by' → Use active voice"),
-            (r'were\s+(\w+ed)\s+by', "Passive voice: 'were {verb} by' → Use active voice"),
-            (r'been\s+(\w+ed)', "Passive voice: 'been {verb}' → Consider active alternative"),
-        ]
-
-        # Ambiguous "should" usage (should be "must" or "may")
-        self.ambiguous_should_pattern = r'\bshould\b'
+        """Initialize post-processor (patterns are compiled once per class)."""
+        cls = type(self)
+        if cls._combined is None:
+            cls._compile_rules()
+
+    @classmethod
+    def _compile_rules(cls) -> None:
+        """Compile every rule and merge them into one lookahead alternation."""
+        specs = []
+        for pattern, message in cls.conversational_patterns:
+            specs.append(("voice_tone", ViolationSeverity.WARNING, pattern, message, None))
+        for pattern in cls.hedging_patterns:
+            specs.append((
+                "precision", ViolationSeverity.WARNING, pattern,
+                "Hedging language: '{text}' weakens precision",
+                "Use 'must', 'will', 'can', or remove entirely"
+            ))
+        for pattern, message in cls.passive_voice_patterns:
+            specs.append(("active_voice", ViolationSeverity.INFO, pattern, message, None))
+        specs.append((
+            "ambiguity", ViolationSeverity.WARNING, cls.ambiguous_should_pattern,
+            "Ambiguous 'should' - use 'must' (requirement), 'may' (optional), or 'will' (definite)",
+            "Replace with 'must', 'may', or 'will' depending on context"
+        ))
+
+        cls._rules = tuple(
+            _Rule(i, category, severity, re.compile(_single_line(pattern), re.IGNORECASE), message, suggestion)
+            for i, (category, severity, pattern, message, suggestion) in enumerate(specs)
+        )
+        # Zero-width alternation: finds every position where any rule can start
+        cls._combined = re.compile(
+            '|'.join(f'(?={_single_line(pattern)})' for _, _, pattern, _, _ in specs),
+            re.IGNORECASE
+        )
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _index_lines(markdown: str) -> List[_LineInfo]:
+        """Build the line-offset index and per-line context in one pass."""
+        infos = []
+        offset = 0
+        in_code = False
+        for line in markdown.split('\n'):
+            stripped = line.strip()
+            fence = stripped.startswith('```')
+            infos.append(_LineInfo(
+                start=offset,
+                fence=fence,
+                in_code=in_code and not fence,
+                header=stripped.startswith('#'),
+                quote=stripped.startswith('>'),
+                pipe='|' in line,
+            ))
+            if fence:
+                in_code = not in_code
+            offset += len(line) + 1
+        return infos
+
+    @staticmethod
+    def _rule_applies(category: str, info: _LineInfo) -> bool:
+        """Line-level skip rules per category (code is never checked)."""
+        if info.fence or info.in_code:
+            return False
+        if category == "voice_tone":
+            return not info.header
+        if category == "active_voice":
+            return not info.pipe
+        if category == "ambiguity":
+            return not info.quote
+        return True
+
+    def _scan(self, markdown: str, categories: Set[str]) -> List[Violation]:
+        """
+        Single pass over the document for all requested regex categories.
+
+        Each rule keeps finditer semantics (non-overlapping with itself),
+        while different rules may overlap, exactly as separate scans would.
+        """
+        lines = self._index_lines(markdown)
+        line_starts = [info.start for info in lines]
+        rules = [rule for rule in self._rules if rule.category in categories]
+        next_allowed = {rule.index: 0 for rule in rules}
+        found = []
+
+        for candidate in self._combined.finditer(markdown):
+            pos = candidate.start()
+            line_number = bisect_right(line_starts, pos) - 1
+            info = lines[line_number]
+            for rule in rules:
+                if pos < next_allowed[rule.index] or not self._rule_applies(rule.category, info):
+                    continue
+                match = rule.regex.match(markdown, pos)
+                if not match:
+                    continue
+                next_allowed[rule.index] = match.end()
+                verb = match.group(1) if match.lastindex else ""
+                found.append((line_number, rule.index, pos, Violation(
+                    category=rule.category,
+                    severity=rule.severity,
+                    line_number=line_number,
+                    text=match.group(0),
+                    message=rule.message.format(verb=verb, text=match.group(0)),
+                    suggestion=rule.suggestion,
+                    column=pos - info.start,
+                )))
+
+        # Per line: rule order, then position (same order as per-pattern scans)
+        found.sort(key=lambda item: item[:3])
+        return [violation for *_, violation in found]
 
     def check_all(self, markdown: str) -> List[Violation]:
         """
@@ -103,15 +258,12 @@ class DocumentPostProcessor:
         Returns:
             List of violations sorted by line number
         """
-        violations = []
-        violations.extend(self.check_voice_tone(markdown))
-        violations.extend(self.check_precision(markdown))
-        violations.extend(self.check_active_voice(markdown))
+        order = {category: i for i, category in enumerate(self.CATEGORY_ORDER)}
+        violations = self._scan(markdown, set(self.CATEGORY_ORDER))
         violations.extend(self.check_table_usage(markdown))
-        violations.extend(self.check_ambiguity(markdown))
 
         # Sort by line number for easier review
-        return sorted(violations, key=lambda v: v.line_number)
+        return sorted(violations, key=lambda v: (v.line_number, order[v.category]))
 
     def check_voice_tone(self, markdown: str) -> List[Violation]:
         """
@@ -128,28 +280,7 @@ class DocumentPostProcessor:
         Returns:
             List of voice & tone violations
         """
-        violations = []
-        lines = markdown.split('\n')
-
-        for i, line in enumerate(lines):
-            # Skip code blocks and headers
-            if line.strip().startswith('```') or line.strip().startswith('#'):
-                continue
-
-            for pattern, message_template in self.conversational_patterns:
-                matches = re.finditer(pattern, line, re.IGNORECASE)
-                for match in matches:
-                    verb = match.group(1) if match.lastindex >= 1 else ""
-                    violations.append(Violation(
-                        category="voice_tone",
-                        severity=ViolationSeverity.WARNING,
-                        line_number=i,
-                        text=match.group(0),
-                        message=message_template.format(verb=verb),
-                        suggestion=None  # Context-dependent, can't auto-fix
-                    ))
-
-        return violations
+        return self._scan(markdown, {"voice_tone"})
 
     def check_precision(self, markdown: str) -> List[Violation]:
         """
@@ -158,7 +289,7 @@ class DocumentPostProcessor:
         Detects:
         - "should probably" → "must" or "will"
         - "might want to" → "should" or "can"
-        - "perhaps", "maybe" → Remove or rephrase
+        - "perhaps", "maybe", "basically" → Remove or rephrase
 
         Args:
             markdown: Markdown content
@@ -166,27 +297,7 @@ class DocumentPostProcessor:
         Returns:
             List of precision violations
         """
-        violations = []
-        lines = markdown.split('\n')
-
-        for i, line in enumerate(lines):
-            # Skip code blocks
-            if line.strip().startswith('```'):
-                continue
-
-            for pattern in self.hedging_patterns:
-                matches = re.finditer(pattern, line, re.IGNORECASE)
-                for match in matches:
-                    violations.append(Violation(
-                        category="precision",
-                        severity=ViolationSeverity.WARNING,
-                        line_number=i,
-                        text=match.group(0),
-                        message=f"Hedging language: '{match.group(0)}' weakens precision",
-                        suggestion="Use 'must', 'will', 'can', or remove entirely"
-                    ))
-
-        return violations
+        return self._scan(markdown, {"precision"})
 
     def check_active_voice(self, markdown: str) -> List[Violation]:
         """
@@ -203,28 +314,7 @@ class DocumentPostProcessor:
         Returns:
             List of active voice violations
         """
-        violations = []
-        lines = markdown.split('\n')
-
-        for i, line in enumerate(lines):
-            # Skip code blocks and tables
-            if line.strip().startswith('```') or '|' in line:
-                continue
-
-            for pattern, message_template in self.passive_voice_patterns:
-                matches = re.finditer(pattern, line, re.IGNORECASE)
-                for match in matches:
-                    verb = match.group(1) if match.lastindex >= 1 else ""
-                    violations.append(Violation(
-                        category="active_voice",
-                        severity=ViolationSeverity.INFO,
-                        line_number=i,
-                        text=match.group(0),
-                        message=message_template.format(verb=verb),
-                        suggestion=None  # Context-dependent
-                    ))
-
-        return violations
+        return self._scan(markdown, {"active_voice"})
 
     def check_table_usage(self, markdown: str) -> List[Violation]:
         """
@@ -244,10 +334,22 @@ class DocumentPostProcessor:
         lines = markdown.split('\n')
 
         # Detect list items with key-value patterns
-        structured_list_items = []
+        structured_list_items: List[int] = []
         in_list = False
         list_start = 0
 
+        def close_list(end: int) -> None:
+            # If we found 3+ structured items, suggest table
+            if len(structured_list_items) >= 3:
+                violations.append(Violation(
+                    category="table_usage",
+                    severity=ViolationSeverity.INFO,
+                    line_number=list_start,
+                    text=f"List items {list_start}-{end}",
+                    message=f"Found {len(structured_list_items)} list items with key-value structure. Consider using a table for better readability.",
+                    suggestion="Convert to markdown table with columns for each key"
+                ))
+
         for i, line in enumerate(lines):
             stripped = line.strip()
 
@@ -263,22 +365,15 @@ class DocumentPostProcessor:
                 if ':' in stripped and (',' in stripped or '**' in stripped):
                     structured_list_items.append(i)
 
-            # Detect list end
-            elif in_list and not stripped.startswith('- ') and stripped:
-                # If we found 3+ structured items, suggest table
-                if len(structured_list_items) >= 3:
-                    violations.append(Violation(
-                        category="table_usage",
-                        severity=ViolationSeverity.INFO,
-                        line_number=list_start,
-                        text=f"List items {list_start}-{i-1}",
-                        message=f"Found {len(structured_list_items)} list items with key-value structure. Consider using a table for better readability.",
-                        suggestion="Convert to markdown table with columns for each key"
-                    ))
-
+            # Detect list end (next non-list content or end of document)
+            elif in_list and stripped:
+                close_list(i - 1)
                 in_list = False
                 structured_list_items = []
 
+        if in_list:
+            close_list(len(lines) - 1)
+
         return violations
 
     def check_ambiguity(self, markdown: str) -> List[Violation]:
@@ -296,33 +391,15 @@ class DocumentPostProcessor:
         Returns:
             List of ambiguity violations
         """
-        violations = []
-        lines = markdown.split('\n')
-
-        for i, line in enumerate(lines):
-            # Skip code blocks, comments, and quotes
-            if line.strip().startswith('```') or line.strip().startswith('>'):
-                continue
-
-            matches = re.finditer(self.ambiguous_should_pattern, line, re.IGNORECASE)
-            for match in matches:
-                violations.append(Violation(
-                    category="ambiguity",
-                    severity=ViolationSeverity.WARNING,
-                    line_number=i,
-                    text=match.group(0),
-                    message="Ambiguous 'should' - use 'must' (requirement), 'may' (optional), or 'will' (definite)",
-                    suggestion="Replace with 'must', 'may', or 'will' depending on context"
-                ))
-
-        return violations
+        return self._scan(markdown, {"ambiguity"})
 
     def apply_fixes(self, markdown: str, violations: List[Violation]) -> str:
         """
         Apply automatic fixes to violations where possible.
 
-        Only fixes violations with non-None suggestions that are safe
-        to auto-apply (e.g., removing filler words).
+        Only removes filler/hedge words (AUTO_FIX_WORDS) flagged as precision
+        violations, together with a trailing comma and spaces. All edits are
+        collected as spans and applied in one linear rebuild of the document.
 
         Args:
             markdown: Original markdown content
@@ -331,31 +408,46 @@ class DocumentPostProcessor:
         Returns:
             Fixed markdown content
         """
-        lines = markdown.split('\n')
+        line_starts = [info.start for info in self._index_lines(markdown)]
 
-        # Group violations by line number (reverse order to preserve indices)
-        violations_by_line = {}
+        spans = []
         for v in violations:
-            if v.line_number not in violations_by_line:
-                violations_by_line[v.line_number] = []
-            violations_by_line[v.line_number].append(v)
-
-        # Apply fixes (only for safe auto-fixable patterns)
-        for line_num in sorted(violations_by_line.keys(), reverse=True):
-            line = lines[line_num]
-
-            for violation in violations_by_line[line_num]:
-                # Auto-fix: Remove conversational filler words
-                if violation.category == "precision" and violation.text in ["basically", "okay"]:
-                    line = line.replace(violation.text, "")
-
-                # Auto-fix: Common hedge word removals
-                elif violation.category == "precision" and violation.text in ["perhaps", "maybe"]:
-                    line = re.sub(r'\b' + re.escape(violation.text) + r'\b\s*,?\s*', '', line, flags=re.IGNORECASE)
-
-            lines[line_num] = line
+            if v.category != "precision" or v.text.lower() not in self.AUTO_FIX_WORDS:
+                continue
+            if not 0 <= v.line_number < len(line_starts):
+                continue
 
-        return '\n'.join(lines)
+            line_start = line_starts[v.line_number]
+            if v.column is not None:
+                start = line_start + v.column
+            else:
+                # Violation built without a column: locate the word on its line
+                line_end = markdown.find('\n', line_start)
+                line_end = len(markdown) if line_end == -1 else line_end
+                located = re.compile(r'\b' + re.escape(v.text) + r'\b', re.IGNORECASE).search(
+                    markdown, line_start, line_end
+                )
+                if not located:
+                    continue
+                start = located.start()
+
+            if markdown[start:start + len(v.text)].lower() != v.text.lower():
+                continue
+            end = self._fix_tail.match(markdown, start + len(v.text)).end()
+            spans.append((start, end))
+
+        if not spans:
+            return markdown
+
+        parts = []
+        cursor = 0
+        for start, end in sorted(spans):
+            if start < cursor:
+                continue  # Overlaps an edit already applied
+            parts.append(markdown[cursor:start])
+            cursor = end
+        parts.append(markdown[cursor:])
+        return ''.join(parts)
 
     def get_report(self, violations: List[Violation]) -> str:
         """
@@ -374,7 +374,7 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "element_name": {
                         "type": "string",
-                        "description": "Name of code element to document (e.g., 'AuthService', 'Button', 'useAuth')"
+                        "description": "Name of code element to document (e.g., 'AuthService', 'Button', 'useAuth'). Required unless element_names or element_filter is given."
                     },
                     "project_path": {
                         "type": "string",
@@ -408,9 +408,30 @@ async def list_tools() -> list[Tool]:
                         "type": "boolean",
                         "description": "Automatically validate generated resource sheet with Papertrail (default: true). Set to false to skip validation.",
                         "default": True
+                    },
+                    "element_names": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Batch mode: generate sheets for many elements in one call, sharing the loaded index, file index and module registry"
+                    },
+                    "element_filter": {
+                        "type": "object",
+                        "description": "Batch mode: select elements from .coderef/index.json. Keys: type (string or list), file_pattern (glob), name_pattern (glob), exported_only (bool)",
+                        "properties": {
+                            "type": {"type": ["string", "array"], "items": {"type": "string"}},
+                            "file_pattern": {"type": "string"},
+                            "name_pattern": {"type": "string"},
+                            "exported_only": {"type": "boolean"}
+                        }
+                    },
+                    "concurrency": {
+                        "type": "integer",
+                        "description": "Batch mode: max elements composed concurrently (default: 8)",
+                        "minimum": 1,
+                        "default": 8
                     }
                 },
-                "required": ["element_name", "project_path"]
+                "required": ["project_path"]
             }
         ),
         Tool(
@@ -0,0 +1,247 @@
+"""
+MCP SSE transport primitives for the HTTP wrapper (http_server.py).
+
+Implements the MCP "HTTP with SSE" transport:
+- GET /sse opens a long-lived event stream and registers a session
+- The first event is `endpoint`, telling the client where to POST messages
+- POST /messages?session_id=... accepts JSON-RPC requests (202 Accepted)
+- Responses and progress notifications are pushed onto the session queue and
+  flushed to the client as soon as they are produced
+
+Tool handlers report incremental progress through `report_progress()`. It is a
+no-op unless a reporter is bound for the current call, so handlers behave the
+same under stdio, /mcp and /sse.
+
+Usage:
+    from sse_transport import report_progress
+
+    for i, name in enumerate(templates, 1):
+        report_progress(i, len(templates), message=f"[{i}/{len(templates)}] {name}")
+"""
+
+import contextvars
+import json
+import queue
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+# Seconds between keep-alive comments on an idle stream (proxies drop silent connections)
+KEEPALIVE_INTERVAL = 15.0
+
+# Upper bound on queued events per session before producers block
+MAX_QUEUED_EVENTS = 1000
+
+# Seconds a producer waits for room on a full queue before dropping the event
+SEND_TIMEOUT = 5.0
+
+# Sentinel pushed onto a session queue to end its stream
+_CLOSE = object()
+
+
+def format_sse_event(event: str, data: Any) -> str:
+    """
+    Format a single SSE frame.
+
+    Args:
+        event: SSE event name (e.g., 'endpoint', 'message')
+        data: String payload, or any JSON-serializable value
+
+    Returns:
+        SSE frame terminated by a blank line
+    """
+    payload = data if isinstance(data, str) else json.dumps(data, default=str)
+    lines = payload.split('\n')
+    return f"event: {event}\n" + ''.join(f"data: {line}\n" for line in lines) + "\n"
+
+
+class SSESession:
+    """One connected SSE client and its outbound event queue."""
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.created_at = time.time()
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=MAX_QUEUED_EVENTS)
+        self._closed = threading.Event()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed.is_set()
+
+    def send(self, message: Dict[str, Any], event: str = 'message') -> bool:
+        """
+        Queue a JSON-RPC message for delivery to the client.
+
+        A full queue (a client that stopped reading) is waited on for at most
+        SEND_TIMEOUT seconds, so tool-call threads never hang on a dead client.
+
+        Returns:
+            True if queued; False if the session is closed or the message was
+            dropped because the queue stayed full
+        """
+        if self.closed:
+            return False
+        try:
+            self._queue.put((event, message), timeout=SEND_TIMEOUT)
+        except queue.Full:
+            return False
+        return not self.closed
+
+    def close(self) -> None:
+        """Mark the session closed and wake the stream so it can exit."""
+        if not self.closed:
+            self._closed.set()
+            try:
+                self._queue.put_nowait(_CLOSE)
+            except queue.Full:
+                pass
+
+    def stream(self, endpoint_url: str, keepalive: float = KEEPALIVE_INTERVAL) -> Iterator[str]:
+        """
+        Yield SSE frames until the session is closed.
+
+        The first frame is the MCP `endpoint` event. Idle periods produce
+        comment frames so intermediaries keep the connection open.
+        """
+        yield format_sse_event('endpoint', endpoint_url)
+        while not self.closed:
+            try:
+                item = self._queue.get(timeout=keepalive)
+            except queue.Empty:
+                yield ": keepalive\n\n"
+                continue
+            if item is _CLOSE:
+                break
+            event, message = item
+            yield format_sse_event(event, message)
+
+
+class SessionRegistry:
+    """Thread-safe registry of open SSE sessions keyed by session ID."""
+
+    def __init__(self):
+        self._sessions: Dict[str, SSESession] = {}
+        self._lock = threading.Lock()
+
+    def create(self) -> SSESession:
+        session = SSESession(uuid.uuid4().hex)
+        with self._lock:
+            self._sessions[session.session_id] = session
+        return session
+
+    def get(self, session_id: Optional[str]) -> Optional[SSESession]:
+        if not session_id:
+            return None
+        with self._lock:
+            return self._sessions.get(session_id)
+
+    def remove(self, session_id: str) -> None:
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is not None:
+            session.close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._sessions
+
+
+# ============================================================================
+# PROGRESS REPORTING
+# ============================================================================
+
+class ProgressReporter:
+    """
+    Emits MCP `notifications/progress` for one in-flight tool call.
+
+    Progress notifications carry the client's progressToken (from
+    params._meta.progressToken), falling back to the request ID. Partial
+    content, when supplied, is attached as MCP content items so clients can
+    render results before the final response arrives.
+    """
+
+    def __init__(self, session: SSESession, progress_token: Any):
+        self.session = session
+        self.progress_token = progress_token
+
+    def report(
+        self,
+        progress: float,
+        total: Optional[float] = None,
+        message: Optional[str] = None,
+        content: Optional[str] = None
+    ) -> None:
+        params: Dict[str, Any] = {
+            'progressToken': self.progress_token,
+            'progress': progress
+        }
+        if total is not None:
+            params['total'] = total
+        if message:
+            params['message'] = message
+        if content:
+            params['content'] = [{'type': 'text', 'text': content}]
+
+        self.session.send({
+            'jsonrpc': '2.0',
+            'method': 'notifications/progress',
+            'params': params
+        })
+
+
+_current_reporter: contextvars.ContextVar[Optional[ProgressReporter]] = contextvars.ContextVar(
+    'progress_reporter', default=None
+)
+
+
+@contextmanager
+def bind_reporter(reporter: Optional[ProgressReporter]) -> Iterator[None]:
+    """Bind a progress reporter for the duration of a tool call."""
+    token = _current_reporter.set(reporter)
+    try:
+        yield
+    finally:
+        _current_reporter.reset(token)
+
+
+def report_progress(
+    progress: float,
+    total: Optional[float] = None,
+    message: Optional[str] = None,
+    content: Optional[str] = None
+) -> None:
+    """
+    Report incremental progress (and optional partial content) for the current tool call.
+
+    No-op when the call is not running under a streaming transport.
+
+    Args:
+        progress: Units completed so far (monotonically increasing)
+        total: Total units, if known
+        message: Short human-readable status (e.g., '[2/5] Generating SCHEMA...')
+        content: Partial text output produced by this step
+    """
+    reporter = _current_reporter.get()
+    if reporter is not None:
+        reporter.report(progress, total, message, content)
+
+
+def get_progress_token(message: Dict[str, Any]) -> Any:
+    """Extract the progress token from a JSON-RPC request, defaulting to its ID."""
+    params = message.get('params') or {}
+    meta = params.get('_meta') or {}
+    return meta.get('progressToken', message.get('id'))
+
@@ -550,5 +550,138 @@ class TestIntegration:
         assert data['status'] == 'operational'
 
 
+# ============================================================================
+# SSE TRANSPORT TESTS
+# ============================================================================
+
+def _read_sse_event(stream) -> Dict[str, Any]:
+    """Read the next non-comment SSE frame from a streaming response iterator."""
+    while True:
+        frame = next(stream)
+        if isinstance(frame, bytes):
+            frame = frame.decode('utf-8')
+        if frame.startswith(':'):
+            continue
+        event = {'event': None, 'data': ''}
+        for line in frame.strip().split('\n'):
+            if line.startswith('event: '):
+                event['event'] = line[len('event: '):]
+            elif line.startswith('data: '):
+                event['data'] += line[len('data: '):]
+        return event
+
+
+class TestSSETransport:
+    """Tests for GET /sse + POST /messages (MCP SSE transport)."""
+
+    def test_sse_first_event_is_endpoint(self, client):
+        """SSE stream should announce the message endpoint with a session id."""
+        response = client.get('/sse')
+        assert response.status_code == 200
+        assert response.mimetype == 'text/event-stream'
+
+        stream = iter(response.response)
+        event = _read_sse_event(stream)
+        assert event['event'] == 'endpoint'
+        assert '/messages?session_id=' in event['data']
+        response.close()
+
+    def test_messages_unknown_session_returns_404(self, client):
+        """POST /messages with an unknown session should return 404."""
+        response = client.post(
+            '/messages?session_id=does-not-exist',
+            data=json.dumps({'jsonrpc': '2.0', 'id': 1, 'method': 'tools/list'}),
+            content_type='application/json'
+        )
+        assert response.status_code == 404
+
+    def test_response_delivered_on_stream(self, client):
+        """Responses to POSTed messages should arrive on the SSE stream."""
+        response = client.get('/sse')
+        stream = iter(response.response)
+        endpoint = _read_sse_event(stream)['data']
+
+        post = client.post(
+            endpoint,
+            data=json.dumps({'jsonrpc': '2.0', 'id': 7, 'method': 'tools/list'}),
+            content_type='application/json'
+        )
+        assert post.status_code == 202
+
+        event = _read_sse_event(stream)
+        assert event['event'] == 'message'
+        message = json.loads(event['data'])
+        assert message['id'] == 7
+        assert 'tools' in message['result']
+        response.close()
+
+    def test_tool_progress_streamed_before_result(self, client, monkeypatch):
+        """report_progress() calls should be flushed before the final result."""
+        import http_server
+        from sse_transport import report_progress
+
+        async def slow_tool(arguments: dict):
+            for i in range(1, 4):
+                report_progress(i, 3, message=f"[{i}/3]", content=f"chunk {i}")
+            return [{'type': 'text', 'text': 'done'}]
+
+        monkeypatch.setitem(http_server.ALL_TOOL_HANDLERS, 'slow_tool', slow_tool)
+
+        response = client.get('/sse')
+        stream = iter(response.response)
+        endpoint = _read_sse_event(stream)['data']
+
+        payload = {
+            'jsonrpc': '2.0',
+            'id': 'call-1',
+            'method': 'tools/call',
+            'params': {
+                'name': 'slow_tool',
+                'arguments': {},
+                '_meta': {'progressToken': 'tok-1'}
+            }
+        }
+        post = client.post(endpoint, data=json.dumps(payload), content_type='application/json')
+        assert post.status_code == 202
+
+        messages = [json.loads(_read_sse_event(stream)['data']) for _ in range(4)]
+        progress = messages[:3]
+        assert [m['method'] for m in progress] == ['notifications/progress'] * 3
+        assert [m['params']['progress'] for m in progress] == [1, 2, 3]
+        assert all(m['params']['progressToken'] == 'tok-1' for m in progress)
+        assert progress[0]['params']['content'][0]['text'] == 'chunk 1'
+
+        final = messages[3]
+        assert final['id'] == 'call-1'
+        assert final['result']['content'][0]['text'] == 'done'
+        response.close()
+
+    def test_session_removed_on_disconnect(self, client):
+        """Closing the stream should unregister the session."""
+        import http_server
+
+        response = client.get('/sse')
+        stream = iter(response.response)
+        endpoint = _read_sse_event(stream)['data']
+        session_id = endpoint.split('session_id=')[1]
+        assert session_id in http_server.SSE_SESSIONS
+
+        response.close()
+        assert session_id not in http_server.SSE_SESSIONS
+
+    def test_send_drops_when_closed_or_full(self, monkeypatch):
+        """send() must never block a tool-call thread on a client that stopped reading."""
+        import sse_transport
+
+        monkeypatch.setattr(sse_transport, 'SEND_TIMEOUT', 0.01)
+        session = sse_transport.SSESession('full')
+        for i in range(sse_transport.MAX_QUEUED_EVENTS):
+            assert session.send({'id': i})
+        assert not session.send({'id': 'overflow'})
+
+        session.close()
+        assert not session.send({'id': 'late'})
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -316,7 +316,8 @@ class TestApplyFixes:
 
         assert "perhaps" not in fixed.lower()
 
-    def test_removes_maybe(self, processor):Test that 'maybe' is removed."""
+    def test_removes_maybe(self, processor):
+        """Test that 'maybe' is removed."""
         markdown = "Maybe add error handling here."
         violations = processor.check_precision(markdown)
         fixed = processor.apply_fixes(markdown, violations)
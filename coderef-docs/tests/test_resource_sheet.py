@@ -199,6 +199,89 @@ class TestDocumentComposer:
         assert any("TestElement" in line for line in jsdoc)
 
 
+class TestCodeAnalyzerGraph:
+    """Test indexed graph queries (GraphIndex + per-project cache)."""
+
+    @staticmethod
+    def _write_graph(project: Path, graph: dict) -> Path:
+        graph_path = project / ".coderef" / "exports" / "graph.json"
+        graph_path.parent.mkdir(parents=True, exist_ok=True)
+        graph_path.write_text(json.dumps(graph), encoding="utf-8")
+        return graph_path
+
+    @staticmethod
+    def _sample_graph() -> dict:
+        return {
+            "nodes": [
+                {"id": "a", "name": "AuthService", "file": "auth.ts", "type": "class"},
+                {"id": "b", "name": "HttpClient", "file": "http.ts", "type": "class"},
+                {"id": "c", "name": "LoginForm", "file": "login.tsx", "type": "component"},
+            ],
+            "edges": [
+                {"source": "a", "target": "b", "type": "imports"},
+                {"source": "c", "target": "a", "type": "calls"},
+            ],
+        }
+
+    @pytest.fixture(autouse=True)
+    def _reset_cache(self):
+        from resource_sheet.detection.analyzer import _clear_graph_cache
+        _clear_graph_cache()
+        yield
+        _clear_graph_cache()
+
+    @pytest.mark.asyncio
+    async def test_query_relationships(self, tmp_path):
+        """Should answer dependency, consumer, import and caller queries."""
+        self._write_graph(tmp_path, self._sample_graph())
+        analyzer = CodeAnalyzer()
+
+        deps = await analyzer.query_dependencies("AuthService", str(tmp_path))
+        consumers = await analyzer.query_consumers("AuthService", str(tmp_path))
+        imports = await analyzer.query_imports("AuthService", str(tmp_path))
+        callers = await analyzer.query_callers("AuthService", str(tmp_path))
+
+        assert [d["name"] for d in deps] == ["HttpClient"]
+        assert [c["name"] for c in consumers] == ["LoginForm"]
+        assert [i["name"] for i in imports] == ["HttpClient"]
+        assert [c["name"] for c in callers] == ["LoginForm"]
+        assert await analyzer.query_dependencies("Missing", str(tmp_path)) == []
+
+    @pytest.mark.asyncio
+    async def test_graph_loaded_once_per_version(self, tmp_path, monkeypatch):
+        """Repeated queries should reuse the cached index until graph.json changes."""
+        import os
+        from resource_sheet.detection import analyzer as analyzer_mod
+
+        graph_path = self._write_graph(tmp_path, self._sample_graph())
+        analyzer = CodeAnalyzer()
+
+        builds = []
+        original_init = analyzer_mod.GraphIndex.__init__
+
+        def counting_init(self, graph):
+            builds.append(1)
+            original_init(self, graph)
+
+        monkeypatch.setattr(analyzer_mod.GraphIndex, "__init__", counting_init)
+
+        await analyzer.query_dependencies("AuthService", str(tmp_path))
+        await analyzer.query_consumers("AuthService", str(tmp_path))
+        await analyzer.query_imports("AuthService", str(tmp_path))
+        assert len(builds) == 1
+
+        # Rewrite graph with a new edge and bump mtime -> cache invalidated
+        graph = self._sample_graph()
+        graph["edges"].append({"source": "a", "target": "c", "type": "calls"})
+        graph_path.write_text(json.dumps(graph), encoding="utf-8")
+        stat = graph_path.stat()
+        os.utime(graph_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        deps = await analyzer.query_dependencies("AuthService", str(tmp_path))
+        assert len(builds) == 2
+        assert sorted(d["name"] for d in deps) == ["HttpClient", "LoginForm"]
+
+
 class TestResourceSheetGenerator:
     """Test end-to-end generator workflow."""
 
@@ -259,3 +342,146 @@ class TestResourceSheetGenerator:
         assert "element_name" in result
         assert "outputs" in result
         assert result["element_name"] == "TestElement"
+
+
+class TestResourceSheetBatch:
+    """Test batch generation with shared analysis context."""
+
+    @pytest.mark.asyncio
+    async def test_generate_batch_writes_all_outputs(self, tmp_path):
+        """Should generate one sheet per unique element and report a summary."""
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "AuthService.ts").write_text("export class AuthService { fetch('/api') }", encoding="utf-8")
+        (src / "Button.tsx").write_text("export const Button = () => <button />", encoding="utf-8")
+
+        generator = ResourceSheetGenerator()
+        summary = await generator.generate_batch(
+            element_names=["AuthService", "Button", "AuthService", "Missing"],
+            project_path=str(tmp_path),
+            output_path=str(tmp_path / "output"),
+            concurrency=2,
+        )
+
+        assert summary["requested"] == 3
+        assert summary["generated"] == 3
+        assert summary["failed"] == 0
+        names = [r["element_name"] for r in summary["results"]]
+        assert names == ["AuthService", "Button", "Missing"]
+        for result in summary["results"]:
+            assert Path(result["outputs"]["markdown"]).exists()
+
+    @pytest.mark.asyncio
+    async def test_generate_batch_walks_project_once(self, tmp_path, monkeypatch):
+        """Batch analysis should use the shared file index instead of per-element globs."""
+        (tmp_path / "Widget.tsx").write_text("export const Widget = () => null", encoding="utf-8")
+
+        def fail_glob(self, pattern):
+            raise AssertionError("batch generation should not glob per element")
+
+        monkeypatch.setattr(Path, "glob", fail_glob)
+
+        generator = ResourceSheetGenerator()
+        summary = await generator.generate_batch(
+            element_names=["Widget", "Other"],
+            project_path=str(tmp_path),
+            output_path=str(tmp_path / "output"),
+        )
+
+        assert summary["generated"] == 2
+        assert summary["failures"] == []
+
+    @pytest.mark.asyncio
+    async def test_generate_batch_keeps_first_of_colliding_filenames(self, tmp_path):
+        """Elements mapping to the same sheet filename should not overwrite each other."""
+        generator = ResourceSheetGenerator()
+        summary = await generator.generate_batch(
+            element_names=["AuthService", "Auth Service"],
+            project_path=str(tmp_path),
+            output_path=str(tmp_path / "output"),
+        )
+
+        assert [r["element_name"] for r in summary["results"]] == ["AuthService"]
+        assert summary["failures"][0]["element_name"] == "Auth Service"
+        assert "'AuthService'" in summary["failures"][0]["error"]
+
+    @pytest.mark.asyncio
+    async def test_generate_batch_rejects_zero_concurrency(self, tmp_path):
+        generator = ResourceSheetGenerator()
+        with pytest.raises(ValueError, match="concurrency"):
+            await generator.generate_batch(["Widget"], str(tmp_path), concurrency=0)
+
+    def test_build_file_index_skips_excluded_dirs(self, tmp_path):
+        """File index should prune node_modules/.git and keep source files."""
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "Hidden.ts").write_text("", encoding="utf-8")
+        (tmp_path / "lib").mkdir()
+        (tmp_path / "lib" / "Visible.py").write_text("", encoding="utf-8")
+        (tmp_path / "lib" / "notes.md").write_text("", encoding="utf-8")
+
+        index = CodeAnalyzer().build_file_index(str(tmp_path))
+
+        assert "Visible.py" in index
+        assert "Hidden.ts" not in index
+        assert "notes.md" not in index
+
+
+class TestElementTypeRegistryCache:
+    """Test the process-wide element type mapping cache."""
+
+    def _write_mapping(self, path, checklist):
+        mapping = {
+            "element_types": [{
+                "element_type": "custom_hooks",
+                "display_name": "Custom Hooks Library",
+                "checklist_items": checklist,
+                "required_sections": ["Hook Signature", "Side Effects"]
+            }]
+        }
+        path.write_text(json.dumps(mapping), encoding="utf-8")
+
+    def test_registries_share_parsed_mapping(self, tmp_path):
+        """Constructing registries repeatedly should parse the mapping once."""
+        from resource_sheet.module_registry import ModuleRegistry, _clear_registry_cache
+
+        _clear_registry_cache()
+        mapping_file = tmp_path / "mapping.json"
+        self._write_mapping(mapping_file, ["Side effects - Network"])
+
+        first = ModuleRegistry(mapping_file)
+        second = ModuleRegistry(mapping_file)
+
+        assert first.index is second.index
+        assert first.format_checklist_markdown("custom_hooks") == "#### Checklist\n- [ ] Side effects - Network"
+
+        # Callers mutating returned lists must not corrupt the shared cache
+        first.get_checklist("custom_hooks").append("extra")
+        assert second.get_checklist("custom_hooks") == ["Side effects - Network"]
+
+    def test_mapping_reloaded_when_file_changes(self, tmp_path):
+        """An edited mapping file should invalidate the cached index."""
+        import os
+        from resource_sheet.module_registry import ModuleRegistry, _clear_registry_cache
+
+        _clear_registry_cache()
+        mapping_file = tmp_path / "mapping.json"
+        self._write_mapping(mapping_file, ["Old item"])
+        assert ModuleRegistry(mapping_file).get_checklist("custom_hooks") == ["Old item"]
+
+        self._write_mapping(mapping_file, ["New item", "Second item"])
+        stat = mapping_file.stat()
+        os.utime(mapping_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert ModuleRegistry(mapping_file).get_checklist("custom_hooks") == ["New item", "Second item"]
+
+    def test_validation_pipeline_uses_prebuilt_specs(self):
+        """Gate 3 should score element types from the shared registry."""
+        from generators.validation_pipeline import ValidationPipeline
+
+        sheet = "#### Checklist\nSide effects and cleanup guarantees.\n## Hook Signature\n## Dependencies\n"
+        gate = ValidationPipeline()._gate_3_element_specific(sheet, "custom_hooks")
+        unknown = ValidationPipeline()._gate_3_element_specific(sheet, "not_a_type")
+
+        assert ValidationPipeline().registry.index is ValidationPipeline().registry.index
+        assert gate.checks_total == 3
+        assert unknown.passed and unknown.warnings
@@ -26,7 +26,7 @@ from generators.plan_validator import PlanValidator
 from generators.review_formatter import ReviewFormatter
 from generators.planning_generator import PlanningGenerator
 from generators.risk_generator import RiskGenerator
-from generators.resource_sheet_generator import ResourceSheetGenerator
+from generators.resource_sheet_generator import ResourceSheetGenerator, BATCH_CONCURRENCY
 from generators.user_guide_generator import UserGuideGenerator  # USER-003 (WO-GENERATION-ENHANCEMENT-001)
 from constants import Paths, Files, ScanDepth, FocusArea, AuditSeverity, AuditScope, PlanningPaths
 from validation import (
@@ -59,6 +59,9 @@ from logger_config import logger
 from handler_decorators import mcp_error_handler, log_invocation
 from handler_helpers import format_success_response, generate_workorder_id, get_workorder_timestamp, add_response_timestamp
 
+# Progress streaming (no-op outside the SSE transport)
+from sse_transport import report_progress
+
 # Import .coderef/ integration helpers (WO-CODEREF-CONTEXT-MCP-INTEGRATION-001)
 from mcp_integration import (
     check_coderef_resources,
@@ -512,12 +515,18 @@ async def handle_generate_foundation_docs(arguments: dict) -> list[TextContent]:
     result += "\n" + "=" * 50 + "\n\n"
     result += "GENERATION SEQUENCE:\n\n"
 
-    # Generate each template sequentially
+    # Generate each template sequentially (streamed per document under SSE)
     for i, (template_name, description) in enumerate(templates_to_generate, 1):
-        result += f"[{i}/{len(templates_to_generate)}] Generating {template_name.upper()}...\n"
-        result += f"Tool: generate_individual_doc\n"
-        result += f"Template: {template_name}\n"
-        result += "\n"
+        step = f"[{i}/{len(templates_to_generate)}] Generating {template_name.upper()}...\n"
+        step += f"Tool: generate_individual_doc\n"
+        step += f"Template: {template_name}\n"
+        step += "\n"
+        result += step
+        report_progress(
+            i, len(templates_to_generate),
+            message=f"[{i}/{len(templates_to_generate)}] {template_name.upper()}",
+            content=step
+        )
 
     result += "=" * 50 + "\n\n"
     result += "INSTRUCTIONS:\n"
@@ -1804,6 +1813,7 @@ async def handle_audit_codebase(arguments: dict) -> list[TextContent]:
 
     # Parse standards documents
     logger.info("Parsing standards documents")
+    report_progress(1, 4, message="[1/4] Parsing standards documents")
     standards = generator.parse_standards_documents(standards_dir)
 
     if standards.get('parse_errors'):
@@ -1811,6 +1821,7 @@ async def handle_audit_codebase(arguments: dict) -> list[TextContent]:
 
     # Scan for violations
     logger.info("Scanning codebase for violations")
+    report_progress(2, 4, message="[2/4] Scanning codebase for violations")
     violations = generator.scan_for_violations(standards)
 
     # Extract files_scanned metadata
@@ -1830,6 +1841,7 @@ async def handle_audit_codebase(arguments: dict) -> list[TextContent]:
 
     # Calculate compliance score
     logger.info("Calculating compliance score")
+    report_progress(3, 4, message=f"[3/4] Calculating compliance score ({len(violations)} violations)")
     total_patterns = (
         len(standards.get('ui_patterns', {}).get('buttons', {}).get('allowed_sizes', [])) +
         len(standards.get('ui_patterns', {}).get('buttons', {}).get('allowed_variants', [])) +
@@ -1853,6 +1865,7 @@ async def handle_audit_codebase(arguments: dict) -> list[TextContent]:
 
     # Generate audit report
     logger.info("Generating audit report")
+    report_progress(4, 4, message="[4/4] Generating audit report")
     report_content = generator.generate_audit_report(violations, compliance, scan_metadata)
 
     # Save audit report
@@ -2164,6 +2177,10 @@ async def handle_generate_resource_sheet(arguments: dict) -> list[TextContent]:
         output_path = arguments.get("output_path")
         validate_against_code = arguments.get("validate_against_code", True)
 
+        # Batch mode: element_names list and/or element_filter over index.json
+        if project_path and (arguments.get("element_names") or arguments.get("element_filter")):
+            return await _generate_resource_sheet_batch(arguments)
+
         if not element_name or not project_path:
             raise ValueError("element_name and project_path are required")
 
@@ -2266,6 +2283,122 @@ async def handle_generate_resource_sheet(arguments: dict) -> list[TextContent]:
         ]
 
 
+def _filter_index_elements(elements: list[dict], element_filter: dict) -> list[str]:
+    """
+    Select element names from .coderef/index.json for batch resource sheets.
+
+    Filter keys (all optional, combined with AND):
+    - type: element type or list of types (e.g., 'component', ['class', 'function'])
+    - file_pattern: fnmatch glob on the element's file path (e.g., 'src/components/*')
+    - name_pattern: fnmatch glob on the element name (e.g., 'use*')
+    - exported_only: only elements marked exported
+    """
+    import fnmatch
+
+    types = element_filter.get("type")
+    if isinstance(types, str):
+        types = [types]
+    file_pattern = element_filter.get("file_pattern")
+    name_pattern = element_filter.get("name_pattern")
+    exported_only = element_filter.get("exported_only", False)
+
+    names = []
+    for element in elements:
+        name = element.get("name")
+        if not name:
+            continue
+        if types and element.get("type") not in types:
+            continue
+        if file_pattern and not fnmatch.fnmatch(str(element.get("file", "")).replace("\\", "/"), file_pattern):
+            continue
+        if name_pattern and not fnmatch.fnmatch(name, name_pattern):
+            continue
+        if exported_only and not element.get("exported"):
+            continue
+        names.append(name)
+    return names
+
+
+async def _generate_resource_sheet_batch(arguments: dict) -> list[TextContent]:
+    """
+    Batch branch of generate_resource_sheet.
+
+    Loads .coderef/index.json once for both element selection and complexity
+    stats, then delegates to ResourceSheetGenerator.generate_batch which shares
+    the file index and module registry across all elements.
+    """
+    project_path = arguments["project_path"]
+    element_names = list(arguments.get("element_names") or [])
+    element_filter = arguments.get("element_filter")
+
+    elements = []
+    coderef_index = Path(project_path) / ".coderef" / "index.json"
+    if coderef_index.exists():
+        try:
+            elements = json.loads(coderef_index.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.warning(f"Could not read {coderef_index}: {e}")
+
+    if element_filter:
+        if not elements:
+            raise ValueError("element_filter requires .coderef/index.json (run coderef_scan first)")
+        element_names.extend(_filter_index_elements(elements, element_filter))
+
+    if not element_names:
+        raise ValueError("Batch mode selected no elements (check element_names / element_filter)")
+
+    logger.info(f"Generating {len(element_names)} resource sheets in batch for {project_path}")
+
+    generator = ResourceSheetGenerator()
+    summary = await generator.generate_batch(
+        element_names=element_names,
+        project_path=project_path,
+        mode=arguments.get("mode", "reverse-engineer"),
+        auto_analyze=arguments.get("auto_analyze", True),
+        output_path=arguments.get("output_path"),
+        concurrency=arguments.get("concurrency", BATCH_CONCURRENCY),
+    )
+
+    # Complexity stats are project-wide, so compute once for the batch
+    complexity_stats = generator.calculate_complexity_stats(elements) if elements else None
+
+    report = {
+        "success": summary["failed"] == 0,
+        "batch": True,
+        "requested": summary["requested"],
+        "generated": summary["generated"],
+        "failed": summary["failed"],
+        "output_directory": summary["output_directory"],
+        "duration_seconds": summary["duration_seconds"],
+        "results": [
+            {
+                "element_name": r["element_name"],
+                "markdown": r["outputs"]["markdown"],
+                "modules": r["selected_modules"],
+                "auto_fill_rate": f"{r['auto_fill_rate']:.1f}%",
+            }
+            for r in summary["results"]
+        ],
+        "failures": summary["failures"],
+        "complexity_stats": complexity_stats,
+        "generated_at": summary["generated_at"],
+    }
+
+    summary_path = Path(summary["output_directory"]) / "batch-summary.json"
+    try:
+        summary_path.parent.mkdir(parents=True, exist_ok=True)
+        summary_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        report["summary_report"] = str(summary_path)
+    except OSError as e:
+        logger.warning(f"Could not write batch summary: {e}")
+
+    logger.info(
+        f"Batch resource sheets: {summary['generated']}/{summary['requested']} generated "
+        f"in {summary['duration_seconds']}s"
+    )
+    return [TextContent(type="text", text=json.dumps(report, indent=2))]
+
+
 async def handle_coderef_foundation_docs(arguments: dict) -> list[TextContent]:
     """
     Handle coderef_foundation_docs tool call.
@@ -44,13 +44,23 @@ async def list_tools() -> list[Tool]:
     return [
         Tool(
             name="use_persona",
-            description="Activate an expert persona to gain specialized knowledge and behavior. Returns the persona's system prompt and expertise.",
+            description="Activate an expert persona to gain specialized knowledge and behavior. Returns the persona's system prompt and expertise. Use 'sections' or 'max_bytes' for a smaller payload and fetch the remaining sections on demand.",
             inputSchema={
                 "type": "object",
                 "properties": {
                     "name": {
                         "type": "string",
                         "description": "Name of the persona to activate (e.g., 'mcp-expert')",
+                    },
+                    "sections": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only return these sections: 'core' (system prompt intro), a system prompt section key (its '## ' heading, slugified), or 'profile' (expertise, use cases, style). Omitted sections are listed in the response."
+                    },
+                    "max_bytes": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "description": "Byte budget: return the core prompt plus further sections in order while the payload fits. Ignored when 'sections' is given."
                     }
                 },
                 "required": ["name"]
@@ -243,7 +253,7 @@ async def handle_use_persona(arguments: dict) -> list[TextContent]:
     Activate a persona.
 
     Args:
-        arguments: {"name": "persona-name"}
+        arguments: {"name": "persona-name", "sections": [...] (optional), "max_bytes": int (optional)}
 
     Returns:
         Persona system prompt and metadata
@@ -257,44 +267,17 @@ async def handle_use_persona(arguments: dict) -> list[TextContent]:
         )]
 
     try:
-        # Activate persona
-        result = persona_manager.activate_persona(persona_name)
-        persona = result['persona']
-
-        # Build response with system prompt and metadata
-        response = f"""# Persona Activated: {persona.name}
-
-**Version:** {persona.version}
-**Description:** {persona.description}
-
----
-
-## System Prompt
-
-{persona.system_prompt}
-
----
-
-## Expertise Areas
-
-{chr(10).join(f"- {item}" for item in persona.expertise)}
-
-## Use Cases
-
-{chr(10).join(f"- {item}" for item in persona.use_cases)}
-
-## Communication Style
-
-{persona.behavior.communication_style}
-
-## Problem-Solving Approach
-
-{persona.behavior.problem_solving}
-
----
+        # Pre-rendered once per persona version; whole or section/size-budgeted.
+        # Rendered before activating so invalid sections/max_bytes change nothing.
+        persona = persona_manager.load_persona(persona_name)
+        rendered = persona_manager.get_rendered_persona(persona)
+        response = rendered.render(
+            sections=arguments.get("sections"),
+            max_bytes=arguments.get("max_bytes")
+        )
 
-✅ Persona '{persona.name}' is now active. You should adopt this persona's expertise, communication style, and problem-solving approach for all subsequent interactions.
-"""
+        # Activate persona
+        persona_manager.activate_persona(persona_name)
 
         return [TextContent(type="text", text=response)]
 
@@ -371,7 +354,8 @@ async def handle_list_personas(arguments: dict) -> list[TextContent]:
     Returns:
         List of personas with descriptions
     """
-    available_personas = persona_manager.list_available_personas()
+    # Metadata from the catalog index - no full persona loads
+    available_personas = persona_manager.list_persona_summaries()
 
     if not available_personas:
         return [TextContent(
@@ -382,19 +366,19 @@ async def handle_list_personas(arguments: dict) -> list[TextContent]:
     # Build detailed list
     response_lines = ["# Available Personas\n"]
 
-    for persona_name in available_personas:
-        try:
-            info = persona_manager.get_persona_info(persona_name)
-            response_lines.append(f"## {info['name']} (v{info['version']})")
-            response_lines.append(f"\n**Description:** {info['description']}\n")
-            response_lines.append("**Expertise:**")
-            response_lines.extend(f"- {item}" for item in info['expertise'][:5])  # Show first 5
-            if len(info['expertise']) > 5:
-                response_lines.append(f"- ... and {len(info['expertise']) - 5} more")
-            response_lines.append("")
-        except Exception as e:
-            response_lines.append(f"## {persona_name}")
-            response_lines.append(f"Error loading info: {str(e)}\n")
+    for info in available_personas:
+        if 'error' in info:
+            response_lines.append(f"## {info['file_name']}")
+            response_lines.append(f"Error loading info: {info['error']}\n")
+            continue
+
+        response_lines.append(f"## {info['name']} (v{info['version']})")
+        response_lines.append(f"\n**Description:** {info['description']}\n")
+        response_lines.append("**Expertise:**")
+        response_lines.extend(f"- {item}" for item in info['expertise'][:5])  # Show first 5
+        if info['expertise_count'] > 5:
+            response_lines.append(f"- ... and {info['expertise_count'] - 5} more")
+        response_lines.append("")
 
     response_lines.append(f"\n**Total:** {len(available_personas)} persona(s) available")
     response_lines.append("\nUse `use_persona` to activate a persona.")
@@ -1,11 +1,18 @@
 """
 Persona management - loading, activation, and state tracking.
+
+Listing is served from a catalog index (name, version, description, first
+expertise items and file signature per persona file), so list_personas never
+fully loads or validates persona definitions. Full definitions are loaded
+lazily on activation. Both the catalog and loaded definitions are checked
+against each file's mtime/size, so edited personas take effect without
+restarting the server.
 """
 
 import json
 import sys
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, List, Optional, Dict, Tuple
 from datetime import datetime
 
 # Add coderef/ utilities to path for wrapper functions
@@ -13,6 +20,20 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from coderef.utils import read_coderef_output, check_coderef_available
 
 from src.models import PersonaDefinition, PersonaState
+from src.persona_renderer import RenderedPersona
+
+
+# Persona subdirectories, in lookup order
+PERSONA_DIRS = ("base", "custom", "coderef-personas")
+
+# Expertise items kept in the catalog (list_personas shows the first 5)
+EXPERTISE_HEAD = 5
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+    """(mtime_ns, size) of a file, used to detect edits."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
 
 
 class PersonaManager:
@@ -20,14 +41,105 @@ class PersonaManager:
 
     def __init__(self, personas_dir: Path):
         """
-        Initialize persona manager.
+        Initialize persona manager and build the persona catalog.
 
         Args:
             personas_dir: Root directory containing persona JSON files
         """
         self.personas_dir = personas_dir
         self.state = PersonaState()
-        self._persona_cache: Dict[str, PersonaDefinition] = {}
+        # name -> (file, mtime_ns, size, definition)
+        self._persona_cache: Dict[str, Tuple[Path, int, int, PersonaDefinition]] = {}
+        # persona file -> catalog entry
+        self._catalog: Dict[Path, Dict[str, Any]] = {}
+        # (name, version) -> (definition it was rendered from, activation payload)
+        self._rendered_cache: Dict[Tuple[str, str], Tuple[PersonaDefinition, RenderedPersona]] = {}
+        self.refresh_catalog()
+
+    def _find_persona_file(self, name: str) -> Optional[Path]:
+        """Persona file for name, checking base/, custom/ and coderef-personas/ in order."""
+        for subdir in PERSONA_DIRS:
+            persona_file = self.personas_dir / subdir / f"{name}.json"
+            if persona_file.exists():
+                return persona_file
+        return None
+
+    def _persona_files(self) -> List[Path]:
+        """All persona JSON files, skipping backups."""
+        files = []
+        for subdir in PERSONA_DIRS:
+            directory = self.personas_dir / subdir
+            if directory.exists():
+                for file in directory.glob("*.json"):
+                    # Skip backup files
+                    if not file.stem.endswith('.old') and not file.stem.endswith('.backup'):
+                        files.append(file)
+        return files
+
+    def refresh_catalog(self) -> Dict[Path, Dict[str, Any]]:
+        """
+        Bring the catalog index up to date with the persona directories.
+
+        Only files that are new or whose mtime/size changed are read; entries
+        for deleted files are dropped.
+
+        Returns:
+            Dict mapping persona file to its catalog entry
+        """
+        catalog = {}
+        for persona_file in self._persona_files():
+            try:
+                mtime_ns, size = _file_signature(persona_file)
+            except OSError:
+                continue
+
+            entry = self._catalog.get(persona_file)
+            if entry is None or entry['mtime_ns'] != mtime_ns or entry['size'] != size:
+                entry = self._read_catalog_entry(persona_file, mtime_ns, size)
+            catalog[persona_file] = entry
+
+        self._catalog = catalog
+        return catalog
+
+    @staticmethod
+    def _read_catalog_entry(persona_file: Path, mtime_ns: int, size: int) -> Dict[str, Any]:
+        """Read the listing metadata of one persona file (without schema validation)."""
+        entry: Dict[str, Any] = {
+            'file_name': persona_file.stem,
+            'path': str(persona_file),
+            'mtime_ns': mtime_ns,
+            'size': size
+        }
+
+        try:
+            with open(persona_file, 'r', encoding='utf-8') as f:
+                persona_data = json.load(f)
+            expertise = persona_data['expertise']
+            entry.update({
+                'name': persona_data['name'],
+                'version': persona_data['version'],
+                'description': persona_data['description'],
+                'expertise': list(expertise[:EXPERTISE_HEAD]),
+                'expertise_count': len(expertise)
+            })
+        except json.JSONDecodeError as e:
+            entry['error'] = f"Invalid JSON in {persona_file}: {e}"
+        except (OSError, KeyError, TypeError) as e:
+            entry['error'] = f"Failed to read persona metadata from {persona_file}: {e!r}"
+
+        return entry
+
+    def list_persona_summaries(self) -> List[Dict[str, Any]]:
+        """
+        Listing metadata for every persona file, from the catalog index.
+
+        Returns:
+            Catalog entries sorted by file name. Each has file_name, path,
+            mtime_ns and size, plus either name, version, description,
+            expertise (first EXPERTISE_HEAD items) and expertise_count, or
+            error if the file could not be read.
+        """
+        return sorted(self.refresh_catalog().values(), key=lambda entry: entry['file_name'])
 
     def load_persona(self, name: str) -> PersonaDefinition:
         """
@@ -43,27 +155,22 @@ class PersonaManager:
             FileNotFoundError: If persona JSON file doesn't exist
             ValueError: If JSON is invalid or doesn't match schema
         """
-        # Check cache first
-        if name in self._persona_cache:
-            return self._persona_cache[name]
-
         # Check base/, custom/, and coderef-personas/ directories
-        persona_file = self.personas_dir / "base" / f"{name}.json"
-
-        # If not in base/, check custom/
-        if not persona_file.exists():
-            persona_file = self.personas_dir / "custom" / f"{name}.json"
+        persona_file = self._find_persona_file(name)
 
-        # If not in custom/, check coderef-personas/
-        if not persona_file.exists():
-            persona_file = self.personas_dir / "coderef-personas" / f"{name}.json"
-
-        if not persona_file.exists():
+        if persona_file is None:
+            self._persona_cache.pop(name, None)
             raise FileNotFoundError(
                 f"Persona '{name}' not found in base/, custom/, or coderef-personas/ directories. "
                 f"Available personas: {self.list_available_personas()}"
             )
 
+        # Check cache first (reused until the file is edited)
+        mtime_ns, size = _file_signature(persona_file)
+        cached = self._persona_cache.get(name)
+        if cached and cached[:3] == (persona_file, mtime_ns, size):
+            return cached[3]
+
         # Load and validate JSON
         try:
             with open(persona_file, 'r', encoding='utf-8') as f:
@@ -73,7 +180,7 @@ class PersonaManager:
             persona = PersonaDefinition(**persona_data)
 
             # Cache for future use
-            self._persona_cache[name] = persona
+            self._persona_cache[name] = (persona_file, mtime_ns, size, persona)
 
             return persona
 
@@ -151,6 +258,28 @@ class PersonaManager:
 
         return result
 
+    def get_rendered_persona(self, persona: PersonaDefinition) -> RenderedPersona:
+        """
+        Activation payload for a persona, rendered once per (name, version).
+
+        The cached payload is rebuilt if the persona file was edited (a new
+        definition was loaded) even when the version did not change.
+
+        Args:
+            persona: Definition returned by load_persona/activate_persona
+
+        Returns:
+            RenderedPersona
+        """
+        key = (persona.name, persona.version)
+        cached = self._rendered_cache.get(key)
+        if cached and cached[0] is persona:
+            return cached[1]
+
+        rendered = RenderedPersona(persona)
+        self._rendered_cache[key] = (persona, rendered)
+        return rendered
+
     def get_active_persona(self) -> Optional[PersonaDefinition]:
         """
         Get currently active persona.
@@ -179,33 +308,7 @@ class PersonaManager:
         Returns:
             List of persona names (e.g., ['coderef-expert', 'docs-expert', 'mcp-expert', 'research-scout'])
         """
-        personas = []
-
-        # Check base/ directory
-        base_dir = self.personas_dir / "base"
-        if base_dir.exists():
-            for file in base_dir.glob("*.json"):
-                # Skip backup files
-                if not file.stem.endswith('.old') and not file.stem.endswith('.backup'):
-                    personas.append(file.stem)
-
-        # Check custom/ directory
-        custom_dir = self.personas_dir / "custom"
-        if custom_dir.exists():
-            for file in custom_dir.glob("*.json"):
-                # Skip backup files
-                if not file.stem.endswith('.old') and not file.stem.endswith('.backup'):
-                    personas.append(file.stem)
-
-        # Check coderef-personas/ directory
-        coderef_dir = self.personas_dir / "coderef-personas"
-        if coderef_dir.exists():
-            for file in coderef_dir.glob("*.json"):
-                # Skip backup files
-                if not file.stem.endswith('.old') and not file.stem.endswith('.backup'):
-                    personas.append(file.stem)
-
-        return sorted(personas)
+        return sorted(file.stem for file in self._persona_files())
 
     def get_persona_info(self, name: str) -> Dict:
         """
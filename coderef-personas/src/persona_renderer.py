@@ -0,0 +1,210 @@
+"""
+Activation payload rendering for use_persona.
+
+A persona is rendered once into its activation parts: a header, the system
+prompt split into sections at its top-level "## " headings (the text before
+the first heading is the "core" section), and a "profile" section with
+expertise, use cases, communication style and problem-solving approach.
+
+The full payload is the markdown use_persona has always returned. Partial
+payloads select sections by key, or fill a byte budget in document order,
+and list what was left out so agents can fetch it on demand.
+"""
+
+import re
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .models import PersonaDefinition
+
+
+CORE_SECTION = "core"
+PROFILE_SECTION = "profile"
+
+SECTION_SEPARATOR = "\n\n---\n\n"
+
+# Section keys are slugs of their headings, cut to this many characters
+MAX_KEY_LENGTH = 60
+
+# Line breaks: newlines, and the literal "\n" escapes some persona files
+# store their whole prompt with
+_LINE_BREAK = re.compile(r"\n|\\n")
+
+
+def _byte_size(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def _slugify(title: str) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+    return slug[:MAX_KEY_LENGTH].rstrip("-") or "section"
+
+
+def _lines(text: str) -> Iterator[Tuple[str, str]]:
+    """Yield (line with its line break, line content) pairs covering text."""
+    start = 0
+    for match in _LINE_BREAK.finditer(text):
+        yield text[start:match.end()], text[start:match.start()]
+        start = match.end()
+    if start < len(text):
+        yield text[start:], text[start:]
+
+
+def split_prompt_sections(system_prompt: str) -> List[Dict[str, str]]:
+    """
+    Split a system prompt at its top-level "## " headings.
+
+    Headings inside ``` code fences are ignored. Literal "\\n" escapes
+    count as line breaks, so prompts stored with escaped newlines split
+    too. Joining the returned texts gives back the original prompt exactly.
+
+    Args:
+        system_prompt: Persona system prompt (markdown)
+
+    Returns:
+        List of {key, title, text}; the first is the "core" section (text
+        before the first heading, possibly empty)
+    """
+    sections = [{"key": CORE_SECTION, "title": "Core", "lines": []}]
+    seen_keys = {CORE_SECTION, PROFILE_SECTION}
+    in_fence = False
+
+    for line, content in _lines(system_prompt):
+        if content.lstrip().startswith("```"):
+            in_fence = not in_fence
+        elif not in_fence and content.startswith("## "):
+            title = content[3:].strip()
+            key = base_key = _slugify(title)
+            suffix = 2
+            while key in seen_keys:
+                key = f"{base_key}-{suffix}"
+                suffix += 1
+            seen_keys.add(key)
+            sections.append({"key": key, "title": title, "lines": []})
+        sections[-1]["lines"].append(line)
+
+    return [
+        {"key": section["key"], "title": section["title"], "text": "".join(section["lines"])}
+        for section in sections
+    ]
+
+
+class RenderedPersona:
+    """Pre-rendered activation payload of one persona definition."""
+
+    def __init__(self, persona: PersonaDefinition):
+        """
+        Render a persona into its activation parts.
+
+        Args:
+            persona: Validated persona definition
+        """
+        self.name = persona.name
+        self.version = persona.version
+
+        self.header = f"""# Persona Activated: {persona.name}
+
+**Version:** {persona.version}
+**Description:** {persona.description}"""
+
+        self.prompt_sections = split_prompt_sections(persona.system_prompt)
+
+        self.profile = f"""## Expertise Areas
+
+{chr(10).join(f"- {item}" for item in persona.expertise)}
+
+## Use Cases
+
+{chr(10).join(f"- {item}" for item in persona.use_cases)}
+
+## Communication Style
+
+{persona.behavior.communication_style}
+
+## Problem-Solving Approach
+
+{persona.behavior.problem_solving}"""
+
+        self.activated = (
+            f"✅ Persona '{persona.name}' is now active. You should adopt this persona's expertise, "
+            f"communication style, and problem-solving approach for all subsequent interactions.\n"
+        )
+
+        self.full = (
+            self.header + SECTION_SEPARATOR + "## System Prompt\n\n" + persona.system_prompt +
+            SECTION_SEPARATOR + self.profile + SECTION_SEPARATOR + self.activated
+        )
+
+        self.section_sizes: Dict[str, int] = {
+            section["key"]: _byte_size(section["text"]) for section in self.prompt_sections
+        }
+        self.section_sizes[PROFILE_SECTION] = _byte_size(self.profile)
+
+    @property
+    def section_keys(self) -> List[str]:
+        """All selectable section keys, in document order."""
+        return list(self.section_sizes)
+
+    def render(self, sections: Optional[Sequence[str]] = None, max_bytes: Optional[int] = None) -> str:
+        """
+        Activation payload, whole or partial.
+
+        Args:
+            sections: Section keys to include (see section_keys)
+            max_bytes: Byte budget when sections is not given: the core
+                section is always included, then each further section (in
+                document order) that still fits within the budget
+
+        Returns:
+            Markdown payload; partial payloads end with a list of the omitted
+            sections and their sizes
+
+        Raises:
+            ValueError: If a section key is unknown or max_bytes is not positive
+        """
+        if sections is None and max_bytes is None:
+            return self.full
+
+        if sections is not None:
+            unknown = [key for key in sections if key not in self.section_sizes]
+            if unknown:
+                raise ValueError(
+                    f"Unknown section(s) for persona '{self.name}': {', '.join(unknown)}. "
+                    f"Available sections: {', '.join(self.section_keys)}"
+                )
+            selected = [key for key in self.section_keys if key in sections]
+        else:
+            if max_bytes <= 0:
+                raise ValueError("max_bytes must be a positive integer")
+            selected = self._fill_budget(max_bytes)
+
+        return self._assemble(selected)
+
+    def _fill_budget(self, max_bytes: int) -> List[str]:
+        selected = [CORE_SECTION]
+        for key in self.section_keys[1:]:
+            candidate = selected + [key]
+            if _byte_size(self._assemble(candidate)) <= max_bytes:
+                selected = candidate
+        return selected
+
+    def _assemble(self, selected: List[str]) -> str:
+        parts = [self.header]
+
+        prompt_text = "".join(
+            section["text"] for section in self.prompt_sections if section["key"] in selected
+        ).strip()
+        if prompt_text:
+            parts.append("## System Prompt\n\n" + prompt_text)
+
+        if PROFILE_SECTION in selected:
+            parts.append(self.profile)
+
+        omitted = [key for key in self.section_keys if key not in selected]
+        if omitted:
+            lines = ["## More Sections Available", ""]
+            lines.extend(f"- `{key}` ({self.section_sizes[key]} bytes)" for key in omitted)
+            lines.append("")
+            lines.append(f"Fetch them with `use_persona` (name: '{self.name}', sections: [...]).")
+            parts.append("\n".join(lines))
+
+        return SECTION_SEPARATOR.join(parts) + SECTION_SEPARATOR + self.activated
@@ -0,0 +1,105 @@
+"""
+Unit tests for PersonaManager's catalog index and cache invalidation.
+"""
+
+import json
+import os
+import pytest
+from unittest.mock import patch
+
+from src import persona_manager as persona_manager_module
+from src.persona_manager import PersonaManager
+
+
+def _persona(name, expertise_count=3, **overrides):
+    data = {
+        "name": name,
+        "version": "1.0.0",
+        "description": f"{name} description",
+        "system_prompt": "You are a helpful expert. " * 100,
+        "expertise": [f"Expertise {i}" for i in range(expertise_count)],
+        "use_cases": ["Use case 1"],
+        "behavior": {
+            "communication_style": "Clear",
+            "problem_solving": "Systematic",
+            "tool_usage": "Standard tools"
+        },
+        "created_at": "2026-01-01",
+        "updated_at": "2026-01-01"
+    }
+    data.update(overrides)
+    return data
+
+
+def _write(path, data, bump_ns=0):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+    if bump_ns:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump_ns))
+
+
+@pytest.fixture
+def personas_dir(tmp_path):
+    _write(tmp_path / "base" / "alpha.json", _persona("alpha", expertise_count=7))
+    _write(tmp_path / "custom" / "beta.json", _persona("beta"))
+    _write(tmp_path / "custom" / "beta.old.json", _persona("beta"))
+    (tmp_path / "coderef-personas").mkdir()
+    (tmp_path / "coderef-personas" / "broken.json").write_text("{not json", encoding="utf-8")
+    return tmp_path
+
+
+def test_summaries_come_from_catalog(personas_dir):
+    """Listing reads metadata only - no persona is validated."""
+    manager = PersonaManager(personas_dir)
+
+    with patch.object(persona_manager_module, "PersonaDefinition") as definition:
+        summaries = manager.list_persona_summaries()
+        assert definition.call_count == 0
+
+    assert [s["file_name"] for s in summaries] == ["alpha", "beta", "broken"]
+    alpha = summaries[0]
+    assert alpha["version"] == "1.0.0"
+    assert alpha["expertise"] == [f"Expertise {i}" for i in range(5)]
+    assert alpha["expertise_count"] == 7
+    assert "system_prompt" not in alpha
+    assert "Invalid JSON" in summaries[2]["error"]
+    assert manager.list_available_personas() == ["alpha", "beta", "broken"]
+
+
+def test_unchanged_files_are_not_reread(personas_dir):
+    manager = PersonaManager(personas_dir)
+
+    with patch.object(PersonaManager, "_read_catalog_entry") as read:
+        manager.list_persona_summaries()
+        assert read.call_count == 0
+
+
+def test_edited_persona_takes_effect(personas_dir):
+    """Both the catalog and loaded definitions reload when a file changes."""
+    manager = PersonaManager(personas_dir)
+    assert manager.load_persona("alpha").version == "1.0.0"
+
+    _write(personas_dir / "base" / "alpha.json", _persona("alpha", version="2.0.0"), bump_ns=1_000_000)
+
+    assert manager.load_persona("alpha").version == "2.0.0"
+    assert manager.list_persona_summaries()[0]["version"] == "2.0.0"
+
+
+def test_loaded_persona_is_cached(personas_dir):
+    manager = PersonaManager(personas_dir)
+    persona = manager.load_persona("beta")
+
+    assert manager.load_persona("beta") is persona
+
+
+def test_added_and_removed_personas(personas_dir):
+    manager = PersonaManager(personas_dir)
+    manager.load_persona("beta")
+
+    (personas_dir / "custom" / "beta.json").unlink()
+    _write(personas_dir / "custom" / "gamma.json", _persona("gamma"))
+
+    assert [s["file_name"] for s in manager.list_persona_summaries()] == ["alpha", "broken", "gamma"]
+    with pytest.raises(FileNotFoundError):
+        manager.load_persona("beta")
@@ -0,0 +1,136 @@
+"""
+Unit tests for pre-rendered persona activation payloads.
+"""
+
+import pytest
+
+from src.models import PersonaBehavior, PersonaDefinition
+from src.persona_manager import PersonaManager
+from src.persona_renderer import MAX_KEY_LENGTH, RenderedPersona, split_prompt_sections
+
+
+SYSTEM_PROMPT = """# Tester
+
+You are a testing expert.
+
+## Identity
+
+You write tests.
+
+```bash
+## not a heading
+pytest -q
+```
+
+## Identity
+
+Second section with a duplicate heading.
+
+## Remember
+
+Keep tests fast.
+"""
+
+
+@pytest.fixture
+def persona():
+    return PersonaDefinition(
+        name="tester",
+        version="1.0.0",
+        description="Testing expert",
+        system_prompt=SYSTEM_PROMPT,
+        expertise=["Unit tests", "Fixtures"],
+        use_cases=["Write tests"],
+        behavior=PersonaBehavior(
+            communication_style="Direct",
+            problem_solving="Test first",
+            tool_usage="pytest"
+        ),
+        created_at="2026-01-01",
+        updated_at="2026-01-01"
+    )
+
+
+def test_split_prompt_sections():
+    sections = split_prompt_sections(SYSTEM_PROMPT)
+
+    assert [s["key"] for s in sections] == ["core", "identity", "identity-2", "remember"]
+    assert "## not a heading" in sections[1]["text"]
+    assert "".join(s["text"] for s in sections) == SYSTEM_PROMPT
+
+
+def test_full_payload(persona):
+    rendered = RenderedPersona(persona)
+
+    assert rendered.render() == rendered.full
+    assert rendered.full.startswith("# Persona Activated: tester\n\n**Version:** 1.0.0")
+    assert SYSTEM_PROMPT in rendered.full
+    assert "## Expertise Areas\n\n- Unit tests\n- Fixtures" in rendered.full
+    assert rendered.full.endswith("for all subsequent interactions.\n")
+
+
+def test_selected_sections(persona):
+    rendered = RenderedPersona(persona)
+
+    payload = rendered.render(sections=["core"])
+    assert "You are a testing expert." in payload
+    assert "You write tests." not in payload
+    assert "## Expertise Areas" not in payload
+    assert "- `identity`" in payload
+    assert "- `profile`" in payload
+
+    payload = rendered.render(sections=["profile", "remember"])
+    assert "Keep tests fast." in payload
+    assert "## Expertise Areas" in payload
+    assert "You are a testing expert." not in payload
+
+    with pytest.raises(ValueError, match="Available sections: core, identity"):
+        rendered.render(sections=["missing"])
+
+
+def test_byte_budget(persona):
+    rendered = RenderedPersona(persona)
+    core_only = rendered.render(sections=["core"])
+
+    budget = len(core_only.encode("utf-8")) + 20
+    payload = rendered.render(max_bytes=budget)
+    assert len(payload.encode("utf-8")) <= budget
+    assert "You are a testing expert." in payload
+
+    # The core prompt is always included
+    assert rendered.render(max_bytes=1) == core_only
+
+    with pytest.raises(ValueError):
+        rendered.render(max_bytes=0)
+
+
+def test_rendered_once_per_definition(tmp_path, persona):
+    manager = PersonaManager(tmp_path)
+
+    rendered = manager.get_rendered_persona(persona)
+    assert manager.get_rendered_persona(persona) is rendered
+
+    edited = persona.model_copy(update={"description": "Edited"})
+    assert manager.get_rendered_persona(edited) is not rendered
+
+
+def test_long_headings_get_capped_keys():
+    title = "Very long heading " * 10
+    prompt = f"Core.\n\n## {title}\n\nOne.\n\n## {title}\n\nTwo.\n"
+
+    keys = [s["key"] for s in split_prompt_sections(prompt)]
+
+    assert len(keys[1]) <= MAX_KEY_LENGTH
+    assert not keys[1].endswith("-")
+    assert keys[2] == keys[1] + "-2"
+
+
+def test_split_literal_line_breaks():
+    """Prompts stored with escaped newlines split like real ones."""
+    prompt = "You are a tester.\\n\\n## Identity\\n\\nYou write tests.\\n\\n## Remember\\n\\nKeep tests fast."
+
+    sections = split_prompt_sections(prompt)
+
+    assert [s["key"] for s in sections] == ["core", "identity", "remember"]
+    assert sections[0]["text"] == "You are a tester.\\n\\n"
+    assert "".join(s["text"] for s in sections) == prompt
@@ -193,6 +193,7 @@ class PlanningPaths:
     PLANS_DIR = Path('plans')
     REVIEWS_DIR = Path('coderef') / 'planning-reviews'
     WORKING_DIR = Path('coderef') / 'workorder'  # Working directory for active features (WO-WORKFLOW-PATH-001)
+    BASELINES_DIR = Path('coderef') / 'baselines'  # Content-addressed .coderef/index.json baseline snapshots
 
 
 class ValidationSeverity(Enum):
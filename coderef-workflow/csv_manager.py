@@ -4,18 +4,26 @@ CSV Manager - Automated CSV Maintenance Utilities
 Provides functions for coderef-workflow tools to automatically update
 tools-and-commands.csv when creating/modifying resources.
 
+Storage: entries live in an embedded SQLite store next to the CSV
+(tools-and-commands.db, WAL mode) keyed by (Server, Name). Lookups use the
+key index instead of scanning the CSV, and every write runs in a SQLite
+write transaction, which serializes all MCP server processes sharing the
+file. The CSV is exported from the store (atomically, after each write by
+default, or on demand via export_csv()) so existing readers keep working.
+If the CSV is edited outside these functions, the store re-imports it on
+next access.
+
 Part of WO-CSV-ECOSYSTEM-SYNC-001 Phase 3 Task 2.
 """
 
 import csv
 import os
+import shutil
+import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, List
-import threading
-
-# Thread lock for CSV file access
-_csv_lock = threading.Lock()
+from typing import Optional, Dict, Iterator, List
 
 # CSV path - global single source of truth
 CSV_PATH = Path(r"C:\Users\willh\Desktop\coderef-dashboard\packages\dashboard\src\app\resources\coderef\tools-and-commands.csv")
@@ -23,6 +31,25 @@ CSV_PATH = Path(r"C:\Users\willh\Desktop\coderef-dashboard\packages\dashboard\sr
 # CSV field names
 CSV_FIELDS = ['Type', 'Server', 'Category', 'Name', 'Description', 'Status', 'Path', 'Created', 'LastUpdated']
 
+# Re-export the CSV after every write (disable to batch exports via export_csv())
+CSV_AUTO_EXPORT = os.getenv("CODEREF_CSV_AUTO_EXPORT", "true").lower() == "true"
+
+# Seconds to wait for another process's write transaction
+STORE_TIMEOUT = 30.0
+
+_COLUMNS = ', '.join(f'"{field}"' for field in CSV_FIELDS)
+_PLACEHOLDERS = ', '.join('?' for _ in CSV_FIELDS)
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS resources (
+    id INTEGER PRIMARY KEY,
+    {', '.join(f'"{field}" TEXT NOT NULL DEFAULT ' + "''" for field in CSV_FIELDS)},
+    UNIQUE ("Server", "Name")
+);
+CREATE INDEX IF NOT EXISTS resources_name ON resources ("Name");
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
 
 def get_csv_path() -> Path:
     """Get CSV file path, verify it exists."""
@@ -31,28 +58,164 @@ def get_csv_path() -> Path:
     return CSV_PATH
 
 
-def read_csv() -> List[Dict[str, str]]:
-    """Read CSV file and return list of dictionaries."""
-    csv_path = get_csv_path()
+def get_store_path() -> Path:
+    """SQLite store backing the CSV (same directory and stem)."""
+    return get_csv_path().with_suffix('.db')
+
+
+# ============================================================================
+# STORE
+# ============================================================================
+
+def _row_to_entry(row: sqlite3.Row) -> Dict[str, str]:
+    return {field: row[field] for field in CSV_FIELDS}
+
+
+def _entry_values(entry: Dict[str, str]) -> List[str]:
+    return [entry.get(field) or '' for field in CSV_FIELDS]
+
+
+def _csv_signature(csv_path: Path) -> str:
+    stat = csv_path.stat()
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _get_meta(conn: sqlite3.Connection, key: str) -> Optional[str]:
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row['value'] if row else None
+
+
+def _set_meta(conn: sqlite3.Connection, key: str, value: str) -> None:
+    conn.execute(
+        "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+        (key, value)
+    )
+
+
+def _import_csv(conn: sqlite3.Connection, csv_path: Path) -> None:
+    """Replace store contents with the CSV (first entry wins for duplicate keys)."""
     with open(csv_path, 'r', encoding='utf-8', newline='') as f:
-        reader = csv.DictReader(f)
-        return list(reader)
+        entries = list(csv.DictReader(f))
 
+    conn.execute("DELETE FROM resources")
+    conn.executemany(
+        f"INSERT OR IGNORE INTO resources ({_COLUMNS}) VALUES ({_PLACEHOLDERS})",
+        [_entry_values(entry) for entry in entries]
+    )
+    _set_meta(conn, 'csv_signature', _csv_signature(csv_path))
 
-def write_csv(entries: List[Dict[str, str]]) -> None:
-    """Write entries to CSV file."""
-    csv_path = get_csv_path()
 
+def _write_rows(conn: sqlite3.Connection, path: Path) -> None:
+    """Write store contents (in insertion order) as CSV to path."""
+    rows = conn.execute(f"SELECT {_COLUMNS} FROM resources ORDER BY id").fetchall()
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(_row_to_entry(row) for row in rows)
+
+
+def _export_csv(conn: sqlite3.Connection, csv_path: Path) -> None:
+    """Write store contents to the CSV atomically, keeping a backup of the previous file."""
     # Backup existing CSV before writing
     backup_path = csv_path.parent / f"{csv_path.stem}.backup{csv_path.suffix}"
     if csv_path.exists():
-        import shutil
         shutil.copy2(csv_path, backup_path)
 
-    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
-        writer.writeheader()
-        writer.writerows(entries)
+    temp_path = csv_path.with_name(f".{csv_path.name}.tmp")
+    _write_rows(conn, temp_path)
+    os.replace(temp_path, csv_path)
+
+    _set_meta(conn, 'csv_signature', _csv_signature(csv_path))
+
+
+@contextmanager
+def _store(write: bool = False) -> Iterator[sqlite3.Connection]:
+    """
+    Open the store, importing the CSV first if it changed out-of-band.
+
+    With write=True the block runs in a write transaction (one writer across
+    all processes) and the CSV is re-exported on success when CSV_AUTO_EXPORT
+    is set.
+
+    Raises:
+        FileNotFoundError: If CSV not found
+    """
+    csv_path = get_csv_path()
+    conn = sqlite3.connect(str(get_store_path()), timeout=STORE_TIMEOUT, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+
+        if write or _get_meta(conn, 'csv_signature') != _csv_signature(csv_path):
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Re-check under the write lock: another process may have imported already
+                if _get_meta(conn, 'csv_signature') != _csv_signature(csv_path):
+                    _import_csv(conn, csv_path)
+                if write:
+                    yield conn
+                    if CSV_AUTO_EXPORT:
+                        _export_csv(conn, csv_path)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            if write:
+                return
+
+        yield conn
+    finally:
+        conn.close()
+
+
+def export_csv(path: Optional[Path] = None) -> Path:
+    """
+    Export the store to CSV on demand.
+
+    Needed after writes when CSV_AUTO_EXPORT is disabled. While exports are
+    deferred, hand edits to the CSV are re-imported over unexported writes.
+
+    Args:
+        path: Destination (default: CSV_PATH)
+
+    Returns:
+        Path written
+    """
+    with _store() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if path is None or Path(path) == CSV_PATH:
+                _export_csv(conn, CSV_PATH)
+                path = CSV_PATH
+            else:
+                _write_rows(conn, Path(path))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+    return Path(path)
+
+
+# ============================================================================
+# PUBLIC API
+# ============================================================================
+
+def read_csv() -> List[Dict[str, str]]:
+    """Read all entries (in CSV order) and return list of dictionaries."""
+    with _store() as conn:
+        rows = conn.execute(f"SELECT {_COLUMNS} FROM resources ORDER BY id").fetchall()
+    return [_row_to_entry(row) for row in rows]
+
+
+def write_csv(entries: List[Dict[str, str]]) -> None:
+    """Replace all entries (store and CSV)."""
+    with _store(write=True) as conn:
+        conn.execute("DELETE FROM resources")
+        conn.executemany(
+            f"INSERT OR IGNORE INTO resources ({_COLUMNS}) VALUES ({_PLACEHOLDERS})",
+            [_entry_values(entry) for entry in entries]
+        )
 
 
 def add_csv_entry(
@@ -111,20 +274,12 @@ def add_csv_entry(
         'LastUpdated': last_updated
     }
 
-    # Thread-safe CSV append
-    with _csv_lock:
-        # Check if entry already exists (prevent duplicates)
-        if check_csv_exists(name, server):
-            raise ValueError(f"Entry already exists: {name} (Server: {server})")
-
-        # Read existing entries
-        entries = read_csv()
-
-        # Append new entry
-        entries.append(entry)
-
-        # Write back to CSV
-        write_csv(entries)
+    # (Server, Name) is unique in the store - duplicates are rejected atomically
+    try:
+        with _store(write=True) as conn:
+            conn.execute(f"INSERT INTO resources ({_COLUMNS}) VALUES ({_PLACEHOLDERS})", _entry_values(entry))
+    except sqlite3.IntegrityError:
+        raise ValueError(f"Entry already exists: {name} (Server: {server})")
 
     return entry
 
@@ -145,27 +300,18 @@ def update_csv_status(resource_name: str, new_status: str, server: Optional[str]
         FileNotFoundError: If CSV not found
         ValueError: If no matching entries found
     """
-    # Thread-safe CSV update
-    with _csv_lock:
-        entries = read_csv()
-
-        updated_count = 0
-        now = datetime.now().isoformat()
-
-        for entry in entries:
-            # Match by name and optionally server
-            if entry['Name'] == resource_name:
-                if server is None or entry['Server'] == server:
-                    entry['Status'] = new_status
-                    entry['LastUpdated'] = now
-                    updated_count += 1
-
+    now = datetime.now().isoformat()
+    query = 'UPDATE resources SET "Status" = ?, "LastUpdated" = ? WHERE "Name" = ?'
+    params = [new_status, now, resource_name]
+    if server is not None:
+        query += ' AND "Server" = ?'
+        params.append(server)
+
+    with _store(write=True) as conn:
+        updated_count = conn.execute(query, params).rowcount
         if updated_count == 0:
             raise ValueError(f"No matching entries found for: {resource_name}")
 
-        # Write updated entries back
-        write_csv(entries)
-
     return updated_count
 
 
@@ -187,32 +333,29 @@ def update_csv_entry(
 
     Raises:
         FileNotFoundError: If CSV not found
-        ValueError: If resource not found
+        ValueError: If resource not found, or the update would duplicate another entry
     """
-    # Thread-safe CSV update
-    with _csv_lock:
-        entries = read_csv()
-
-        updated_entry = None
-        now = datetime.now().isoformat()
-
-        for entry in entries:
-            if entry['Name'] == resource_name and entry['Server'] == server:
-                # Update specified fields
-                for field, value in updates.items():
-                    if field in CSV_FIELDS:
-                        entry[field] = value
-
-                # Always update LastUpdated
-                entry['LastUpdated'] = now
-                updated_entry = entry
-                break
-
-        if updated_entry is None:
+    changes = {field: value for field, value in updates.items() if field in CSV_FIELDS}
+    # Always update LastUpdated
+    changes['LastUpdated'] = datetime.now().isoformat()
+
+    assignments = ', '.join(f'"{field}" = ?' for field in changes)
+
+    with _store(write=True) as conn:
+        row = conn.execute(
+            'SELECT id FROM resources WHERE "Name" = ? AND "Server" = ?', (resource_name, server)
+        ).fetchone()
+        if row is None:
             raise ValueError(f"Resource not found: {resource_name} (Server: {server})")
 
-        # Write updated entries back
-        write_csv(entries)
+        try:
+            conn.execute(f"UPDATE resources SET {assignments} WHERE id = ?", [*changes.values(), row['id']])
+        except sqlite3.IntegrityError:
+            name = changes.get('Name', resource_name)
+            raise ValueError(f"Entry already exists: {name} (Server: {changes.get('Server', server)})")
+        updated_entry = _row_to_entry(
+            conn.execute(f"SELECT {_COLUMNS} FROM resources WHERE id = ?", (row['id'],)).fetchone()
+        )
 
     return updated_entry
 
@@ -228,17 +371,7 @@ def check_csv_exists(resource_name: str, server: Optional[str] = None) -> bool:
     Returns:
         True if resource exists, False otherwise
     """
-    try:
-        entries = read_csv()
-
-        for entry in entries:
-            if entry['Name'] == resource_name:
-                if server is None or entry['Server'] == server:
-                    return True
-
-        return False
-    except FileNotFoundError:
-        return False
+    return find_csv_entry(resource_name, server) is not None
 
 
 def find_csv_entry(resource_name: str, server: Optional[str] = None) -> Optional[Dict[str, str]]:
@@ -252,18 +385,39 @@ def find_csv_entry(resource_name: str, server: Optional[str] = None) -> Optional
     Returns:
         Entry dictionary if found, None otherwise
     """
-    try:
-        entries = read_csv()
-
-        for entry in entries:
-            if entry['Name'] == resource_name:
-                if server is None or entry['Server'] == server:
-                    return entry
+    query = f'SELECT {_COLUMNS} FROM resources WHERE "Name" = ?'
+    params = [resource_name]
+    if server is not None:
+        query += ' AND "Server" = ?'
+        params.append(server)
 
-        return None
+    try:
+        with _store() as conn:
+            row = conn.execute(query + " ORDER BY id LIMIT 1", params).fetchone()
     except FileNotFoundError:
         return None
 
+    return _row_to_entry(row) if row else None
+
+
+def _normalize_new_entry(new_entry: Dict[str, str], now: str) -> Dict[str, str]:
+    """Validate required fields and fill in defaults for a bulk entry."""
+    required = ['Type', 'Server', 'Category', 'Name', 'Description']
+    if not all(field in new_entry for field in required):
+        raise ValueError(f"Missing required fields in entry: {new_entry.get('Name', 'unknown')}")
+
+    return {
+        'Type': new_entry['Type'],
+        'Server': new_entry['Server'],
+        'Category': new_entry['Category'],
+        'Name': new_entry['Name'],
+        'Description': new_entry['Description'],
+        'Status': new_entry.get('Status', 'active'),
+        'Path': new_entry.get('Path', ''),
+        'Created': new_entry.get('Created', now),
+        'LastUpdated': new_entry.get('LastUpdated', now)
+    }
+
 
 def bulk_add_csv_entries(entries_list: List[Dict[str, str]]) -> int:
     """
@@ -279,46 +433,50 @@ def bulk_add_csv_entries(entries_list: List[Dict[str, str]]) -> int:
         FileNotFoundError: If CSV not found
         ValueError: If any entry is invalid or duplicate
     """
-    # Thread-safe bulk add
-    with _csv_lock:
-        existing_entries = read_csv()
-
-        # Validate all new entries first
-        now = datetime.now().isoformat()
-        validated_entries = []
-
-        for new_entry in entries_list:
-            # Validate required fields
-            required = ['Type', 'Server', 'Category', 'Name', 'Description']
-            if not all(field in new_entry for field in required):
-                raise ValueError(f"Missing required fields in entry: {new_entry.get('Name', 'unknown')}")
-
-            # Check for duplicates
-            name = new_entry['Name']
-            server = new_entry['Server']
-            if any(e['Name'] == name and e['Server'] == server for e in existing_entries):
-                raise ValueError(f"Duplicate entry: {name} (Server: {server})")
-
-            # Fill in defaults
-            entry = {
-                'Type': new_entry['Type'],
-                'Server': new_entry['Server'],
-                'Category': new_entry['Category'],
-                'Name': new_entry['Name'],
-                'Description': new_entry['Description'],
-                'Status': new_entry.get('Status', 'active'),
-                'Path': new_entry.get('Path', ''),
-                'Created': new_entry.get('Created', now),
-                'LastUpdated': new_entry.get('LastUpdated', now)
-            }
-
-            validated_entries.append(entry)
-
-        # Add all validated entries
-        existing_entries.extend(validated_entries)
-
-        # Write back to CSV
-        write_csv(existing_entries)
+    # Validate all new entries first
+    now = datetime.now().isoformat()
+    validated_entries = [_normalize_new_entry(new_entry, now) for new_entry in entries_list]
+
+    with _store(write=True) as conn:
+        for entry in validated_entries:
+            try:
+                conn.execute(f"INSERT INTO resources ({_COLUMNS}) VALUES ({_PLACEHOLDERS})", _entry_values(entry))
+            except sqlite3.IntegrityError:
+                # Rolls back the whole batch
+                raise ValueError(f"Duplicate entry: {entry['Name']} (Server: {entry['Server']})")
+
+    return len(validated_entries)
+
+
+def bulk_upsert_csv_entries(entries_list: List[Dict[str, str]]) -> int:
+    """
+    Insert or update multiple entries keyed by (Server, Name) in one transaction.
+
+    Existing entries keep their position and Created timestamp; all other
+    fields are replaced.
+
+    Args:
+        entries_list: List of entry dictionaries (each with required fields)
+
+    Returns:
+        Number of entries written
+
+    Raises:
+        FileNotFoundError: If CSV not found
+        ValueError: If any entry is missing required fields
+    """
+    now = datetime.now().isoformat()
+    validated_entries = [_normalize_new_entry(new_entry, now) for new_entry in entries_list]
+
+    updated_fields = [field for field in CSV_FIELDS if field not in ('Server', 'Name', 'Created')]
+    assignments = ', '.join(f'"{field}" = excluded."{field}"' for field in updated_fields)
+
+    with _store(write=True) as conn:
+        conn.executemany(
+            f'INSERT INTO resources ({_COLUMNS}) VALUES ({_PLACEHOLDERS}) '
+            f'ON CONFLICT("Server", "Name") DO UPDATE SET {assignments}',
+            [_entry_values(entry) for entry in validated_entries]
+        )
 
     return len(validated_entries)
 
@@ -330,31 +488,19 @@ def get_csv_stats() -> Dict[str, int]:
     Returns:
         Dictionary with counts by type, server, status
     """
-    entries = read_csv()
-
     stats = {
-        'total': len(entries),
+        'total': 0,
         'by_type': {},
         'by_server': {},
         'by_status': {},
         'by_category': {}
     }
 
-    for entry in entries:
-        # Count by type
-        type_val = entry.get('Type', 'Unknown')
-        stats['by_type'][type_val] = stats['by_type'].get(type_val, 0) + 1
-
-        # Count by server
-        server_val = entry.get('Server', 'Unknown')
-        stats['by_server'][server_val] = stats['by_server'].get(server_val, 0) + 1
-
-        # Count by status
-        status_val = entry.get('Status', 'Unknown')
-        stats['by_status'][status_val] = stats['by_status'].get(status_val, 0) + 1
-
-        # Count by category
-        category_val = entry.get('Category', 'Unknown')
-        stats['by_category'][category_val] = stats['by_category'].get(category_val, 0) + 1
+    with _store() as conn:
+        stats['total'] = conn.execute("SELECT COUNT(*) FROM resources").fetchone()[0]
+        for key, field in (('by_type', 'Type'), ('by_server', 'Server'),
+                           ('by_status', 'Status'), ('by_category', 'Category')):
+            for row in conn.execute(f'SELECT "{field}", COUNT(*) FROM resources GROUP BY "{field}" ORDER BY MIN(id)'):
+                stats[key][row[0]] = row[1]
 
     return stats
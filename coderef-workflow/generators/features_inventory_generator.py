@@ -1,15 +1,38 @@
-"""Features inventory generator for scanning and cataloging project features."""
+"""
+Features inventory generator for scanning and cataloging project features.
+
+Per-feature info is cached in coderef/.features-inventory-cache.json, keyed by
+feature folder and the mtime/size of the files it is built from (plan.json,
+context.json, DELIVERABLES.md, communication.json). Each inventory run only
+stats those files; features that are new or changed are re-read, in parallel
+when there are several (e.g. on a cold cache).
+"""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import sys
 
+# Add coderef/ utilities to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from coderef.utils import FileSignatureCache, IO_WORKERS, file_signature
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from constants import Paths
 from logger_config import logger, log_error
+from utils.json_store import write_json_atomic
+
+
+CACHE_VERSION = 1
+
+# Files a feature's inventory entry is derived from (their mtimes/sizes key the cache)
+FEATURE_FILES = ('plan.json', 'context.json', 'DELIVERABLES.md', 'communication.json')
+
+# In-memory copy of each cache file: cache path -> entries
+_inventory_cache = FileSignatureCache()
 
 
 class FeaturesInventoryGenerator:
@@ -25,6 +48,92 @@ class FeaturesInventoryGenerator:
         self.project_path = project_path
         self.working_dir = project_path / "coderef" / "workorder"
         self.archived_dir = project_path / "coderef" / "archived"
+        self.cache_file = project_path / "coderef" / ".features-inventory-cache.json"
+
+    @staticmethod
+    def _read_cache(cache_file: Path) -> Dict[str, Any]:
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            log_error('inventory_cache_read_error', str(e), path=str(cache_file))
+            return {}
+
+        return data.get('features', {}) if isinstance(data, dict) and data.get('version') == CACHE_VERSION else {}
+
+    def _load_cache(self) -> Dict[str, Any]:
+        """Cached entries by feature path ({} if the cache is missing or stale)."""
+        try:
+            return _inventory_cache.load(self.cache_file, self._read_cache)[1]
+        except OSError:
+            return {}
+
+    def _save_cache(self, entries: Dict[str, Any]) -> None:
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            write_json_atomic(self.cache_file, {'version': CACHE_VERSION, 'features': entries}, indent=None)
+        except OSError as e:
+            log_error('inventory_cache_write_error', str(e), path=str(self.cache_file))
+            return
+
+        signature = file_signature(self.cache_file)
+        if signature:
+            _inventory_cache.put(str(self.cache_file), entries, signature)
+
+    @staticmethod
+    def _feature_signature(feature_dir: Path) -> List[Optional[List[int]]]:
+        """[mtime_ns, size] (or None if missing) for each of FEATURE_FILES."""
+        signatures = (file_signature(feature_dir / name) for name in FEATURE_FILES)
+        return [list(signature) if signature else None for signature in signatures]
+
+    def _extract_features(self, feature_dirs: List[Path], status: str) -> List[Dict[str, Any]]:
+        """
+        Feature info for each directory, reusing cached entries for unchanged features.
+
+        Returns:
+            Feature dictionaries (fresh copies) in feature_dirs order
+        """
+        entries = self._load_cache()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(feature_dirs)
+        pending = []
+
+        for position, feature_dir in enumerate(feature_dirs):
+            key = str(feature_dir.relative_to(self.project_path))
+            signature = self._feature_signature(feature_dir)
+            entry = entries.get(key)
+            if entry and entry.get('status') == status and entry.get('signature') == signature:
+                results[position] = dict(entry['feature'])
+            else:
+                pending.append((position, key, signature))
+
+        if pending:
+            logger.debug(f"Reading {len(pending)} changed feature(s), {len(feature_dirs) - len(pending)} cached")
+
+            def run(item):
+                return self._extract_feature_info(feature_dirs[item[0]], status=status)
+
+            if len(pending) == 1:
+                extracted = [run(pending[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=min(IO_WORKERS, len(pending))) as pool:
+                    extracted = list(pool.map(run, pending))
+
+            entries = dict(entries)
+            for (position, key, signature), feature in zip(pending, extracted):
+                results[position] = dict(feature) if feature else None
+                if feature:
+                    entries[key] = {'status': status, 'signature': signature, 'feature': feature}
+
+        # Drop entries for features of this status that no longer exist
+        present = {str(d.relative_to(self.project_path)) for d in feature_dirs}
+        removed = [k for k, e in entries.items() if e.get('status') == status and k not in present]
+        if removed:
+            entries = {k: e for k, e in entries.items() if k not in removed}
+
+        if pending or removed:
+            self._save_cache(entries)
+
+        return [feature for feature in results if feature]
 
     def scan_working_features(self) -> List[Dict[str, Any]]:
         """
@@ -39,6 +148,7 @@ class FeaturesInventoryGenerator:
             logger.debug(f"Working directory not found: {self.working_dir}")
             return features
 
+        feature_dirs = []
         for feature_dir in self.working_dir.iterdir():
             if not feature_dir.is_dir():
                 continue
@@ -47,11 +157,9 @@ class FeaturesInventoryGenerator:
             if feature_dir.name.startswith('.') or feature_dir.name == 'README.md':
                 continue
 
-            feature = self._extract_feature_info(feature_dir, status='active')
-            if feature:
-                features.append(feature)
+            feature_dirs.append(feature_dir)
 
-        return features
+        return self._extract_features(feature_dirs, status='active')
 
     def scan_archived_features(self) -> List[Dict[str, Any]]:
         """
@@ -81,6 +189,7 @@ class FeaturesInventoryGenerator:
             except (json.JSONDecodeError, IOError) as e:
                 log_error('index_read_error', str(e), path=str(index_file))
 
+        feature_dirs = []
         for feature_dir in self.archived_dir.iterdir():
             if not feature_dir.is_dir():
                 continue
@@ -89,15 +198,16 @@ class FeaturesInventoryGenerator:
             if feature_dir.name.startswith('.'):
                 continue
 
-            feature = self._extract_feature_info(feature_dir, status='archived')
-            if feature:
-                # Enrich with index.json metadata if available
-                if feature_dir.name in archived_metadata:
-                    meta = archived_metadata[feature_dir.name]
-                    feature['archived_at'] = meta.get('archived_at')
-                    if not feature.get('display_name'):
-                        feature['display_name'] = meta.get('feature_name')
-                features.append(feature)
+            feature_dirs.append(feature_dir)
+
+        for feature in self._extract_features(feature_dirs, status='archived'):
+            # Enrich with index.json metadata if available
+            if feature['name'] in archived_metadata:
+                meta = archived_metadata[feature['name']]
+                feature['archived_at'] = meta.get('archived_at')
+                if not feature.get('display_name'):
+                    feature['display_name'] = meta.get('feature_name')
+            features.append(feature)
 
         return features
 
@@ -7,19 +7,89 @@ Validates implementation plans against:
 
 Scores plans 0-100 based on completeness, quality, and autonomy.
 Enables iterative review loop until score >= 90.
+
+validate(incremental=True) re-runs only the checks whose inputs changed
+since the last validation of the same plan file: each section of
+UNIVERSAL_PLANNING_STRUCTURE (and each other top-level key) is hashed, and
+text scans and section checks are reused for unchanged parts. The issues,
+score and checklist are identical to a full validation.
 """
 
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Optional, Tuple
+import hashlib
 import json
 import re
+import sys
 import time
+
+# Add coderef/ utilities to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from coderef.utils import FileSignatureCache
+
 from type_defs import ValidationResultDict, ValidationIssueDict
 from logger_config import logger
+from utils.schema_registry import registry as schema_registry
 
 # Schema path relative to project root
 SCHEMA_PATH = Path(__file__).parent.parent / "coderef" / "schemas" / "plan.schema.json"
 
+PLACEHOLDER_PATTERN = re.compile(
+    r'\b(TBD|TODO|\[placeholder\]|Coming soon|Fill this in|to be determined)\b', re.IGNORECASE
+)
+AMBIGUOUS_PATTERN = re.compile(
+    r'\b(might|could|maybe|possibly|perhaps|unclear|TBD|to be determined|needs clarification)\b', re.IGNORECASE
+)
+QUESTION_PATTERN = re.compile(r'(Should we|What about|What if|How do we|Which|\?)', re.IGNORECASE)
+
+# Time keywords that violate the agentic constraint, and technical terms that contain "time"
+TIME_KEYWORDS = [
+    'hours', 'minutes', 'duration', 'timeline',
+    'schedule', 'deadline', 'estimated_time', 'time_estimate'
+]
+TIME_EXCEPTIONS = ['real-time', 'realtime', 'runtime', 'run-time']
+
+# Autonomy issues reported per pattern
+MAX_AUTONOMY_MATCHES = 5
+
+# Incremental validation state: plan path -> {check key: (input digest, cached result)}
+_validation_cache = FileSignatureCache()
+
+
+def _plan_parts(plan_data: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """
+    Split json.dumps(plan_data) into named parts for hashing and scanning.
+
+    Each top-level key is one part ('"key": value'), except
+    UNIVERSAL_PLANNING_STRUCTURE, which is split into one part per section.
+    Concatenated in order (with the separators json.dumps puts between
+    them, which no check pattern matches) they make up the full dump.
+
+    Returns:
+        List of (part name, serialized text)
+    """
+    parts = []
+    for key, value in plan_data.items():
+        if key == 'UNIVERSAL_PLANNING_STRUCTURE' and isinstance(value, dict):
+            parts.append((key, f'{json.dumps(key)}: '))
+            for section, content in value.items():
+                parts.append((f'{key}/{section}', f'{json.dumps(section)}: {json.dumps(content)}'))
+        else:
+            parts.append((key, f'{json.dumps(key)}: {json.dumps(value)}'))
+    return parts
+
+
+def _scan_text(text: str) -> Dict[str, List[str]]:
+    """Run the whole-plan text checks (placeholders, autonomy, time estimates) over text."""
+    lowered = text.lower()
+    return {
+        'placeholders': [m.group() for m in PLACEHOLDER_PATTERN.finditer(text)],
+        'ambiguous': [m.group() for m in AMBIGUOUS_PATTERN.finditer(text)][:MAX_AUTONOMY_MATCHES],
+        'questions': [m.group() for m in QUESTION_PATTERN.finditer(text)][:MAX_AUTONOMY_MATCHES],
+        'time_keywords': [keyword for keyword in TIME_KEYWORDS if keyword in lowered],
+        'time_exceptions': [exception for exception in TIME_EXCEPTIONS if exception in lowered]
+    }
+
 
 class PlanValidator:
     """Validates implementation plans against schema and quality checklist."""
@@ -44,40 +114,36 @@ class PlanValidator:
     # OLD format fields (for backward compatibility)
     EXECUTIVE_SUMMARY_LEGACY = ["feature_overview", "value_proposition", "real_world_analogy", "primary_use_cases", "success_metrics"]
 
-    def __init__(self, plan_path: Path):
+    def __init__(self, plan_path: Path, plan_data: Optional[Dict[str, Any]] = None):
         """Initialize validator with path to plan file.
 
         Args:
             plan_path: Path to plan JSON file
+            plan_data: Already-parsed plan (skips reading plan_path)
         """
         self.plan_path = plan_path
-        self.plan_data = None
+        self.plan_data = plan_data
+        self._preloaded = plan_data is not None
         self.issues: List[ValidationIssueDict] = []
-        self._schema: Optional[Dict[str, Any]] = None
 
     def _load_schema(self) -> Optional[Dict[str, Any]]:
         """Load plan schema from coderef/schemas/plan.schema.json.
 
+        The schema is parsed and compiled once per process by the schema
+        registry (and reloaded when the file changes).
+
         Returns:
             Schema dict or None if not found
         """
-        if self._schema is not None:
-            return self._schema
-
-        try:
-            if SCHEMA_PATH.exists():
-                with open(SCHEMA_PATH, 'r', encoding='utf-8') as f:
-                    self._schema = json.load(f)
-                    logger.debug(f"Loaded plan schema v{self._schema.get('version', 'unknown')}")
-                    return self._schema
-        except Exception as e:
-            logger.warning(f"Could not load plan schema: {e}")
-
-        return None
+        return schema_registry.get_schema(SCHEMA_PATH.name)
 
-    def validate(self) -> ValidationResultDict:
+    def validate(self, incremental: bool = False) -> ValidationResultDict:
         """Validate plan and return results.
 
+        Args:
+            incremental: Reuse results cached by the last validation of this
+                plan path for sections that have not changed
+
         Returns:
             ValidationResultDict with score, issues, and checklist results
         """
@@ -87,19 +153,11 @@ class PlanValidator:
         # Load plan JSON
         self._load_plan()
 
-        # Run validators
-        self.validate_structure()
-        self.validate_completeness()
-        self.validate_quality()
-        self.validate_workorder()  # F6.4: Optional validation (only runs if workorder exists)
-        self.validate_autonomy()
-        self.validate_no_time_estimates()  # NEW: Enforce agentic constraint (no timelines)
-
-        # Check for circular dependencies
-        if 'UNIVERSAL_PLANNING_STRUCTURE' in self.plan_data:
-            structure = self.plan_data['UNIVERSAL_PLANNING_STRUCTURE']
-            if '6_implementation_phases' in structure:
-                self._validate_no_circular_dependencies(structure['6_implementation_phases'])
+        if incremental and isinstance(self.plan_data, dict) and \
+                isinstance(self.plan_data.get('UNIVERSAL_PLANNING_STRUCTURE', {}), dict):
+            self._run_checks_incremental()
+        else:
+            self._run_checks()
 
         # Calculate score and determine result
         score = self.calculate_score()
@@ -121,8 +179,105 @@ class PlanValidator:
             approved=approved
         )
 
+    def _run_checks(self):
+        """Run every check over the whole plan."""
+        self.validate_structure()
+        self.validate_completeness()
+        self.validate_quality()
+        self.validate_workorder()  # F6.4: Optional validation (only runs if workorder exists)
+        self.validate_autonomy()
+        self.validate_no_time_estimates()  # NEW: Enforce agentic constraint (no timelines)
+
+        # Check for circular dependencies
+        if 'UNIVERSAL_PLANNING_STRUCTURE' in self.plan_data:
+            structure = self.plan_data['UNIVERSAL_PLANNING_STRUCTURE']
+            if '6_implementation_phases' in structure:
+                self._validate_no_circular_dependencies(structure['6_implementation_phases'])
+
+    def _run_checks_incremental(self):
+        """Run the same checks as _run_checks, reusing results for unchanged plan parts.
+
+        Issues are appended in the same order as a full run.
+        """
+        previous = _validation_cache.peek(str(self.plan_path)) or {}
+        current: Dict[str, Tuple[str, Any]] = {}
+        digests: Dict[str, str] = {}
+        rerun = []
+
+        def cached(key: str, digest: str, compute: Callable[[], Any]) -> Any:
+            entry = previous.get(key)
+            if entry is not None and entry[0] == digest:
+                result = entry[1]
+            else:
+                result = compute()
+                rerun.append(key)
+            current[key] = (digest, result)
+            return result
+
+        def section_issues(key: str, section: str, check: Callable[[Any], None]) -> None:
+            def compute():
+                saved = self.issues
+                self.issues = []
+                try:
+                    check(structure[section])
+                    return self.issues
+                finally:
+                    self.issues = saved
+
+            issues = cached(key, digests[f'UNIVERSAL_PLANNING_STRUCTURE/{section}'], compute)
+            self.issues.extend(dict(issue) for issue in issues)
+
+        # Whole-plan text scans, one per part
+        scans = []
+        for name, text in _plan_parts(self.plan_data):
+            digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+            digests[name] = digest
+            scans.append(cached(f'scan:{name}', digest, lambda text=text: _scan_text(text)))
+
+        def merged(field: str) -> List[str]:
+            return [match for scan in scans for match in scan[field]]
+
+        has_structure = 'UNIVERSAL_PLANNING_STRUCTURE' in self.plan_data
+        structure = self.plan_data.get('UNIVERSAL_PLANNING_STRUCTURE', {})
+
+        self.validate_structure()
+
+        # Completeness
+        self._add_placeholder_issues(merged('placeholders'))
+        if has_structure and '6_implementation_phases' in structure:
+            section_issues('task_ids', '6_implementation_phases', self._validate_task_ids)
+
+        # Quality
+        if has_structure:
+            if '6_implementation_phases' in structure:
+                section_issues('phases', '6_implementation_phases', self._validate_phases_quality)
+            if '8_success_criteria' in structure:
+                section_issues('success_criteria', '8_success_criteria', self._validate_success_criteria)
+            if '7_testing_strategy' in structure:
+                section_issues('edge_cases', '7_testing_strategy', self._validate_edge_cases)
+
+        # Workorder (only reads section 5)
+        if has_structure and '5_task_id_system' in structure:
+            section_issues('workorder', '5_task_id_system', lambda _: self.validate_workorder())
+
+        # Autonomy and agentic constraint
+        self._add_autonomy_issues(
+            merged('ambiguous')[:MAX_AUTONOMY_MATCHES],
+            merged('questions')[:MAX_AUTONOMY_MATCHES]
+        )
+        self._add_time_estimate_issues(merged('time_keywords'), merged('time_exceptions'))
+
+        if has_structure and '6_implementation_phases' in structure:
+            section_issues('circular_dependencies', '6_implementation_phases', self._validate_no_circular_dependencies)
+
+        _validation_cache.put(str(self.plan_path), current)
+        logger.debug(f'Incremental validation re-ran {len(rerun)} of {len(current)} checks: {rerun}')
+
     def _load_plan(self):
-        """Load and parse plan JSON file."""
+        """Load and parse plan JSON file (unless plan data was passed in)."""
+        if self._preloaded:
+            return
+
         try:
             with open(self.plan_path, 'r', encoding='utf-8') as f:
                 self.plan_data = json.load(f)
@@ -184,15 +339,7 @@ class PlanValidator:
 
         # Check for placeholder text
         plan_json_str = json.dumps(self.plan_data)
-        placeholder_pattern = r'\b(TBD|TODO|\[placeholder\]|Coming soon|Fill this in|to be determined)\b'
-        matches = re.finditer(placeholder_pattern, plan_json_str, re.IGNORECASE)
-        for match in matches:
-            self.issues.append({
-                'severity': 'major',
-                'section': 'completeness',
-                'issue': f'Placeholder text found: "{match.group()}"',
-                'suggestion': 'Replace placeholder with actual content'
-            })
+        self._add_placeholder_issues(m.group() for m in PLACEHOLDER_PATTERN.finditer(plan_json_str))
 
         # Validate task IDs if implementation_phases exists
         if 'UNIVERSAL_PLANNING_STRUCTURE' in self.plan_data:
@@ -200,6 +347,16 @@ class PlanValidator:
             if '6_implementation_phases' in structure:
                 self._validate_task_ids(structure['6_implementation_phases'])
 
+    def _add_placeholder_issues(self, matches):
+        """Add one issue per placeholder match."""
+        for match in matches:
+            self.issues.append({
+                'severity': 'major',
+                'section': 'completeness',
+                'issue': f'Placeholder text found: "{match}"',
+                'suggestion': 'Replace placeholder with actual content'
+            })
+
     def _validate_task_ids(self, phases_data):
         """Validate task IDs are unique and dependencies are valid."""
         task_ids = set()
@@ -291,8 +448,7 @@ class PlanValidator:
 
         # Validate task descriptions
         if '6_implementation_phases' in structure:
-            self._validate_task_descriptions(structure['6_implementation_phases'])
-            self._validate_phase_fields(structure['6_implementation_phases'])
+            self._validate_phases_quality(structure['6_implementation_phases'])
 
         # Validate success criteria
         if '8_success_criteria' in structure:
@@ -302,6 +458,11 @@ class PlanValidator:
         if '7_testing_strategy' in structure:
             self._validate_edge_cases(structure['7_testing_strategy'])
 
+    def _validate_phases_quality(self, phases_data):
+        """Check task descriptions and phase fields of section 6."""
+        self._validate_task_descriptions(phases_data)
+        self._validate_phase_fields(phases_data)
+
     def _validate_task_descriptions(self, phases_data):
         """Check task descriptions are clear and specific."""
         for phase_key, phase in phases_data.items():
@@ -496,27 +657,26 @@ class PlanValidator:
 
         plan_json_str = json.dumps(self.plan_data)
 
-        # Check for ambiguous phrases
-        ambiguous_pattern = r'\b(might|could|maybe|possibly|perhaps|unclear|TBD|to be determined|needs clarification)\b'
-        matches = list(re.finditer(ambiguous_pattern, plan_json_str, re.IGNORECASE))
+        # Check for ambiguous phrases and questions (first 5 of each to avoid spam)
+        ambiguous = [m.group() for m in AMBIGUOUS_PATTERN.finditer(plan_json_str)]
+        questions = [m.group() for m in QUESTION_PATTERN.finditer(plan_json_str)]
+        self._add_autonomy_issues(ambiguous[:MAX_AUTONOMY_MATCHES], questions[:MAX_AUTONOMY_MATCHES])
 
-        for match in matches[:5]:  # Limit to first 5 to avoid spam
+    def _add_autonomy_issues(self, ambiguous, questions):
+        """Add issues for ambiguous phrases and unresolved questions."""
+        for match in ambiguous:
             self.issues.append({
                 'severity': 'major',
                 'section': 'autonomy',
-                'issue': f'Ambiguous phrase found: "{match.group()}"',
+                'issue': f'Ambiguous phrase found: "{match}"',
                 'suggestion': 'Replace with definitive language - make clear decisions'
             })
 
-        # Check for questions
-        question_pattern = r'(Should we|What about|What if|How do we|Which|\?)'
-        matches = list(re.finditer(question_pattern, plan_json_str, re.IGNORECASE))
-
-        for match in matches[:5]:  # Limit to first 5
+        for match in questions:
             self.issues.append({
                 'severity': 'major',
                 'section': 'autonomy',
-                'issue': f'Question found in plan: "{match.group()}"',
+                'issue': f'Question found in plan: "{match}"',
                 'suggestion': 'Answer the question in the plan - no unresolved questions'
             })
 
@@ -643,21 +803,23 @@ class PlanValidator:
 
         plan_str = json.dumps(self.plan_data).lower()
 
-        # Time keywords that violate agentic constraint
-        time_keywords = [
-            'hours', 'minutes', 'duration', 'timeline',
-            'schedule', 'deadline', 'estimated_time', 'time_estimate'
-        ]
+        self._add_time_estimate_issues(
+            [keyword for keyword in TIME_KEYWORDS if keyword in plan_str],
+            [exception for exception in TIME_EXCEPTIONS if exception in plan_str]
+        )
 
-        # Exceptions (technical terms that contain "time")
-        exceptions = ['real-time', 'realtime', 'runtime', 'run-time']
+    def _add_time_estimate_issues(self, keywords_present, exceptions_present):
+        """Add the time-estimate issue for keywords found in the plan.
 
+        Args:
+            keywords_present: TIME_KEYWORDS that occur in the plan (may repeat)
+            exceptions_present: TIME_EXCEPTIONS that occur in the plan
+        """
         found_keywords = []
-        for keyword in time_keywords:
-            # Check if keyword exists
-            if keyword in plan_str:
+        for keyword in TIME_KEYWORDS:
+            if keyword in keywords_present:
                 # Skip if it's part of an exception
-                is_exception = any(exc in plan_str for exc in exceptions if keyword in exc)
+                is_exception = any(keyword in exc for exc in exceptions_present)
                 if not is_exception:
                     found_keywords.append(keyword)
 
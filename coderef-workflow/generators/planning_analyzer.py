@@ -5,28 +5,49 @@ Analyzes projects to discover foundation docs, coding standards, reference compo
 and patterns. Automates section 0 (Preparation) of implementation plans.
 """
 
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, Awaitable, Callable, List, Dict, Optional, Tuple, Union
 import json
 import re
 import asyncio
 import sys
+import threading
+import time
 
 # Add coderef/ utilities to path for wrapper functions
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from coderef.utils import check_coderef_available, read_coderef_output
+from coderef.utils import check_coderef_available, read_coderef_output, read_coderef_index
 
 from type_defs import PreparationSummaryDict
 from logger_config import logger
 from constants import EXCLUDE_DIRS, ALLOWED_FILE_EXTENSIONS
 from mcp_client import call_coderef_tool
+from utils.project_snapshot import get_project_snapshot
 
 # NEW v2.1.0: Scanner Integration - Import ImpactAnalyzer
 # WO-WORKFLOW-SCANNER-INTEGRATION-001 IMPL-007
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from handlers import ImpactAnalyzer
 
-__all__ = ['PlanningAnalyzer']
+__all__ = ['PlanningAnalyzer', 'AnalysisStage']
+
+
+@dataclass(frozen=True)
+class AnalysisStage:
+    """
+    One node of the PlanningAnalyzer.analyze() stage graph.
+
+    Attributes:
+        name: Result key for this stage
+        run: Called with the results dict so far; returns a value or an awaitable
+        deps: Names of stages that must finish first
+        blocking: Run in a worker thread (synchronous filesystem/CPU work)
+    """
+    name: str
+    run: Callable[[Dict[str, Any]], Union[Any, Awaitable[Any]]]
+    deps: Tuple[str, ...] = ()
+    blocking: bool = False
 
 
 class PlanningAnalyzer:
@@ -61,26 +82,34 @@ class PlanningAnalyzer:
             'foundation_doc_reads': [],     # Track foundation doc reads
             'total_sources_used': 0
         }
+        self._telemetry_lock = threading.Lock()  # Stages may track from worker threads
+
+        # Per-stage wall-clock seconds from the last analyze() run
+        self.stage_timings: Dict[str, float] = {}
+        self.analysis_duration: Optional[float] = None
 
         logger.debug(f"Initialized PlanningAnalyzer for project: {project_path}")
 
     def _track_coderef_file_read(self, file_path: str):
         """Track when a .coderef/ file is read."""
-        self.telemetry['coderef_file_reads'].append(file_path)
-        self.telemetry['total_sources_used'] += 1
+        with self._telemetry_lock:
+            self.telemetry['coderef_file_reads'].append(file_path)
+            self.telemetry['total_sources_used'] += 1
         logger.info(f"📁 .coderef/ file read: {file_path}")
 
     def _track_mcp_tool_call(self, tool_name: str, success: bool):
         """Track when an MCP tool is called."""
-        self.telemetry['mcp_tool_calls'].append({'tool': tool_name, 'success': success})
-        self.telemetry['total_sources_used'] += 1
+        with self._telemetry_lock:
+            self.telemetry['mcp_tool_calls'].append({'tool': tool_name, 'success': success})
+            self.telemetry['total_sources_used'] += 1
         status = "✅" if success else "❌"
         logger.info(f"🔧 MCP tool called: {tool_name} {status}")
 
     def _track_foundation_doc_read(self, doc_name: str):
         """Track when a foundation doc is read."""
-        self.telemetry['foundation_doc_reads'].append(doc_name)
-        self.telemetry['total_sources_used'] += 1
+        with self._telemetry_lock:
+            self.telemetry['foundation_doc_reads'].append(doc_name)
+            self.telemetry['total_sources_used'] += 1
         logger.info(f"📄 Foundation doc read: {doc_name}")
 
     def _extract_entry_point_from_docs(self) -> Optional[str]:
@@ -151,8 +180,9 @@ class PlanningAnalyzer:
             Element name to analyze, or None if no elements found
         """
         try:
-            # Read .coderef/index.json to get all elements
-            elements = read_coderef_output(str(self.project_path), 'index')
+            # Read .coderef/index.json to get all elements (shared, parsed once)
+            index = read_coderef_index(str(self.project_path))
+            elements = index.elements
 
             if not elements:
                 logger.debug("No elements found in .coderef/index.json")
@@ -176,14 +206,14 @@ class PlanningAnalyzer:
                     return elem.get('name')
 
             # Priority 2: Classes (prefer classes over functions for broader analysis)
-            classes = [e for e in elements if e.get('type') == 'class']
+            classes = index.by_type.get('class', [])
             if classes:
                 # Return first class
                 logger.info(f"Selected class for analysis: {classes[0].get('name')}")
                 return classes[0].get('name')
 
             # Priority 3: Functions
-            functions = [e for e in elements if e.get('type') == 'function']
+            functions = index.by_type.get('function', [])
             if functions:
                 logger.info(f"Selected function for analysis: {functions[0].get('name')}")
                 return functions[0].get('name')
@@ -232,6 +262,13 @@ class PlanningAnalyzer:
             }
         }
 
+        if self.stage_timings:
+            # Slowest stages first; total is wall time, less than the sum when stages overlap
+            summary['stage_timings'] = dict(
+                sorted(self.stage_timings.items(), key=lambda item: item[1], reverse=True)
+            )
+            summary['analysis_duration_seconds'] = self.analysis_duration
+
         logger.info(
             f"📊 Telemetry Summary: {coderef_count} .coderef/ reads, "
             f"{mcp_count} MCP calls ({mcp_success_count} successful), "
@@ -378,127 +415,188 @@ class PlanningAnalyzer:
             'can_proceed': len(critical) == 0
         }
 
-    async def analyze(self) -> PreparationSummaryDict:
+    def _analysis_stages(self) -> List[AnalysisStage]:
         """
-        Main analysis method - orchestrates all scanning operations.
+        Build the analyze() stage graph.
 
-        Async version supports MCP tool calls for enhanced analysis.
-
-        Returns:
-            PreparationSummaryDict with all analysis results
+        Stages with no dependency between them run concurrently. Blocking
+        stages (filesystem walks, file reads, regex scans) run in worker
+        threads so MCP calls from other stages are not held up.
         """
-        import time
-        start_time = time.time()
+        async def dependency_analysis(results):
+            target = results['target_element']
+            if not target:
+                return None
+            logger.info(f"Analyzing dependencies for {target}...")
+            return await self.analyze_dependencies(target)
 
-        logger.info("Starting project analysis", extra={'project_path': str(self.project_path)})
+        async def impact_analysis(results):
+            target = results['target_element']
+            if not target:
+                return None
+            logger.info(f"Analyzing impact for {target}...")
+            return await self.analyze_impact(target, "modify")
 
-        # Check .coderef/ freshness before analysis
-        drift_warning = self.check_coderef_freshness()
-        if drift_warning:
-            logger.warning(drift_warning)
+        async def complexity_analysis(results):
+            target = results['target_element']
+            if not target:
+                return None
+            logger.info(f"Analyzing complexity for {target}...")
+            return await self.analyze_complexity(target)
+
+        async def architecture_diagram(results):
+            # Generate architecture diagram if project is complex enough
+            inventory_data = results['inventory_data']
+            if inventory_data and inventory_data.get('total_elements', 0) > 50:
+                logger.info("Generating architecture diagram...")
+                return await self.generate_architecture_diagram("dependencies", depth=2)
+            return None
 
-        # Run all scanner methods with progress logging
-        logger.info("Scanning foundation docs...")
-        foundation_docs = self.scan_foundation_docs()
+        def foundation_doc_content(results):
+            content = self.read_foundation_doc_content()
+            self.foundation_doc_content = content  # Store for entry point extraction
+            return content
 
-        logger.info("Reading foundation doc content...")
-        foundation_doc_content = self.read_foundation_doc_content()
-        self.foundation_doc_content = foundation_doc_content  # Store for entry point extraction
+        def target_element(results):
+            # Find a representative element to analyze using intelligent selection
+            inventory_data = results['inventory_data']
+            if inventory_data and inventory_data.get('source') == 'coderef_index':
+                return self._select_analysis_target()
+            return None
 
-        logger.info("Reading inventory data...")
-        inventory_data = await self.read_inventory_data()
+        async def change_impact(results):
+            # NEW v2.1.0: Scanner Integration - Change Impact Analysis
+            # WO-WORKFLOW-SCANNER-INTEGRATION-001 IMPL-007
+            target = results['target_element']
+            if not target:
+                return None
+            logger.info(f"Running change impact analysis for: {target}")
+            return await self.analyze_change_impact([target], max_depth=3)
+
+        return [
+            AnalysisStage('foundation_docs', lambda r: self.scan_foundation_docs(), blocking=True),
+            AnalysisStage('foundation_doc_content', foundation_doc_content, blocking=True),
+            AnalysisStage('inventory_data', lambda r: self.read_inventory_data()),
+            AnalysisStage('coding_standards', lambda r: self.scan_coding_standards(), blocking=True),
+            AnalysisStage('reference_components', lambda r: self.find_reference_components()),
+            AnalysisStage('key_patterns_identified', lambda r: self.identify_patterns()),
+            AnalysisStage('technology_stack', lambda r: self.detect_technology_stack(), blocking=True),
+            AnalysisStage('project_structure', lambda r: self.analyze_project_structure(), blocking=True),
+            AnalysisStage('gaps_and_risks', lambda r: self.identify_gaps_and_risks()),
+            # NEW v1.5.0: Enhanced analysis using MCP tools
+            AnalysisStage('target_element', target_element,
+                          deps=('inventory_data', 'foundation_doc_content'), blocking=True),
+            AnalysisStage('dependency_analysis', dependency_analysis, deps=('target_element',)),
+            AnalysisStage('impact_analysis', impact_analysis, deps=('target_element',)),
+            AnalysisStage('complexity_analysis', complexity_analysis, deps=('target_element',)),
+            AnalysisStage('architecture_diagram', architecture_diagram, deps=('inventory_data',)),
+            # NEW v2.1.0: Scanner Integration - Type System and Decorators
+            # WO-WORKFLOW-SCANNER-INTEGRATION-001 IMPL-001 & IMPL-002
+            AnalysisStage('type_system', lambda r: self.get_type_system_elements()),
+            AnalysisStage('decorators', lambda r: self.get_decorator_elements()),
+            AnalysisStage('change_impact_analysis', change_impact, deps=('target_element',)),
+        ]
 
-        logger.info("Scanning coding standards...")
-        coding_standards = self.scan_coding_standards()
+    async def _run_stages(self, stages: List[AnalysisStage]) -> Dict[str, Any]:
+        """
+        Run a stage graph, starting each stage as soon as its dependencies finish.
+
+        Per-stage durations are recorded in self.stage_timings. If any stage
+        raises, the remaining stages are cancelled and the error propagates.
 
-        logger.info("Finding reference components...")
-        reference_components = await self.find_reference_components()
+        Args:
+            stages: Stages in dependency order (dependencies listed first)
 
-        logger.info("Analyzing code patterns...")
-        key_patterns_identified = await self.identify_patterns()
+        Returns:
+            Dict mapping stage name to its result
+        """
+        results: Dict[str, Any] = {}
+        tasks: Dict[str, asyncio.Task] = {}
 
-        logger.info("Detecting technology stack...")
-        technology_stack = self.detect_technology_stack()
+        async def run(stage: AnalysisStage):
+            if stage.deps:
+                await asyncio.gather(*(tasks[dep] for dep in stage.deps))
 
-        logger.info("Analyzing project structure...")
-        project_structure = self.analyze_project_structure()
+            started = time.perf_counter()
+            if stage.blocking:
+                value = await asyncio.to_thread(stage.run, results)
+            else:
+                value = await stage.run(results)
+            self.stage_timings[stage.name] = round(time.perf_counter() - started, 3)
 
-        logger.info("Identifying gaps and risks...")
-        gaps_and_risks = await self.identify_gaps_and_risks()
+            results[stage.name] = value
+            return value
 
-        # NEW v1.5.0: Enhanced analysis using MCP tools
-        logger.info("Running enhanced code intelligence analysis...")
+        for stage in stages:
+            missing = [dep for dep in stage.deps if dep not in tasks]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown or later stages: {missing}")
+            tasks[stage.name] = asyncio.create_task(run(stage), name=f"analyze:{stage.name}")
 
-        # Try to analyze key components if we have inventory data
-        dependency_analysis = None
-        impact_analysis = None
-        complexity_analysis = None
-        architecture_diagram = None
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
 
-        # Find a representative element to analyze using intelligent selection
-        target_element = None
-        if inventory_data and inventory_data.get('source') == 'coderef_index':
-            target_element = self._select_analysis_target()
+        return results
 
-        if target_element:
-            # Analyze dependencies using coderef_query
-            logger.info(f"Analyzing dependencies for {target_element}...")
-            dependency_analysis = await self.analyze_dependencies(target_element)
+    async def analyze(self) -> PreparationSummaryDict:
+        """
+        Main analysis method - orchestrates all scanning operations.
 
-            # Analyze impact using coderef_impact
-            logger.info(f"Analyzing impact for {target_element}...")
-            impact_analysis = await self.analyze_impact(target_element, "modify")
+        Async version supports MCP tool calls for enhanced analysis. Independent
+        stages run concurrently (see _analysis_stages); per-stage timings are
+        reported in telemetry_summary['stage_timings'].
 
-            # Analyze complexity using coderef_complexity
-            logger.info(f"Analyzing complexity for {target_element}...")
-            complexity_analysis = await self.analyze_complexity(target_element)
+        Returns:
+            PreparationSummaryDict with all analysis results
+        """
+        start_time = time.time()
+        self.stage_timings = {}
 
-        # Generate architecture diagram if project is complex enough
-        if inventory_data and inventory_data.get('total_elements', 0) > 50:
-            logger.info("Generating architecture diagram...")
-            architecture_diagram = await self.generate_architecture_diagram("dependencies", depth=2)
+        logger.info("Starting project analysis", extra={'project_path': str(self.project_path)})
 
-        # NEW v2.1.0: Scanner Integration - Type System and Decorators
-        # WO-WORKFLOW-SCANNER-INTEGRATION-001 IMPL-001 & IMPL-002
-        type_system = await self.get_type_system_elements()
-        decorators = await self.get_decorator_elements()
+        # Check .coderef/ freshness before analysis
+        drift_warning = self.check_coderef_freshness()
+        if drift_warning:
+            logger.warning(drift_warning)
 
-        # NEW v2.1.0: Scanner Integration - Change Impact Analysis
-        # WO-WORKFLOW-SCANNER-INTEGRATION-001 IMPL-007
-        # Analyze impact if entry point or critical elements identified
-        change_impact = None
-        if target_element:
-            logger.info(f"Running change impact analysis for: {target_element}")
-            change_impact = await self.analyze_change_impact([target_element], max_depth=3)
+        stages = await self._run_stages(self._analysis_stages())
 
-            # Add impact warnings to gaps_and_risks if high-risk changes detected
-            if change_impact and change_impact.get('warnings'):
-                for warning in change_impact['warnings']:
-                    gaps_and_risks.append(warning['message'])
+        # Add impact warnings to gaps_and_risks if high-risk changes detected
+        gaps_and_risks = stages['gaps_and_risks']
+        change_impact = stages['change_impact_analysis']
+        if change_impact and change_impact.get('warnings'):
+            for warning in change_impact['warnings']:
+                gaps_and_risks.append(warning['message'])
 
         # Build result
         result: PreparationSummaryDict = {
-            'foundation_docs': foundation_docs,
-            'foundation_doc_content': foundation_doc_content,
-            'inventory_data': inventory_data,
-            'coding_standards': coding_standards,
-            'reference_components': reference_components,
-            'key_patterns_identified': key_patterns_identified,
-            'technology_stack': technology_stack,
-            'project_structure': project_structure,
+            'foundation_docs': stages['foundation_docs'],
+            'foundation_doc_content': stages['foundation_doc_content'],
+            'inventory_data': stages['inventory_data'],
+            'coding_standards': stages['coding_standards'],
+            'reference_components': stages['reference_components'],
+            'key_patterns_identified': stages['key_patterns_identified'],
+            'technology_stack': stages['technology_stack'],
+            'project_structure': stages['project_structure'],
             'gaps_and_risks': gaps_and_risks,
             # NEW v1.5.0: Enhanced analysis from MCP tools
-            'dependency_analysis': dependency_analysis,
-            'impact_analysis': impact_analysis,
-            'complexity_analysis': complexity_analysis,
-            'architecture_diagram': architecture_diagram,
+            'dependency_analysis': stages['dependency_analysis'],
+            'impact_analysis': stages['impact_analysis'],
+            'complexity_analysis': stages['complexity_analysis'],
+            'architecture_diagram': stages['architecture_diagram'],
             # NEW v2.1.0: Scanner Integration - Type System, Decorators, and Change Impact
-            'type_system': type_system,
-            'decorators': decorators,
+            'type_system': stages['type_system'],
+            'decorators': stages['decorators'],
             'change_impact_analysis': change_impact
         }
 
         duration = time.time() - start_time
+        self.analysis_duration = round(duration, 3)
         logger.info(f"Analysis completed in {duration:.2f}s", extra={'duration_seconds': duration})
 
         # Add telemetry summary to result
@@ -613,32 +711,25 @@ class PlanningAnalyzer:
         """
         logger.debug("Reading inventory data...")
 
-        # Priority 1: Try to read .coderef/index.json (FASTEST)
-        if check_coderef_available(str(self.project_path)):
-            try:
-                index_data = read_coderef_output(str(self.project_path), 'index')
-                self._track_coderef_file_read('.coderef/index.json')
-                logger.info(f"Read .coderef/index.json: {len(index_data)} elements")
-
-                # Group by type for summary
-                by_type = {}
-                for element in index_data:
-                    element_type = element.get('type', 'unknown')
-                    by_type[element_type] = by_type.get(element_type, 0) + 1
+        # Priority 1: Try to read .coderef/index.json (FASTEST, shared parse)
+        try:
+            index = read_coderef_index(str(self.project_path))
+        except Exception as e:
+            index = None
+            logger.debug(f".coderef/index.json read failed: {str(e)}, trying coderef_scan")
 
-                # Extract unique files
-                files = set(e.get('file') for e in index_data if 'file' in e)
+        if index:
+            self._track_coderef_file_read('.coderef/index.json')
+            logger.info(f"Read .coderef/index.json: {len(index)} elements")
 
-                return {
-                    # 'index_data': index_data,  # REMOVED: Causes 76K+ token bloat
-                    'source': 'coderef_index',
-                    'total_elements': len(index_data),
-                    'by_type': by_type,
-                    'files': len(files),
-                    'utilization': '.coderef/index.json (preprocessed)'
-                }
-            except Exception as e:
-                logger.debug(f".coderef/index.json read failed: {str(e)}, trying coderef_scan")
+            return {
+                # 'index_data': index_data,  # REMOVED: Causes 76K+ token bloat
+                'source': 'coderef_index',
+                'total_elements': len(index),
+                'by_type': index.type_counts(),
+                'files': len(index.by_file),
+                'utilization': '.coderef/index.json (preprocessed)'
+            }
 
         # Priority 2: Try to use coderef_scan for live inventory
         try:
@@ -916,7 +1007,11 @@ class PlanningAnalyzer:
         except Exception as e:
             logger.debug(f"coderef_patterns unavailable: {str(e)}, using fallback regex analysis")
 
-        # Fallback to regex-based analysis
+        # Fallback to regex-based analysis (file walk + reads, off the event loop)
+        return await asyncio.to_thread(self._identify_patterns_fallback)
+
+    def _identify_patterns_fallback(self) -> List[str]:
+        """Regex-based pattern analysis over source files (used when coderef tools are unavailable)."""
         source_files = self._scan_source_files()
         if not source_files:
             logger.debug("No source files found for pattern analysis")
@@ -1106,25 +1201,13 @@ class PlanningAnalyzer:
         """
         logger.debug("Analyzing project structure...")
 
-        dir_file_counts = {}
-
-        # Walk directory tree and count files per directory
-        try:
-            for item in self.project_path.rglob('*'):
-                # Skip excluded directories
-                if any(excluded in item.parts for excluded in EXCLUDE_DIRS):
-                    continue
-
-                if item.is_dir():
-                    # Count files in this directory (non-recursive)
-                    file_count = sum(1 for f in item.iterdir() if f.is_file())
-                    if file_count > 0:
-                        # Store relative path
-                        rel_path = item.relative_to(self.project_path)
-                        dir_file_counts[str(rel_path)] = file_count
-
-        except PermissionError as e:
-            logger.warning(f"Permission denied analyzing structure: {e}")
+        # Per-directory file counts from the shared project snapshot (one pruned walk)
+        snapshot = get_project_snapshot(self.project_path, EXCLUDE_DIRS)
+        dir_file_counts = {
+            str(Path(rel_dir)): count
+            for rel_dir, count in snapshot.dir_file_counts.items()
+            if rel_dir != '.'
+        }
 
         # Identify main directories (10+ files)
         main_directories = [dir_path for dir_path, count in dir_file_counts.items() if count >= 10]
@@ -1142,7 +1225,7 @@ class PlanningAnalyzer:
                 organization_pattern = 'layered (MVC/service-based)'
             else:
                 organization_pattern = 'modular (src-based)'
-        elif len([f for f in self.project_path.iterdir() if f.is_file() and f.suffix in ALLOWED_FILE_EXTENSIONS]) > 10:
+        elif len([f for f in snapshot.root_files() if f.suffix in ALLOWED_FILE_EXTENSIONS]) > 10:
             organization_pattern = 'flat (files in root)'
 
         logger.debug(f"Project structure: {organization_pattern}, {len(main_directories)} main directories")
@@ -1407,37 +1490,28 @@ class PlanningAnalyzer:
         type_aliases = []
 
         try:
-            # Read .coderef/index.json for element inventory
-            elements = read_coderef_output(str(self.project_path), 'index')
+            # Read .coderef/index.json for element inventory (shared, parsed once)
+            index = read_coderef_index(str(self.project_path))
 
-            if not elements:
+            if not index:
                 logger.debug("No elements found in .coderef/index.json")
                 return {'interfaces': [], 'type_aliases': []}
 
             self._track_coderef_file_read('.coderef/index.json (type system)')
 
-            # Filter by type='interface' and type='type'
-            for element in elements:
-                elem_type = element.get('type')
-                name = element.get('name')
-                file_path = element.get('file', '')
-                line = element.get('line', 0)
+            # Pre-grouped by type='interface' and type='type'
+            for elem_type, bucket in (('interface', interfaces), ('type', type_aliases)):
+                for element in index.by_type.get(elem_type, []):
+                    file_path = element.get('file', '')
 
-                # Skip .venv files
-                if '.venv' in file_path or 'node_modules' in file_path:
-                    continue
+                    # Skip .venv files
+                    if '.venv' in file_path or 'node_modules' in file_path:
+                        continue
 
-                if elem_type == 'interface':
-                    interfaces.append({
-                        'name': name,
-                        'file': file_path,
-                        'line': line
-                    })
-                elif elem_type == 'type':
-                    type_aliases.append({
-                        'name': name,
+                    bucket.append({
+                        'name': element.get('name'),
                         'file': file_path,
-                        'line': line
+                        'line': element.get('line', 0)
                     })
 
             logger.info(f"Found {len(interfaces)} interfaces, {len(type_aliases)} type aliases")
@@ -1465,30 +1539,29 @@ class PlanningAnalyzer:
         decorators = []
 
         try:
-            # Read .coderef/index.json for element inventory
-            elements = read_coderef_output(str(self.project_path), 'index')
+            # Read .coderef/index.json for element inventory (shared, parsed once)
+            index = read_coderef_index(str(self.project_path))
 
-            if not elements:
+            if not index:
                 logger.debug("No elements found in .coderef/index.json")
                 return []
 
             self._track_coderef_file_read('.coderef/index.json (decorators)')
 
-            # Filter by type='decorator'
-            for element in elements:
-                if element.get('type') == 'decorator':
-                    file_path = element.get('file', '')
+            # Pre-grouped by type='decorator'
+            for element in index.by_type.get('decorator', []):
+                file_path = element.get('file', '')
 
-                    # Skip .venv files
-                    if '.venv' in file_path or 'node_modules' in file_path:
-                        continue
+                # Skip .venv files
+                if '.venv' in file_path or 'node_modules' in file_path:
+                    continue
 
-                    decorators.append({
-                        'name': element.get('name'),
-                        'target': 'function/class',  # Could be enhanced with actual target info
-                        'file': file_path,
-                        'line': element.get('line', 0)
-                    })
+                decorators.append({
+                    'name': element.get('name'),
+                    'target': 'function/class',  # Could be enhanced with actual target info
+                    'file': file_path,
+                    'line': element.get('line', 0)
+                })
 
             logger.info(f"Found {len(decorators)} decorators")
 
@@ -1514,6 +1587,7 @@ class PlanningAnalyzer:
             - high_risk_changes: List of elements with high/critical impact
             - impact_reports: Dict mapping element_name -> impact report
             - warnings: List of warning messages for analysis.json
+            - combined_affected_count / combined_risk_level: Impact of all changes together
         """
         logger.debug("Analyzing change impact...")
 
@@ -1529,9 +1603,10 @@ class PlanningAnalyzer:
             impact_reports = {}
             warnings = []
 
-            for elem_name in element_names:
-                result = analyzer.analyze_element_impact(elem_name, max_depth=max_depth)
+            # One multi-source traversal for all changed elements
+            batch = analyzer.analyze_elements_impact(element_names, max_depth=max_depth)
 
+            for elem_name, result in batch['results'].items():
                 if result:
                     impact_score = result.get('impact_score', {})
                     risk_level = impact_score.get('risk_level', 'low')
@@ -1561,7 +1636,9 @@ class PlanningAnalyzer:
                 'high_risk_changes': high_risk_changes,
                 'impact_reports': impact_reports,
                 'warnings': warnings,
-                'total_elements_analyzed': len(element_names)
+                'total_elements_analyzed': len(element_names),
+                'combined_affected_count': batch['combined_score']['affected_count'],
+                'combined_risk_level': batch['combined_score']['risk_level']
             }
 
         except Exception as e:
@@ -1572,30 +1649,15 @@ class PlanningAnalyzer:
         """
         Helper method to recursively scan source files.
 
-        Excludes EXCLUDE_DIRS and filters by ALLOWED_FILE_EXTENSIONS.
+        Excludes EXCLUDE_DIRS and filters by ALLOWED_FILE_EXTENSIONS, using the
+        shared project snapshot (sorted by relative path).
 
         Returns:
             List of Path objects for source files
         """
         logger.debug("Scanning source files...")
-        source_files = []
-
-        try:
-            for file_path in self.project_path.rglob('*'):
-                # Skip if file is in excluded directory
-                if any(excluded in file_path.parts for excluded in EXCLUDE_DIRS):
-                    continue
-
-                # Skip if not a file
-                if not file_path.is_file():
-                    continue
-
-                # Check if file extension is allowed
-                if file_path.suffix in ALLOWED_FILE_EXTENSIONS:
-                    source_files.append(file_path)
-
-        except PermissionError as e:
-            logger.warning(f"Permission denied scanning files: {e}")
+        snapshot = get_project_snapshot(self.project_path, EXCLUDE_DIRS)
+        source_files = [f.path for f in snapshot.files_with_extensions(ALLOWED_FILE_EXTENSIONS)]
 
         logger.debug(f"Found {len(source_files)} source files")
         return source_files
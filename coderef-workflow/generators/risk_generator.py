@@ -12,13 +12,14 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
-from constants import Paths
+from constants import Paths, EXCLUDE_DIRS
 from type_defs import (
     RiskDimensionDict, CompositeScoreDict, RecommendationDict,
     MitigationStrategyDict, OptionComparisonDict, ProjectContextDict,
     ProposedChangeDict, RiskAssessmentDict, RiskAssessmentResultDict
 )
 from logger_config import logger
+from utils.project_snapshot import get_project_snapshot
 
 
 class RiskGenerator:
@@ -85,12 +86,8 @@ class RiskGenerator:
         }
 
         try:
-            # Count source files (exclude common non-source directories)
-            exclude_dirs = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'venv'}
-            source_files = [
-                f for f in self.project_path.rglob('*')
-                if f.is_file() and not any(excl in f.parts for excl in exclude_dirs)
-            ]
+            # Count source files (shared project snapshot; excluded dirs are never entered)
+            source_files = get_project_snapshot(self.project_path, EXCLUDE_DIRS).paths()
             context['files_analyzed'] = len(source_files)
 
             # Check for dependencies
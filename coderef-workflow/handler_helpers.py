@@ -20,6 +20,8 @@ import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from utils.json_store import ConcurrentUpdateError, update_json_document
+
 
 # Workorder ID Generation Helper
 def generate_workorder_id(feature_name: str) -> str:
@@ -610,63 +612,78 @@ def parse_agent_status(communication_json_path: Path) -> Dict[str, any]:
     try:
         content = communication_json_path.read_text(encoding='utf-8')
         data = json.loads(content)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in communication file: {e}")
 
-        result = {
-            'feature': data.get('feature', 'UNKNOWN'),
-            'workorder_id': data.get('workorder_id', 'UNKNOWN'),
-            'agents': [],
-            'overall_status': 'UNKNOWN'
-        }
+    return agent_status_from_data(data)
 
-        # Find all agent status fields
-        agent_statuses = {}
-        for key, value in data.items():
-            if key.startswith('agent_') and key.endswith('_status'):
-                # Extract agent number from key (e.g., 'agent_2_status' -> '2')
-                agent_num = key.replace('agent_', '').replace('_status', '')
-                agent_statuses[agent_num] = value
-
-        # Build agent list
-        for agent_num in sorted(agent_statuses.keys(), key=lambda x: int(x) if x.isdigit() else 999):
-            status = agent_statuses[agent_num]
-            agent_info = {
-                'agent_number': agent_num,
-                'status': status if status else 'NOT_ASSIGNED',
-                'completion_time': None,
-                'blockers': []
-            }
-
-            # Look for completion details
-            completion_key = f'agent_{agent_num}_completion'
-            if completion_key in data:
-                completion = data[completion_key]
-                if isinstance(completion, dict):
-                    agent_info['completion_time'] = completion.get('timestamp')
-                    # Check for blockers
-                    if completion.get('verification', {}).get('forbidden_files_unchanged') is False:
-                        agent_info['blockers'].append('FORBIDDEN_FILES_MODIFIED')
-                    if completion.get('verification', {}).get('tests_passing') is False:
-                        agent_info['blockers'].append('TESTS_FAILING')
-
-            result['agents'].append(agent_info)
-
-        # Determine overall status
-        statuses = [a['status'] for a in result['agents']]
-        if all(s == 'NOT_ASSIGNED' or s is None or 'READY' in str(s) for s in statuses):
-            result['overall_status'] = 'READY'
-        elif any('VERIFIED' in str(s) for s in statuses):
-            result['overall_status'] = 'VERIFIED'
-        elif all('COMPLETE' in str(s) for s in statuses if s and s != 'NOT_ASSIGNED'):
-            result['overall_status'] = 'COMPLETE'
-        elif any('IN_PROGRESS' in str(s) or 'ASSIGNED' in str(s) for s in statuses):
-            result['overall_status'] = 'IN_PROGRESS'
-        else:
-            result['overall_status'] = 'READY'
 
-        return result
+def agent_status_from_data(data: Dict[str, any]) -> Dict[str, any]:
+    """
+    Build the agent status summary from already-loaded communication.json data.
 
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in communication file: {e}")
+    Lets handlers that just wrote communication.json record its status without
+    reading the file back. See parse_agent_status() for the result format.
+
+    Args:
+        data: Parsed communication.json
+
+    Returns:
+        Dictionary with feature, workorder_id, agents and overall_status
+    """
+    result = {
+        'feature': data.get('feature', 'UNKNOWN'),
+        'workorder_id': data.get('workorder_id', 'UNKNOWN'),
+        'agents': [],
+        'overall_status': 'UNKNOWN'
+    }
+
+    # Find all agent status fields
+    agent_statuses = {}
+    for key, value in data.items():
+        if key.startswith('agent_') and key.endswith('_status'):
+            # Extract agent number from key (e.g., 'agent_2_status' -> '2')
+            agent_num = key.replace('agent_', '').replace('_status', '')
+            agent_statuses[agent_num] = value
+
+    # Build agent list
+    for agent_num in sorted(agent_statuses.keys(), key=lambda x: int(x) if x.isdigit() else 999):
+        status = agent_statuses[agent_num]
+        agent_info = {
+            'agent_number': agent_num,
+            'status': status if status else 'NOT_ASSIGNED',
+            'completion_time': None,
+            'blockers': []
+        }
+
+        # Look for completion details
+        completion_key = f'agent_{agent_num}_completion'
+        if completion_key in data:
+            completion = data[completion_key]
+            if isinstance(completion, dict):
+                agent_info['completion_time'] = completion.get('timestamp')
+                # Check for blockers
+                if completion.get('verification', {}).get('forbidden_files_unchanged') is False:
+                    agent_info['blockers'].append('FORBIDDEN_FILES_MODIFIED')
+                if completion.get('verification', {}).get('tests_passing') is False:
+                    agent_info['blockers'].append('TESTS_FAILING')
+
+        result['agents'].append(agent_info)
+
+    # Determine overall status
+    statuses = [a['status'] for a in result['agents']]
+    if all(s == 'NOT_ASSIGNED' or s is None or 'READY' in str(s) for s in statuses):
+        result['overall_status'] = 'READY'
+    elif any('VERIFIED' in str(s) for s in statuses):
+        result['overall_status'] = 'VERIFIED'
+    elif all('COMPLETE' in str(s) for s in statuses if s and s != 'NOT_ASSIGNED'):
+        result['overall_status'] = 'COMPLETE'
+    elif any('IN_PROGRESS' in str(s) or 'ASSIGNED' in str(s) for s in statuses):
+        result['overall_status'] = 'IN_PROGRESS'
+    else:
+        result['overall_status'] = 'READY'
+
+    return result
 
 
 # Archive Feature Helpers (ARCHIVE-001, ARCHIVE-002)
@@ -704,43 +721,33 @@ def update_archive_index(project_path: Path, feature_name: str, folder_name: str
     # Ensure archived directory exists
     archived_dir.mkdir(parents=True, exist_ok=True)
 
-    # Load existing index or create new one
-    if index_path.exists():
-        try:
-            content = index_path.read_text(encoding='utf-8')
-            index_data = json.loads(content)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Corrupted index.json: {e}")
-    else:
-        index_data = {
-            'archived_features': [],
-            'total_archived': 0,
-            'last_updated': None
-        }
-
-    # Validate structure
-    if not isinstance(index_data.get('archived_features'), list):
-        raise ValueError("Invalid index.json: 'archived_features' must be an array")
+    def add_entry(index_data: dict) -> None:
+        # Validate structure
+        if not isinstance(index_data.get('archived_features'), list):
+            raise ValueError("Invalid index.json: 'archived_features' must be an array")
 
-    # Create new entry
-    new_entry = {
-        'feature_name': feature_name,
-        'folder_name': folder_name,
-        'archived_at': archived_at
-    }
+        # Create new entry
+        new_entry = {
+            'feature_name': feature_name,
+            'folder_name': folder_name,
+            'archived_at': archived_at
+        }
 
-    # Append to archived_features
-    index_data['archived_features'].append(new_entry)
-    index_data['total_archived'] = len(index_data['archived_features'])
-    index_data['last_updated'] = archived_at
+        # Append to archived_features
+        index_data['archived_features'].append(new_entry)
+        index_data['total_archived'] = len(index_data['archived_features'])
+        index_data['last_updated'] = archived_at
 
-    # Write back to file with indentation
+    # Load existing index (or create new one), append and write back atomically
     try:
-        index_path.write_text(
-            json.dumps(index_data, indent=2, ensure_ascii=False),
-            encoding='utf-8'
-        )
-    except IOError as e:
+        update_json_document(index_path, add_entry, default=lambda: {
+            'archived_features': [],
+            'total_archived': 0,
+            'last_updated': None
+        })
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Corrupted index.json: {e}")
+    except (IOError, ConcurrentUpdateError) as e:
         raise IOError(f"Failed to write index.json: {e}")
 
     # GAP-004 + GAP-005: Validate archive index with ValidatorFactory and centralized error handling
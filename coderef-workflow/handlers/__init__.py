@@ -1,5 +1,5 @@
 """Handlers module for coderef-workflow."""
 
-from .impact_analysis import ImpactAnalyzer
+from .impact_analysis import ImpactAnalyzer, RelationshipGraph
 
-__all__ = ['ImpactAnalyzer']
+__all__ = ['ImpactAnalyzer', 'RelationshipGraph']
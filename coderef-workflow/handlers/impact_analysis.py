@@ -8,16 +8,177 @@ Part of WO-WORKFLOW-SCANNER-INTEGRATION-001 IMPL-004, IMPL-005, IMPL-006
 """
 
 from pathlib import Path
-from typing import List, Dict, Set, Optional, Tuple
+from typing import List, Dict, Iterator, Optional, Tuple
 import sys
+import threading
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from coderef.utils import read_coderef_output
+from coderef.utils import read_coderef_index, CoderefIndex
 
 from logger_config import logger
 
 
+def _iter_bits(bits: int) -> Iterator[int]:
+    """Yield the indexes of set bits, lowest first."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class RelationshipGraph:
+    """
+    Element relationship maps for one index version, with names interned to ids.
+
+    downstream[i] lists the ids that call/use element i (calledBy); upstream[i]
+    lists the ids element i depends on (dependencies). Elements under .venv or
+    node_modules contribute no edges. Built once per index version by
+    get_relationship_graph() and shared; treat as read-only.
+    """
+
+    def __init__(self, elements: List[Dict]):
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+        # First element with each name (None for names that are only referenced)
+        self.elements: List[Optional[Dict]] = []
+
+        downstream: Dict[int, List[int]] = {}
+        upstream: Dict[int, List[int]] = {}
+
+        for elem in elements:
+            name = elem.get('name')
+            if not name:
+                continue
+
+            node = self._intern(name)
+            if self.elements[node] is None:
+                self.elements[node] = elem
+
+            # Skip .venv and node_modules
+            file_path = elem.get('file') or ''
+            if '.venv' in file_path or 'node_modules' in file_path:
+                continue
+
+            # Later elements with the same name replace earlier relationships
+            calledBy = elem.get('calledBy', [])
+            if calledBy:
+                downstream[node] = [self._intern(dependent) for dependent in calledBy]
+            dependencies = elem.get('dependencies', [])
+            if dependencies:
+                upstream[node] = [self._intern(dependency) for dependency in dependencies]
+
+        self.downstream: List[Tuple[int, ...]] = [tuple(downstream.get(i, ())) for i in range(len(self.names))]
+        self.upstream: List[Tuple[int, ...]] = [tuple(upstream.get(i, ())) for i in range(len(self.names))]
+
+        logger.debug(f"Relationship graph: {len(self.names)} names, {sum(map(len, self.downstream))} edges")
+
+    def _intern(self, name: str) -> int:
+        node = self.ids.get(name)
+        if node is None:
+            node = len(self.names)
+            self.ids[name] = node
+            self.names.append(name)
+            self.elements.append(None)
+        return node
+
+    def element(self, name: str) -> Optional[Dict]:
+        """First element with this name, or None."""
+        node = self.ids.get(name)
+        return self.elements[node] if node is not None else None
+
+    def bfs(
+        self,
+        source_ids: List[int],
+        max_depth: int = 3,
+        direction: str = 'downstream'
+    ) -> List[Tuple[int, int, int, int]]:
+        """
+        Level-synchronous BFS from several sources at once.
+
+        Source i is tracked as bit i of an integer mask. Each level's frontier
+        is the previous level's arrivals in order, and a node is expanded once
+        per arrival, only for the sources that reached it then. Restricted to
+        one source, the arrivals therefore come in the order, at the depths
+        and from the parents of that source's own FIFO BFS. Names without an
+        element are never reached (as in a single-source traversal).
+
+        Args:
+            source_ids: Interned source ids (-1 for unknown names)
+            max_depth: Maximum traversal depth
+            direction: 'downstream' or 'upstream'
+
+        Returns:
+            Arrivals in discovery order: (node, depth, new source bits, parent node)
+        """
+        adjacency = self.downstream if direction == 'downstream' else self.upstream
+
+        reached: Dict[int, int] = {}
+        frontier: List[Tuple[int, int]] = []
+        for index, node in enumerate(source_ids):
+            if node >= 0:
+                frontier.append((node, 1 << index))
+                reached[node] = reached.get(node, 0) | (1 << index)
+
+        arrivals: List[Tuple[int, int, int, int]] = []
+        depth = 0
+        while frontier and depth < max_depth:
+            depth += 1
+            next_frontier: List[Tuple[int, int]] = []
+            for node, bits in frontier:
+                for neighbor in adjacency[node]:
+                    if self.elements[neighbor] is None:
+                        continue
+                    new_bits = bits & ~reached.get(neighbor, 0)
+                    if new_bits:
+                        reached[neighbor] = reached.get(neighbor, 0) | new_bits
+                        next_frontier.append((neighbor, new_bits))
+                        arrivals.append((neighbor, depth, new_bits, node))
+            frontier = next_frontier
+
+        return arrivals
+
+
+# Per-project relationship graphs: resolved project path -> (CoderefIndex, RelationshipGraph)
+_graph_cache: Dict[str, Tuple[CoderefIndex, RelationshipGraph]] = {}
+_graph_lock = threading.Lock()
+
+
+def get_relationship_graph(project_path: Path) -> RelationshipGraph:
+    """
+    Get the relationship graph for a project's current .coderef/index.json.
+
+    The graph is rebuilt only when read_coderef_index() returns a new index
+    version (i.e. index.json changed).
+
+    Args:
+        project_path: Path to project root directory
+
+    Returns:
+        Shared RelationshipGraph
+
+    Raises:
+        FileNotFoundError: If .coderef/index.json doesn't exist
+    """
+    index = read_coderef_index(str(project_path))
+    key = str(Path(project_path).resolve())
+
+    with _graph_lock:
+        cached = _graph_cache.get(key)
+        if cached and cached[0] is index:
+            return cached[1]
+
+        graph = RelationshipGraph(index.elements)
+        _graph_cache[key] = (index, graph)
+        return graph
+
+
+def _clear_graph_cache() -> None:
+    """Clear cached relationship graphs (useful for testing)."""
+    with _graph_lock:
+        _graph_cache.clear()
+
+
 class ImpactAnalyzer:
     """
     Analyzes code change impact using relationship graphs.
@@ -37,6 +198,7 @@ class ImpactAnalyzer:
         """
         self.project_path = project_path
         self.elements_cache = None  # Lazy-loaded from .coderef/index.json
+        self.graph = None  # Lazy-loaded shared RelationshipGraph
         logger.debug(f"ImpactAnalyzer initialized for: {project_path}")
 
     def _load_elements(self) -> List[Dict]:
@@ -48,7 +210,7 @@ class ImpactAnalyzer:
         """
         if self.elements_cache is None:
             try:
-                self.elements_cache = read_coderef_output(str(self.project_path), 'index')
+                self.elements_cache = read_coderef_index(str(self.project_path)).elements
                 if not self.elements_cache:
                     self.elements_cache = []
                 logger.info(f"Loaded {len(self.elements_cache)} elements from .coderef/index.json")
@@ -58,6 +220,22 @@ class ImpactAnalyzer:
 
         return self.elements_cache
 
+    def _load_graph(self) -> 'RelationshipGraph':
+        """
+        Get the relationship graph for the current index version (lazy loading).
+
+        Returns:
+            Shared RelationshipGraph (empty if .coderef/index.json is unavailable)
+        """
+        if self.graph is None:
+            try:
+                self.graph = get_relationship_graph(self.project_path)
+            except Exception as e:
+                logger.warning(f"Failed to load relationship graph: {str(e)}")
+                self.graph = RelationshipGraph([])
+
+        return self.graph
+
     def _find_element_by_name(self, element_name: str) -> Optional[Dict]:
         """
         Find an element by name in the loaded elements.
@@ -68,13 +246,7 @@ class ImpactAnalyzer:
         Returns:
             ElementData dict or None if not found
         """
-        elements = self._load_elements()
-
-        for elem in elements:
-            if elem.get('name') == element_name:
-                return elem
-
-        return None
+        return self._load_graph().element(element_name)
 
     def traverse_dependencies(
         self,
@@ -100,73 +272,83 @@ class ImpactAnalyzer:
         """
         logger.debug(f"Traversing {direction} dependencies for: {element_name}, max_depth={max_depth}")
 
-        elements = self._load_elements()
-        if not elements:
+        graph = self._load_graph()
+        if not graph.names:
             logger.warning("No elements loaded - cannot traverse dependencies")
             return []
 
-        # Build relationship map: element_name -> [dependent_names]
-        relationship_map: Dict[str, List[str]] = {}
-
-        for elem in elements:
-            name = elem.get('name')
-            if not name:
-                continue
+        affected = self.traverse_dependencies_multi([element_name], max_depth, direction)['by_source'][element_name]
 
-            # Skip .venv and node_modules
-            file_path = elem.get('file', '')
-            if '.venv' in file_path or 'node_modules' in file_path:
-                continue
-
-            if direction == 'downstream':
-                # Who calls/uses this element? (calledBy field)
-                calledBy = elem.get('calledBy', [])
-                if calledBy:
-                    relationship_map[name] = calledBy
-            else:
-                # What does this element depend on? (dependencies field)
-                dependencies = elem.get('dependencies', [])
-                if dependencies:
-                    relationship_map[name] = dependencies
-
-        # BFS traversal
-        affected = []
-        visited: Set[str] = set()
-        queue: List[Tuple[str, int, List[str]]] = [(element_name, 0, [element_name])]
-
-        visited.add(element_name)
-
-        while queue:
-            current_name, depth, path = queue.pop(0)
-
-            # Stop if max depth reached
-            if depth >= max_depth:
-                continue
-
-            # Get elements that depend on current element
-            dependents = relationship_map.get(current_name, [])
+        logger.info(f"Found {len(affected)} affected elements (max_depth={max_depth})")
+        return affected
 
-            for dependent in dependents:
-                if dependent not in visited:
-                    visited.add(dependent)
+    def traverse_dependencies_multi(
+        self,
+        element_names: List[str],
+        max_depth: int = 3,
+        direction: str = 'downstream'
+    ) -> Dict:
+        """
+        Traverse dependencies of several changed elements in one multi-source BFS.
 
-                    # Find full element data
-                    elem_data = self._find_element_by_name(dependent)
-                    if elem_data:
-                        affected.append({
-                            'name': dependent,
-                            'type': elem_data.get('type', 'unknown'),
-                            'file': elem_data.get('file', ''),
-                            'line': elem_data.get('line', 0),
-                            'depth': depth + 1,
-                            'path': ' → '.join(path + [dependent])
-                        })
+        Each arrival carries the changed elements reaching a node for the
+        first time and the node it came from, so by_source[name] (order,
+        depths and paths) equals traverse_dependencies(name) for each name.
 
-                        # Add to queue for further traversal
-                        queue.append((dependent, depth + 1, path + [dependent]))
+        Args:
+            element_names: Names of the changed elements
+            max_depth: Maximum traversal depth (default: 3)
+            direction: 'downstream' (who depends on me) or 'upstream' (what I depend on)
 
-        logger.info(f"Found {len(affected)} affected elements (max_depth={max_depth})")
-        return affected
+        Returns:
+            dict with:
+            - affected: Combined impact set in discovery order; each entry has
+              name/type/file/line, depth and path (nearest changed element),
+              sources (changed elements reaching it) and source_depths
+            - by_source: Dict mapping element_name -> affected list for that element
+        """
+        graph = self._load_graph()
+        if not graph.names:
+            logger.warning("No elements loaded - cannot traverse dependencies")
+            return {'affected': [], 'by_source': {name: [] for name in element_names}}
+
+        sources = list(dict.fromkeys(element_names))
+        # Names not in the graph have no relationships (-1 is never traversed)
+        source_ids = [graph.ids.get(name, -1) for name in sources]
+
+        # Per source: node -> path from that source
+        paths: List[Dict[int, str]] = [{node: name} for node, name in zip(source_ids, sources)]
+        by_source: Dict[str, List[Dict]] = {name: [] for name in sources}
+        combined: Dict[int, Dict] = {}
+
+        for node, depth, bits, parent in graph.bfs(source_ids, max_depth=max_depth, direction=direction):
+            elem_data = graph.elements[node]
+            for source_index in _iter_bits(bits):
+                source = sources[source_index]
+                path = f"{paths[source_index][parent]} → {graph.names[node]}"
+                paths[source_index][node] = path
+                entry = {
+                    'name': graph.names[node],
+                    'type': elem_data.get('type', 'unknown'),
+                    'file': elem_data.get('file', ''),
+                    'line': elem_data.get('line', 0),
+                    'depth': depth,
+                    'path': path
+                }
+                by_source[source].append(entry)
+
+                combined_entry = combined.get(node)
+                if combined_entry is None:
+                    combined_entry = dict(entry, sources=[], source_depths={})
+                    combined[node] = combined_entry
+                combined_entry['sources'].append(source)
+                combined_entry['source_depths'][source] = depth
+
+        logger.debug(
+            f"Found {len(combined)} affected elements for {len(sources)} changed elements "
+            f"(max_depth={max_depth})"
+        )
+        return {'affected': list(combined.values()), 'by_source': by_source}
 
     def calculate_impact_score(self, affected_elements: List[Dict]) -> Dict:
         """
@@ -376,3 +558,50 @@ class ImpactAnalyzer:
             'impact_score': score,
             'report': report
         }
+
+    def analyze_elements_impact(
+        self,
+        element_names: List[str],
+        max_depth: int = 3
+    ) -> Dict:
+        """
+        Impact analysis for several changed elements from one traversal.
+
+        Equivalent to calling analyze_element_impact() per element, but the
+        dependency graph is walked once for all of them.
+
+        Args:
+            element_names: Names of elements to analyze
+            max_depth: Maximum traversal depth
+
+        Returns:
+            dict with:
+            - results: Dict mapping element_name -> analyze_element_impact() result
+              (elements that don't exist are omitted)
+            - combined_affected: Combined impact set with per-element attribution
+            - combined_score: Impact score dict for the combined set
+        """
+        found = [name for name in dict.fromkeys(element_names) if self._find_element_by_name(name)]
+        for name in element_names:
+            if name not in found:
+                logger.warning(f"Element not found: {name}")
+
+        logger.info(f"Analyzing impact for {len(found)} elements")
+        traversal = self.traverse_dependencies_multi(found, max_depth=max_depth, direction='downstream')
+
+        results = {}
+        for name in found:
+            affected = traversal['by_source'][name]
+            score = self.calculate_impact_score(affected)
+            results[name] = {
+                'element_name': name,
+                'affected_elements': affected,
+                'impact_score': score,
+                'report': self.generate_impact_report(name, affected, score)
+            }
+
+        return {
+            'results': results,
+            'combined_affected': traversal['affected'],
+            'combined_score': self.calculate_impact_score(traversal['affected'])
+        }
@@ -3,30 +3,56 @@ MCP-to-MCP Client for inter-server communication.
 
 Allows coderef-workflow MCP to call tools from coderef-context MCP.
 Implements JSON-RPC 2.0 protocol over stdio transport.
+
+One subprocess session is multiplexed across callers: a background reader
+task routes each response to the waiting request by JSON-RPC `id`, and
+writes are serialized with a lock, so many tool calls can be in flight at
+once without reading each other's responses.
 """
 
-import subprocess
 import json
 import logging
 import asyncio
+import os
+import subprocess
+import sys
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Number of coderef-context worker processes behind call_coderef_tool
+POOL_SIZE = int(os.getenv("CODEREF_CONTEXT_POOL_SIZE", "2"))
+
+# Seconds between worker health checks (0 disables the background check)
+HEALTH_CHECK_INTERVAL = float(os.getenv("CODEREF_CONTEXT_HEALTH_INTERVAL", "30"))
+
+# Most recently used projects remembered for worker affinity
+AFFINITY_SIZE = int(os.getenv("CODEREF_CONTEXT_AFFINITY_SIZE", "256"))
+
+# Start pool workers when the workflow server starts
+WARM_UP_ON_START = os.getenv("CODEREF_CONTEXT_WARMUP", "true").lower() == "true"
+
 
 class MCPToolClient:
     """
     Lightweight MCP client for calling coderef-context tools from coderef-workflow.
 
     Uses JSON-RPC 2.0 protocol over stdio subprocess communication.
-    Supports retries, timeouts, and graceful error handling.
+    Supports concurrent calls, retries, timeouts, and graceful error handling.
     """
 
     # Class-level singleton instance
     _instance: Optional['MCPToolClient'] = None
     _lock = asyncio.Lock()
 
+    # MCP protocol version sent in the initialize handshake
+    PROTOCOL_VERSION = "2024-11-05"
+
+    # Max bytes per stdout line (coderef_scan results can be large)
+    STREAM_LIMIT = 64 * 1024 * 1024
+
     def __init__(self, server_script_path: Optional[str] = None):
         """
         Initialize MCP client.
@@ -40,42 +66,230 @@ class MCPToolClient:
             server_script_path = str(Path(__file__).parent.parent / "coderef-context" / "server.py")
 
         self.server_script_path = server_script_path
-        self.process: Optional[subprocess.Popen] = None
+        self.process: Optional[asyncio.subprocess.Process] = None
         self.message_id = 0
         self.timeout_seconds = 120  # Increased from 30s to 120s (5x safety margin for large AST scans)
+        self.handshake_timeout = 30
         self.max_retries = 3
+        self.server_info: Optional[Dict[str, Any]] = None
+
+        # In-flight requests awaiting a response, keyed by JSON-RPC id
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._reader_task: Optional[asyncio.Task] = None
+        self._stderr_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._write_lock: Optional[asyncio.Lock] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
 
         logger.debug(f"Initialized MCPToolClient with server: {server_script_path}")
 
+    @property
+    def connected(self) -> bool:
+        """True while the session's process and reader task are alive on the running loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return (
+            self.process is not None
+            and self.process.returncode is None
+            and self._reader_task is not None
+            and not self._reader_task.done()
+            and self._loop is loop
+        )
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently awaiting a response."""
+        return len(self._pending)
+
+    def _bind_loop(self) -> None:
+        """Create loop-bound locks, resetting state left over from another event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._reap_stale_process()
+            self._loop = loop
+            self._write_lock = asyncio.Lock()
+            self._connect_lock = asyncio.Lock()
+            self._reader_task = None
+            self._stderr_task = None
+            self._pending = {}
+
+    def _reap_stale_process(self) -> None:
+        """
+        Stop a server process started on a previous event loop.
+
+        Its pipes belong to that loop and cannot be awaited here, so the child
+        is terminated and reaped through the underlying Popen object.
+        """
+        process, self.process = self.process, None
+        if process is None or process.returncode is not None:
+            return
+
+        transport = getattr(process, "_transport", None)
+        popen = transport.get_extra_info("subprocess") if transport is not None else None
+        if popen is None:
+            logger.warning(f"Cannot reap MCP server process {process.pid} from a previous event loop")
+            return
+
+        try:
+            popen.terminate()
+            popen.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            popen.kill()
+            popen.wait()
+        except OSError:
+            pass
+        logger.info(f"Stopped MCP server process {process.pid} left by a previous event loop")
+
     async def connect(self) -> bool:
         """
-        Start the MCP server subprocess.
+        Start the MCP server subprocess and perform the initialize handshake.
 
         Returns:
             True if connection successful, False otherwise.
         """
-        try:
-            if self.process and self.process.poll() is None:
+        self._bind_loop()
+
+        async with self._connect_lock:
+            if self.connected:
                 logger.debug("MCP server already running")
                 return True
 
-            # Start server process
-            self.process = subprocess.Popen(
-                ["python", self.server_script_path],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1  # Line buffered
-            )
+            try:
+                # Start server process
+                self.process = await asyncio.create_subprocess_exec(
+                    sys.executable, self.server_script_path,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    limit=self.STREAM_LIMIT
+                )
+                logger.info(f"Started MCP server process (PID: {self.process.pid})")
 
-            logger.info(f"Started MCP server process (PID: {self.process.pid})")
-            await asyncio.sleep(0.5)  # Give server time to start
+                self._reader_task = asyncio.create_task(self._read_responses(self.process))
+                self._stderr_task = asyncio.create_task(self._drain_stderr(self.process))
+
+                response = await self._request("initialize", {
+                    "protocolVersion": self.PROTOCOL_VERSION,
+                    "capabilities": {},
+                    "clientInfo": {"name": "coderef-workflow", "version": "1.0.0"}
+                }, timeout=self.handshake_timeout)
+
+                if "error" in response:
+                    raise RuntimeError(response["error"].get("message", "initialize failed"))
+
+                self.server_info = response.get("result", {}).get("serverInfo")
+                await self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+                return True
+            except Exception as e:
+                logger.error(f"Failed to connect to MCP server: {str(e)}")
+                await self._terminate()
+                return False
+
+    async def _send(self, message: Dict[str, Any]) -> None:
+        """Write one JSON-RPC message; the lock keeps concurrent writes from interleaving."""
+        line = (json.dumps(message) + "\n").encode("utf-8")
+        async with self._write_lock:
+            self.process.stdin.write(line)
+            await self.process.stdin.drain()
+
+    async def _request(self, method: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """
+        Send a JSON-RPC request and wait for the response with the same id.
 
-            return True
+        Raises:
+            asyncio.TimeoutError: If no response arrives within timeout
+            RuntimeError: If the server exits before responding
+        """
+        self.message_id += 1
+        request_id = self.message_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+
+        try:
+            request = {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": method,
+                "params": params
+            }
+            logger.debug(f"Sending MCP request: {json.dumps(request)[:100]}...")
+            await self._send(request)
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _read_responses(self, process: asyncio.subprocess.Process) -> None:
+        """Background task: route each response line to its pending request by id."""
+        error = RuntimeError("MCP server closed connection unexpectedly")
+        try:
+            while True:
+                line = await process.stdout.readline()
+                if not line:
+                    break
+                line = line.strip()
+                if not line:
+                    continue
+
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.error(f"Failed to parse MCP response: {line[:200]!r}")
+                    continue
+
+                await self._dispatch(message)
+        except asyncio.CancelledError:
+            error = RuntimeError("MCP client disconnected")
+            raise
         except Exception as e:
-            logger.error(f"Failed to connect to MCP server: {str(e)}")
-            return False
+            logger.error(f"MCP reader stopped: {str(e)}")
+            error = RuntimeError(f"MCP reader failed: {str(e)}")
+        finally:
+            self._fail_pending(error)
+
+    async def _dispatch(self, message: Dict[str, Any]) -> None:
+        """Handle one message from the server."""
+        if "method" in message:
+            # Server-initiated request or notification
+            if "id" in message:
+                if message["method"] == "ping":
+                    reply = {"jsonrpc": "2.0", "id": message["id"], "result": {}}
+                else:
+                    reply = {
+                        "jsonrpc": "2.0",
+                        "id": message["id"],
+                        "error": {"code": -32601, "message": f"Method not found: {message['method']}"}
+                    }
+                await self._send(reply)
+            return
+
+        future = self._pending.pop(message.get("id"), None)
+        if future is None:
+            logger.debug(f"Dropping MCP response with unknown id: {message.get('id')}")
+        elif not future.done():
+            future.set_result(message)
+
+    async def _drain_stderr(self, process: asyncio.subprocess.Process) -> None:
+        """Keep the server's stderr pipe from filling up and blocking it."""
+        try:
+            while True:
+                line = await process.stderr.readline()
+                if not line:
+                    break
+                logger.debug(f"coderef-context: {line.decode('utf-8', errors='replace').rstrip()}")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            pass
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every in-flight request (server exited or client disconnected)."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
 
     async def call_tool(
         self,
@@ -86,6 +300,8 @@ class MCPToolClient:
         """
         Call an MCP tool in coderef-context server.
 
+        Safe to call concurrently; all calls share one server session.
+
         Args:
             tool_name: Name of tool to call (e.g., "coderef_scan")
             tool_args: Arguments to pass to tool
@@ -100,51 +316,20 @@ class MCPToolClient:
             RuntimeError: If tool execution fails
         """
         # Ensure connected
-        if not self.process or self.process.poll() is not None:
+        if not self.connected:
             connected = await self.connect()
             if not connected:
                 raise ConnectionError("Failed to connect to MCP server")
 
         try:
-            # Build JSON-RPC request
-            self.message_id += 1
-            request = {
-                "jsonrpc": "2.0",
-                "id": self.message_id,
-                "method": "tools/call",
-                "params": {
+            try:
+                response = await self._request("tools/call", {
                     "name": tool_name,
                     "arguments": tool_args
-                }
-            }
-
-            # Send request
-            request_json = json.dumps(request)
-            logger.debug(f"Sending MCP request: {request_json[:100]}...")
-
-            self.process.stdin.write(request_json + "\n")
-            self.process.stdin.flush()
-
-            # Read response with timeout
-            try:
-                loop = asyncio.get_event_loop()
-                response_line = await asyncio.wait_for(
-                    loop.run_in_executor(None, self.process.stdout.readline),
-                    timeout=self.timeout_seconds
-                )
+                }, timeout=self.timeout_seconds)
             except asyncio.TimeoutError:
                 raise TimeoutError(f"Tool call '{tool_name}' exceeded {self.timeout_seconds}s timeout")
 
-            if not response_line:
-                raise RuntimeError(f"MCP server closed connection unexpectedly")
-
-            # Parse response
-            try:
-                response = json.loads(response_line)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse MCP response: {response_line}")
-                raise RuntimeError(f"Invalid JSON response from MCP server: {str(e)}")
-
             # Check for errors
             if "error" in response:
                 error_msg = response["error"].get("message", "Unknown error")
@@ -178,6 +363,31 @@ class MCPToolClient:
             logger.error(f"Unexpected error calling tool '{tool_name}': {str(e)}")
             raise RuntimeError(f"Tool call failed: {str(e)}")
 
+    async def call_tools(self, calls: List[tuple]) -> List[Any]:
+        """
+        Issue several tool calls concurrently over the shared session.
+
+        Args:
+            calls: List of (tool_name, tool_args) tuples
+
+        Returns:
+            Results in the same order; failed calls are returned as exceptions
+        """
+        return await asyncio.gather(
+            *(self.call_tool(name, args) for name, args in calls),
+            return_exceptions=True
+        )
+
+    async def ping(self, timeout: float = 5) -> bool:
+        """Check that the server session is alive and responding."""
+        if not self.connected:
+            return False
+        try:
+            response = await self._request("ping", {}, timeout=timeout)
+        except Exception:
+            return False
+        return "error" not in response
+
     def _is_retryable(self, error_msg: str) -> bool:
         """Check if error is likely transient and worth retrying."""
         retryable_patterns = [
@@ -189,16 +399,32 @@ class MCPToolClient:
         ]
         return any(pattern in error_msg.lower() for pattern in retryable_patterns)
 
+    async def _terminate(self) -> None:
+        """Stop background tasks and the server process, failing in-flight calls."""
+        for task in (self._reader_task, self._stderr_task):
+            if task is not None and not task.done():
+                task.cancel()
+        self._reader_task = None
+        self._stderr_task = None
+        self._fail_pending(RuntimeError("MCP client disconnected"))
+
+        process, self.process = self.process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            await asyncio.wait_for(process.wait(), timeout=5)
+            logger.info("MCP server disconnected")
+        except Exception as e:
+            logger.warning(f"Error disconnecting MCP server: {str(e)}")
+            try:
+                process.kill()
+            except Exception:
+                pass
+
     async def disconnect(self):
         """Gracefully shutdown MCP server."""
-        if self.process and self.process.poll() is None:
-            try:
-                self.process.stdin.close()
-                self.process.wait(timeout=5)
-                logger.info("MCP server disconnected")
-            except Exception as e:
-                logger.warning(f"Error disconnecting MCP server: {str(e)}")
-                self.process.kill()
+        await self._terminate()
 
     @classmethod
     async def get_instance(cls, server_path: Optional[str] = None) -> 'MCPToolClient':
@@ -220,6 +446,169 @@ class MCPToolClient:
         return cls._instance
 
 
+class MCPClientPool:
+    """
+    Pool of coderef-context sessions behind call_coderef_tool.
+
+    Calls for a project are routed to the same worker so its parsed index
+    stays hot; new projects (and calls without a project_path) go to the
+    least-loaded worker. Crashed workers are restarted on their next call
+    and by the periodic health check.
+    """
+
+    _instance: Optional['MCPClientPool'] = None
+    _lock = asyncio.Lock()
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        server_script_path: Optional[str] = None,
+        health_check_interval: Optional[float] = None
+    ):
+        """
+        Initialize pool (workers are started by start() or on first use).
+
+        Args:
+            size: Number of worker sessions (default: CODEREF_CONTEXT_POOL_SIZE)
+            server_script_path: Path to coderef-context server.py
+            health_check_interval: Seconds between health checks, 0 to disable
+        """
+        size = POOL_SIZE if size is None else size
+        self.workers: List[MCPToolClient] = [
+            MCPToolClient(server_script_path) for _ in range(max(1, size))
+        ]
+        self.health_check_interval = (
+            HEALTH_CHECK_INTERVAL if health_check_interval is None else health_check_interval
+        )
+        self.restarts = 0
+
+        # Project key -> worker index, least recently used first (bounded by AFFINITY_SIZE)
+        self._affinity: "OrderedDict[str, int]" = OrderedDict()
+        self._health_task: Optional[asyncio.Task] = None
+
+    @property
+    def size(self) -> int:
+        return len(self.workers)
+
+    async def start(self) -> int:
+        """
+        Warm up all workers concurrently and start health checks.
+
+        Returns:
+            Number of workers that connected
+        """
+        results = await asyncio.gather(*(worker.connect() for worker in self.workers))
+        if self.health_check_interval > 0 and (self._health_task is None or self._health_task.done()):
+            self._health_task = asyncio.create_task(self._health_loop())
+
+        connected = sum(1 for ok in results if ok)
+        logger.info(f"coderef-context pool ready: {connected}/{self.size} workers")
+        return connected
+
+    @staticmethod
+    def _affinity_key(tool_args: Dict[str, Any]) -> Optional[str]:
+        project_path = tool_args.get("project_path")
+        if not project_path:
+            return None
+        try:
+            return str(Path(project_path).resolve())
+        except (OSError, ValueError):
+            return str(project_path)
+
+    def _least_loaded(self) -> int:
+        """Index of the worker with the fewest in-flight calls, then fewest projects."""
+        assigned = [0] * self.size
+        for index in self._affinity.values():
+            assigned[index] += 1
+        return min(range(self.size), key=lambda i: (self.workers[i].in_flight, assigned[i], i))
+
+    def select_worker(self, tool_args: Dict[str, Any]) -> MCPToolClient:
+        """Pick the worker for a call (project affinity, else least-loaded)."""
+        key = self._affinity_key(tool_args)
+        if key is None:
+            return self.workers[self._least_loaded()]
+
+        index = self._affinity.get(key)
+        if index is None:
+            index = self._least_loaded()
+            self._affinity[key] = index
+            while len(self._affinity) > max(1, AFFINITY_SIZE):
+                self._affinity.popitem(last=False)
+        else:
+            self._affinity.move_to_end(key)
+        return self.workers[index]
+
+    async def call_tool(self, tool_name: str, tool_args: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Call a coderef-context tool on the routed worker.
+
+        A worker whose process has exited is restarted by MCPToolClient.call_tool.
+        """
+        worker = self.select_worker(tool_args)
+        if worker.process is not None and not worker.connected:
+            self.restarts += 1
+            logger.warning("Restarting crashed coderef-context worker")
+        return await worker.call_tool(tool_name, tool_args)
+
+    async def health_check(self) -> List[bool]:
+        """
+        Ping every worker, restarting any that are dead or unresponsive.
+
+        Returns:
+            Health of each worker after the check
+        """
+        async def check(worker: MCPToolClient) -> bool:
+            if await worker.ping():
+                return True
+            if worker.in_flight:
+                return True  # Busy with long calls; not evidence of a crash
+            self.restarts += 1
+            logger.warning("coderef-context worker failed health check, restarting")
+            await worker.disconnect()
+            return await worker.connect()
+
+        return list(await asyncio.gather(*(check(worker) for worker in self.workers)))
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            try:
+                await self.health_check()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"coderef-context health check failed: {str(e)}")
+
+    async def close(self) -> None:
+        """Stop health checks and shut down every worker."""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        await asyncio.gather(*(worker.disconnect() for worker in self.workers))
+        self._affinity.clear()
+
+    @classmethod
+    async def get_instance(cls) -> 'MCPClientPool':
+        """Get the process-wide pool, creating it on first use."""
+        if cls._instance is None:
+            async with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    async def warm_up(cls) -> int:
+        """Start the process-wide pool's workers (called at server start)."""
+        pool = await cls.get_instance()
+        return await pool.start()
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close the process-wide pool, if one was created."""
+        if cls._instance is not None:
+            await cls._instance.close()
+
+
 # Convenience function for async code
 async def call_coderef_tool(
     tool_name: str,
@@ -228,6 +617,8 @@ async def call_coderef_tool(
     """
     Convenience function to call a coderef tool.
 
+    Routed through the process-wide MCPClientPool.
+
     Args:
         tool_name: Name of tool to call
         tool_args: Arguments to pass to tool
@@ -238,5 +629,5 @@ async def call_coderef_tool(
     Raises:
         ConnectionError, TimeoutError, RuntimeError on failure
     """
-    client = await MCPToolClient.get_instance()
-    return await client.call_tool(tool_name, tool_args)
+    pool = await MCPClientPool.get_instance()
+    return await pool.call_tool(tool_name, tool_args)
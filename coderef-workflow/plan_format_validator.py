@@ -12,7 +12,7 @@ Rejects non-standard formats with clear guidance.
 import json
 import re
 from pathlib import Path
-from typing import Tuple, Optional, List
+from typing import Any, Tuple, Optional, List
 from logger_config import logger
 
 
@@ -41,7 +41,7 @@ class PlanFormatError(ValueError):
         super().__init__(f"{message}\n\nSuggestion: {suggestion}")
 
 
-def validate_plan_format(plan_path: Path) -> Tuple[bool, Optional[str]]:
+def validate_plan_format(plan_path: Path, plan_data: Optional[Any] = None) -> Tuple[bool, Optional[str]]:
     """
     Validate that plan file is in correct format.
 
@@ -52,6 +52,8 @@ def validate_plan_format(plan_path: Path) -> Tuple[bool, Optional[str]]:
 
     Args:
         plan_path: Path to plan file
+        plan_data: Plan content the caller already parsed from plan_path
+            (skips reading the file again)
 
     Returns:
         Tuple of (is_valid, error_message)
@@ -90,6 +92,9 @@ def validate_plan_format(plan_path: Path) -> Tuple[bool, Optional[str]]:
     if not plan_path.exists():
         return False, f"Plan file not found: {plan_path}"
 
+    if plan_data is not None:
+        return True, None
+
     # Validate JSON content
     try:
         with open(plan_path, 'r', encoding='utf-8') as f:
@@ -173,7 +178,8 @@ def validate_plan_location(plan_path: Path, project_path: Path) -> Tuple[bool, O
 def enforce_plan_format(
     plan_path: Path,
     project_path: Path = None,
-    strict: bool = False
+    strict: bool = False,
+    plan_data: Optional[Any] = None
 ) -> Tuple[bool, List[str], Optional[str]]:
     """
     Enforce plan.json format with comprehensive validation.
@@ -184,6 +190,7 @@ def enforce_plan_format(
         plan_path: Path to plan file
         project_path: Root project directory (optional)
         strict: If True, treat location warnings as errors
+        plan_data: Plan content the caller already parsed from plan_path
 
     Returns:
         Tuple of (is_valid, errors_list, feature_name)
@@ -205,7 +212,7 @@ def enforce_plan_format(
     feature_name = None
 
     # Step 1: Validate format
-    format_valid, format_error = validate_plan_format(plan_path)
+    format_valid, format_error = validate_plan_format(plan_path, plan_data)
     if not format_valid:
         errors.append(format_error)
         logger.warning(f"Plan format validation failed: {plan_path}", extra={
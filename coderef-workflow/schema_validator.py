@@ -13,26 +13,26 @@ Modes:
 
 import json
 import logging
-from pathlib import Path
 from typing import Any
 
+from utils.schema_registry import PLAN_SCHEMA, registry as schema_registry
+
 logger = logging.getLogger(__name__)
 
 # Global strict mode flag - set True to log warnings on normalization
 STRICT_MODE = True  # Enable by default to help identify where AI generates wrong formats
 
-# Schema directory relative to this file
-SCHEMA_DIR = Path(__file__).parent / "schemas"
-PLAN_SCHEMA_PATH = SCHEMA_DIR / "plan.schema.json"
+# Schema directory (shared with the process-wide schema registry)
+SCHEMA_DIR = schema_registry.schema_dir
+PLAN_SCHEMA_PATH = SCHEMA_DIR / PLAN_SCHEMA
 
 
 def load_plan_schema() -> dict:
-    """Load the plan.schema.json file."""
+    """Load the plan.schema.json file (parsed once per process, reloaded on change)."""
     if not PLAN_SCHEMA_PATH.exists():
         raise FileNotFoundError(f"Schema file not found: {PLAN_SCHEMA_PATH}")
 
-    with open(PLAN_SCHEMA_PATH, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return schema_registry.get(PLAN_SCHEMA).schema
 
 
 def validate_plan_schema(plan: dict) -> tuple[bool, list[str]]:
@@ -41,6 +41,9 @@ import tool_handlers
 # Import logging (ARCH-003)
 from logger_config import logger, log_tool_call
 
+# coderef-context worker pool
+from mcp_client import MCPClientPool, WARM_UP_ON_START
+
 # Get server directory
 SERVER_DIR = Path(__file__).parent
 TEMPLATES_DIR = SERVER_DIR / Paths.TEMPLATES_DIR
@@ -834,6 +837,48 @@ Run after /update-deliverables and before /archive-feature.''',
                 'required': ['project_path', 'feature_name', 'task_id', 'status']
             }
         ),
+        Tool(
+            name='batch_update_task_status',
+            description='Update many task statuses in plan.json in one call. Applies all updates with a single load and atomic write, validates once, and returns per-task results plus a progress summary. Nothing is written if any task ID is unknown.',
+            inputSchema={
+                'type': 'object',
+                'properties': {
+                    'project_path': {
+                        'type': 'string',
+                        'description': 'Absolute path to project directory'
+                    },
+                    'feature_name': {
+                        'type': 'string',
+                        'description': 'Feature name (folder in coderef/workorder/)',
+                        'pattern': '^[a-zA-Z0-9_-]+$'
+                    },
+                    'updates': {
+                        'type': 'array',
+                        'description': 'Status updates, applied in order',
+                        'minItems': 1,
+                        'items': {
+                            'type': 'object',
+                            'properties': {
+                                'task_id': {
+                                    'type': 'string',
+                                    'description': 'Task ID to update (e.g., "SETUP-001", "IMPL-002")'
+                                },
+                                'status': {
+                                    'type': 'string',
+                                    'enum': ['pending', 'in_progress', 'completed', 'blocked']
+                                },
+                                'notes': {
+                                    'type': 'string',
+                                    'description': 'Optional notes about the status change'
+                                }
+                            },
+                            'required': ['task_id', 'status']
+                        }
+                    }
+                },
+                'required': ['project_path', 'feature_name', 'updates']
+            }
+        ),
         Tool(
             name='audit_plans',
             description='Audit all plans in coderef/workorder/ directory (STUB-011). Provides plan format validation, progress status extraction, stale plan detection, issue identification and recommendations. Returns health score (0-100).',
@@ -1069,6 +1114,10 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
 async def main() -> None:
     """Run the server using stdio transport."""
     logger.info("Starting MCP server main loop")
+
+    # Warm up coderef-context workers in the background so the first planning call is fast
+    warm_up_task = asyncio.create_task(MCPClientPool.warm_up()) if WARM_UP_ON_START else None
+
     try:
         async with stdio_server() as (read_stream, write_stream):
             await app.run(
@@ -1079,6 +1128,10 @@ async def main() -> None:
     except Exception as e:
         logger.error(f"Server error: {str(e)}", exc_info=True)
         raise
+    finally:
+        if warm_up_task is not None:
+            warm_up_task.cancel()
+        await MCPClientPool.shutdown()
 
 
 if __name__ == "__main__":
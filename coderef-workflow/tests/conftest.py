@@ -4,12 +4,17 @@ Pytest configuration and shared fixtures for bug-fixes-testing.
 Workorder: WO-BUG-FIXES-TESTING-001
 """
 import os
+import sys
 import tempfile
 import shutil
 from pathlib import Path
 import pytest
 import json
 
+# Add repository root to path for the shared coderef/ utilities
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from coderef.utils import clear_caches
+
 
 @pytest.fixture
 def temp_project_dir():
@@ -158,3 +163,28 @@ def mock_validation_result_high_score():
         "issues": [],
         "approved": True
     }
+
+
+@pytest.fixture(autouse=True)
+def clear_file_caches():
+    """Run every test with empty process-wide file caches."""
+    clear_caches()
+    yield
+    clear_caches()
+
+
+@pytest.fixture
+def workorder_dir(tmp_path):
+    """Create and return coderef/workorder/ inside a temporary project."""
+    working = tmp_path / "coderef" / "workorder"
+    working.mkdir(parents=True)
+    return working
+
+
+@pytest.fixture
+def bump_mtime():
+    """Factory fixture moving a file's mtime forward, so a rewrite is seen as a change."""
+    def _bump(path, ns=1_000_000):
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + ns))
+    return _bump
@@ -0,0 +1,91 @@
+"""
+Tests for the materialized agent status view (utils/agent_status_view.py).
+"""
+
+import asyncio
+import json
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tool_handlers import handle_track_agent_status
+from utils import agent_status_view
+from utils.agent_status_view import get_agent_statuses, record_communication, view_path_for
+
+
+def _write_comm(working_dir, feature, **agents):
+    path = working_dir / feature / 'communication.json'
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {'feature': feature, 'workorder_id': f'WO-{feature.upper()}-001'}
+    data.update({f'agent_{number}_status': status for number, status in agents.items()})
+    path.write_text(json.dumps(data, indent=2), encoding='utf-8')
+    return path, data
+
+
+@pytest.fixture
+def working_dir(workorder_dir):
+    _write_comm(workorder_dir, 'auth', **{'1': 'COMPLETE', '2': None})
+    _write_comm(workorder_dir, 'search', **{'1': 'ASSIGNED - Agent 1 assigned to work'})
+    return workorder_dir
+
+
+class TestAgentStatusView:
+    """Test incremental updates and reconciliation."""
+
+    def test_unchanged_files_are_not_reparsed(self, working_dir, bump_mtime):
+        first = get_agent_statuses(working_dir)
+        assert [s['feature'] for s in first] == ['auth', 'search']
+        assert view_path_for(working_dir).exists()
+
+        with patch.object(agent_status_view, 'parse_agent_status', wraps=agent_status_view.parse_agent_status) as parse:
+            assert get_agent_statuses(working_dir) == first
+            assert parse.call_count == 0
+
+            # Out-of-band edit: only that feature is re-parsed
+            path, _ = _write_comm(working_dir, 'search', **{'1': 'COMPLETE'})
+            bump_mtime(path)
+            statuses = get_agent_statuses(working_dir)
+            assert parse.call_count == 1
+
+        assert statuses[1]['overall_status'] == 'COMPLETE'
+
+    def test_record_updates_view_without_reading(self, working_dir, bump_mtime):
+        get_agent_statuses(working_dir)
+
+        path, data = _write_comm(working_dir, 'auth', **{'1': 'VERIFIED', '2': 'COMPLETE'})
+        bump_mtime(path)
+        with patch.object(agent_status_view, 'parse_agent_status') as parse:
+            record_communication(path, data)
+            statuses = get_agent_statuses(working_dir)
+            assert parse.call_count == 0
+
+        assert statuses[0]['overall_status'] == 'VERIFIED'
+
+    def test_removed_and_broken_features(self, working_dir):
+        get_agent_statuses(working_dir)
+
+        (working_dir / 'search' / 'communication.json').unlink()
+        (working_dir / 'broken').mkdir()
+        (working_dir / 'broken' / 'communication.json').write_text('{oops', encoding='utf-8')
+
+        statuses = get_agent_statuses(working_dir)
+        assert [s['feature'] for s in statuses] == ['auth']
+
+        view = json.loads(view_path_for(working_dir).read_text(encoding='utf-8'))
+        assert set(view['features']) == {'auth', 'broken'}
+        assert 'error' in view['features']['broken']
+
+    def test_track_agent_status_dashboard(self, working_dir):
+        project = working_dir.parent.parent
+        text = asyncio.run(handle_track_agent_status({'project_path': str(project)}))[0].text
+        result = json.loads(text[text.index('{'):])
+
+        assert result['features_tracked'] == 2
+        assert result['total_agents'] == 3
+        assert result['status_summary']['available'] == 1
+        assert result['status_summary']['complete'] == 1
+        assert result['status_summary']['in_progress'] == 1
@@ -0,0 +1,99 @@
+"""
+Tests for the content-addressed baseline snapshot store (utils/baseline_store.py).
+"""
+
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tool_handlers import save_baseline_snapshot
+from utils.baseline_store import BaselineStore
+
+
+BASELINE_ELEMENTS = [
+    {'name': 'AuthService', 'type': 'class', 'file': 'auth.py', 'line': 1, 'complexity': 4},
+    {'name': 'login', 'type': 'function', 'file': 'auth.py', 'line': 10, 'complexity': 2},
+    {'name': 'CONFIG', 'type': 'constant', 'file': 'config.py', 'line': 1}
+]
+
+CURRENT_ELEMENTS = BASELINE_ELEMENTS[:1] + [
+    {'name': 'login', 'type': 'function', 'file': 'auth.py', 'line': 10, 'complexity': 6},
+    {'name': 'logout', 'type': 'method', 'file': 'auth.py', 'line': 20},
+    {'name': 'LoginForm', 'type': 'component', 'file': 'ui.tsx', 'line': 3}
+]
+
+
+def _write_index(project, elements):
+    index = project / '.coderef' / 'index.json'
+    index.parent.mkdir(parents=True, exist_ok=True)
+    index.write_text(json.dumps({'elements': elements}, indent=2), encoding='utf-8')
+
+
+@pytest.fixture
+def project(tmp_path):
+    _write_index(tmp_path, BASELINE_ELEMENTS)
+    return tmp_path
+
+
+def _objects(project):
+    return sorted(p.name for p in (project / 'coderef' / 'baselines' / 'objects').iterdir())
+
+
+class TestBaselineStore:
+    """Test snapshot storage, deduplication and comparison."""
+
+    def test_features_share_one_compressed_object(self, project):
+        assert save_baseline_snapshot(project, 'auth')
+        assert save_baseline_snapshot(project, 'search')
+
+        objects = _objects(project)
+        assert len(objects) == 2
+        assert any(name.endswith('.json.gz') for name in objects)
+        assert not (project / '.coderef' / 'index-baseline-auth.json').exists()
+
+        store = BaselineStore(project)
+        assert store.get_ref('auth')['hash'] == store.get_ref('search')['hash']
+        assert json.loads(store.load_snapshot('auth'))['elements'] == BASELINE_ELEMENTS
+        path = store.snapshot_path('auth')
+        assert path.relative_to(project).as_posix() == f"coderef/baselines/objects/{store.get_ref('auth')['hash']}.json.gz"
+
+    def test_changes_since_baseline(self, project):
+        store = BaselineStore(project)
+        store.save('auth')
+        _write_index(project, CURRENT_ELEMENTS)
+
+        changes = store.changes_since_baseline('auth')
+
+        assert changes['components_added'] == [{'name': 'LoginForm', 'type': 'component', 'file': 'ui.tsx', 'line': 3}]
+        assert [f['name'] for f in changes['functions_added']] == ['logout']
+        assert changes['complexity_delta'] == 2.0
+
+    def test_unreferenced_object_is_removed(self, project):
+        store = BaselineStore(project)
+        store.save('auth')
+        first = store.get_ref('auth')['hash']
+
+        _write_index(project, CURRENT_ELEMENTS)
+        store.save('auth')
+
+        assert store.get_ref('auth')['hash'] != first
+        assert not any(name.startswith(first) for name in _objects(project))
+
+    def test_legacy_baseline_is_imported(self, project):
+        legacy = project / '.coderef' / 'index-baseline-auth.json'
+        legacy.write_text(json.dumps(BASELINE_ELEMENTS), encoding='utf-8')
+        _write_index(project, CURRENT_ELEMENTS)
+
+        changes = BaselineStore(project).changes_since_baseline('auth')
+
+        assert not legacy.exists()
+        assert len(changes['components_added']) == 1
+        assert BaselineStore(project).get_ref('auth') is not None
+
+    def test_no_baseline(self, project):
+        assert BaselineStore(project).changes_since_baseline('missing') is None
+        assert BaselineStore(project).snapshot_path('missing') is None
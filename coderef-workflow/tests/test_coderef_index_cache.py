@@ -0,0 +1,127 @@
+"""
+Unit tests for the shared .coderef/ data layer (coderef.utils).
+
+A planning run should parse .coderef/index.json once and share the grouped views.
+"""
+
+import json
+import os
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from coderef.utils import check_coderef_available, read_coderef_output, read_coderef_index
+from coderef.utils import coderef_wrapper
+from generators.planning_analyzer import PlanningAnalyzer
+
+
+ELEMENTS = [
+    {"name": "AuthService", "type": "class", "file": "src/auth.ts", "line": 1},
+    {"name": "User", "type": "interface", "file": "src/types.ts", "line": 3},
+    {"name": "UserId", "type": "type", "file": "src/types.ts", "line": 9},
+    {"name": "Injectable", "type": "decorator", "file": "src/auth.ts", "line": 1},
+    {"name": "login", "type": "function", "file": "src/auth.ts", "line": 20},
+]
+
+
+@pytest.fixture
+def project(tmp_path):
+    coderef_dir = tmp_path / ".coderef"
+    coderef_dir.mkdir()
+    (coderef_dir / "index.json").write_text(json.dumps(ELEMENTS), encoding="utf-8")
+    return tmp_path
+
+
+class TestCoderefIndexCache:
+    """Test process-wide caching and grouped views."""
+
+    def test_grouped_views(self, project):
+        """Views should group elements by type, file and name in index order."""
+        index = read_coderef_index(str(project))
+
+        assert len(index) == 5
+        assert [e["name"] for e in index.by_type["class"]] == ["AuthService"]
+        assert [e["name"] for e in index.by_file["src/auth.ts"]] == ["AuthService", "Injectable", "login"]
+        assert index.find("login")["line"] == 20
+        assert index.type_counts()["interface"] == 1
+
+    def test_parsed_once_until_file_changes(self, project):
+        """Repeated reads should share one parse; editing the file reloads it."""
+        with patch.object(coderef_wrapper.json, "loads", wraps=json.loads) as loads:
+            first = read_coderef_output(str(project), "index")
+            assert read_coderef_output(str(project), "index") is first
+            assert read_coderef_index(str(project)).elements is first
+            assert loads.call_count == 1
+
+            index_path = project / ".coderef" / "index.json"
+            index_path.write_text(json.dumps(ELEMENTS[:2]), encoding="utf-8")
+            stat = index_path.stat()
+            os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+            assert len(read_coderef_index(str(project))) == 2
+            assert loads.call_count == 2
+
+    def test_missing_output_raises(self, tmp_path):
+        """Missing files and unknown output types keep their existing errors."""
+        with pytest.raises(FileNotFoundError):
+            read_coderef_output(str(tmp_path), "index")
+        with pytest.raises(ValueError):
+            read_coderef_output(str(tmp_path), "bogus")
+
+    @pytest.mark.asyncio
+    async def test_planning_analyzer_parses_index_once(self, project):
+        """Inventory, type system and decorator stages should share one parse."""
+        analyzer = PlanningAnalyzer(project)
+
+        with patch.object(coderef_wrapper.json, "loads", wraps=json.loads) as loads:
+            inventory = await analyzer.read_inventory_data()
+            type_system = await analyzer.get_type_system_elements()
+            decorators = await analyzer.get_decorator_elements()
+
+        assert loads.call_count == 1
+        assert inventory["total_elements"] == 5
+        assert inventory["files"] == 2
+        assert [i["name"] for i in type_system["interfaces"]] == ["User"]
+        assert [t["name"] for t in type_system["type_aliases"]] == ["UserId"]
+        assert [d["name"] for d in decorators] == ["Injectable"]
+
+
+class TestCoderefAvailabilityProbe:
+    """check_coderef_available should never parse a large index."""
+
+    def _write_index(self, project, content):
+        index_path = project / ".coderef" / "index.json"
+        index_path.write_text(content, encoding="utf-8")
+        stat = index_path.stat()
+        os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    def test_large_index_is_probed_not_parsed(self, project):
+        """Large indexes are checked from a header/tail read and cached on mtime."""
+        self._write_index(project, json.dumps(ELEMENTS * 500, indent=2))
+
+        with patch.object(coderef_wrapper.json, "loads", wraps=json.loads) as loads, \
+                patch.object(coderef_wrapper, "_probe_index", wraps=coderef_wrapper._probe_index) as probe:
+            assert check_coderef_available(str(project))
+            assert check_coderef_available(str(project))
+            assert loads.call_count == 0
+            assert probe.call_count == 1
+
+            self._write_index(project, "[" + " " * 10000 + "]")
+            assert not check_coderef_available(str(project))
+            assert probe.call_count == 2
+
+    def test_matches_full_parse(self, project):
+        """Empty, truncated and invalid indexes are unavailable, as before."""
+        large = json.dumps(ELEMENTS * 500)
+        cases = [("[]", False), ("{}", False), ("null", False), ("[1,", False),
+                 (json.dumps(ELEMENTS), True), (large, True), (large[:-1], False)]
+
+        for content, expected in cases:
+            self._write_index(project, content)
+            assert check_coderef_available(str(project)) is expected, content[:20]
+
+    def test_missing_index(self, tmp_path):
+        assert not check_coderef_available(str(tmp_path))
@@ -167,5 +167,128 @@ class TestCSVManager:
         assert all(results), "All checks should find resource"
 
 
+@pytest.fixture
+def temp_csv(tmp_path, monkeypatch):
+    """Point csv_manager at a temporary CSV with a few entries"""
+    import csv_manager
+
+    csv_path = tmp_path / "tools-and-commands.csv"
+    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=csv_manager.CSV_FIELDS)
+        writer.writeheader()
+        for i, (kind, server) in enumerate([('Command', 'coderef-workflow'), ('Tool', 'coderef-docs'),
+                                            ('Tool', 'coderef-workflow')]):
+            writer.writerow({
+                'Type': kind, 'Server': server, 'Category': 'Workflow', 'Name': f'/resource-{i}',
+                'Description': f'Resource {i}', 'Status': 'active', 'Path': '', 'Created': '', 'LastUpdated': ''
+            })
+
+    monkeypatch.setattr(csv_manager, 'CSV_PATH', csv_path)
+    return csv_path
+
+
+def _read_exported(csv_path):
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+class TestCSVStore:
+    """Test the SQLite-backed store against a temporary CSV"""
+
+    def test_lookups_and_stats(self, temp_csv):
+        """Store imports the CSV and answers indexed lookups"""
+        import csv_manager
+
+        assert csv_manager.check_csv_exists('/resource-1')
+        assert not csv_manager.check_csv_exists('/resource-1', 'coderef-workflow')
+        assert csv_manager.find_csv_entry('/resource-2', 'coderef-workflow')['Type'] == 'Tool'
+        assert [e['Name'] for e in csv_manager.read_csv()] == ['/resource-0', '/resource-1', '/resource-2']
+
+        stats = csv_manager.get_csv_stats()
+        assert stats['total'] == 3
+        assert stats['by_type'] == {'Command': 1, 'Tool': 2}
+        assert temp_csv.with_suffix('.db').exists()
+
+    def test_writes_export_csv(self, temp_csv):
+        """Writes go to the store and are exported to the CSV"""
+        import csv_manager
+
+        csv_manager.add_csv_entry('Tool', 'coderef-docs', 'Docs', '/new', 'New resource')
+        assert csv_manager.update_csv_status('/resource-0', 'archived') == 1
+        csv_manager.update_csv_entry('/resource-1', 'coderef-docs', {'Description': 'Changed', 'Bogus': 'x'})
+
+        exported = _read_exported(temp_csv)
+        assert [e['Name'] for e in exported] == ['/resource-0', '/resource-1', '/resource-2', '/new']
+        assert exported[0]['Status'] == 'archived'
+        assert exported[1]['Description'] == 'Changed'
+
+        with pytest.raises(ValueError, match="Entry already exists"):
+            csv_manager.add_csv_entry('Tool', 'coderef-docs', 'Docs', '/new', 'Duplicate')
+        with pytest.raises(ValueError, match="Entry already exists"):
+            csv_manager.update_csv_entry('/resource-1', 'coderef-docs', {'Name': '/new'})
+        with pytest.raises(ValueError, match="No matching entries"):
+            csv_manager.update_csv_status('/missing', 'archived')
+
+    def test_bulk_add_is_all_or_nothing(self, temp_csv):
+        """A duplicate in a bulk add leaves the store unchanged"""
+        import csv_manager
+
+        entries = [
+            {'Type': 'Tool', 'Server': 'coderef-docs', 'Category': 'Docs', 'Name': '/bulk-a', 'Description': 'A'},
+            {'Type': 'Tool', 'Server': 'coderef-docs', 'Category': 'Docs', 'Name': '/resource-1', 'Description': 'Dup'},
+        ]
+        with pytest.raises(ValueError, match="Duplicate entry"):
+            csv_manager.bulk_add_csv_entries(entries)
+
+        assert not csv_manager.check_csv_exists('/bulk-a')
+        assert len(_read_exported(temp_csv)) == 3
+
+    def test_bulk_upsert(self, temp_csv):
+        """Upserts update existing keys in place and append new ones"""
+        import csv_manager
+
+        written = csv_manager.bulk_upsert_csv_entries([
+            {'Type': 'Tool', 'Server': 'coderef-docs', 'Category': 'Docs', 'Name': '/resource-1',
+             'Description': 'Updated', 'Created': 'ignored'},
+            {'Type': 'Script', 'Server': 'coderef-docs', 'Category': 'Docs', 'Name': '/script', 'Description': 'S'},
+        ])
+
+        assert written == 2
+        exported = _read_exported(temp_csv)
+        assert [e['Name'] for e in exported] == ['/resource-0', '/resource-1', '/resource-2', '/script']
+        assert exported[1]['Description'] == 'Updated'
+        assert exported[1]['Created'] == ''
+
+    def test_out_of_band_csv_edit_is_reimported(self, temp_csv):
+        """Editing the CSV directly is picked up on next access"""
+        import csv_manager
+
+        assert csv_manager.get_csv_stats()['total'] == 3
+
+        with open(temp_csv, 'a', encoding='utf-8', newline='') as f:
+            csv.DictWriter(f, fieldnames=csv_manager.CSV_FIELDS).writerow({
+                'Type': 'Command', 'Server': 'coderef-docs', 'Category': 'Docs', 'Name': '/manual',
+                'Description': 'Added by hand', 'Status': 'active', 'Path': '', 'Created': '', 'LastUpdated': ''
+            })
+
+        assert csv_manager.check_csv_exists('/manual', 'coderef-docs')
+
+    def test_concurrent_adds(self, temp_csv):
+        """Concurrent writers do not lose entries"""
+        import csv_manager
+        import threading
+
+        def add(i):
+            csv_manager.add_csv_entry('Tool', 'coderef-testing', 'Testing', f'/concurrent-{i}', 'C')
+
+        threads = [threading.Thread(target=add, args=(i,)) for i in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(_read_exported(temp_csv)) == 13
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,105 @@
+"""
+Tests for the incremental features inventory cache (generators/features_inventory_generator.py).
+"""
+
+import json
+import pytest
+import shutil
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from coderef.utils import clear_caches
+from generators.features_inventory_generator import FeaturesInventoryGenerator
+
+
+def _write_plan(feature_dir, name, statuses):
+    feature_dir.mkdir(parents=True, exist_ok=True)
+    plan = {
+        'META_DOCUMENTATION': {'status': 'approved'},
+        'UNIVERSAL_PLANNING_STRUCTURE': {
+            '1_executive_summary': {'feature_name': name, 'goal': f'{name} goal'},
+            '5_task_id_system': {
+                'workorder': {'id': f'WO-{feature_dir.name.upper()}-001'},
+                'tasks': [{'id': f'T-{i}', 'status': status} for i, status in enumerate(statuses)]
+            }
+        }
+    }
+    path = feature_dir / 'plan.json'
+    path.write_text(json.dumps(plan, indent=2), encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def project(tmp_path, workorder_dir):
+    _write_plan(workorder_dir / 'auth', 'Auth', ['completed', 'pending'])
+    _write_plan(workorder_dir / 'search', 'Search', ['in_progress'])
+    (workorder_dir / 'search' / 'context.json').write_text(json.dumps({'requirements': ['a', 'b']}), encoding='utf-8')
+    (workorder_dir / 'notes').mkdir()
+
+    archived = tmp_path / 'coderef' / 'archived'
+    _write_plan(archived / 'legacy', None, ['completed'])
+    (archived / 'index.json').write_text(json.dumps({'archived_features': [
+        {'folder_name': 'legacy', 'feature_name': 'Legacy Feature', 'archived_at': '2026-01-02T00:00:00'}
+    ]}), encoding='utf-8')
+
+    return tmp_path
+
+
+def _inventory(project):
+    inventory = FeaturesInventoryGenerator(project).generate_inventory()
+    inventory.pop('generated_at')
+    for key in ('active_features', 'archived_features'):
+        inventory[key].sort(key=lambda f: f['name'])
+    return inventory
+
+
+class TestFeaturesInventoryCache:
+    """Test that only changed features are re-read."""
+
+    def test_cached_inventory_matches_cold_scan(self, project):
+        cold = _inventory(project)
+        assert (project / 'coderef' / '.features-inventory-cache.json').exists()
+
+        clear_caches()
+        with patch.object(FeaturesInventoryGenerator, '_read_json_safely') as read:
+            warm = _inventory(project)
+            assert read.call_count == 0
+
+        assert warm == cold
+        search = next(f for f in warm['active_features'] if f['name'] == 'search')
+        assert search['requirements_count'] == 2
+        legacy = warm['archived_features'][0]
+        assert legacy['display_name'] == 'Legacy Feature'
+        assert legacy['archived_at'] == '2026-01-02T00:00:00'
+
+    def test_only_changed_feature_is_reread(self, project, bump_mtime):
+        _inventory(project)
+
+        plan_path = _write_plan(project / 'coderef' / 'workorder' / 'auth', 'Auth', ['completed', 'completed'])
+        bump_mtime(plan_path)
+
+        with patch.object(
+            FeaturesInventoryGenerator, '_read_json_safely',
+            autospec=True, side_effect=FeaturesInventoryGenerator._read_json_safely
+        ) as read:
+            inventory = _inventory(project)
+            assert [call.args[1] for call in read.call_args_list] == [plan_path]
+
+        auth = next(f for f in inventory['active_features'] if f['name'] == 'auth')
+        assert auth['progress_percent'] == 100
+
+    def test_added_and_removed_features(self, project):
+        _inventory(project)
+
+        shutil.rmtree(project / 'coderef' / 'workorder' / 'search')
+        _write_plan(project / 'coderef' / 'workorder' / 'billing', 'Billing', [])
+
+        inventory = _inventory(project)
+        assert [f['name'] for f in inventory['active_features']] == ['auth', 'billing', 'notes']
+
+        cache = json.loads((project / 'coderef' / '.features-inventory-cache.json').read_text(encoding='utf-8'))
+        assert not any(key.endswith('search') for key in cache['features'])
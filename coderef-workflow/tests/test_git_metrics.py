@@ -0,0 +1,129 @@
+"""
+Tests for single-pass workorder git metrics (utils/git_metrics.py).
+"""
+
+import asyncio
+import json
+import pytest
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tool_handlers import handle_aggregate_agent_deliverables
+from utils import git_metrics
+from utils.git_metrics import collect_workorder_metrics
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason="git not installed")
+
+
+def _git(repo, *args):
+    subprocess.run(['git', *args], cwd=str(repo), check=True, capture_output=True)
+
+
+def _commit(repo, files, *messages):
+    for name, content in files.items():
+        path = repo / name
+        if content is None:
+            path.unlink()
+        else:
+            path.write_text(content, encoding='utf-8')
+    _git(repo, 'add', '-A')
+    args = ['commit', '-q']
+    for message in messages:
+        args += ['-m', message]
+    _git(repo, *args)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, 'init', '-q')
+    _git(tmp_path, 'config', 'user.email', 'dev@example.com')
+    _git(tmp_path, 'config', 'user.name', 'Dev')
+    _commit(tmp_path, {'README.md': 'base\n'}, 'Initial commit')
+    _commit(tmp_path, {'auth.py': 'a\nb\n'}, 'Add auth (WO-AUTH-001)')
+    _commit(tmp_path, {'auth.py': 'a\nb\nc\n', 'login.py': 'x\n'}, 'Add login', 'Workorder: WO-AUTH-002')
+    _commit(tmp_path, {'login.py': None}, 'Drop login WO-AUTH-001')
+
+    return tmp_path
+
+
+class TestWorkorderMetrics:
+    """Test parsing and caching of the git log pass."""
+
+    def test_single_workorder(self, repo):
+        metrics = collect_workorder_metrics(repo, 'WO-AUTH-001')
+
+        assert [c['message'] for c in metrics['commits']] == ['Drop login WO-AUTH-001', 'Add auth (WO-AUTH-001)']
+        files = {f['path']: f for f in metrics['files_changed']}
+        assert files['auth.py'] == {'path': 'auth.py', 'status': 'added', 'additions': 2, 'deletions': 0}
+        assert files['login.py']['status'] == 'deleted'
+        assert metrics['total_additions'] == 2
+        assert metrics['total_deletions'] == 1
+        assert metrics['contributors'] == ['Dev']
+
+    def test_family_totals_per_agent(self, repo):
+        metrics = collect_workorder_metrics(repo, 'WO-AUTH-001', family=True)
+
+        assert len(metrics['commits']) == 3
+        assert metrics['agents']['WO-AUTH-001']['commits'] == 2
+        assert metrics['agents']['WO-AUTH-002']['additions'] == 2
+        files = {f['path']: f for f in metrics['files_changed']}
+        assert files['auth.py']['additions'] == 3
+
+    def test_family_excludes_prefix_sharing_features(self, repo):
+        _commit(repo, {'system.py': 'x\ny\n'}, 'Add auth system (WO-AUTH-SYSTEM-001)')
+        _commit(repo, {'system.py': 'z\n'}, 'Mention WO-AUTH-1x in passing')
+
+        metrics = collect_workorder_metrics(repo, 'WO-AUTH-001', family=True)
+
+        assert len(metrics['commits']) == 3
+        assert set(metrics['agents']) == {'WO-AUTH-001', 'WO-AUTH-002'}
+        assert 'system.py' not in {f['path'] for f in metrics['files_changed']}
+        assert metrics['total_additions'] == 4
+
+    def test_cached_until_refs_change(self, repo):
+        first = collect_workorder_metrics(repo, 'WO-AUTH-001')
+
+        with patch.object(git_metrics, 'parse_git_log', wraps=git_metrics.parse_git_log) as parse:
+            assert collect_workorder_metrics(repo, 'WO-AUTH-001') is first
+            assert parse.call_count == 0
+
+            _commit(repo, {'auth.py': 'z\n'}, 'Rewrite auth WO-AUTH-001')
+            metrics = collect_workorder_metrics(repo, 'WO-AUTH-001')
+            assert parse.call_count == 1
+
+        assert len(metrics['commits']) == 3
+
+    def test_not_a_repository(self, tmp_path):
+        metrics = collect_workorder_metrics(tmp_path / 'missing', 'WO-AUTH-001')
+        assert metrics['commits'] == []
+        assert metrics['files_changed'] == []
+
+
+class TestAggregateAgentDeliverables:
+    """Test that the aggregator reads metrics from git."""
+
+    def test_aggregate_uses_git(self, repo):
+        feature_dir = repo / 'coderef' / 'workorder' / 'auth'
+        for agent in ('agent-1', 'agent-2'):
+            (feature_dir / agent).mkdir(parents=True)
+            (feature_dir / agent / 'DELIVERABLES.md').write_text('- **Lines Added**: 999\n', encoding='utf-8')
+        (feature_dir / 'communication.json').write_text(json.dumps({'workorder_id': 'WO-AUTH-001'}), encoding='utf-8')
+
+        text = asyncio.run(handle_aggregate_agent_deliverables({
+            'project_path': str(repo),
+            'feature_name': 'auth'
+        }))[0].text
+        result = json.loads(text[text.index('{'):])
+
+        assert result['metrics_source'] == 'git'
+        assert result['total_loc_added'] == 4
+        assert result['total_loc_deleted'] == 1
+        assert result['total_commits'] == 3
+        assert result['agents_count'] == 2
+        assert set(result['agents']) == {'WO-AUTH-001', 'WO-AUTH-002'}
@@ -9,8 +9,10 @@ WO-WORKFLOW-SCANNER-INTEGRATION-001 TEST-003
 
 import pytest
 import json
+import os
 from pathlib import Path
-from handlers.impact_analysis import ImpactAnalyzer
+from unittest.mock import patch
+from handlers.impact_analysis import ImpactAnalyzer, RelationshipGraph, get_relationship_graph
 
 
 @pytest.fixture
@@ -364,6 +366,89 @@ class TestElementLookup:
         assert elem is None, "Should return None for nonexistent element"
 
 
+class TestMultiSourceTraversal:
+    """Test the shared relationship graph and multi-source BFS."""
+
+    CHANGED = ['authenticateUser', 'AuthService', 'IAuthService', 'NonexistentElement']
+
+    def test_by_source_matches_single_traversals(self, project_path):
+        """Each element's attribution should equal its own traversal."""
+        analyzer = ImpactAnalyzer(project_path)
+
+        result = analyzer.traverse_dependencies_multi(self.CHANGED, max_depth=3)
+
+        for name in self.CHANGED:
+            single = ImpactAnalyzer(project_path).traverse_dependencies(name, max_depth=3)
+            assert result['by_source'][name] == single, f"Attribution differs for {name}"
+
+    def test_by_source_paths_follow_each_source(self, tmp_path):
+        """Paths should follow each element's own BFS order, not the shared frontier's."""
+        called_by = {
+            'S1': ['e5'], 'S2': ['e4'], 'e5': ['e1'], 'e4': ['e3', 'e1'],
+            'e3': ['e6'], 'e1': ['e6'], 'e6': []
+        }
+        coderef_dir = tmp_path / ".coderef"
+        coderef_dir.mkdir()
+        (coderef_dir / "index.json").write_text(json.dumps([
+            {'name': name, 'type': 'function', 'file': f'{name}.py', 'line': 1, 'calledBy': callers}
+            for name, callers in called_by.items()
+        ]))
+        analyzer = ImpactAnalyzer(tmp_path)
+
+        with patch.object(RelationshipGraph, 'bfs', autospec=True, side_effect=RelationshipGraph.bfs) as bfs:
+            result = analyzer.traverse_dependencies_multi(['S1', 'S2'], max_depth=3)
+            assert bfs.call_count == 1
+
+        # S2's own FIFO BFS: e4, then e3 and e1, then e6 (first reached from e3)
+        assert [(elem['name'], elem['path']) for elem in result['by_source']['S2']] == [
+            ('e4', 'S2 → e4'),
+            ('e3', 'S2 → e4 → e3'),
+            ('e1', 'S2 → e4 → e1'),
+            ('e6', 'S2 → e4 → e3 → e6'),
+        ]
+        for name in ('S1', 'S2'):
+            assert result['by_source'][name] == analyzer.traverse_dependencies(name, max_depth=3)
+
+    def test_combined_set_attributes_sources(self, project_path):
+        """Combined set should hold each element once, with every source reaching it."""
+        analyzer = ImpactAnalyzer(project_path)
+
+        result = analyzer.traverse_dependencies_multi(self.CHANGED, max_depth=3)
+        combined = {elem['name']: elem for elem in result['affected']}
+
+        assert len(combined) == len(result['affected']), "Combined set should not repeat elements"
+        for name, affected in result['by_source'].items():
+            for elem in affected:
+                entry = combined[elem['name']]
+                assert name in entry['sources']
+                assert entry['source_depths'][name] == elem['depth']
+                assert entry['depth'] <= elem['depth']
+
+    def test_graph_shared_until_index_changes(self, project_path, sample_index_data):
+        """The graph should be built once per index version."""
+        graph = get_relationship_graph(project_path)
+        assert get_relationship_graph(project_path) is graph
+        assert ImpactAnalyzer(project_path)._load_graph() is graph
+
+        index_path = project_path / ".coderef" / "index.json"
+        index_path.write_text(json.dumps(sample_index_data[:5]))
+        stat = index_path.stat()
+        os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert get_relationship_graph(project_path) is not graph
+
+    def test_analyze_elements_impact_matches_single(self, project_path):
+        """Batch analysis should produce the same per-element results."""
+        analyzer = ImpactAnalyzer(project_path)
+
+        batch = analyzer.analyze_elements_impact(self.CHANGED, max_depth=2)
+
+        assert 'NonexistentElement' not in batch['results']
+        for name, result in batch['results'].items():
+            assert result == analyzer.analyze_element_impact(name, max_depth=2)
+        assert batch['combined_score']['affected_count'] == len(batch['combined_affected'])
+
+
 @pytest.mark.integration
 class TestImpactAnalysisIntegration:
     """Integration tests for complete impact analysis workflow."""
@@ -0,0 +1,126 @@
+"""
+Tests for transactional JSON document updates (utils/json_store.py).
+"""
+
+import asyncio
+import json
+import pytest
+import sys
+import threading
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tool_handlers import handle_assign_agent_task
+from utils.json_store import ConcurrentUpdateError, VERSION_FIELD, update_json_document
+
+
+@pytest.fixture
+def doc_path(tmp_path):
+    path = tmp_path / 'state.json'
+    path.write_text(json.dumps({'items': []}), encoding='utf-8')
+    return path
+
+
+class TestUpdateJsonDocument:
+    """Test versioning, retries and concurrency."""
+
+    def test_update_bumps_version_and_returns_result(self, doc_path):
+        data, result = update_json_document(doc_path, lambda d: d['items'].append(1) or len(d['items']))
+
+        assert result == 1
+        assert data[VERSION_FIELD] == 1
+        assert json.loads(doc_path.read_text(encoding='utf-8')) == {'items': [1], VERSION_FIELD: 1}
+
+        update_json_document(doc_path, lambda d: d['items'].append(2))
+        assert json.loads(doc_path.read_text(encoding='utf-8'))[VERSION_FIELD] == 2
+
+    def test_missing_file_uses_default(self, tmp_path):
+        path = tmp_path / 'log.json'
+        with pytest.raises(FileNotFoundError):
+            update_json_document(path, lambda d: None)
+
+        update_json_document(path, lambda log: log.append('a'), default=list)
+        update_json_document(path, lambda log: log.append('b'), default=list)
+        assert json.loads(path.read_text(encoding='utf-8')) == ['a', 'b']
+
+    def test_conflicting_write_is_retried(self, doc_path):
+        calls = []
+
+        def mutate(data):
+            calls.append(list(data['items']))
+            if len(calls) == 1:
+                # Another writer commits between our read and our write
+                update_json_document(doc_path, lambda d: d['items'].append('other'))
+            data['items'].append('mine')
+
+        update_json_document(doc_path, mutate)
+
+        assert calls == [[], ['other']]
+        assert json.loads(doc_path.read_text(encoding='utf-8'))['items'] == ['other', 'mine']
+
+    def test_gives_up_after_retries(self, doc_path):
+        def mutate(data):
+            doc_path.write_text(json.dumps({'items': ['out-of-band', len(data['items'])]}), encoding='utf-8')
+
+        with pytest.raises(ConcurrentUpdateError):
+            update_json_document(doc_path, mutate, retries=2)
+
+    def test_error_in_mutate_leaves_file_untouched(self, doc_path):
+        before = doc_path.read_text(encoding='utf-8')
+
+        def mutate(data):
+            data['items'].append(1)
+            raise ValueError('rejected')
+
+        with pytest.raises(ValueError):
+            update_json_document(doc_path, mutate)
+        assert doc_path.read_text(encoding='utf-8') == before
+
+    def test_concurrent_writers_lose_no_updates(self, doc_path):
+        def worker(n):
+            for i in range(10):
+                update_json_document(doc_path, lambda d: d['items'].append(f'{n}-{i}'), retries=100)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        data = json.loads(doc_path.read_text(encoding='utf-8'))
+        assert len(data['items']) == 40
+        assert data[VERSION_FIELD] == 40
+
+
+class TestCommunicationUpdates:
+    """Test handlers that update communication.json."""
+
+    def test_parallel_assignments_are_all_kept(self, tmp_path):
+        feature_dir = tmp_path / 'coderef' / 'workorder' / 'auth'
+        feature_dir.mkdir(parents=True)
+        comm_path = feature_dir / 'communication.json'
+        comm_path.write_text(json.dumps({
+            'feature': 'auth',
+            'workorder_id': 'WO-AUTH-001',
+            'metadata': {}
+        }), encoding='utf-8')
+
+        async def assign_all():
+            return await asyncio.gather(*[
+                asyncio.to_thread(asyncio.run, handle_assign_agent_task({
+                    'project_path': str(tmp_path),
+                    'feature_name': 'auth',
+                    'agent_number': number
+                }))
+                for number in range(2, 6)
+            ])
+
+        asyncio.run(assign_all())
+
+        data = json.loads(comm_path.read_text(encoding='utf-8'))
+        for number in range(2, 6):
+            assert data[f'agent_{number}_status'].startswith('ASSIGNED')
+            assert data[f'agent_{number}_workorder'] == f'WO-AUTH-{number:03d}'
+        assert data[VERSION_FIELD] == 4
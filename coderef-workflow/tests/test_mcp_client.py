@@ -15,7 +15,8 @@ from unittest.mock import Mock, patch, MagicMock, AsyncMock
 # Import the client
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from mcp_client import MCPToolClient, call_coderef_tool
+import mcp_client
+from mcp_client import MCPToolClient, MCPClientPool, call_coderef_tool
 
 
 class TestMCPToolClientInit:
@@ -245,5 +246,189 @@ class TestLogging:
         pass
 
 
+FAKE_SERVER = """
+import asyncio, json, sys
+
+async def main():
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    initialized = False
+
+    def reply(message):
+        sys.stdout.write(json.dumps(message) + "\\n")
+        sys.stdout.flush()
+
+    async def handle(request):
+        args = request["params"]["arguments"]
+        await asyncio.sleep(args.get("delay", 0))
+        if not initialized:
+            reply({"jsonrpc": "2.0", "id": request["id"], "error": {"message": "not initialized"}})
+        else:
+            reply({"jsonrpc": "2.0", "id": request["id"], "result": {"echo": args["value"]}})
+
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        request = json.loads(line)
+        if request.get("method") == "initialize":
+            reply({"jsonrpc": "2.0", "id": request["id"], "result": {"serverInfo": {"name": "fake"}}})
+        elif request.get("method") == "notifications/initialized":
+            initialized = True
+        elif request.get("method") == "ping":
+            reply({"jsonrpc": "2.0", "id": request["id"], "result": {}})
+        elif request.get("method") == "tools/call":
+            asyncio.ensure_future(handle(request))
+
+asyncio.run(main())
+"""
+
+
+@pytest.fixture
+def fake_server(tmp_path):
+    """Path to a minimal MCP server script (initialize, ping, echo tool)."""
+    script = tmp_path / "fake_server.py"
+    script.write_text(FAKE_SERVER, encoding="utf-8")
+    return str(script)
+
+
+class TestMultiplexedSession:
+    """Test concurrent calls over one real subprocess session."""
+
+    @pytest.mark.asyncio
+    async def test_handshake_before_tool_calls(self, fake_server):
+        """connect() should complete the initialize handshake."""
+        client = MCPToolClient(fake_server)
+        try:
+            assert await client.connect()
+            assert client.server_info == {"name": "fake"}
+
+            result = await client.call_tool("echo", {"value": 1})
+            assert result["data"] == {"echo": 1}
+        finally:
+            await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_out_of_order_responses_routed_by_id(self, fake_server):
+        """Concurrent calls should each receive their own response."""
+        client = MCPToolClient(fake_server)
+        try:
+            # Earlier calls sleep longer, so responses arrive in reverse order
+            results = await asyncio.gather(*(
+                client.call_tool("echo", {"value": i, "delay": 0.05 * (5 - i)})
+                for i in range(5)
+            ))
+
+            assert [r["data"]["echo"] for r in results] == list(range(5))
+            assert client.in_flight == 0
+        finally:
+            await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_fails_in_flight_calls(self, fake_server):
+        """Pending calls should fail instead of hanging when the session closes."""
+        client = MCPToolClient(fake_server)
+        try:
+            assert await client.connect()
+            call = asyncio.ensure_future(client.call_tool("echo", {"value": 1, "delay": 10}))
+            while client.in_flight == 0:
+                await asyncio.sleep(0.01)
+
+            await client.disconnect()
+
+            with pytest.raises(RuntimeError):
+                await call
+        finally:
+            await client.disconnect()
+
+    def test_new_event_loop_stops_previous_process(self, fake_server):
+        """A client reused from another event loop should not leak its old server process."""
+        client = MCPToolClient(fake_server)
+
+        async def connect():
+            assert await client.connect()
+            return client.process
+
+        first = asyncio.run(connect())
+        second = asyncio.run(connect())
+        try:
+            assert first is not second
+            assert first.returncode is not None or \
+                first._transport.get_extra_info("subprocess").poll() is not None
+        finally:
+            asyncio.run(client.disconnect())
+
+
+class TestClientPool:
+    """Test routing and recovery in the coderef-context worker pool."""
+
+    def test_project_affinity_and_least_loaded(self, tmp_path):
+        """Each project sticks to one worker; new projects spread across workers."""
+        pool = MCPClientPool(size=2, server_script_path="unused.py", health_check_interval=0)
+
+        first = pool.select_worker({"project_path": str(tmp_path / "a")})
+        second = pool.select_worker({"project_path": str(tmp_path / "b")})
+
+        assert first is not second
+        assert pool.select_worker({"project_path": str(tmp_path / "a")}) is first
+        assert pool.select_worker({"project_path": str(tmp_path / "b")}) is second
+
+    def test_affinity_is_bounded(self, tmp_path):
+        """Only the most recently used projects keep their worker assignment."""
+        pool = MCPClientPool(size=2, server_script_path="unused.py", health_check_interval=0)
+
+        with patch.object(mcp_client, "AFFINITY_SIZE", 2):
+            for name in ("a", "b", "a", "c"):
+                pool.select_worker({"project_path": str(tmp_path / name)})
+
+        assert list(pool._affinity) == [str((tmp_path / "a").resolve()), str((tmp_path / "c").resolve())]
+
+    @pytest.mark.asyncio
+    async def test_crashed_worker_restarted(self, fake_server, tmp_path):
+        """A worker whose process died should be restarted on the next call."""
+        pool = MCPClientPool(size=2, server_script_path=fake_server, health_check_interval=0)
+        try:
+            assert await pool.start() == 2
+
+            args = {"project_path": str(tmp_path), "value": 7}
+            worker = pool.select_worker(args)
+            healthy = next(w for w in pool.workers if w is not worker)
+            healthy_process = healthy.process
+            worker.process.kill()
+            await worker.process.wait()
+
+            result = await pool.call_tool("echo", args)
+
+            assert result["data"] == {"echo": 7}
+            assert pool.restarts == 1
+
+            # Both workers answer ping now, so the health check restarts nothing
+            assert await pool.health_check() == [True, True]
+            assert pool.restarts == 1
+            assert healthy.process is healthy_process
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_health_check_restarts_only_crashed_worker(self, fake_server):
+        """The health check should restart a dead worker and leave responsive ones alone."""
+        pool = MCPClientPool(size=2, server_script_path=fake_server, health_check_interval=0)
+        try:
+            assert await pool.start() == 2
+            crashed, healthy = pool.workers
+            crashed_process, healthy_process = crashed.process, healthy.process
+            crashed_process.kill()
+            await crashed_process.wait()
+
+            assert await pool.health_check() == [True, True]
+
+            assert pool.restarts == 1
+            assert crashed.process is not crashed_process
+            assert healthy.process is healthy_process
+        finally:
+            await pool.close()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,102 @@
+"""
+Tests for audit_plans caching (utils/plan_audit.py).
+"""
+
+import asyncio
+import json
+import os
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import plan_format_validator
+from tool_handlers import handle_audit_plans
+from utils import plan_audit
+
+
+def _write_plan(feature_dir, statuses):
+    feature_dir.mkdir(parents=True, exist_ok=True)
+    plan = {
+        'META_DOCUMENTATION': {'workorder_id': f'WO-{feature_dir.name.upper()}-001', 'last_updated': '2026-01-01'},
+        'UNIVERSAL_PLANNING_STRUCTURE': {
+            '9_implementation_checklist': {
+                'impl': [{'id': f'IMPL-{i:03d}', 'status': status} for i, status in enumerate(statuses, 1)]
+            }
+        }
+    }
+    (feature_dir / 'plan.json').write_text(json.dumps(plan, indent=2), encoding='utf-8')
+
+
+@pytest.fixture
+def project(tmp_path, workorder_dir):
+    _write_plan(workorder_dir / 'auth', ['completed', 'completed'])
+    _write_plan(workorder_dir / 'search', ['in_progress', 'blocked', 'pending'])
+    (workorder_dir / 'no-plan').mkdir()
+    (workorder_dir / 'broken').mkdir()
+    (workorder_dir / 'broken' / 'plan.json').write_text('{not json', encoding='utf-8')
+    _write_plan(tmp_path / 'coderef' / 'archived' / 'old', ['completed'])
+
+    return tmp_path
+
+
+def _audit(project, **arguments):
+    text = asyncio.run(handle_audit_plans({'project_path': str(project), **arguments}))[0].text
+    return json.loads(text[text.index('{'):])
+
+
+class TestAuditPlansCache:
+    """Test per-plan caching and aggregation."""
+
+    def test_aggregates(self, project):
+        result = _audit(project, include_archived=True)
+
+        assert result['total_features'] == 5
+        assert result['valid_plans'] == 3
+        assert result['invalid_plans'] == 1
+        assert result['completed_plans'] == 2
+        assert result['active_plans'] == 1
+        features = {f['feature_name']: f for f in result['features']}
+        assert features['search']['progress']['blocked'] == 1
+        assert features['old']['location'] == 'archived'
+        assert not features['no-plan']['has_plan']
+
+    def test_valid_plans_are_parsed_once(self, project):
+        with patch.object(plan_format_validator.json, 'load', wraps=json.load) as load:
+            result = _audit(project, include_archived=True)
+
+        # Only the broken plan is re-read, to report its JSON error
+        assert load.call_count == 1
+        assert result['valid_plans'] == 3
+
+    def test_repeat_audit_uses_cache(self, project, bump_mtime):
+        first = _audit(project, include_archived=True)
+
+        with patch.object(plan_audit, 'enforce_plan_format', wraps=plan_audit.enforce_plan_format) as enforce:
+            second = _audit(project, include_archived=True)
+            assert enforce.call_count == 0
+
+            # Only the changed plan is re-audited
+            plan_path = project / 'coderef' / 'workorder' / 'search' / 'plan.json'
+            _write_plan(plan_path.parent, ['completed', 'completed', 'completed'])
+            bump_mtime(plan_path)
+            third = _audit(project, include_archived=True)
+            assert enforce.call_count == 1
+
+        for result in (first, second):
+            result.pop('timestamp', None)
+        assert first == second
+        assert third['completed_plans'] == 3
+
+    def test_staleness_uses_current_threshold(self, project):
+        _audit(project)
+
+        plan_path = project / 'coderef' / 'workorder' / 'auth' / 'plan.json'
+        old = plan_path.stat().st_mtime - 30 * 24 * 60 * 60
+        os.utime(plan_path, (old, old))
+
+        assert _audit(project, stale_days=7)['stale_plans'] == 1
+        assert _audit(project, stale_days=60)['stale_plans'] == 0
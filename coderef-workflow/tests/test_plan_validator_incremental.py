@@ -0,0 +1,101 @@
+"""
+Tests for section-level incremental plan validation (generators/plan_validator.py).
+"""
+
+import copy
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from generators import plan_validator
+from generators.plan_validator import PlanValidator
+
+
+PLAN = {
+    'META_DOCUMENTATION': {'plan_name': 'Auth', 'status': 'approved'},
+    'UNIVERSAL_PLANNING_STRUCTURE': {
+        '0_preparation': {'notes': 'Reviewed existing auth module'},
+        '1_executive_summary': {'goal': 'Add login', 'description': 'Login flow', 'scope': 'API'},
+        '2_risk_assessment': {'risks': ['Token leakage might happen']},
+        '3_current_state_analysis': {'files': ['auth.py']},
+        '4_key_features': ['login'],
+        '5_task_id_system': {
+            'workorder': {'id': 'WO-AUTH-001', 'name': 'Auth', 'feature_dir': 'coderef/workorder/auth'},
+            'tasks': [
+                {'id': 'IMPL-001', 'workorder_id': 'WO-AUTH-001', 'status': 'pending'},
+                {'id': 'IMPL-002', 'status': 'pending'}
+            ]
+        },
+        '6_implementation_phases': {
+            'phase_1': {
+                'title': 'Build',
+                'complexity': 'huge',
+                'tasks': [
+                    {'id': 'IMPL-001', 'description': 'Write the login endpoint', 'depends_on': ['IMPL-002']},
+                    {'id': 'IMPL-002', 'description': 'Write the session store', 'depends_on': ['IMPL-001']}
+                ]
+            }
+        },
+        '7_testing_strategy': {'edge_cases': ['empty password', 'TBD']},
+        '8_success_criteria': {'criteria': ['Login responds in < 200 ms for 95% of requests']},
+        '9_implementation_checklist': ['Which tests are needed?']
+    }
+}
+
+
+def _validate(plan, incremental=True):
+    return PlanValidator(Path('plan.json'), plan_data=copy.deepcopy(plan)).validate(incremental=incremental)
+
+
+class TestIncrementalValidation:
+    """Test that incremental validation matches full validation and reuses results."""
+
+    def test_matches_full_validation(self):
+        result = _validate(PLAN)
+
+        assert result == _validate(PLAN, incremental=False)
+        assert result['issues']
+        assert not result['checklist_results']['no_circular_dependencies']
+
+    def test_unchanged_sections_are_not_rechecked(self):
+        _validate(PLAN)
+
+        updated = copy.deepcopy(PLAN)
+        updated['UNIVERSAL_PLANNING_STRUCTURE']['5_task_id_system']['tasks'][0]['status'] = 'complete'
+
+        with patch.object(PlanValidator, '_validate_task_ids') as task_ids, \
+                patch.object(PlanValidator, '_validate_edge_cases') as edge_cases, \
+                patch.object(plan_validator, '_scan_text', wraps=plan_validator._scan_text) as scan:
+            result = _validate(updated)
+
+            assert task_ids.call_count == 0
+            assert edge_cases.call_count == 0
+            assert scan.call_count == 1
+
+        assert result == _validate(updated, incremental=False)
+
+    def test_changed_section_is_rechecked(self):
+        _validate(PLAN)
+
+        updated = copy.deepcopy(PLAN)
+        phase = updated['UNIVERSAL_PLANNING_STRUCTURE']['6_implementation_phases']['phase_1']
+        phase['tasks'][1]['depends_on'] = []
+        phase['tasks'][0]['description'] = 'What if the login endpoint takes hours?'
+
+        result = _validate(updated)
+
+        assert result == _validate(updated, incremental=False)
+        assert result['checklist_results']['no_circular_dependencies']
+        assert not result['checklist_results']['no_questions']
+
+    def test_removed_and_added_sections(self):
+        _validate(PLAN)
+
+        updated = copy.deepcopy(PLAN)
+        del updated['UNIVERSAL_PLANNING_STRUCTURE']['7_testing_strategy']
+        updated['NOTES'] = 'Schedule to be determined'
+
+        assert _validate(updated) == _validate(updated, incremental=False)
@@ -12,7 +12,7 @@ from unittest.mock import Mock, patch, AsyncMock, MagicMock
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from generators.planning_analyzer import PlanningAnalyzer
+from generators.planning_analyzer import PlanningAnalyzer, AnalysisStage
 from mcp_client import call_coderef_tool
 
 
@@ -301,5 +301,73 @@ class TestErrorRecovery:
             assert result2 is not None
 
 
+class TestStageGraph:
+    """Test concurrent stage execution in analyze()."""
+
+    @pytest.mark.asyncio
+    async def test_independent_mcp_stages_overlap(self, tmp_path):
+        """Independent MCP-backed stages should run concurrently."""
+        analyzer = PlanningAnalyzer(tmp_path)
+        active = 0
+        peak = 0
+
+        async def slow_tool(tool_name, args):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.05)
+            active -= 1
+            return {"success": False}
+
+        with patch('generators.planning_analyzer.call_coderef_tool', side_effect=slow_tool):
+            result = await analyzer.analyze()
+
+        assert peak > 1
+        timings = result["telemetry_summary"]["stage_timings"]
+        assert {"inventory_data", "key_patterns_identified", "gaps_and_risks"} <= set(timings)
+        assert result["telemetry_summary"]["analysis_duration_seconds"] is not None
+
+    @pytest.mark.asyncio
+    async def test_dependencies_finish_first(self, tmp_path):
+        """A stage should only start after all of its dependencies complete."""
+        analyzer = PlanningAnalyzer(tmp_path)
+        order = []
+
+        async def slow(results):
+            await asyncio.sleep(0.02)
+            order.append("slow")
+            return 1
+
+        def dependent(results):
+            order.append("dependent")
+            return results["slow"] + 1
+
+        results = await analyzer._run_stages([
+            AnalysisStage("slow", slow),
+            AnalysisStage("dependent", dependent, deps=("slow",), blocking=True),
+        ])
+
+        assert order == ["slow", "dependent"]
+        assert results["dependent"] == 2
+        assert set(analyzer.stage_timings) == {"slow", "dependent"}
+
+    @pytest.mark.asyncio
+    async def test_stage_failure_propagates(self, tmp_path):
+        """A failing stage should cancel the graph and raise."""
+        analyzer = PlanningAnalyzer(tmp_path)
+
+        async def boom(results):
+            raise RuntimeError("stage failed")
+
+        async def never(results):
+            await asyncio.sleep(10)
+
+        with pytest.raises(RuntimeError, match="stage failed"):
+            await analyzer._run_stages([
+                AnalysisStage("boom", boom),
+                AnalysisStage("never", never),
+            ])
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
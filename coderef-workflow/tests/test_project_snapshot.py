@@ -0,0 +1,64 @@
+"""
+Unit tests for ProjectSnapshot - the shared, cached project directory walk.
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.project_snapshot import ProjectSnapshot, get_project_snapshot
+from generators.planning_analyzer import PlanningAnalyzer
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Small project with excluded directories that must never be walked."""
+    (tmp_path / "src" / "components").mkdir(parents=True)
+    (tmp_path / "src" / "components" / "Button.tsx").write_text("export const Button = 1")
+    (tmp_path / "src" / "index.ts").write_text("export * from './components'")
+    (tmp_path / "node_modules" / "react").mkdir(parents=True)
+    (tmp_path / "node_modules" / "react" / "index.js").write_text("")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main")
+    (tmp_path / "README.md").write_text("# Project")
+    return tmp_path
+
+
+class TestProjectSnapshot:
+    """Test the pruned walk and per-project caching."""
+
+    def test_walk_prunes_excluded_dirs(self, project):
+        """Excluded directories should not be entered at all."""
+        snapshot = ProjectSnapshot.build(project)
+
+        assert [f.rel_path for f in snapshot.files] == [
+            "README.md", "src/components/Button.tsx", "src/index.ts"
+        ]
+        assert snapshot.dir_file_counts == {".": 1, "src": 1, "src/components": 1}
+        assert not any("node_modules" in d or ".git" in d for d in snapshot.dir_mtimes)
+        assert snapshot.files[0].size == len("# Project")
+
+    def test_cached_until_tree_changes(self, project, bump_mtime):
+        """The snapshot should be reused until a directory gains or loses entries."""
+        first = get_project_snapshot(project)
+        assert get_project_snapshot(project) is first
+
+        new_file = project / "src" / "utils.ts"
+        new_file.write_text("export const x = 1")
+        bump_mtime(project / "src")
+
+        second = get_project_snapshot(project)
+        assert second is not first
+        assert "src/utils.ts" in [f.rel_path for f in second.files]
+
+    def test_planning_analyzer_uses_snapshot(self, project):
+        """Structure analysis and source scan should share one walk."""
+        analyzer = PlanningAnalyzer(project)
+
+        structure = analyzer.analyze_project_structure()
+        source_files = analyzer._scan_source_files()
+
+        assert structure["file_counts"] == {"src": 1, str(Path("src/components")): 1}
+        assert [p.name for p in source_files] == ["Button.tsx", "index.ts"]
+        assert get_project_snapshot(project) is get_project_snapshot(project)
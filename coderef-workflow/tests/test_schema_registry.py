@@ -0,0 +1,93 @@
+"""
+Tests for the process-wide compiled schema registry (utils/schema_registry.py).
+"""
+
+import json
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import schema_validator
+from generators.plan_validator import PlanValidator
+from utils import schema_registry
+from utils.schema_registry import SchemaRegistry
+
+
+SCHEMA = {
+    '$schema': 'http://json-schema.org/draft-07/schema#',
+    'type': 'object',
+    'required': ['name'],
+    'properties': {
+        'name': {'type': 'string'},
+        'created': {'type': 'string', 'format': 'date'}
+    }
+}
+
+
+def _write_schema(schema_dir, schema):
+    path = schema_dir / 'item.schema.json'
+    path.write_text(json.dumps(schema), encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def registry(tmp_path):
+    _write_schema(tmp_path, SCHEMA)
+    return SchemaRegistry(tmp_path)
+
+
+class TestSchemaRegistry:
+    """Test compile-once, reload-on-change and in-memory validation."""
+
+    def test_compiled_once(self, registry):
+        first = registry.get('item.schema.json')
+
+        with patch.object(schema_registry.Draft7Validator, 'check_schema') as check:
+            assert registry.get('item.schema.json') is first
+            assert check.call_count == 0
+
+    def test_validate_parsed_document(self, registry):
+        assert registry.validate({'name': 'auth'}, 'item.schema.json') == (True, [])
+
+        is_valid, errors = registry.validate({'name': 3, 'created': 'not-a-date'}, 'item.schema.json')
+        assert not is_valid
+        assert errors == ["created: 'not-a-date' is not a 'date'", "name: 3 is not of type 'string'"]
+
+        is_valid, errors = registry.validate({}, 'item.schema.json')
+        assert errors == ["(root): 'name' is a required property"]
+
+    def test_reloaded_when_file_changes(self, registry, tmp_path, bump_mtime):
+        registry.get('item.schema.json')
+
+        bump_mtime(_write_schema(tmp_path, dict(SCHEMA, required=[])))
+
+        assert registry.validate({}, 'item.schema.json') == (True, [])
+
+    def test_invalid_and_missing_schemas(self, registry, tmp_path):
+        (tmp_path / 'broken.schema.json').write_text(json.dumps({'type': 12}), encoding='utf-8')
+
+        with pytest.raises(ValueError):
+            registry.get('broken.schema.json')
+        with pytest.raises(FileNotFoundError):
+            registry.get('missing.schema.json')
+        assert registry.get_schema('missing.schema.json') is None
+
+    def test_validators_share_plan_schema(self, tmp_path):
+        plan = schema_registry.registry.get()
+
+        assert PlanValidator(tmp_path / 'plan.json')._load_schema() is plan.schema
+        assert schema_validator.load_plan_schema() is plan.schema
+
+    def test_plan_validator_uses_parsed_plan(self, tmp_path):
+        plan_path = tmp_path / 'plan.json'
+        plan_data = {'META_DOCUMENTATION': {}, 'UNIVERSAL_PLANNING_STRUCTURE': {}}
+
+        with patch('builtins.open', side_effect=AssertionError('plan file was read')):
+            validator = PlanValidator(plan_path, plan_data=plan_data)
+            validator._load_plan()
+
+        assert validator.plan_data is plan_data
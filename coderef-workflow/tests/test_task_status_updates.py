@@ -0,0 +1,134 @@
+"""
+Tests for task status updates in plan.json (update_task_status, batch_update_task_status).
+"""
+
+import asyncio
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tool_handlers import handle_update_task_status, handle_batch_update_task_status
+from utils.task_status import apply_task_updates, build_task_index
+
+
+def _plan():
+    return {
+        'META_DOCUMENTATION': {'feature_name': 'auth', 'last_updated': '2026-01-01'},
+        'UNIVERSAL_PLANNING_STRUCTURE': {
+            '5_task_id_system': {
+                'tasks': [
+                    {'id': 'LEGACY-001', 'description': 'Section 5 only'},
+                    {'id': 'SETUP-001', 'description': 'Shadowed by checklist'}
+                ]
+            },
+            '9_implementation_checklist': {
+                'setup': [{'id': 'SETUP-001', 'status': 'pending'}],
+                'impl': [
+                    {'id': 'IMPL-001', 'status': 'pending'},
+                    {'id': 'IMPL-002', 'status': 'in_progress'},
+                    {'id': 'IMPL-003', 'status': 'pending'}
+                ]
+            }
+        }
+    }
+
+
+@pytest.fixture
+def plan_path(tmp_path):
+    feature_dir = tmp_path / 'coderef' / 'workorder' / 'auth'
+    feature_dir.mkdir(parents=True)
+    path = feature_dir / 'plan.json'
+    path.write_text(json.dumps(_plan(), indent=2), encoding='utf-8')
+    return path
+
+
+def _call(handler, arguments):
+    """Run a handler and return its response text (message + JSON body)."""
+    return asyncio.run(handler(arguments))[0].text
+
+
+def _data(text):
+    """JSON body of a success response."""
+    return json.loads(text[text.index('{'):])
+
+
+class TestTaskIndex:
+    """Test task lookup and in-memory updates."""
+
+    def test_checklist_takes_precedence(self):
+        plan = _plan()
+        index = build_task_index(plan)
+
+        checklist = plan['UNIVERSAL_PLANNING_STRUCTURE']['9_implementation_checklist']
+        assert index['SETUP-001'] is checklist['setup'][0]
+        assert 'LEGACY-001' in index
+
+    def test_unknown_task_leaves_plan_untouched(self):
+        plan = _plan()
+
+        with pytest.raises(ValueError, match='MISSING-001'):
+            apply_task_updates(plan, [
+                {'task_id': 'IMPL-001', 'status': 'completed'},
+                {'task_id': 'MISSING-001', 'status': 'completed'}
+            ], '2026-02-01')
+
+        assert plan == _plan()
+
+
+class TestBatchUpdateTaskStatus:
+    """Test the batch handler end to end."""
+
+    def test_batch_applies_all_updates_in_one_write(self, tmp_path, plan_path):
+        response = _data(_call(handle_batch_update_task_status, {
+            'project_path': str(tmp_path),
+            'feature_name': 'auth',
+            'updates': [
+                {'task_id': 'IMPL-001', 'status': 'completed', 'notes': 'done'},
+                {'task_id': 'IMPL-002', 'status': 'completed'},
+                {'task_id': 'LEGACY-001', 'status': 'blocked'},
+                {'task_id': 'IMPL-001', 'status': 'in_progress'}
+            ]
+        }))
+
+        assert response['updated_count'] == 4
+        assert [u['old_status'] for u in response['updates']] == ['pending', 'in_progress', 'pending', 'completed']
+        assert response['progress']['completed'] == 1
+        assert response['progress']['in_progress'] == 1
+
+        plan = json.loads(plan_path.read_text(encoding='utf-8'))
+        impl = plan['UNIVERSAL_PLANNING_STRUCTURE']['9_implementation_checklist']['impl']
+        assert impl[0]['status'] == 'in_progress'
+        assert impl[0]['notes'] == 'done'
+        assert plan['UNIVERSAL_PLANNING_STRUCTURE']['5_task_id_system']['tasks'][0]['status'] == 'blocked'
+        assert not list(plan_path.parent.glob('*.tmp')), "Temp files should be renamed into place"
+
+    def test_batch_rejects_unknown_task_without_writing(self, tmp_path, plan_path):
+        before = plan_path.read_text(encoding='utf-8')
+
+        response = _call(handle_batch_update_task_status, {
+            'project_path': str(tmp_path),
+            'feature_name': 'auth',
+            'updates': [
+                {'task_id': 'IMPL-001', 'status': 'completed'},
+                {'task_id': 'NOPE-001', 'status': 'completed'}
+            ]
+        })
+
+        assert 'NOPE-001' in response
+        assert plan_path.read_text(encoding='utf-8') == before
+
+    def test_single_update_still_supported(self, tmp_path, plan_path):
+        response = _data(_call(handle_update_task_status, {
+            'project_path': str(tmp_path),
+            'feature_name': 'auth',
+            'task_id': 'IMPL-003',
+            'status': 'completed'
+        }))
+
+        assert response['old_status'] == 'pending'
+        assert response['progress']['total'] == 4
+        assert response['progress']['percent'] == 25.0
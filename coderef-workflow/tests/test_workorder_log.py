@@ -0,0 +1,177 @@
+"""
+Unit tests for the append-only workorder log (utils/workorder_log.py).
+"""
+
+import json
+import threading
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils import workorder_log
+from utils.workorder_log import WorkorderLog, parse_entry, workorder_family
+
+
+def _log_entries(log, count):
+    for i in range(count):
+        project = 'alpha' if i % 2 else 'beta-service'
+        family = 'WO-AUTH' if i % 3 else 'WO-UI-REFRESH'
+        log.append(f"{family}-{i:03d}", project, f"Task {i}", f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}Z")
+
+
+def _brute_force(log_file, project_filter='', workorder_pattern=''):
+    entries = [parse_entry(line) for line in reversed(log_file.read_text(encoding='utf-8').splitlines()) if line]
+    return [
+        e for e in entries
+        if (not project_filter or project_filter in e['project'].lower())
+        and (not workorder_pattern or e['workorder_id'].startswith(workorder_pattern))
+    ]
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    return tmp_path / "coderef" / "workorder-log.txt"
+
+
+class TestWorkorderLog:
+    """Test appending, tail reads and indexed filtering."""
+
+    def test_append_and_read_newest_first(self, log_file):
+        """Entries are appended to the file and returned latest first."""
+        log = WorkorderLog(log_file)
+        log.append('WO-AUTH-001', 'alpha', 'First', '2026-01-01T00:00:00Z')
+        log.append('WO-AUTH-002', 'alpha', 'Second', '2026-01-02T00:00:00Z')
+
+        assert log_file.read_text(encoding='utf-8').splitlines()[0].startswith('WO-AUTH-001')
+
+        entries, total = log.read()
+        assert total == 2
+        assert [e['workorder_id'] for e in entries] == ['WO-AUTH-002', 'WO-AUTH-001']
+
+    def test_tail_read_across_blocks(self, log_file, monkeypatch):
+        """Limited reads seek back from EOF, across block boundaries."""
+        monkeypatch.setattr(workorder_log, 'TAIL_BLOCK_SIZE', 37)
+        log = WorkorderLog(log_file)
+        _log_entries(log, 50)
+
+        expected = _brute_force(log_file)
+        for limit in (1, 7, 50, None):
+            entries, total = log.read(limit=limit)
+            assert total == 50
+            assert entries == expected[:limit]
+
+    @pytest.mark.parametrize('project_filter,workorder_pattern', [
+        ('alpha', ''),
+        ('service', ''),
+        ('', 'WO-AUTH'),
+        ('', 'WO-AUTH-01'),
+        ('', 'WO-U'),
+        ('beta', 'WO-UI-REFRESH'),
+        ('', 'WO-MISSING'),
+    ])
+    def test_filtered_reads_match_full_scan(self, log_file, project_filter, workorder_pattern):
+        """Index-backed filters return what a full scan would."""
+        log = WorkorderLog(log_file)
+        _log_entries(log, 40)
+
+        entries, _ = log.read(project_filter=project_filter, workorder_pattern=workorder_pattern)
+        assert entries == _brute_force(log_file, project_filter, workorder_pattern)
+
+        limited, _ = log.read(project_filter=project_filter, workorder_pattern=workorder_pattern, limit=3)
+        assert limited == entries[:3]
+
+    def test_index_extended_for_external_appends(self, log_file):
+        """Lines appended outside WorkorderLog are indexed from the last indexed offset."""
+        log = WorkorderLog(log_file)
+        _log_entries(log, 5)
+        with open(log_file, 'a', encoding='utf-8') as f:
+            f.write('WO-DOCS-001 | gamma | External | 2026-02-01T00:00:00Z\n')
+
+        entries, total = log.read(workorder_pattern='WO-DOCS')
+        assert total == 6
+        assert [e['project'] for e in entries] == ['gamma']
+        assert json.loads(log.delta_file.read_text().splitlines()[-1])[1] == log_file.stat().st_size
+
+        log.append('WO-DOCS-002', 'gamma', 'Internal', '2026-02-02T00:00:00Z')
+        assert [e['description'] for e in log.read(project_filter='gamma')[0]] == ['Internal', 'External']
+
+    def test_append_only_adds_a_delta_record(self, log_file):
+        """Once the index is current, an append neither loads nor rewrites the snapshot."""
+        log = WorkorderLog(log_file)
+        _log_entries(log, 3)
+        snapshot = log.index_file.read_bytes()
+
+        with patch.object(WorkorderLog, '_load_index', side_effect=AssertionError('index loaded')):
+            log.append('WO-AUTH-100', 'alpha', 'Fast', '2026-01-05T00:00:00Z')
+
+        assert log.index_file.read_bytes() == snapshot
+        assert json.loads(log.delta_file.read_text().splitlines()[-1])[2:] == ['WO-AUTH', 'alpha']
+        assert log.read(workorder_pattern='WO-AUTH-1')[0][0]['description'] == 'Fast'
+
+    def test_delta_folded_into_snapshot(self, log_file, monkeypatch):
+        """Reads fold a delta that outgrew the snapshot; results are unchanged."""
+        monkeypatch.setattr(workorder_log, 'COMPACT_MIN_RECORDS', 4)
+        log = WorkorderLog(log_file)
+        _log_entries(log, 10)
+        assert len(log.delta_file.read_text().splitlines()) > 4
+
+        entries, total = log.read(project_filter='alpha')
+
+        assert total == 10
+        assert entries == _brute_force(log_file, 'alpha')
+        assert len(log.delta_file.read_text().splitlines()) == 1
+        assert json.loads(log.index_file.read_text())['count'] == 10
+
+    def test_damaged_delta_rebuilt(self, log_file):
+        """A torn delta record makes the next read rebuild the index from the log."""
+        log = WorkorderLog(log_file)
+        _log_entries(log, 6)
+        with open(log.delta_file, 'a', encoding='utf-8') as f:
+            f.write('[12')
+
+        entries, total = log.read(workorder_pattern='WO-UI')
+        assert total == 6
+        assert entries == _brute_force(log_file, workorder_pattern='WO-UI')
+
+    def test_legacy_prepended_log_converted(self, log_file):
+        """A newest-first log from the old prepend implementation is reversed once."""
+        log_file.parent.mkdir(parents=True)
+        log_file.write_text(
+            'WO-AUTH-003 | alpha | Third | 2026-01-03T00:00:00Z\n'
+            'WO-AUTH-002 | alpha | Second | 2026-01-02T00:00:00Z\n'
+            'WO-AUTH-001 | alpha | First | 2026-01-01T00:00:00Z\n',
+            encoding='utf-8'
+        )
+
+        log = WorkorderLog(log_file)
+        log.append('WO-AUTH-004', 'alpha', 'Fourth', '2026-01-04T00:00:00Z')
+
+        entries, total = log.read()
+        assert total == 4
+        assert [e['description'] for e in entries] == ['Fourth', 'Third', 'Second', 'First']
+
+    def test_concurrent_appends_are_not_lost(self, log_file):
+        """Appends from several threads all land in the log and the index."""
+        log = WorkorderLog(log_file)
+
+        def worker(n):
+            for i in range(20):
+                WorkorderLog(log_file).append(f"WO-T{n}-{i:03d}", f"proj{n}", 'Concurrent', '2026-01-01T00:00:00Z')
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        entries, total = log.read()
+        assert total == 80
+        assert len({e['workorder_id'] for e in entries}) == 80
+        assert len(log.read(project_filter='proj2')[0]) == 20
+
+    def test_workorder_family(self):
+        assert workorder_family('WO-AUTH-001') == 'WO-AUTH'
+        assert workorder_family('WO-UI-REFRESH-12') == 'WO-UI-REFRESH'
+        assert workorder_family('WO-CUSTOM') == 'WO-CUSTOM'
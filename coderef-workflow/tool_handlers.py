@@ -129,6 +129,14 @@ from logger_config import logger
 from handler_decorators import mcp_error_handler, log_invocation
 from handler_helpers import format_success_response, generate_workorder_id, get_workorder_timestamp, add_response_timestamp
 from uds_helpers import get_server_version
+from utils.agent_status_view import get_agent_statuses, record_communication
+from utils.baseline_store import BaselineStore
+from utils.git_metrics import collect_workorder_metrics, summarize_agent_metrics
+from utils.json_store import update_json_document, write_json_atomic
+from utils.plan_audit import audit_plan_files
+from utils.schema_registry import validate as validate_against_schema
+from utils.task_status import TASK_STATUSES, apply_task_updates, calculate_progress, validate_updates
+from utils.workorder_log import WorkorderLog, workorder_family
 
 
 @log_invocation
@@ -1148,7 +1156,7 @@ async def handle_validate_implementation_plan(arguments: dict) -> list[TextConte
         # Fallback to legacy validator if Papertrail not available
         logger.warning("Papertrail validators not available - using legacy validator")
         validator = LegacyPlanValidator(plan_path)
-        result = validator.validate()
+        result = validator.validate(incremental=True)
 
         logger.info(
             f'Validation complete (legacy): score={result["score"]}, result={result["validation_result"]}, issues={len(result["issues"])}',
@@ -1158,7 +1166,7 @@ async def handle_validate_implementation_plan(arguments: dict) -> list[TextConte
         # Critical validation failure from handle_validation_result
         logger.error("Plan validation failed critically - using legacy validator as fallback")
         validator = LegacyPlanValidator(plan_path)
-        result = validator.validate()
+        result = validator.validate(incremental=True)
 
     # Return result as JSON
     return [TextContent(type='text', text=json.dumps(result, indent=2))]
@@ -1204,7 +1212,7 @@ async def handle_generate_plan_review_report(arguments: dict) -> list[TextConten
         # Fallback to legacy validator if Papertrail not available
         logger.warning("Papertrail validators not available - using legacy validator for review report")
         validator = LegacyPlanValidator(plan_path)
-        validation_result = validator.validate()
+        validation_result = validator.validate(incremental=True)
 
         logger.debug(
             f'Validation completed (legacy): score={validation_result["score"]}, issues={len(validation_result["issues"])}'
@@ -1213,7 +1221,7 @@ async def handle_generate_plan_review_report(arguments: dict) -> list[TextConten
         # Critical validation failure - use legacy validator as fallback
         logger.error("Plan validation failed critically - using legacy validator")
         validator = LegacyPlanValidator(plan_path)
-        validation_result = validator.validate()
+        validation_result = validator.validate(incremental=True)
 
     # Extract plan name from file path
     plan_name = plan_path.stem  # e.g., "feature-auth-plan" from "feature-auth-plan.json"
@@ -1448,9 +1456,9 @@ async def handle_finalize_plan_from_agent(arguments: dict) -> list[TextContent]:
 
         # Auto-validate the plan
         try:
-            from validators.plan_validator import LegacyPlanValidator
-            validator = LegacyPlanValidator(str(plan_file))
-            validation_result = validator.validate()
+            # plan_data is what save_plan just wrote - validate it without re-reading
+            validator = LegacyPlanValidator(plan_file, plan_data=plan_data)
+            validation_result = validator.validate(incremental=True)
 
             validation_score = validation_result.get('score', 0)
             validation_status = "PASS" if validation_result.get('approved', False) else "FAIL"
@@ -1670,6 +1678,9 @@ def save_baseline_snapshot(project_path: Path, feature_name: str) -> bool:
     Phase 4: Baseline Snapshot Mechanism
     (WO-DELIVERABLES-ENHANCEMENT-001)
 
+    Snapshots go to the content-addressed store in coderef/baselines/
+    (deduplicated across features, with precomputed element keys).
+
     Args:
         project_path: Path to project root
         feature_name: Feature name for baseline filename
@@ -1677,18 +1688,10 @@ def save_baseline_snapshot(project_path: Path, feature_name: str) -> bool:
     Returns:
         bool: True if baseline saved successfully, False otherwise
     """
-    source_path = Path(project_path) / '.coderef' / 'index.json'
-    baseline_path = Path(project_path) / '.coderef' / f'index-baseline-{feature_name}.json'
-
-    if not source_path.exists():
-        logger.warning(f".coderef/index.json not found, skipping baseline snapshot")
-        return False
-
     try:
-        # Copy index.json to baseline
-        import shutil
-        shutil.copy2(source_path, baseline_path)
-        logger.info(f"Baseline snapshot saved: {baseline_path}")
+        if not BaselineStore(project_path).save(feature_name):
+            logger.warning(f".coderef/index.json not found, skipping baseline snapshot")
+            return False
         return True
     except Exception as e:
         logger.error(f"Failed to save baseline snapshot: {e}")
@@ -1743,47 +1746,32 @@ async def _generate_enhanced_deliverables(
     engine.register_extension('plan', WorkflowExtension())
 
     # PHASE 3: Data Collection
-    # Collect git data
-    git_ext = engine.extensions['git']
+    # Collect git data (one cached git log pass per workorder and repository state)
+    git_metrics = collect_workorder_metrics(Path(project_path), workorder_id)
     git_data = {
-        'files_changed': git_ext.get_files_changed(workorder_id) or [],
-        'commits': git_ext.get_commits(workorder_id) or [],
-        'total_additions': 0,
-        'total_deletions': 0,
+        'files_changed': git_metrics['files_changed'],
+        'commits': git_metrics['commits'],
+        'total_additions': git_metrics['total_additions'],
+        'total_deletions': git_metrics['total_deletions'],
         'source': f'git log --grep={workorder_id}'
     }
 
-    # Calculate totals
-    for file in git_data['files_changed']:
-        git_data['total_additions'] += file.get('additions', 0)
-        git_data['total_deletions'] += file.get('deletions', 0)
-
-    # Collect coderef data
-    baseline_path = Path(project_path) / '.coderef' / f'index-baseline-{feature_name}.json'
-    current_path = Path(project_path) / '.coderef' / 'index.json'
+    # Collect coderef data (set difference against the baseline's stored element keys)
+    baseline_store = BaselineStore(project_path)
+    baseline_path = baseline_store.snapshot_path(feature_name)
 
-    coderef_ext = engine.extensions['coderef']
     coderef_data = {
         'components_added': [],
         'functions_added': [],
         'complexity_delta': 0.0,
-        'baseline': str(baseline_path) if baseline_path.exists() else None
+        'baseline': baseline_path.relative_to(project_path).as_posix() if baseline_path else None
     }
 
-    if baseline_path.exists() and current_path.exists():
+    if baseline_path:
         try:
-            coderef_data['components_added'] = coderef_ext.get_components_added(
-                str(baseline_path),
-                str(current_path)
-            ) or []
-            coderef_data['functions_added'] = coderef_ext.get_functions_added(
-                str(baseline_path),
-                str(current_path)
-            ) or []
-            coderef_data['complexity_delta'] = coderef_ext.calculate_complexity_delta(
-                str(baseline_path),
-                str(current_path)
-            )
+            changes = baseline_store.changes_since_baseline(feature_name)
+            if changes:
+                coderef_data.update(changes)
         except Exception as e:
             logger.warning(f"CodeRef data collection failed: {e}")
 
@@ -2291,7 +2279,12 @@ async def handle_generate_agent_communication(arguments: dict) -> list[TextConte
     })
 
     # Save communication.json
-    comm_path.write_text(json.dumps(communication, indent=2), encoding='utf-8')
+    def replace_communication(data: dict) -> None:
+        data.clear()
+        data.update(communication)
+
+    communication, _ = update_json_document(comm_path, replace_communication, default=dict)
+    record_communication(comm_path, communication)
 
     # GAP-004 + GAP-005: Validate communication.json with ValidatorFactory and centralized error handling
     try:
@@ -2370,39 +2363,35 @@ async def handle_assign_agent_task(arguments: dict) -> list[TextContent]:
             f"Run generate_agent_communication for feature '{feature_name}' first."
         )
 
-    # Load communication.json
-    comm_data = json.loads(comm_path.read_text(encoding='utf-8'))
-
-    # Generate agent-scoped workorder ID
-    base_workorder = comm_data.get('workorder_id', f'WO-{feature_name.upper()}-001')
-    agent_workorder = generate_agent_workorder_id(base_workorder, agent_number)
-
-    # Check for existing assignments to detect conflicts
     agent_status_key = f'agent_{agent_number}_status'
-    existing_status = comm_data.get(agent_status_key)
 
-    if existing_status and 'ASSIGNED' in str(existing_status):
-        logger.warning(f"Agent {agent_number} already assigned to feature '{feature_name}'")
+    def apply_assignment(data: dict) -> str:
+        # Generate agent-scoped workorder ID
+        base_workorder = data.get('workorder_id', f'WO-{feature_name.upper()}-001')
+        agent_workorder = generate_agent_workorder_id(base_workorder, agent_number)
 
-    # Build agent-specific instruction set
-    if phase_id:
-        instruction = f"Execute {phase_id} tasks for {comm_data.get('feature', feature_name)}"
-    else:
-        instruction = comm_data.get('instruction', f"Execute tasks for {comm_data.get('feature', feature_name)}")
+        # Check for existing assignments to detect conflicts
+        existing_status = data.get(agent_status_key)
 
-    # Update communication.json with assignment
-    comm_data[agent_status_key] = f"ASSIGNED - Agent {agent_number} assigned to work"
-    comm_data[f'agent_{agent_number}_assigned_at'] = datetime.now().isoformat()
-    comm_data[f'agent_{agent_number}_workorder'] = agent_workorder
+        if existing_status and 'ASSIGNED' in str(existing_status):
+            logger.warning(f"Agent {agent_number} already assigned to feature '{feature_name}'")
 
-    if phase_id:
-        comm_data[f'agent_{agent_number}_phase'] = phase_id
+        # Update communication.json with assignment
+        data[agent_status_key] = f"ASSIGNED - Agent {agent_number} assigned to work"
+        data[f'agent_{agent_number}_assigned_at'] = datetime.now().isoformat()
+        data[f'agent_{agent_number}_workorder'] = agent_workorder
 
-    # Update metadata
-    comm_data['metadata']['updated_at'] = datetime.now().isoformat()
+        if phase_id:
+            data[f'agent_{agent_number}_phase'] = phase_id
 
-    # Save updated communication.json
-    comm_path.write_text(json.dumps(comm_data, indent=2), encoding='utf-8')
+        # Update metadata
+        data['metadata']['updated_at'] = datetime.now().isoformat()
+        return agent_workorder
+
+    # Load, update and save communication.json (locked, versioned, atomic)
+    comm_data, agent_workorder = update_json_document(comm_path, apply_assignment)
+    base_workorder = comm_data.get('workorder_id', f'WO-{feature_name.upper()}-001')
+    record_communication(comm_path, comm_data)
 
     # GAP-004 + GAP-005: Validate communication.json with ValidatorFactory and centralized error handling
     try:
@@ -2541,29 +2530,39 @@ async def handle_verify_agent_completion(arguments: dict) -> list[TextContent]:
         # All criteria require manual review for now
         verification_results['success_criteria_check']['manual_review_required'].append(criterion)
 
-    # Update communication.json with verification results
-    comm_data[f'agent_{agent_number}_verification'] = {
-        'verified_at': datetime.now().isoformat(),
-        'verified_by': 'Agent 1',
-        'forbidden_files_check': verification_results['forbidden_files_check'],
-        'success_criteria': {
-            'total': len(success_criteria),
-            'manual_review_count': len(verification_results['success_criteria_check']['manual_review_required'])
-        },
-        'overall_status': verification_results['overall_status']
-    }
+    def apply_verification(data: dict) -> None:
+        # Re-check against the latest document: another agent may have updated it meanwhile
+        latest_status = data.get(agent_status_key, '')
+        if 'COMPLETE' not in str(latest_status):
+            raise ValueError(
+                f"Agent {agent_number} status is '{latest_status}'. "
+                f"Must be COMPLETE before verification."
+            )
 
-    # Update agent status based on verification
-    if verification_results['overall_status'] == 'PASSED':
-        comm_data[agent_status_key] = f"VERIFIED - Agent {agent_number} work verified and approved"
-    else:
-        comm_data[agent_status_key] = f"VERIFICATION_FAILED - Agent {agent_number} work needs revision"
+        # Update communication.json with verification results
+        data[f'agent_{agent_number}_verification'] = {
+            'verified_at': datetime.now().isoformat(),
+            'verified_by': 'Agent 1',
+            'forbidden_files_check': verification_results['forbidden_files_check'],
+            'success_criteria': {
+                'total': len(success_criteria),
+                'manual_review_count': len(verification_results['success_criteria_check']['manual_review_required'])
+            },
+            'overall_status': verification_results['overall_status']
+        }
+
+        # Update agent status based on verification
+        if verification_results['overall_status'] == 'PASSED':
+            data[agent_status_key] = f"VERIFIED - Agent {agent_number} work verified and approved"
+        else:
+            data[agent_status_key] = f"VERIFICATION_FAILED - Agent {agent_number} work needs revision"
 
-    # Update metadata
-    comm_data['metadata']['updated_at'] = datetime.now().isoformat()
+        # Update metadata
+        data['metadata']['updated_at'] = datetime.now().isoformat()
 
-    # Save updated communication.json
-    comm_path.write_text(json.dumps(comm_data, indent=2), encoding='utf-8')
+    # Save updated communication.json (locked, versioned, atomic)
+    comm_data, _ = update_json_document(comm_path, apply_verification)
+    record_communication(comm_path, comm_data)
 
     # GAP-004 + GAP-005: Validate communication.json with ValidatorFactory and centralized error handling
     try:
@@ -2599,6 +2598,24 @@ async def handle_verify_agent_completion(arguments: dict) -> list[TextContent]:
     )
 
 
+def _feature_workorder_id(feature_dir: Path) -> str:
+    """Workorder ID from a feature's communication.json or plan.json ('' if neither has one)."""
+    from schema_validator import get_workorder_id
+
+    for filename in ('communication.json', 'plan.json'):
+        path = feature_dir / filename
+        if not path.exists():
+            continue
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            continue
+        workorder_id = data.get('workorder_id') if filename == 'communication.json' else get_workorder_id(data)
+        if workorder_id and workorder_id != 'N/A':
+            return workorder_id
+    return ''
+
+
 @log_invocation
 @mcp_error_handler
 async def handle_aggregate_agent_deliverables(arguments: dict) -> list[TextContent]:
@@ -2643,8 +2660,19 @@ async def handle_aggregate_agent_deliverables(arguments: dict) -> list[TextConte
 
     logger.info(f"Found {len(deliverables_files)} DELIVERABLES.md files for feature '{feature_name}'")
 
-    # Aggregate metrics
-    aggregated = aggregate_agent_metrics(deliverables_files)
+    # Aggregate metrics from git (one pass over the workorder family's commits);
+    # fall back to the numbers recorded in each DELIVERABLES.md
+    workorder_id = _feature_workorder_id(feature_dir)
+    git_metrics = collect_workorder_metrics(Path(project_path), workorder_id, family=True) if workorder_id else None
+
+    if git_metrics and git_metrics['commits']:
+        aggregated = summarize_agent_metrics(git_metrics, len(deliverables_files))
+        metrics_source = 'git'
+        aggregation_method = f"git log --grep={workorder_family(workorder_id)}- (per-agent workorder IDs)"
+    else:
+        aggregated = aggregate_agent_metrics(deliverables_files)
+        metrics_source = 'deliverables'
+        aggregation_method = "Sum LOC, count commits, unique contributors, time range"
 
     # Create combined deliverables report
     combined_path = feature_dir / "DELIVERABLES-COMBINED.md"
@@ -2699,7 +2727,7 @@ This report aggregates metrics from **{aggregated['agents_count']} agent(s)** wo
 ## Aggregation Details
 
 **Source Files**: {len(deliverables_files)} DELIVERABLES.md files
-**Aggregation Method**: Sum LOC, count commits, unique contributors, time range
+**Aggregation Method**: {aggregation_method}
 **First Commit Date**: {aggregated.get('first_commit_date', 'N/A')}
 **Last Commit Date**: {aggregated.get('last_commit_date', 'N/A')}
 
@@ -2726,6 +2754,8 @@ This report aggregates metrics from **{aggregated['agents_count']} agent(s)** wo
             'days_elapsed': aggregated['days_elapsed'],
             'hours_elapsed': aggregated['hours_elapsed'],
             'deliverables_files_found': len(deliverables_files),
+            'metrics_source': metrics_source,
+            'agents': aggregated.get('agents', {}),
             'success': True
         },
         message=f"✅ Aggregated deliverables from {aggregated['agents_count']} agent(s): {aggregated['total_commits']} commits, {aggregated['loc_net']} net LOC"
@@ -2755,8 +2785,6 @@ async def handle_track_agent_status(arguments: dict) -> list[TextContent]:
     Raises:
         ValueError: If inputs invalid
     """
-    from handler_helpers import parse_agent_status
-
     # Validate inputs
     project_path = validate_project_path_input(arguments.get("project_path", ""))
     feature_name = arguments.get("feature_name")  # Optional
@@ -2782,15 +2810,8 @@ async def handle_track_agent_status(arguments: dict) -> list[TextContent]:
 
     logger.info(f"Tracking {len(comm_files)} feature(s)")
 
-    # Parse status from all communication files
-    all_statuses = []
-    for comm_file in comm_files:
-        try:
-            status = parse_agent_status(comm_file)
-            all_statuses.append(status)
-        except Exception as e:
-            logger.warning(f"Failed to parse {comm_file}: {e}")
-            continue
+    # Statuses come from the materialized view; only changed files are re-parsed
+    all_statuses = get_agent_statuses(working_dir, feature_name)
 
     # Build dashboard
     dashboard = {
@@ -3562,24 +3583,14 @@ def log_execution(project_path: Path, feature_name: str, workorder_id: str, task
         "tasks": tasks
     }
 
-    # Load existing log or create new
-    execution_log = []
-    if log_file.exists():
+    # Append new entry to the existing log (or a new one)
+    try:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
         try:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                execution_log = json.load(f)
+            update_json_document(log_file, lambda log: log.append(execution_entry), default=list)
         except json.JSONDecodeError:
             logger.warning(f"Malformed execution log, creating new: {log_file}")
-            execution_log = []
-
-    # Append new entry
-    execution_log.append(execution_entry)
-
-    # Save log
-    try:
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(log_file, 'w', encoding='utf-8') as f:
-            json.dump(execution_log, f, indent=2)
+            write_json_atomic(log_file, [execution_entry])
 
         # GAP-002 + GAP-004 + GAP-005: Validate with cross-validation, factory, and centralized handling
         try:
@@ -3625,8 +3636,8 @@ async def handle_log_workorder(arguments: dict) -> list[TextContent]:
     Creates simple one-line workorder log entry with format:
     WO-ID | Project | Description | Timestamp
 
-    Latest entries appear at top (prepend, reverse chronological).
-    Thread-safe with file locking for concurrent access.
+    Entries are appended under a file lock (safe for concurrent access) and
+    returned latest first by get_workorder_log (reverse chronological).
 
     Args:
         arguments: Dict with:
@@ -3673,9 +3684,6 @@ async def handle_log_workorder(arguments: dict) -> list[TextContent]:
         }
     )
 
-    # Build log entry
-    log_entry = f"{workorder_id} | {project_name} | {description} | {timestamp}\n"
-
     # Ensure coderef directory exists
     coderef_dir = Path(project_path) / Paths.CODEREF
     coderef_dir.mkdir(parents=True, exist_ok=True)
@@ -3683,19 +3691,9 @@ async def handle_log_workorder(arguments: dict) -> list[TextContent]:
     # Path to log file
     log_file = coderef_dir / Files.WORKORDER_LOG
 
-    # Prepend to log file (read-then-write approach, simpler for Windows)
+    # Append under file lock (readers present entries newest first)
     try:
-        # Read existing content if file exists
-        existing_content = ""
-        if log_file.exists():
-            with open(log_file, 'r', encoding='utf-8') as f:
-                existing_content = f.read()
-
-        # Write new entry at top
-        with open(log_file, 'w', encoding='utf-8') as f:
-            f.write(log_entry)
-            f.write(existing_content)
-
+        WorkorderLog(log_file).append(workorder_id, project_name, description, timestamp)
         logger.info(f"Workorder logged successfully to local: {workorder_id}")
     except IOError as e:
         raise IOError(f"Failed to write workorder log: {e}")
@@ -3708,19 +3706,7 @@ async def handle_log_workorder(arguments: dict) -> list[TextContent]:
         orchestrator_root = Path(OrchestratorPaths.ROOT)
         orchestrator_log_path = orchestrator_root / OrchestratorPaths.WORKORDER_LOG
 
-        # Ensure orchestrator coderef directory exists
-        orchestrator_log_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Read existing orchestrator log content
-        orchestrator_existing = ""
-        if orchestrator_log_path.exists():
-            with open(orchestrator_log_path, 'r', encoding='utf-8') as f:
-                orchestrator_existing = f.read()
-
-        # Write new entry at top of orchestrator log
-        with open(orchestrator_log_path, 'w', encoding='utf-8') as f:
-            f.write(log_entry)
-            f.write(orchestrator_existing)
+        WorkorderLog(orchestrator_log_path).append(workorder_id, project_name, description, timestamp)
 
         orchestrator_logged = True
         logger.info(f"Workorder logged successfully to orchestrator: {workorder_id}")
@@ -3799,52 +3785,22 @@ async def handle_get_workorder_log(arguments: dict) -> list[TextContent]:
             message="No workorder entries found"
         )
 
-    # Read log file
+    # Read newest entries (tail read, or sidecar index for filtered queries)
     try:
-        with open(log_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        entries, total_count = WorkorderLog(log_file).read(
+            project_filter=project_name_filter,
+            workorder_pattern=workorder_pattern,
+            limit=limit
+        )
     except IOError as e:
         raise IOError(f"Failed to read workorder log: {e}")
 
-    # Parse entries
-    entries = []
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        # Parse format: WO-ID | Project | Description | Timestamp
-        parts = line.split('|')
-        if len(parts) != 4:
-            logger.warning(f"Skipping malformed log entry: {line}")
-            continue
-
-        wo_id, proj, desc, ts = [p.strip() for p in parts]
-
-        # Apply filters
-        if project_name_filter and project_name_filter not in proj.lower():
-            continue
-
-        if workorder_pattern and not wo_id.startswith(workorder_pattern):
-            continue
-
-        entries.append({
-            'workorder_id': wo_id,
-            'project': proj,
-            'description': desc,
-            'timestamp': ts
-        })
-
-    # Apply limit
-    if limit and limit > 0:
-        entries = entries[:limit]
-
-    logger.info(f"Found {len(entries)} workorder entries (total {len(lines)} in log)")
+    logger.info(f"Found {len(entries)} workorder entries (total {total_count} in log)")
 
     return format_success_response(
         data={
             'entries': entries,
-            'total_count': len(lines),
+            'total_count': total_count,
             'filtered_count': len(entries),
             'log_file': str(log_file.relative_to(Path(project_path))),
             'filters_applied': {
@@ -4097,6 +4053,50 @@ async def handle_assess_risk(arguments: dict) -> list[TextContent]:
 # Progress Tracking (STUB-009)
 # =============================================================================
 
+def _update_plan_tasks(project_path: Path, feature_name: str, updates: list) -> tuple:
+    """
+    Apply task status updates to a feature's plan.json in one load/write.
+
+    The read-modify-write goes through update_json_document (per-plan lock,
+    version check with retry, atomic replace); validation runs once, after
+    the write.
+
+    Returns:
+        Tuple of (plan_path, per-update results, progress summary)
+    """
+    plan_path = project_path / 'coderef' / 'workorder' / feature_name / 'plan.json'
+    if not plan_path.exists():
+        raise FileNotFoundError(f"Plan not found: {plan_path}")
+
+    timestamp = get_workorder_timestamp()
+    plan_data, results = update_json_document(
+        plan_path, lambda data: apply_task_updates(data, updates, timestamp)
+    )
+
+    # GAP-004 + GAP-005: Validate plan.json with ValidatorFactory and centralized error handling
+    try:
+        from papertrail.validators.factory import ValidatorFactory
+        from utils.validation_helpers import handle_validation_result
+
+        validator = ValidatorFactory.get_validator(str(plan_path))
+        result = validator.validate_file(str(plan_path))
+        handle_validation_result(result, "plan.json")
+    except ImportError:
+        # Fallback: check the already-parsed plan against the compiled plan schema
+        try:
+            is_valid, errors = validate_against_schema(plan_data)
+            if not is_valid:
+                logger.warning(f"plan.json has {len(errors)} schema issue(s) after update: {errors[:3]}")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Plan schema not available - skipping update validation: {e}")
+    except ValueError:
+        logger.error("plan.json validation failed critically - continuing with partial data")
+    except Exception as e:
+        logger.warning(f"Plan update validation error: {e} - continuing without validation")
+
+    return plan_path, results, calculate_progress(plan_data)
+
+
 @log_invocation
 @mcp_error_handler
 async def handle_update_task_status(arguments: dict) -> list[TextContent]:
@@ -4127,111 +4127,23 @@ async def handle_update_task_status(arguments: dict) -> list[TextContent]:
     feature_name = validate_feature_name_input(feature_name)
 
     # Validate status
-    valid_statuses = ['pending', 'in_progress', 'completed', 'blocked']
-    if status not in valid_statuses:
-        raise ValueError(f"Invalid status '{status}'. Must be one of: {', '.join(valid_statuses)}")
+    if status not in TASK_STATUSES:
+        raise ValueError(f"Invalid status '{status}'. Must be one of: {', '.join(TASK_STATUSES)}")
 
     if not task_id:
         raise ValueError("task_id is required")
 
-    # Load plan.json
-    plan_path = project_path / 'coderef' / 'workorder' / feature_name / 'plan.json'
-    if not plan_path.exists():
-        raise FileNotFoundError(f"Plan not found: {plan_path}")
-
-    with open(plan_path, 'r', encoding='utf-8') as f:
-        plan_data = json.load(f)
-
-    # Find and update task in section 9 (implementation checklist)
-    structure = plan_data.get('UNIVERSAL_PLANNING_STRUCTURE', {})
-    checklist = structure.get('9_implementation_checklist', {})
-
-    task_found = False
-    old_status = None
-
-    # Search through checklist categories
-    for category_name, category_tasks in checklist.items():
-        if isinstance(category_tasks, list):
-            for task in category_tasks:
-                if isinstance(task, dict) and task.get('id') == task_id:
-                    old_status = task.get('status', 'pending')
-                    task['status'] = status
-                    task['updated_at'] = get_workorder_timestamp()
-                    if notes:
-                        task['notes'] = notes
-                    task_found = True
-                    break
-        if task_found:
-            break
-
-    # Also search in section 5 tasks array
-    if not task_found:
-        task_section = structure.get('5_task_id_system', {})
-        tasks = task_section.get('tasks', [])
-        for task in tasks:
-            if isinstance(task, dict) and task.get('id') == task_id:
-                old_status = task.get('status', 'pending')
-                task['status'] = status
-                task['updated_at'] = get_workorder_timestamp()
-                if notes:
-                    task['notes'] = notes
-                task_found = True
-                break
-
-    if not task_found:
-        raise ValueError(f"Task '{task_id}' not found in plan.json")
-
-    # Update META_DOCUMENTATION with last_updated timestamp
-    if 'META_DOCUMENTATION' in plan_data:
-        plan_data['META_DOCUMENTATION']['last_updated'] = get_workorder_timestamp()
-
-    # Save updated plan
-    with open(plan_path, 'w', encoding='utf-8') as f:
-        json.dump(plan_data, f, indent=2, ensure_ascii=False)
-        f.write('\n')
-
-    # GAP-004 + GAP-005: Validate plan.json with ValidatorFactory and centralized error handling
-    try:
-        from papertrail.validators.factory import ValidatorFactory
-        from utils.validation_helpers import handle_validation_result
-
-        validator = ValidatorFactory.get_validator(str(plan_path))
-        result = validator.validate_file(str(plan_path))
-        handle_validation_result(result, "plan.json")
-    except ImportError:
-        logger.warning("Papertrail validators not available - skipping update validation")
-    except ValueError:
-        logger.error("plan.json validation failed critically - continuing with partial data")
-    except Exception as e:
-        logger.warning(f"Plan update validation error: {e} - continuing without validation")
-
-    # Calculate progress summary
-    total_tasks = 0
-    completed_tasks = 0
-    in_progress_tasks = 0
-    blocked_tasks = 0
-
-    for category_name, category_tasks in checklist.items():
-        if isinstance(category_tasks, list):
-            for task in category_tasks:
-                if isinstance(task, dict):
-                    total_tasks += 1
-                    task_status = task.get('status', 'pending')
-                    if task_status == 'completed':
-                        completed_tasks += 1
-                    elif task_status == 'in_progress':
-                        in_progress_tasks += 1
-                    elif task_status == 'blocked':
-                        blocked_tasks += 1
-
-    progress_percent = round((completed_tasks / total_tasks) * 100, 1) if total_tasks > 0 else 0
+    plan_path, results, progress = _update_plan_tasks(
+        project_path, feature_name, [{'task_id': task_id, 'status': status, 'notes': notes}]
+    )
+    old_status = results[0]['old_status']
 
     logger.info(f"Task status updated: {task_id} ({old_status} -> {status})", extra={
         'feature_name': feature_name,
         'task_id': task_id,
         'old_status': old_status,
         'new_status': status,
-        'progress_percent': progress_percent
+        'progress_percent': progress['percent']
     })
 
     return format_success_response(
@@ -4241,19 +4153,58 @@ async def handle_update_task_status(arguments: dict) -> list[TextContent]:
             'new_status': status,
             'notes': notes,
             'plan_path': str(plan_path.relative_to(project_path)),
-            'progress': {
-                'total': total_tasks,
-                'completed': completed_tasks,
-                'in_progress': in_progress_tasks,
-                'blocked': blocked_tasks,
-                'pending': total_tasks - completed_tasks - in_progress_tasks - blocked_tasks,
-                'percent': progress_percent
-            }
+            'progress': progress
         },
         message=f"✅ Task {task_id} status updated: {old_status} → {status}"
     )
 
 
+@log_invocation
+@mcp_error_handler
+async def handle_batch_update_task_status(arguments: dict) -> list[TextContent]:
+    """
+    Handle batch_update_task_status tool call.
+
+    Applies many task status updates to plan.json with one load, one atomic
+    write and one validation pass. All task IDs are checked first; if any is
+    unknown, nothing is written.
+
+    Args (in arguments):
+        project_path: Absolute path to project directory
+        feature_name: Feature name (folder in coderef/workorder/)
+        updates: List of {task_id, status, notes?} entries, applied in order
+
+    Returns:
+        Success response with per-task results and progress summary
+    """
+    # Validate inputs
+    project_path_str = arguments.get('project_path', '')
+    feature_name = arguments.get('feature_name', '')
+    updates = arguments.get('updates', [])
+
+    project_path = Path(validate_project_path_input(project_path_str)).resolve()
+    feature_name = validate_feature_name_input(feature_name)
+    validate_updates(updates)
+
+    plan_path, results, progress = _update_plan_tasks(project_path, feature_name, updates)
+
+    logger.info(f"Task statuses updated: {len(results)} updates", extra={
+        'feature_name': feature_name,
+        'task_ids': [r['task_id'] for r in results],
+        'progress_percent': progress['percent']
+    })
+
+    return format_success_response(
+        data={
+            'updates': results,
+            'updated_count': len(results),
+            'plan_path': str(plan_path.relative_to(project_path)),
+            'progress': progress
+        },
+        message=f"✅ Updated {len(results)} task statuses ({progress['percent']}% complete)"
+    )
+
+
 @log_invocation
 @mcp_error_handler
 async def handle_audit_plans(arguments: dict) -> list[TextContent]:
@@ -4274,7 +4225,7 @@ async def handle_audit_plans(arguments: dict) -> list[TextContent]:
     Returns:
         Success response with audit results for all plans
     """
-    from plan_format_validator import enforce_plan_format, check_for_invalid_plans
+    from plan_format_validator import check_for_invalid_plans
 
     # Validate inputs
     project_path_str = arguments.get('project_path', '')
@@ -4324,142 +4275,94 @@ async def handle_audit_plans(arguments: dict) -> list[TextContent]:
     current_time = datetime.now()
     stale_threshold = current_time.timestamp() - (stale_days * 24 * 60 * 60)
 
+    feature_dirs = []
     for scan_dir in dirs_to_scan:
         is_archived = scan_dir == archived_dir
-
         for feature_dir in scan_dir.iterdir():
-            if not feature_dir.is_dir():
-                continue
+            if feature_dir.is_dir():
+                feature_dirs.append((feature_dir, is_archived))
 
-            audit_results['total_features'] += 1
-            feature_name = feature_dir.name
-            plan_path = feature_dir / 'plan.json'
+    # Per-plan audits are cached by (path, mtime, size); changed plans run in parallel
+    plan_paths = [feature_dir / 'plan.json' for feature_dir, _ in feature_dirs]
+    existing_plans = [plan_path for plan_path in plan_paths if plan_path.exists()]
+    plan_results = dict(zip(existing_plans, audit_plan_files(existing_plans, project_path)))
 
-            feature_audit = {
-                'feature_name': feature_name,
-                'location': 'archived' if is_archived else 'working',
-                'has_plan': False,
-                'plan_valid': False,
-                'is_stale': False,
-                'progress': None,
-                'workorder_id': None,
-                'last_updated': None,
-                'issues': []
-            }
+    for (feature_dir, is_archived), plan_path in zip(feature_dirs, plan_paths):
+        audit_results['total_features'] += 1
+        feature_name = feature_dir.name
 
-            if not plan_path.exists():
-                feature_audit['issues'].append('No plan.json found')
+        feature_audit = {
+            'feature_name': feature_name,
+            'location': 'archived' if is_archived else 'working',
+            'has_plan': False,
+            'plan_valid': False,
+            'is_stale': False,
+            'progress': None,
+            'workorder_id': None,
+            'last_updated': None,
+            'issues': []
+        }
+
+        plan_result = plan_results.get(plan_path)
+        if plan_result is None:
+            feature_audit['issues'].append('No plan.json found')
+            audit_results['issues'].append({
+                'type': 'missing_plan',
+                'severity': 'major',
+                'feature': feature_name,
+                'issue': 'No plan.json found in feature directory'
+            })
+        elif not plan_result['plan_valid']:
+            feature_audit['has_plan'] = True
+            audit_results['invalid_plans'] += 1
+            for error in plan_result['errors']:
+                feature_audit['issues'].append(error)
                 audit_results['issues'].append({
-                    'type': 'missing_plan',
+                    'type': 'validation_error',
                     'severity': 'major',
                     'feature': feature_name,
-                    'issue': 'No plan.json found in feature directory'
+                    'issue': error
                 })
-            else:
-                feature_audit['has_plan'] = True
-
-                # Validate plan format
-                is_valid, errors, _ = enforce_plan_format(
-                    plan_path=plan_path,
-                    project_path=project_path,
-                    strict=False
+        else:
+            feature_audit['has_plan'] = True
+            feature_audit['plan_valid'] = True
+            audit_results['valid_plans'] += 1
+
+            feature_audit['workorder_id'] = plan_result['workorder_id']
+            feature_audit['last_updated'] = plan_result['last_updated']
+
+            # Check staleness
+            if plan_result['mtime'] < stale_threshold:
+                feature_audit['is_stale'] = True
+                audit_results['stale_plans'] += 1
+                feature_audit['issues'].append(
+                    f'Plan is stale (not updated in {stale_days}+ days)'
                 )
 
-                if is_valid:
-                    feature_audit['plan_valid'] = True
-                    audit_results['valid_plans'] += 1
-
-                    # Load plan to extract details
-                    try:
-                        with open(plan_path, 'r', encoding='utf-8') as f:
-                            plan_data = json.load(f)
-
-                        # Extract workorder ID
-                        meta = plan_data.get('META_DOCUMENTATION', {})
-                        feature_audit['workorder_id'] = meta.get('workorder_id')
-                        feature_audit['last_updated'] = meta.get('last_updated')
-
-                        # Check staleness
-                        last_modified = plan_path.stat().st_mtime
-                        if last_modified < stale_threshold:
-                            feature_audit['is_stale'] = True
-                            audit_results['stale_plans'] += 1
-                            feature_audit['issues'].append(
-                                f'Plan is stale (not updated in {stale_days}+ days)'
-                            )
+            progress = plan_result['progress']
+            if progress:
+                feature_audit['progress'] = dict(progress)
+
+                # Determine plan status
+                if progress['percent'] == 100:
+                    audit_results['completed_plans'] += 1
+                elif progress['in_progress'] > 0 or progress['completed'] > 0:
+                    audit_results['active_plans'] += 1
+
+                # Check for blocked tasks
+                blocked = progress['blocked']
+                if blocked > 0:
+                    feature_audit['issues'].append(
+                        f'{blocked} task(s) are blocked'
+                    )
+                    audit_results['issues'].append({
+                        'type': 'blocked_tasks',
+                        'severity': 'major',
+                        'feature': feature_name,
+                        'issue': f'{blocked} blocked task(s) need attention'
+                    })
 
-                        # Extract progress from section 9
-                        structure = plan_data.get('UNIVERSAL_PLANNING_STRUCTURE', {})
-                        checklist = structure.get('9_implementation_checklist', {})
-
-                        total = 0
-                        completed = 0
-                        in_progress = 0
-                        blocked = 0
-
-                        for category, tasks in checklist.items():
-                            if isinstance(tasks, list):
-                                for task in tasks:
-                                    if isinstance(task, dict):
-                                        total += 1
-                                        status = task.get('status', 'pending')
-                                        if status == 'completed':
-                                            completed += 1
-                                        elif status == 'in_progress':
-                                            in_progress += 1
-                                        elif status == 'blocked':
-                                            blocked += 1
-
-                        if total > 0:
-                            percent = round((completed / total) * 100, 1)
-                            feature_audit['progress'] = {
-                                'total': total,
-                                'completed': completed,
-                                'in_progress': in_progress,
-                                'blocked': blocked,
-                                'pending': total - completed - in_progress - blocked,
-                                'percent': percent
-                            }
-
-                            # Determine plan status
-                            if percent == 100:
-                                audit_results['completed_plans'] += 1
-                            elif in_progress > 0 or completed > 0:
-                                audit_results['active_plans'] += 1
-
-                            # Check for blocked tasks
-                            if blocked > 0:
-                                feature_audit['issues'].append(
-                                    f'{blocked} task(s) are blocked'
-                                )
-                                audit_results['issues'].append({
-                                    'type': 'blocked_tasks',
-                                    'severity': 'major',
-                                    'feature': feature_name,
-                                    'issue': f'{blocked} blocked task(s) need attention'
-                                })
-
-                    except json.JSONDecodeError as e:
-                        feature_audit['issues'].append(f'Invalid JSON: {e.msg}')
-                        audit_results['issues'].append({
-                            'type': 'invalid_json',
-                            'severity': 'critical',
-                            'feature': feature_name,
-                            'issue': f'plan.json is malformed: {e.msg}'
-                        })
-
-                else:
-                    audit_results['invalid_plans'] += 1
-                    for error in errors:
-                        feature_audit['issues'].append(error)
-                        audit_results['issues'].append({
-                            'type': 'validation_error',
-                            'severity': 'major',
-                            'feature': feature_name,
-                            'issue': error
-                        })
-
-            audit_results['features'].append(feature_audit)
+        audit_results['features'].append(feature_audit)
 
     # Generate recommendations based on issues
     if audit_results['invalid_plans'] > 0:
@@ -4595,6 +4498,7 @@ TOOL_HANDLERS = {
     'update_all_documentation': handle_update_all_documentation,
     'execute_plan': handle_execute_plan,
     'update_task_status': handle_update_task_status,
+    'batch_update_task_status': handle_batch_update_task_status,
     'audit_plans': handle_audit_plans,
     'log_workorder': handle_log_workorder,
     'get_workorder_log': handle_get_workorder_log,
@@ -0,0 +1,174 @@
+"""
+Agent Status View - materialized dashboard data for track_agent_status.
+
+Keeps one compact file per working directory (coderef/workorder/.agent-status.json)
+holding the parse_agent_status() summary of every feature's communication.json,
+keyed by feature folder together with the file's mtime_ns and size:
+
+    {
+      "version": 1,
+      "features": {
+        "auth": {"mtime_ns": ..., "size": ..., "status": {...}},
+        "search": {"mtime_ns": ..., "size": ..., "error": "Invalid JSON ..."}
+      }
+    }
+
+Handlers that write communication.json call record_communication() so the view
+is updated incrementally from the data they already hold. Reads reconcile the
+view against the directory listing: entries whose communication.json was added,
+removed or changed out of band (different mtime or size) are re-parsed, all
+others are served from the view without opening their files.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add coderef/ utilities to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from coderef.utils import FileSignatureCache, file_signature
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from handler_helpers import agent_status_from_data, parse_agent_status
+from logger_config import logger
+from utils.file_lock import file_lock
+from utils.json_store import write_json_atomic
+
+
+VIEW_FILENAME = '.agent-status.json'
+VIEW_VERSION = 1
+COMMUNICATION_FILENAME = 'communication.json'
+
+# In-memory copy of each view file: view path -> features
+_view_cache = FileSignatureCache()
+
+
+def view_path_for(working_dir: Path) -> Path:
+    """Materialized view file for a working directory."""
+    return Path(working_dir) / VIEW_FILENAME
+
+
+def _entry(comm_path: Path, signature: Tuple[int, int], data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Parse one communication.json into a view entry (parse errors are kept, not raised)."""
+    entry: Dict[str, Any] = {'mtime_ns': signature[0], 'size': signature[1]}
+    try:
+        entry['status'] = agent_status_from_data(data) if data is not None else parse_agent_status(comm_path)
+    except Exception as e:
+        logger.warning(f"Failed to parse {comm_path}: {e}")
+        entry['error'] = str(e)
+    return entry
+
+
+def _read_view(view_path: Path) -> Dict[str, Any]:
+    """Features mapping from the view file ({} if stale format or unreadable)."""
+    try:
+        view = json.loads(view_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Rebuilding unreadable agent status view {view_path}: {e}")
+        return {}
+
+    if not isinstance(view, dict) or view.get('version') != VIEW_VERSION:
+        return {}
+
+    features = view.get('features', {})
+    if not isinstance(features, dict):
+        return {}
+    return features
+
+
+def _load_view(view_path: Path) -> Dict[str, Any]:
+    """Features mapping from the view file ({} if missing, stale format or unreadable)."""
+    try:
+        return _view_cache.load(view_path, _read_view)[1]
+    except OSError:
+        return {}
+
+
+def _save_view(view_path: Path, features: Dict[str, Any]) -> None:
+    write_json_atomic(view_path, {'version': VIEW_VERSION, 'features': features})
+    signature = file_signature(view_path)
+    if signature:
+        _view_cache.put(str(view_path), features, signature)
+    else:
+        _view_cache.discard(str(view_path))
+
+
+def record_communication(comm_path: Path, data: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Update the view after communication.json was written.
+
+    Never raises: the view is derived data and the next read reconciles it.
+
+    Args:
+        comm_path: coderef/workorder/<feature>/communication.json just written
+        data: Content that was written (avoids reading the file back)
+    """
+    comm_path = Path(comm_path)
+    working_dir = comm_path.parent.parent
+    view_path = view_path_for(working_dir)
+
+    try:
+        signature = file_signature(comm_path)
+        if signature is None:
+            return
+
+        with file_lock(view_path):
+            features = dict(_load_view(view_path))
+            features[comm_path.parent.name] = _entry(comm_path, signature, data)
+            _save_view(view_path, features)
+    except Exception as e:
+        logger.warning(f"Could not update agent status view for {comm_path}: {e}")
+
+
+def get_agent_statuses(working_dir: Path, feature_name: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Agent status summaries for every feature (or one), reconciled with disk.
+
+    Args:
+        working_dir: coderef/workorder directory
+        feature_name: Only return this feature's status
+
+    Returns:
+        parse_agent_status() results sorted by feature folder, skipping
+        communication files that fail to parse
+    """
+    working_dir = Path(working_dir)
+    view_path = view_path_for(working_dir)
+
+    if feature_name:
+        comm_files = {feature_name: working_dir / feature_name / COMMUNICATION_FILENAME}
+    else:
+        comm_files = {p.parent.name: p for p in working_dir.glob(f"*/{COMMUNICATION_FILENAME}")}
+
+    signatures = {name: file_signature(path) for name, path in comm_files.items()}
+    features = _load_view(view_path)
+
+    def is_current(name: str) -> bool:
+        entry = features.get(name)
+        signature = signatures[name]
+        return bool(entry) and signature is not None and (entry.get('mtime_ns'), entry.get('size')) == signature
+
+    stale = [name for name in comm_files if not is_current(name)]
+    removed = [] if feature_name else [name for name in features if name not in comm_files]
+
+    if stale or removed:
+        logger.debug(f"Reconciling agent status view: {len(stale)} changed, {len(removed)} removed")
+        with file_lock(view_path):
+            features = dict(_load_view(view_path))
+            for name in stale:
+                signature = file_signature(comm_files[name])
+                if signature is None:
+                    features.pop(name, None)
+                else:
+                    features[name] = _entry(comm_files[name], signature)
+            for name in removed:
+                features.pop(name, None)
+            _save_view(view_path, features)
+
+    return [
+        features[name]['status']
+        for name in sorted(comm_files)
+        if name in features and 'status' in features[name]
+    ]
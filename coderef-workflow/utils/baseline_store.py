@@ -0,0 +1,324 @@
+"""
+Baseline Store - content-addressed .coderef/index.json snapshots per feature.
+
+Layout under coderef/baselines/:
+
+    objects/<sha256>.json.gz    index.json bytes (gzip, or .json when compression is off)
+    objects/<sha256>.keys.json  element keys precomputed from the snapshot
+    refs.json                   {feature_name: {hash, saved_at, elements}}
+
+Features that start from the same index share one object. The keys file holds
+the component and function keys ('name:file', as used by the papertrail
+CodeRefContextExtension) and per-element complexity, so comparing the current
+index against a baseline parses the current index once and never loads the
+snapshot itself. Objects no longer referenced by any feature are removed.
+
+Baselines saved by the old implementation as .coderef/index-baseline-<feature>.json
+are moved into the store the first time they are used.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add coderef/ utilities to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from coderef.utils import FileSignatureCache
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from constants import PlanningPaths
+from logger_config import logger
+from utils.file_lock import file_lock
+from utils.json_store import update_json_document, write_json_atomic
+
+
+# Store snapshots gzip-compressed (existing objects are read either way)
+COMPRESS_BASELINES = os.getenv("CODEREF_BASELINE_COMPRESS", "true").lower() == "true"
+
+KEYS_VERSION = 1
+COMPONENT_TYPES = ('component', 'class')
+FUNCTION_TYPES = ('function', 'method')
+
+# Parsed current-index elements: path -> elements
+_index_cache = FileSignatureCache()
+
+
+def element_key(element: Dict[str, Any]) -> str:
+    """Identity of an index element across snapshots ('name:file')."""
+    return f"{element.get('name')}:{element.get('file')}"
+
+
+def _elements(data: Any) -> List[Dict[str, Any]]:
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict) and isinstance(data.get('elements'), list):
+        return data['elements']
+    return []
+
+
+def build_snapshot_keys(elements: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Precompute the comparison keys for a snapshot.
+
+    Returns:
+        dict with version, elements (count), components and functions (sorted
+        key lists) and complexity ({key: value}, last element wins)
+    """
+    components = set()
+    functions = set()
+    complexity: Dict[str, Any] = {}
+
+    for element in elements:
+        if not isinstance(element, dict):
+            continue
+        key = element_key(element)
+        element_type = element.get('type')
+        if element_type in COMPONENT_TYPES:
+            components.add(key)
+        elif element_type in FUNCTION_TYPES:
+            functions.add(key)
+        if 'complexity' in element:
+            complexity[key] = element['complexity']
+
+    return {
+        'version': KEYS_VERSION,
+        'elements': len(elements),
+        'components': sorted(components),
+        'functions': sorted(functions),
+        'complexity': complexity
+    }
+
+
+class BaselineStore:
+    """Content-addressed baseline snapshots for a project."""
+
+    def __init__(self, project_path: Path):
+        self.project_path = Path(project_path)
+        self.root = self.project_path / PlanningPaths.BASELINES_DIR
+        self.objects_dir = self.root / 'objects'
+        self.refs_path = self.root / 'refs.json'
+        self.index_path = self.project_path / '.coderef' / 'index.json'
+
+    def _object_path(self, digest: str, compressed: bool) -> Path:
+        return self.objects_dir / (f'{digest}.json.gz' if compressed else f'{digest}.json')
+
+    def _keys_path(self, digest: str) -> Path:
+        return self.objects_dir / f'{digest}.keys.json'
+
+    def _legacy_path(self, feature_name: str) -> Path:
+        return self.project_path / '.coderef' / f'index-baseline-{feature_name}.json'
+
+    def _write_object(self, digest: str, content: bytes) -> None:
+        """Store snapshot bytes (no-op if an object with this hash exists)."""
+        if self._object_path(digest, True).exists() or self._object_path(digest, False).exists():
+            return
+
+        target = self._object_path(digest, COMPRESS_BASELINES)
+        payload = gzip.compress(content) if COMPRESS_BASELINES else content
+        fd, temp_name = tempfile.mkstemp(dir=str(self.objects_dir), prefix=f'.{digest}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_name, target)
+        except BaseException:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+            raise
+
+    def _store(self, feature_name: str, content: bytes) -> str:
+        """Add snapshot bytes to the store and point feature_name at them."""
+        digest = hashlib.sha256(content).hexdigest()
+        keys = build_snapshot_keys(_elements(json.loads(content.decode('utf-8'))))
+
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+
+        def point(refs: Dict[str, Any]) -> Optional[str]:
+            previous = refs.get(feature_name, {}).get('hash')
+            refs[feature_name] = {
+                'hash': digest,
+                'saved_at': datetime.now().isoformat(),
+                'elements': keys['elements']
+            }
+            return previous
+
+        # Point first, then write: a concurrent garbage collection never
+        # removes an object that a ref is about to use
+        _, previous = update_json_document(self.refs_path, point, default=dict, version_field=None)
+        self._write_object(digest, content)
+        if not self._keys_path(digest).exists():
+            write_json_atomic(self._keys_path(digest), keys, indent=None)
+
+        if previous and previous != digest:
+            self._collect_garbage(previous)
+        return digest
+
+    def _collect_garbage(self, digest: str) -> None:
+        """Remove an object once no feature points at it."""
+        with file_lock(self.refs_path):
+            if any(isinstance(ref, dict) and ref.get('hash') == digest for ref in self._refs().values()):
+                return
+            for path in (self._object_path(digest, True), self._object_path(digest, False), self._keys_path(digest)):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
+    def _refs(self) -> Dict[str, Any]:
+        try:
+            refs = json.loads(self.refs_path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return {}
+        return refs if isinstance(refs, dict) else {}
+
+    def save(self, feature_name: str) -> bool:
+        """
+        Snapshot the current .coderef/index.json as feature_name's baseline.
+
+        Returns:
+            bool: True if saved, False if index.json doesn't exist
+        """
+        if not self.index_path.exists():
+            return False
+
+        digest = self._store(feature_name, self.index_path.read_bytes())
+        logger.info(f"Baseline snapshot saved for '{feature_name}': {digest[:12]}")
+        return True
+
+    def get_ref(self, feature_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Baseline pointer for a feature, importing a legacy full-copy baseline if present.
+
+        Returns:
+            {hash, saved_at, elements} or None if the feature has no baseline
+        """
+        ref = self._refs().get(feature_name)
+        if ref:
+            return ref
+
+        legacy = self._legacy_path(feature_name)
+        if not legacy.exists():
+            return None
+
+        try:
+            self._store(feature_name, legacy.read_bytes())
+        except ValueError as e:
+            logger.warning(f"Could not import legacy baseline {legacy}: {e}")
+            return None
+        legacy.unlink()
+        logger.info(f"Moved legacy baseline {legacy.name} into {self.root}")
+        return self._refs().get(feature_name)
+
+    def load_keys(self, feature_name: str) -> Optional[Dict[str, Any]]:
+        """Precomputed element keys for a feature's baseline (None if none saved)."""
+        ref = self.get_ref(feature_name)
+        if not ref:
+            return None
+
+        keys_path = self._keys_path(ref['hash'])
+        try:
+            keys = json.loads(keys_path.read_text(encoding='utf-8'))
+            if keys.get('version') == KEYS_VERSION:
+                return keys
+        except (OSError, ValueError):
+            pass
+
+        # Keys missing or from another version: rebuild from the snapshot
+        keys = build_snapshot_keys(_elements(json.loads(self.load_snapshot(feature_name))))
+        write_json_atomic(keys_path, keys, indent=None)
+        return keys
+
+    def snapshot_path(self, feature_name: str) -> Optional[Path]:
+        """Object file holding a feature's baseline snapshot (None if none saved)."""
+        ref = self.get_ref(feature_name)
+        if not ref:
+            return None
+
+        compressed = self._object_path(ref['hash'], True)
+        if compressed.exists():
+            return compressed
+        return self._object_path(ref['hash'], False)
+
+    def load_snapshot(self, feature_name: str) -> Optional[bytes]:
+        """Raw index.json bytes of a feature's baseline (None if none saved)."""
+        path = self.snapshot_path(feature_name)
+        if path is None:
+            return None
+
+        if path.name.endswith('.gz'):
+            return gzip.decompress(path.read_bytes())
+        return path.read_bytes()
+
+    def _current_elements(self) -> List[Dict[str, Any]]:
+        return _index_cache.load(self.index_path, lambda path: _elements(json.loads(path.read_text(encoding='utf-8'))))[1]
+
+    def changes_since_baseline(self, feature_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Components/functions added and average complexity change since the baseline.
+
+        Same results as CodeRefContextExtension.get_all_changes() on the
+        baseline and current index, computed from the stored key sets.
+
+        Returns:
+            dict with components_added, functions_added, complexity_delta;
+            None if there is no baseline or no current index.json
+        """
+        if not self.index_path.exists():
+            return None
+        keys = self.load_keys(feature_name)
+        if keys is None:
+            return None
+
+        baseline_components = set(keys['components'])
+        baseline_functions = set(keys['functions'])
+        baseline_complexity = keys['complexity']
+
+        components_added = []
+        functions_added = []
+        current_complexity: Dict[str, Any] = {}
+
+        for element in self._current_elements():
+            if not isinstance(element, dict):
+                continue
+            key = element_key(element)
+            element_type = element.get('type')
+            if element_type in COMPONENT_TYPES:
+                if key not in baseline_components:
+                    components_added.append(_summary(element))
+            elif element_type in FUNCTION_TYPES:
+                if key not in baseline_functions:
+                    functions_added.append(_summary(element))
+            if 'complexity' in element:
+                current_complexity[key] = element['complexity']
+
+        deltas = [
+            value - baseline_complexity[key]
+            for key, value in current_complexity.items()
+            if key in baseline_complexity
+        ]
+
+        return {
+            'components_added': components_added,
+            'functions_added': functions_added,
+            'complexity_delta': sum(deltas) / len(deltas) if deltas else 0.0
+        }
+
+
+def _summary(element: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'name': element.get('name', ''),
+        'type': element.get('type', ''),
+        'file': element.get('file', ''),
+        'line': element.get('line', 0)
+    }
+
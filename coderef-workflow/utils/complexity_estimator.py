@@ -13,7 +13,7 @@ import sys
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from coderef.utils import read_coderef_output
+from coderef.utils import read_coderef_index
 
 from logger_config import logger
 
@@ -41,7 +41,7 @@ class ComplexityEstimator:
         """Load elements from .coderef/index.json (lazy loading)."""
         if self.elements_cache is None:
             try:
-                self.elements_cache = read_coderef_output(str(self.project_path), 'index')
+                self.elements_cache = read_coderef_index(str(self.project_path)).elements
                 if not self.elements_cache:
                     self.elements_cache = []
                 logger.info(f"Loaded {len(self.elements_cache)} elements for complexity estimation")
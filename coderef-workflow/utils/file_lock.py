@@ -0,0 +1,74 @@
+"""
+Cross-process exclusive file locks.
+
+Serializes writers of shared files (e.g. workorder-log.txt) between MCP server
+processes and threads. The lock is taken on a sidecar '<name>.lock' file so the
+protected file itself can be replaced or truncated while locked.
+
+Usage:
+    with file_lock(log_file):
+        ...  # read-modify-write log_file
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+
+# Per-path thread locks: msvcrt locks are per process, so threads need their own guard
+_thread_locks: Dict[str, threading.Lock] = {}
+_registry_lock = threading.Lock()
+
+
+def lock_path_for(path: Path) -> Path:
+    """Sidecar lock file for a protected file."""
+    return path.with_name(path.name + '.lock')
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock on path for the duration of the block.
+
+    Blocks until the lock is available. The parent directory must exist.
+
+    Args:
+        path: File being protected (the lock is taken on '<path>.lock')
+    """
+    lock_file = lock_path_for(Path(path))
+    key = str(lock_file.resolve())
+
+    with _registry_lock:
+        thread_lock = _thread_locks.setdefault(key, threading.Lock())
+
+    with thread_lock:
+        fd = os.open(lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.name == 'nt':
+                # LK_LOCK retries for ~10s before raising; keep waiting until acquired
+                while True:
+                    try:
+                        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+
+            try:
+                yield
+            finally:
+                if os.name == 'nt':
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
@@ -0,0 +1,302 @@
+"""
+Git Metrics - single-pass git statistics for a workorder.
+
+One `git log --all --grep=<WO> --numstat --summary` run yields everything the
+deliverables template and the multi-agent aggregator need: commits, per-file
+additions/deletions/status, contributors, first/last commit times and, for a
+feature's workorder family (WO-AUTH-001, WO-AUTH-002, ...), per-agent totals.
+
+Results are cached per (project, workorder, family) and reused while the
+repository refs are unchanged (HEAD plus every ref, since the log uses --all).
+Treat returned dicts as read-only.
+"""
+
+import hashlib
+import re
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add coderef/ utilities to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from coderef.utils import FileSignatureCache
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from logger_config import logger
+from utils.workorder_log import workorder_family
+
+
+# Seconds allowed for each git invocation
+GIT_TIMEOUT = 30
+
+_RECORD_START = '\x1e'
+_HEADER_END = '\x1f'
+_FIELD_SEP = '\x00'
+_LOG_FORMAT = '%x1e%H%x00%an%x00%ai%x00%at%x00%s%x00%B%x1f'
+
+_SUMMARY_LINE = re.compile(r'^\s*(create|delete) mode \d+ (.+)$')
+_ERE_SPECIAL = re.compile(r'([.[\]()*+?{}|^$\\])')
+
+# Metrics cache: (project, workorder_id, family) -> metrics, signed by the refs digest
+_metrics_cache = FileSignatureCache()
+
+
+def _run_git(project_path: Path, args: List[str]) -> Optional[str]:
+    """Run a git command in project_path; None if git fails or isn't installed."""
+    try:
+        result = subprocess.run(
+            ['git'] + args,
+            cwd=str(project_path),
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            timeout=GIT_TIMEOUT
+        )
+    except (subprocess.SubprocessError, FileNotFoundError):
+        return None
+
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def _refs_digest(project_path: Path) -> Optional[str]:
+    """Digest of HEAD and all refs, or None if project_path is not a git repository."""
+    output = _run_git(project_path, ['rev-parse', 'HEAD', '--all'])
+    if not output:
+        return None
+    return hashlib.sha1(output.encode('utf-8')).hexdigest()
+
+
+def _empty_metrics(workorder_id: str) -> Dict[str, Any]:
+    return {
+        'workorder_id': workorder_id,
+        'commits': [],
+        'files_changed': [],
+        'total_additions': 0,
+        'total_deletions': 0,
+        'contributors': [],
+        'first_commit_date': None,
+        'last_commit_date': None,
+        'agents': {}
+    }
+
+
+def _parse_numstat(line: str) -> Optional[Tuple[int, int, str]]:
+    parts = line.split('\t')
+    if len(parts) < 3:
+        return None
+    try:
+        additions = int(parts[0]) if parts[0] != '-' else 0
+        deletions = int(parts[1]) if parts[1] != '-' else 0
+    except ValueError:
+        return None
+    return additions, deletions, parts[2]
+
+
+def parse_git_log(output: str, workorder_id: str, agent_pattern: Optional[re.Pattern] = None) -> Dict[str, Any]:
+    """
+    Build workorder metrics from `git log` output in _LOG_FORMAT with --numstat --summary.
+
+    Args:
+        output: git log stdout (newest commit first)
+        workorder_id: Workorder ID recorded in the result
+        agent_pattern: Regex finding agent workorder IDs in commit messages;
+            commits without a match are skipped, the rest are also totalled
+            per agent ID
+
+    Returns:
+        dict with workorder_id, commits (hash, author, date, message; newest
+        first), files_changed (path, status, additions, deletions),
+        total_additions, total_deletions, contributors, first_commit_date,
+        last_commit_date (datetimes) and agents
+    """
+    metrics = _empty_metrics(workorder_id)
+    files: Dict[str, Dict[str, Any]] = {}
+    contributors = set()
+    first_ts = last_ts = None
+
+    for record in output.split(_RECORD_START):
+        if _HEADER_END not in record:
+            continue
+        header, body = record.split(_HEADER_END, 1)
+        fields = header.split(_FIELD_SEP)
+        if len(fields) < 6:
+            continue
+        commit_hash, author, date, timestamp, subject, message = fields[:6]
+
+        agent_ids = sorted(set(agent_pattern.findall(message))) if agent_pattern is not None else []
+        if agent_pattern is not None and not agent_ids:
+            continue
+
+        metrics['commits'].append({
+            'hash': commit_hash,
+            'author': author,
+            'date': date,
+            'message': subject
+        })
+        contributors.add(author)
+
+        try:
+            ts = int(timestamp)
+        except ValueError:
+            ts = None
+        if ts is not None:
+            first_ts = ts if first_ts is None else min(first_ts, ts)
+            last_ts = ts if last_ts is None else max(last_ts, ts)
+
+        # Per-commit file changes: numstat lines, then create/delete summary lines
+        commit_files: Dict[str, Tuple[int, int]] = {}
+        created = set()
+        deleted = set()
+        for line in body.splitlines():
+            if not line.strip():
+                continue
+            summary = _SUMMARY_LINE.match(line)
+            if summary:
+                (created if summary.group(1) == 'create' else deleted).add(summary.group(2))
+                continue
+            stat = _parse_numstat(line)
+            if stat:
+                additions, deletions, path = stat
+                previous = commit_files.get(path, (0, 0))
+                commit_files[path] = (previous[0] + additions, previous[1] + deletions)
+
+        commit_additions = 0
+        commit_deletions = 0
+        for path, (additions, deletions) in commit_files.items():
+            commit_additions += additions
+            commit_deletions += deletions
+
+            file_data = files.get(path)
+            if file_data is None:
+                # Status comes from the newest commit touching the file
+                status = 'added' if path in created else 'deleted' if path in deleted else 'modified'
+                file_data = files[path] = {'path': path, 'status': status, 'additions': 0, 'deletions': 0}
+            file_data['additions'] += additions
+            file_data['deletions'] += deletions
+
+        for agent_id in agent_ids:
+            agent = metrics['agents'].setdefault(agent_id, {
+                'commits': 0, 'additions': 0, 'deletions': 0, 'contributors': set(),
+                'first_commit_date': None, 'last_commit_date': None
+            })
+            agent['commits'] += 1
+            agent['additions'] += commit_additions
+            agent['deletions'] += commit_deletions
+            agent['contributors'].add(author)
+            if ts is not None:
+                moment = datetime.fromtimestamp(ts)
+                if agent['first_commit_date'] is None or moment < agent['first_commit_date']:
+                    agent['first_commit_date'] = moment
+                if agent['last_commit_date'] is None or moment > agent['last_commit_date']:
+                    agent['last_commit_date'] = moment
+
+    for agent in metrics['agents'].values():
+        agent['contributors'] = sorted(agent['contributors'])
+
+    metrics['files_changed'] = list(files.values())
+    metrics['total_additions'] = sum(f['additions'] for f in metrics['files_changed'])
+    metrics['total_deletions'] = sum(f['deletions'] for f in metrics['files_changed'])
+    metrics['contributors'] = sorted(c for c in contributors if c)
+    if first_ts is not None:
+        metrics['first_commit_date'] = datetime.fromtimestamp(first_ts)
+        metrics['last_commit_date'] = datetime.fromtimestamp(last_ts)
+
+    return metrics
+
+
+def collect_workorder_metrics(project_path: Path, workorder_id: str, family: bool = False) -> Dict[str, Any]:
+    """
+    Git metrics for a workorder from one cached `git log` pass.
+
+    Args:
+        project_path: Git repository (or a directory inside one)
+        workorder_id: Workorder ID to search for in commit messages
+        family: Match every ID in the workorder's family (WO-AUTH-001 also
+            matches WO-AUTH-002, ...) and total commits per agent ID
+
+    Returns:
+        parse_git_log() result; empty metrics if project_path is not a git
+        repository or git is unavailable
+    """
+    project_path = Path(project_path)
+    key = (str(project_path.resolve()), workorder_id, family)
+
+    digest = _refs_digest(project_path)
+    if digest is None:
+        return _empty_metrics(workorder_id)
+
+    cached = _metrics_cache.get(key, digest)
+    if cached is not None:
+        return cached
+
+    if family:
+        # Numbered IDs only: WO-AUTH must not match WO-AUTH-SYSTEM-001
+        base = workorder_family(workorder_id)
+        grep = _ERE_SPECIAL.sub(r'\\\1', base) + r'-[0-9]+\b'
+        grep_args = ['--extended-regexp', f'--grep={grep}']
+        agent_pattern = re.compile(re.escape(base) + r'-\d+\b')
+    else:
+        grep_args = ['--fixed-strings', f'--grep={workorder_id}']
+        agent_pattern = None
+
+    output = _run_git(project_path, [
+        'log', '--all', *grep_args, '--no-renames',
+        '--numstat', '--summary', f'--format={_LOG_FORMAT}'
+    ])
+    metrics = parse_git_log(output or '', workorder_id, agent_pattern)
+
+    logger.debug(f"Collected git metrics for {workorder_id}: {len(metrics['commits'])} commit(s)")
+
+    _metrics_cache.put(key, metrics, digest)
+    return metrics
+
+
+def summarize_agent_metrics(metrics: Dict[str, Any], agents_count: int) -> Dict[str, Any]:
+    """
+    Aggregate metrics in aggregate_agent_metrics() format from family git metrics.
+
+    Args:
+        metrics: collect_workorder_metrics(..., family=True) result
+        agents_count: Number of agents working on the feature
+
+    Returns:
+        dict with loc_added, loc_deleted, loc_net, total_commits, contributors,
+        first_commit_date, last_commit_date, days_elapsed, hours_elapsed,
+        agents_count and per-agent totals under 'agents'
+    """
+    summary = {
+        'loc_added': metrics['total_additions'],
+        'loc_deleted': metrics['total_deletions'],
+        'loc_net': metrics['total_additions'] - metrics['total_deletions'],
+        'total_commits': len(metrics['commits']),
+        'contributors': list(metrics['contributors']),
+        'first_commit_date': metrics['first_commit_date'],
+        'last_commit_date': metrics['last_commit_date'],
+        'days_elapsed': 0,
+        'hours_elapsed': 0,
+        'agents_count': agents_count,
+        'agents': {}
+    }
+
+    if summary['first_commit_date'] and summary['last_commit_date']:
+        elapsed = summary['last_commit_date'] - summary['first_commit_date']
+        summary['days_elapsed'] = elapsed.days
+        summary['hours_elapsed'] = elapsed.days * 24 + elapsed.seconds // 3600
+
+    for agent_id, agent in metrics['agents'].items():
+        summary['agents'][agent_id] = {
+            'commits': agent['commits'],
+            'loc_added': agent['additions'],
+            'loc_deleted': agent['deletions'],
+            'contributors': agent['contributors'],
+            'first_commit_date': agent['first_commit_date'].isoformat() if agent['first_commit_date'] else None,
+            'last_commit_date': agent['last_commit_date'].isoformat() if agent['last_commit_date'] else None
+        }
+
+    return summary
@@ -0,0 +1,153 @@
+"""
+Atomic JSON writes for workflow state files (plan.json, communication.json, ...).
+
+Files are written to a temp file in the same directory and moved into place
+with os.replace, so readers never see a partially written document and a crash
+mid-write leaves the previous version intact. update_json_document() wraps
+read-modify-write cycles: per-file lock for the write, optimistic version
+check with retry, atomic replace.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from logger_config import logger
+from utils.file_lock import file_lock
+
+
+# Top-level key holding a document's write counter (see update_json_document)
+VERSION_FIELD = '_version'
+
+# Attempts before update_json_document gives up on a contended document
+UPDATE_RETRIES = int(os.getenv("CODEREF_JSON_UPDATE_RETRIES", "5"))
+
+T = TypeVar('T')
+
+
+def write_json_atomic(path: Path, data: Any, indent: int = 2) -> None:
+    """
+    Write data as JSON to path via temp file + fsync + rename.
+
+    Output matches the handlers' existing format: indent=2, UTF-8 (no ASCII
+    escaping), trailing newline.
+
+    Args:
+        path: Destination file (parent directory must exist)
+        data: JSON-serializable value
+        indent: JSON indentation
+    """
+    path = Path(path)
+    fd, temp_name = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+            f.write('\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+
+
+class ConcurrentUpdateError(RuntimeError):
+    """Raised when a document keeps changing underneath update_json_document()."""
+
+
+def _read_document(path: Path, default: Optional[Callable[[], Any]]) -> Tuple[Any, Optional[Tuple[int, int]]]:
+    """Load path and return (data, (mtime_ns, size)); signature is None if the file is missing."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        if default is None:
+            raise
+        return default(), None
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data, (stat.st_mtime_ns, stat.st_size)
+
+
+def _document_version(data: Any, version_field: Optional[str]) -> Any:
+    if version_field and isinstance(data, dict):
+        return data.get(version_field, 0)
+    return None
+
+
+def update_json_document(
+    path: Path,
+    mutate: Callable[[Any], T],
+    default: Optional[Callable[[], Any]] = None,
+    version_field: Optional[str] = VERSION_FIELD,
+    retries: int = UPDATE_RETRIES,
+    indent: int = 2
+) -> Tuple[Any, T]:
+    """
+    Transactional read-modify-write of a JSON state file.
+
+    The document is read and mutate(data) runs without holding the lock. The
+    write then happens under file_lock(path) only if the file still has the
+    mtime/size and version that were read; otherwise the cycle is retried on
+    the fresh document, so concurrent writers (including out-of-band edits)
+    never overwrite each other's changes. Dict documents get version_field
+    incremented on every write.
+
+    mutate changes data in place and may run more than once, so it must not
+    have side effects outside the document. Exceptions it raises abort the
+    update without writing.
+
+    Args:
+        path: JSON file to update
+        mutate: Callable applied to the loaded document; its return value is passed back
+        default: Factory for the initial document when path doesn't exist
+            (FileNotFoundError is raised if omitted)
+        version_field: Top-level key holding the document version (None to rely on mtime/size)
+        retries: Attempts before giving up
+        indent: JSON indentation
+
+    Returns:
+        Tuple of (document as written, mutate's return value)
+
+    Raises:
+        FileNotFoundError: If path doesn't exist and no default was given
+        json.JSONDecodeError: If the document is not valid JSON
+        ConcurrentUpdateError: If the document changed on every attempt
+    """
+    path = Path(path)
+
+    for attempt in range(1, retries + 1):
+        data, signature = _read_document(path, default)
+        version = _document_version(data, version_field)
+        result = mutate(data)
+
+        with file_lock(path):
+            try:
+                stat = path.stat()
+                current = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                current = None
+
+            conflict = current != signature
+            if not conflict and version is not None:
+                # mtime can be too coarse to see a same-size rewrite; the version can't be missed
+                latest, _ = _read_document(path, default)
+                conflict = _document_version(latest, version_field) != version
+
+            if not conflict:
+                if version is not None:
+                    data[version_field] = version + 1
+                write_json_atomic(path, data, indent=indent)
+                return data, result
+
+        logger.debug(f"Concurrent update of {path.name}, retrying ({attempt}/{retries})")
+
+    raise ConcurrentUpdateError(f"{path} changed during {retries} update attempts")
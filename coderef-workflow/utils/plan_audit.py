@@ -0,0 +1,129 @@
+"""
+Plan Audit - cached, parallel per-plan audits for audit_plans.
+
+Each plan.json is audited once per (path, mtime, size): format validation,
+META_DOCUMENTATION fields and section 9 progress counts. Results that depend
+on the call (staleness threshold, aggregate counts, issues) are derived from
+the cached per-plan results by handle_audit_plans, so a repeat audit with no
+changed plans only stats each plan file.
+
+Plans that are new or changed are audited in a thread pool.
+"""
+
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add coderef/ utilities to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from coderef.utils import FileSignatureCache, IO_WORKERS, file_signature
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from plan_format_validator import enforce_plan_format
+from utils.task_status import calculate_progress
+
+from logger_config import logger
+
+
+# Per-plan audit cache: plan path -> result
+_audit_cache = FileSignatureCache()
+
+
+def _progress_counts(plan_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Section 9 task counts, or None if the checklist has no tasks."""
+    progress = calculate_progress(plan_data)
+    return progress if progress['total'] else None
+
+
+def audit_single_plan(plan_path: Path, project_path: Path) -> Dict[str, Any]:
+    """
+    Audit one plan.json (independent of staleness threshold and current time).
+
+    Args:
+        plan_path: Path to plan.json (must exist)
+        project_path: Project root (for location validation)
+
+    Returns:
+        dict with plan_valid, errors, workorder_id, last_updated, mtime,
+        and progress (or None)
+    """
+    result: Dict[str, Any] = {
+        'plan_valid': False,
+        'errors': [],
+        'workorder_id': None,
+        'last_updated': None,
+        'mtime': None,
+        'progress': None
+    }
+
+    # Parse once; enforce_plan_format re-reads only to report a broken file
+    try:
+        plan_data = json.loads(plan_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        plan_data = None
+
+    is_valid, errors, _ = enforce_plan_format(
+        plan_path=plan_path,
+        project_path=project_path,
+        strict=False,
+        plan_data=plan_data
+    )
+    if not is_valid:
+        result['errors'] = errors
+        return result
+
+    result['plan_valid'] = True
+    meta = plan_data.get('META_DOCUMENTATION', {})
+    result['workorder_id'] = meta.get('workorder_id')
+    result['last_updated'] = meta.get('last_updated')
+    result['mtime'] = plan_path.stat().st_mtime
+    result['progress'] = _progress_counts(plan_data)
+
+    return result
+
+
+def audit_plan_files(plan_paths: List[Path], project_path: Path) -> List[Dict[str, Any]]:
+    """
+    Audit plans, reusing cached results for unchanged files.
+
+    Args:
+        plan_paths: plan.json paths (each must exist)
+        project_path: Project root
+
+    Returns:
+        Audit results in the same order as plan_paths
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(plan_paths)
+    pending: List[Tuple[int, str, Optional[Tuple[int, int]]]] = []
+
+    for position, plan_path in enumerate(plan_paths):
+        key = str(plan_path)
+        signature = file_signature(plan_path)
+
+        cached = _audit_cache.get(key, signature) if signature else None
+        if cached is not None:
+            results[position] = cached
+        else:
+            pending.append((position, key, signature))
+
+    if pending:
+        logger.debug(f"Auditing {len(pending)} changed plan(s), {len(plan_paths) - len(pending)} cached")
+
+        def run(item: Tuple[int, str, Optional[Tuple[int, int]]]) -> Dict[str, Any]:
+            return audit_single_plan(Path(item[1]), project_path)
+
+        if len(pending) == 1:
+            audited = [run(pending[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(IO_WORKERS, len(pending))) as pool:
+                audited = list(pool.map(run, pending))
+
+        for (position, key, signature), result in zip(pending, audited):
+            results[position] = result
+            if signature:
+                _audit_cache.put(key, result, signature)
+
+    return results
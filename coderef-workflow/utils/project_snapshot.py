@@ -0,0 +1,186 @@
+"""
+Project Snapshot - one pruned directory walk shared by project analyzers.
+
+PlanningAnalyzer (project structure, source file scan) and RiskGenerator
+(project context) all need the project's file list. Instead of each doing its
+own rglob('*') - which descends into node_modules/.git before filtering - a
+ProjectSnapshot is built by a single os.scandir walk that never enters
+EXCLUDE_DIRS, and is cached per project.
+
+Invalidation: the snapshot records every walked directory's mtime. Adding,
+removing or renaming an entry changes its parent directory's mtime, so a
+snapshot is reused only while all recorded directory mtimes are unchanged.
+Recorded file sizes/mtimes reflect the time of the walk.
+"""
+
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Add coderef/ utilities to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from coderef.utils import FileSignatureCache
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from constants import EXCLUDE_DIRS
+
+from logger_config import logger
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    """One file recorded by the snapshot walk."""
+    path: Path          # Absolute path
+    rel_path: str       # POSIX path relative to the project root
+    size: int
+    mtime: float
+
+    @property
+    def suffix(self) -> str:
+        return self.path.suffix
+
+
+class ProjectSnapshot:
+    """
+    Files, sizes, mtimes and per-directory file counts for one project.
+
+    Built by ProjectSnapshot.build(); use get_project_snapshot() to share a
+    cached instance between callers.
+    """
+
+    def __init__(self, root: Path, exclude_dirs: Iterable[str]):
+        self.root = root
+        self.exclude_dirs = frozenset(exclude_dirs)
+        self.files: List[FileEntry] = []
+        # Relative directory path ('.' for the root) -> number of files directly inside
+        self.dir_file_counts: Dict[str, int] = {}
+        # Absolute directory path -> mtime_ns when walked (used for invalidation)
+        self.dir_mtimes: Dict[str, int] = {}
+        self.created_at = time.time()
+        self.walk_seconds = 0.0
+
+    @classmethod
+    def build(cls, root: Path, exclude_dirs: Iterable[str] = EXCLUDE_DIRS) -> 'ProjectSnapshot':
+        """
+        Walk the project once, pruning excluded directories before descending.
+
+        Args:
+            root: Project root directory
+            exclude_dirs: Directory names never entered
+
+        Returns:
+            Populated ProjectSnapshot
+        """
+        snapshot = cls(Path(root), exclude_dirs)
+        started = time.perf_counter()
+
+        stack: List[Tuple[str, str]] = [(str(snapshot.root), '.')]
+        while stack:
+            dir_path, rel_dir = stack.pop()
+            file_count = 0
+            try:
+                snapshot.dir_mtimes[dir_path] = os.stat(dir_path).st_mtime_ns
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        rel_path = entry.name if rel_dir == '.' else f"{rel_dir}/{entry.name}"
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name not in snapshot.exclude_dirs:
+                                    stack.append((entry.path, rel_path))
+                            elif entry.is_file():
+                                stat = entry.stat()
+                                snapshot.files.append(
+                                    FileEntry(Path(entry.path), rel_path, stat.st_size, stat.st_mtime)
+                                )
+                                file_count += 1
+                        except OSError:
+                            continue
+            except PermissionError as e:
+                logger.warning(f"Permission denied scanning {dir_path}: {e}")
+                continue
+            except OSError:
+                continue
+
+            if file_count:
+                snapshot.dir_file_counts[rel_dir] = file_count
+
+        snapshot.files.sort(key=lambda f: f.rel_path)
+        snapshot.walk_seconds = time.perf_counter() - started
+        logger.debug(
+            f"Project snapshot: {len(snapshot.files)} files in {len(snapshot.dir_mtimes)} directories "
+            f"({snapshot.walk_seconds:.3f}s)"
+        )
+        return snapshot
+
+    def is_current(self) -> bool:
+        """True while no walked directory has gained, lost or renamed an entry."""
+        for dir_path, mtime_ns in self.dir_mtimes.items():
+            try:
+                if os.stat(dir_path).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def paths(self) -> List[Path]:
+        """Absolute paths of all files."""
+        return [f.path for f in self.files]
+
+    def files_with_extensions(self, extensions: Iterable[str]) -> List[FileEntry]:
+        """Files whose suffix is in extensions (e.g. ['.ts', '.tsx'])."""
+        wanted = set(extensions)
+        return [f for f in self.files if f.suffix in wanted]
+
+    def root_files(self) -> List[FileEntry]:
+        """Files directly in the project root."""
+        return [f for f in self.files if '/' not in f.rel_path]
+
+    @property
+    def total_size(self) -> int:
+        return sum(f.size for f in self.files)
+
+
+# Per-project snapshot cache: (resolved root, excluded dirs) -> ProjectSnapshot,
+# validated by ProjectSnapshot.is_current()
+_snapshot_cache = FileSignatureCache()
+_snapshot_locks: Dict[Tuple[str, frozenset], threading.Lock] = {}
+_locks_lock = threading.Lock()
+
+
+def get_project_snapshot(
+    project_path: Path,
+    exclude_dirs: Iterable[str] = EXCLUDE_DIRS,
+    refresh: bool = False
+) -> ProjectSnapshot:
+    """
+    Get the cached snapshot for a project, rebuilding it if the tree changed.
+
+    Concurrent callers for the same project wait for a single walk.
+
+    Args:
+        project_path: Project root directory
+        exclude_dirs: Directory names never entered
+        refresh: Force a new walk
+
+    Returns:
+        ProjectSnapshot for the project
+    """
+    root = Path(project_path).resolve()
+    key = (str(root), frozenset(exclude_dirs))
+
+    with _locks_lock:
+        lock = _snapshot_locks.setdefault(key, threading.Lock())
+
+    with lock:
+        cached: Optional[ProjectSnapshot] = _snapshot_cache.peek(key)
+        if cached is not None and not refresh and cached.is_current():
+            return cached
+
+        snapshot = ProjectSnapshot.build(root, exclude_dirs)
+        _snapshot_cache.put(key, snapshot)
+        return snapshot
@@ -0,0 +1,130 @@
+"""
+Schema Registry - process-wide compiled JSON schemas.
+
+Each schema file in coderef/schemas/ is parsed once and compiled into a
+Draft7Validator (with format checking); the compiled form is reused until the
+file's mtime or size changes. Callers that already hold a parsed document
+validate it directly, without writing or re-reading a file:
+
+    is_valid, errors = validate(plan_data)                  # plan.schema.json
+    is_valid, errors = validate(data, 'plan-validator-schema.json')
+"""
+
+import json
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from jsonschema import Draft7Validator, FormatChecker
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from logger_config import logger
+
+
+SCHEMA_DIR = Path(__file__).parent.parent / "coderef" / "schemas"
+PLAN_SCHEMA = "plan.schema.json"
+
+
+class CompiledSchema(NamedTuple):
+    """A parsed schema and its validator, tagged with the file signature it was built from."""
+    mtime_ns: int
+    size: int
+    schema: Dict[str, Any]
+    validator: Draft7Validator
+
+
+class SchemaRegistry:
+    """Loads, compiles and caches the JSON schemas in a directory."""
+
+    def __init__(self, schema_dir: Path = SCHEMA_DIR):
+        self.schema_dir = Path(schema_dir)
+        self._compiled: Dict[str, CompiledSchema] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str = PLAN_SCHEMA) -> CompiledSchema:
+        """
+        Compiled schema, rebuilt if the file changed since it was last loaded.
+
+        Args:
+            name: Schema file name in the schema directory
+
+        Returns:
+            CompiledSchema
+
+        Raises:
+            FileNotFoundError: If the schema file doesn't exist
+            ValueError: If the file is not valid JSON or not a valid Draft 7 schema
+        """
+        path = self.schema_dir / name
+        stat = path.stat()
+
+        compiled = self._compiled.get(name)
+        if compiled and compiled.mtime_ns == stat.st_mtime_ns and compiled.size == stat.st_size:
+            return compiled
+
+        with self._lock:
+            compiled = self._compiled.get(name)
+            if compiled and compiled.mtime_ns == stat.st_mtime_ns and compiled.size == stat.st_size:
+                return compiled
+
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    schema = json.load(f)
+                Draft7Validator.check_schema(schema)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON in schema {name}: {e}")
+            except Exception as e:
+                raise ValueError(f"Invalid schema {name}: {e}")
+
+            validator = Draft7Validator(schema, format_checker=FormatChecker())
+            compiled = CompiledSchema(stat.st_mtime_ns, stat.st_size, schema, validator)
+            self._compiled[name] = compiled
+
+        logger.debug(f"Compiled schema {name} v{schema.get('version', 'unknown')}")
+        return compiled
+
+    def get_schema(self, name: str = PLAN_SCHEMA) -> Optional[Dict[str, Any]]:
+        """Parsed schema dict, or None if it is missing or invalid."""
+        try:
+            return self.get(name).schema
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load schema {name}: {e}")
+            return None
+
+    def validate(self, document: Any, name: str = PLAN_SCHEMA) -> Tuple[bool, List[str]]:
+        """
+        Validate an already-parsed document.
+
+        Args:
+            document: Parsed JSON (e.g. a plan dict)
+            name: Schema file name
+
+        Returns:
+            Tuple of (is_valid, error messages prefixed with their JSON path)
+
+        Raises:
+            FileNotFoundError: If the schema file doesn't exist
+            ValueError: If the schema itself is invalid
+        """
+        validator = self.get(name).validator
+        errors = []
+        for error in sorted(validator.iter_errors(document), key=lambda e: list(e.absolute_path)):
+            location = '/'.join(str(part) for part in error.absolute_path) or '(root)'
+            errors.append(f"{location}: {error.message}")
+        return len(errors) == 0, errors
+
+    def clear(self) -> None:
+        """Drop all compiled schemas (useful for testing)."""
+        with self._lock:
+            self._compiled.clear()
+
+
+# Process-wide registry for coderef/schemas
+registry = SchemaRegistry()
+
+
+def validate(document: Any, name: str = PLAN_SCHEMA) -> Tuple[bool, List[str]]:
+    """Validate a parsed document against a schema in coderef/schemas (see SchemaRegistry.validate)."""
+    return registry.validate(document, name)
@@ -0,0 +1,152 @@
+"""
+Task status updates for plan.json (update_task_status / batch_update_task_status).
+
+Tasks live in UNIVERSAL_PLANNING_STRUCTURE.9_implementation_checklist (lists of
+task dicts per category) and, for older plans, 5_task_id_system.tasks. A task
+index maps each ID to its task dict once per load, so a batch of updates costs
+one plan read, one dict lookup per update, and one atomic write.
+"""
+
+from typing import Any, Dict, List
+
+TASK_STATUSES = ['pending', 'in_progress', 'completed', 'blocked']
+
+
+def _structure(plan_data: Dict[str, Any]) -> Dict[str, Any]:
+    return plan_data.get('UNIVERSAL_PLANNING_STRUCTURE', {})
+
+
+def build_task_index(plan_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Map task ID -> task dict (the same objects held by plan_data).
+
+    Checklist tasks take precedence over section 5 tasks, and the first
+    occurrence of an ID wins, matching the original linear search order.
+    """
+    index: Dict[str, Dict[str, Any]] = {}
+    structure = _structure(plan_data)
+
+    checklist = structure.get('9_implementation_checklist', {})
+    if isinstance(checklist, dict):
+        for category_tasks in checklist.values():
+            if isinstance(category_tasks, list):
+                for task in category_tasks:
+                    if isinstance(task, dict) and task.get('id') is not None:
+                        index.setdefault(task['id'], task)
+
+    task_section = structure.get('5_task_id_system', {})
+    tasks = task_section.get('tasks', []) if isinstance(task_section, dict) else []
+    if isinstance(tasks, list):
+        for task in tasks:
+            if isinstance(task, dict) and task.get('id') is not None:
+                index.setdefault(task['id'], task)
+
+    return index
+
+
+def validate_updates(updates: List[Dict[str, Any]]) -> None:
+    """
+    Check update entries before touching the plan.
+
+    Raises:
+        ValueError: If an entry is missing task_id or has an invalid status
+    """
+    if not updates:
+        raise ValueError("updates must contain at least one {task_id, status} entry")
+
+    for position, update in enumerate(updates):
+        if not isinstance(update, dict):
+            raise ValueError(f"updates[{position}] must be an object with task_id and status")
+        if not update.get('task_id'):
+            raise ValueError(f"updates[{position}]: task_id is required")
+        status = update.get('status', '')
+        if status not in TASK_STATUSES:
+            raise ValueError(
+                f"updates[{position}]: Invalid status '{status}'. Must be one of: {', '.join(TASK_STATUSES)}"
+            )
+
+
+def apply_task_updates(
+    plan_data: Dict[str, Any],
+    updates: List[Dict[str, Any]],
+    timestamp: str
+) -> List[Dict[str, Any]]:
+    """
+    Apply {task_id, status, notes} updates to plan_data in place.
+
+    All task IDs are resolved before anything is changed, so an unknown ID
+    leaves plan_data untouched. Updates apply in order (a repeated ID sees
+    the status set by the earlier entry as its old_status).
+
+    Args:
+        plan_data: Parsed plan.json
+        updates: Entries validated by validate_updates()
+        timestamp: Value for each task's updated_at
+
+    Returns:
+        One {task_id, old_status, new_status, notes} dict per update
+
+    Raises:
+        ValueError: If any task ID is not in the plan
+    """
+    index = build_task_index(plan_data)
+
+    missing = [u['task_id'] for u in updates if u['task_id'] not in index]
+    if missing:
+        if len(missing) == 1:
+            raise ValueError(f"Task '{missing[0]}' not found in plan.json")
+        raise ValueError(f"Tasks not found in plan.json: {', '.join(dict.fromkeys(missing))}")
+
+    results = []
+    for update in updates:
+        task = index[update['task_id']]
+        notes = update.get('notes', '')
+        old_status = task.get('status', 'pending')
+
+        task['status'] = update['status']
+        task['updated_at'] = timestamp
+        if notes:
+            task['notes'] = notes
+
+        results.append({
+            'task_id': update['task_id'],
+            'old_status': old_status,
+            'new_status': update['status'],
+            'notes': notes
+        })
+
+    if 'META_DOCUMENTATION' in plan_data:
+        plan_data['META_DOCUMENTATION']['last_updated'] = timestamp
+
+    return results
+
+
+def calculate_progress(plan_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Progress summary over the implementation checklist.
+
+    Returns:
+        dict with total, completed, in_progress, blocked, pending, percent
+    """
+    counts = {'completed': 0, 'in_progress': 0, 'blocked': 0}
+    total = 0
+
+    checklist = _structure(plan_data).get('9_implementation_checklist', {})
+    if isinstance(checklist, dict):
+        for category_tasks in checklist.values():
+            if isinstance(category_tasks, list):
+                for task in category_tasks:
+                    if isinstance(task, dict):
+                        total += 1
+                        task_status = task.get('status', 'pending')
+                        if task_status in counts:
+                            counts[task_status] += 1
+
+    return {
+        'total': total,
+        'completed': counts['completed'],
+        'in_progress': counts['in_progress'],
+        'blocked': counts['blocked'],
+        'pending': total - sum(counts.values()),
+        'percent': round((counts['completed'] / total) * 100, 1) if total > 0 else 0
+    }
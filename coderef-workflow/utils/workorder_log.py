@@ -0,0 +1,347 @@
+"""
+Workorder Log - append-only workorder-log.txt with tail reads and a sidecar index.
+
+Each entry is one line: WO-ID | Project | Description | Timestamp
+
+Entries are appended under a file lock (constant cost per entry) and presented
+newest first, matching the old prepend-ordered file. The newest N entries are
+read by seeking backwards from EOF.
+
+An offset index maps workorder-ID families (the ID without its trailing
+number, e.g. WO-AUTH for WO-AUTH-001) and lower-cased project names to line
+offsets, so filtered queries read only candidate lines. It is kept in two
+sidecars:
+- '<log>.index.json': a snapshot covering the log up to its recorded size
+- '<log>.index.jsonl': one appended record per line logged since then
+
+An append adds one record to the delta file, so it never reads or rewrites
+the snapshot. Reads load both, index any lines appended by other writers,
+and fold the delta into a new snapshot once it outgrows it.
+
+Logs written by the old prepend implementation (newest first) are reversed
+into append order once, the first time they are opened without an index.
+"""
+
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.file_lock import file_lock
+
+from logger_config import logger
+
+
+INDEX_VERSION = 1
+
+# Delta records kept before reads fold them into the snapshot (at least this
+# many, and at least as many as the snapshot holds, so folding is amortized)
+COMPACT_MIN_RECORDS = 256
+
+# Bytes read per backwards seek when tailing the log
+TAIL_BLOCK_SIZE = 8192
+
+_TRAILING_NUMBER = re.compile(r'-\d+$')
+
+
+def format_entry(workorder_id: str, project_name: str, description: str, timestamp: str) -> str:
+    """Format one log line (without trailing newline)."""
+    return f"{workorder_id} | {project_name} | {description} | {timestamp}"
+
+
+def parse_entry(line: str) -> Optional[Dict[str, str]]:
+    """
+    Parse a log line.
+
+    Returns:
+        Dict with workorder_id, project, description, timestamp - or None if malformed
+    """
+    parts = line.strip().split('|')
+    if len(parts) != 4:
+        return None
+
+    wo_id, proj, desc, ts = [p.strip() for p in parts]
+    return {
+        'workorder_id': wo_id,
+        'project': proj,
+        'description': desc,
+        'timestamp': ts
+    }
+
+
+def workorder_family(workorder_id: str) -> str:
+    """Workorder ID without its trailing number (WO-AUTH-001 -> WO-AUTH)."""
+    return _TRAILING_NUMBER.sub('', workorder_id)
+
+
+class WorkorderLog:
+    """Append-only workorder log file with a sidecar offset index."""
+
+    def __init__(self, log_file: Path):
+        self.log_file = Path(log_file)
+        self.index_file = self.log_file.with_suffix('.index.json')
+        self.delta_file = self.log_file.with_suffix('.index.jsonl')
+
+    def append(self, workorder_id: str, project_name: str, description: str, timestamp: str) -> None:
+        """
+        Append an entry and record its offset in the index delta.
+
+        Raises:
+            IOError: If the log cannot be written
+        """
+        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        data = format_entry(workorder_id, project_name, description, timestamp).encode('utf-8') + b'\n'
+
+        with file_lock(self.log_file):
+            size = self.log_file.stat().st_size if self.log_file.exists() else 0
+
+            if self._delta_end() == size:
+                # Index is current: one log line and one delta record
+                with open(self.log_file, 'ab') as f:
+                    f.write(data)
+                self._append_delta([self._record(size, data)])
+                return
+
+            # New or legacy log, external appends, or a damaged index: catch up around the append
+            self._refresh_index()
+            with open(self.log_file, 'ab') as f:
+                if f.seek(0, os.SEEK_END) and not self._ends_with_newline():
+                    f.write(b'\n')
+                f.write(data)
+            self._refresh_index()
+
+    def read(
+        self,
+        project_filter: str = '',
+        workorder_pattern: str = '',
+        limit: Optional[int] = None
+    ) -> Tuple[List[Dict[str, str]], int]:
+        """
+        Read entries newest first.
+
+        Args:
+            project_filter: Lower-cased substring of the project name
+            workorder_pattern: Upper-cased workorder ID prefix
+            limit: Maximum number of entries (None or <= 0 for all)
+
+        Returns:
+            Tuple of (matching entries, total entries in log)
+        """
+        if not self.log_file.exists():
+            return [], 0
+
+        limit = limit if limit and limit > 0 else None
+
+        with file_lock(self.log_file):
+            index = self._refresh_index()
+
+        if not project_filter and not workorder_pattern:
+            return self._read_tail(limit), index['count']
+
+        candidates: Optional[Set[int]] = None
+        if workorder_pattern:
+            candidates = {
+                offset
+                for family, offsets in index['families'].items()
+                if family.startswith(workorder_pattern) or workorder_pattern.startswith(family)
+                for offset in offsets
+            }
+        if project_filter:
+            by_project = {
+                offset
+                for project, offsets in index['projects'].items()
+                if project_filter in project
+                for offset in offsets
+            }
+            candidates = by_project if candidates is None else candidates & by_project
+
+        entries = []
+        with open(self.log_file, 'rb') as f:
+            for offset in sorted(candidates, reverse=True):
+                f.seek(offset)
+                entry = parse_entry(f.readline().decode('utf-8', errors='replace'))
+                if entry is None:
+                    continue
+                if project_filter and project_filter not in entry['project'].lower():
+                    continue
+                if workorder_pattern and not entry['workorder_id'].startswith(workorder_pattern):
+                    continue
+                entries.append(entry)
+                if limit and len(entries) >= limit:
+                    break
+
+        return entries, index['count']
+
+    def _read_tail(self, limit: Optional[int]) -> List[Dict[str, str]]:
+        """Read the newest entries by seeking backwards from EOF."""
+        entries: List[Dict[str, str]] = []
+
+        with open(self.log_file, 'rb') as f:
+            pos = f.seek(0, os.SEEK_END)
+            partial = b''
+            while pos > 0 and (limit is None or len(entries) < limit):
+                step = min(TAIL_BLOCK_SIZE, pos)
+                pos -= step
+                f.seek(pos)
+                lines = (f.read(step) + partial).split(b'\n')
+                # The first piece may be the end of a line that starts in an earlier block
+                partial = lines.pop(0) if pos > 0 else b''
+
+                for raw in reversed(lines):
+                    line = raw.decode('utf-8', errors='replace').strip()
+                    if not line:
+                        continue
+                    entry = parse_entry(line)
+                    if entry is None:
+                        logger.warning(f"Skipping malformed log entry: {line}")
+                        continue
+                    entries.append(entry)
+                    if limit is not None and len(entries) >= limit:
+                        break
+
+        return entries
+
+    # ------------------------------------------------------------------
+    # Index maintenance (callers hold the file lock)
+    # ------------------------------------------------------------------
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.log_file, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    def _empty_index(self) -> Dict:
+        return {'version': INDEX_VERSION, 'size': 0, 'count': 0, 'families': {}, 'projects': {}, 'pending': 0}
+
+    @staticmethod
+    def _record(offset: int, raw: bytes) -> List:
+        """Delta record for one log line: [offset, end offset, family, project] (None for malformed lines)."""
+        entry = parse_entry(raw.decode('utf-8', errors='replace'))
+        if entry is None:
+            return [offset, offset + len(raw), None, None]
+        return [offset, offset + len(raw), workorder_family(entry['workorder_id']), entry['project'].lower()]
+
+    def _apply_record(self, index: Dict, record: List) -> None:
+        offset, end, family, project = record
+        index['size'] = end
+        index['pending'] += 1
+        if family is not None:
+            index['count'] += 1
+            index['families'].setdefault(family, []).append(offset)
+            index['projects'].setdefault(project, []).append(offset)
+
+    def _load_index(self) -> Optional[Dict]:
+        """Snapshot plus delta records, or None if missing or damaged."""
+        try:
+            index = json.loads(self.index_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(index, dict) or index.get('version') != INDEX_VERSION:
+            return None
+        index['pending'] = 0
+
+        try:
+            with open(self.delta_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    offset, end, family, project = json.loads(line)
+                    if end <= index['size']:
+                        continue  # Folded into the snapshot already
+                    if offset != index['size']:
+                        return None
+                    self._apply_record(index, [offset, end, family, project])
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError):
+            return None
+
+        return index
+
+    def _delta_end(self) -> Optional[int]:
+        """Log offset covered by the last delta record, read from the delta's tail."""
+        try:
+            with open(self.delta_file, 'rb') as f:
+                end = f.seek(0, os.SEEK_END)
+                f.seek(max(0, end - TAIL_BLOCK_SIZE))
+                tail = f.read()
+        except OSError:
+            return None
+        if not tail.endswith(b'\n'):
+            return None
+        try:
+            return json.loads(tail[:-1].rsplit(b'\n', 1)[-1])[1]
+        except (ValueError, IndexError, TypeError):
+            return None
+
+    def _append_delta(self, records: List[List]) -> None:
+        with open(self.delta_file, 'a', encoding='utf-8', newline='\n') as f:
+            f.write(''.join(json.dumps(record, separators=(',', ':')) + '\n' for record in records))
+
+    def _save_snapshot(self, index: Dict) -> None:
+        """Write the index as the new snapshot and reset the delta to an empty record at its end."""
+        snapshot = {key: value for key, value in index.items() if key != 'pending'}
+        temp_file = self.index_file.with_name(self.index_file.name + '.tmp')
+        temp_file.write_text(json.dumps(snapshot, separators=(',', ':')), encoding='utf-8')
+        os.replace(temp_file, self.index_file)
+
+        # Records already in the snapshot are skipped on load, so a crash between
+        # the two replaces is harmless; the empty record gives appends the covered size
+        temp_file = self.delta_file.with_name(self.delta_file.name + '.tmp')
+        temp_file.write_text(json.dumps([index['size'], index['size'], None, None]) + '\n', encoding='utf-8')
+        os.replace(temp_file, self.delta_file)
+        index['pending'] = 0
+
+    def _refresh_index(self) -> Dict:
+        """Load the index and extend it over any lines appended since it was written."""
+        size = self.log_file.stat().st_size if self.log_file.exists() else 0
+        index = self._load_index()
+        rebuilt = index is None
+
+        if index is None:
+            if size and not self.index_file.exists() and not self.delta_file.exists():
+                self._migrate_prepended_log()
+                size = self.log_file.stat().st_size
+            index = self._empty_index()
+        elif index['size'] > size:
+            # Log was truncated or rewritten - rebuild
+            index = self._empty_index()
+            rebuilt = True
+
+        records = []
+        if index['size'] < size:
+            with open(self.log_file, 'rb') as f:
+                f.seek(index['size'])
+                offset = index['size']
+                for raw in f:
+                    # Stop before an unterminated last line; it is indexed once completed
+                    if not raw.endswith(b'\n'):
+                        break
+                    record = self._record(offset, raw)
+                    self._apply_record(index, record)
+                    records.append(record)
+                    offset = record[1]
+
+        if rebuilt or index['pending'] > max(COMPACT_MIN_RECORDS, index['count'] - index['pending']):
+            self._save_snapshot(index)
+        elif records:
+            self._append_delta(records)
+        return index
+
+    def _migrate_prepended_log(self) -> None:
+        """Reverse a log written newest-first into append order."""
+        with open(self.log_file, 'r', encoding='utf-8') as f:
+            lines = [line.rstrip('\r\n') for line in f if line.strip()]
+
+        entries = [parse_entry(line) for line in lines]
+        timestamps = [e['timestamp'] for e in entries if e]
+        if len(timestamps) < 2 or timestamps[0] <= timestamps[-1]:
+            return
+
+        logger.info(f"Converting {self.log_file.name} to append order ({len(lines)} entries)")
+        temp_file = self.log_file.with_name(self.log_file.name + '.tmp')
+        with open(temp_file, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(''.join(line + '\n' for line in reversed(lines)))
+        os.replace(temp_file, self.log_file)
@@ -8,12 +8,26 @@ from .coderef_wrapper import (
     preprocess_index,
     generate_foundation_docs,
     read_coderef_output,
+    read_coderef_index,
+    CoderefIndex,
     check_coderef_available
 )
+from .file_signature_cache import (
+    FileSignatureCache,
+    file_signature,
+    clear_caches,
+    IO_WORKERS
+)
 
 __all__ = [
     'preprocess_index',
     'generate_foundation_docs',
     'read_coderef_output',
-    'check_coderef_available'
+    'read_coderef_index',
+    'CoderefIndex',
+    'check_coderef_available',
+    'FileSignatureCache',
+    'file_signature',
+    'clear_caches',
+    'IO_WORKERS'
 ]
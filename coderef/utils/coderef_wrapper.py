@@ -13,13 +13,20 @@ Usage:
 
     # Generate all foundation docs
     docs = generate_foundation_docs(project_path)
+
+    # Grouped views over .coderef/index.json (parsed once per file version)
+    index = read_coderef_index(project_path)
+    interfaces = index.by_type.get('interface', [])
 """
 
 import json
 import subprocess
 import sys
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from .file_signature_cache import FileSignatureCache, Signature, file_signature
 
 
 # Path to coderef-system scripts
@@ -133,11 +140,133 @@ def generate_foundation_docs(project_path: str, output_dir: Optional[str] = None
     return {name: str(path) for name, path in doc_files.items() if path.exists()}
 
 
+# Process-wide cache of parsed .coderef/ outputs: resolved path -> parsed
+_output_cache = FileSignatureCache()
+
+# Process-wide cache of index views: resolved index path -> CoderefIndex
+_index_cache = FileSignatureCache()
+
+# Availability probe results: resolved index path -> available
+_availability_cache = FileSignatureCache()
+
+# Index files up to this size are parsed by the availability probe; larger
+# ones are probed by reading this many bytes from each end
+PROBE_BYTES = 4096
+
+
+def _output_path(project_path: str, output_type: str) -> Path:
+    """Resolve the file for an output type (raises ValueError for unknown types)."""
+    coderef_dir = Path(project_path).resolve() / ".coderef"
+
+    output_map = {
+        'index': coderef_dir / "index.json",
+        'graph': coderef_dir / "graph.json",
+        'context': coderef_dir / "context.json",
+        'patterns': coderef_dir / "reports" / "patterns.json",
+        'coverage': coderef_dir / "reports" / "coverage.json",
+        'drift': coderef_dir / "reports" / "drift.json",
+        'validation': coderef_dir / "reports" / "validation.json"
+    }
+
+    if output_type not in output_map:
+        valid_types = ', '.join(output_map.keys())
+        raise ValueError(f"Invalid output_type '{output_type}'. Valid: {valid_types}")
+
+    return output_map[output_type]
+
+
+def _load_cached(output_path: Path, output_type: str) -> Tuple[Signature, Any]:
+    """Parse a JSON output, reusing the cached copy while mtime and size are unchanged."""
+    try:
+        return _output_cache.load(output_path, lambda path: json.loads(path.read_text(encoding='utf-8')))
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{output_type} not found at {output_path}")
+
+
+class CoderefIndex:
+    """
+    Parsed .coderef/index.json with grouped views.
+
+    Views are built on first access and shared by every caller until the
+    index file changes. Treat elements and views as read-only.
+    """
+
+    def __init__(self, elements: List[Dict[str, Any]]):
+        self.elements = elements if isinstance(elements, list) else []
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    @cached_property
+    def by_type(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Element type ('function', 'class', 'interface', ...) -> elements, in index order."""
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for element in self.elements:
+            groups.setdefault(element.get('type', 'unknown'), []).append(element)
+        return groups
+
+    @cached_property
+    def by_file(self) -> Dict[str, List[Dict[str, Any]]]:
+        """File path -> elements defined in it (elements without a 'file' key are omitted)."""
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for element in self.elements:
+            if 'file' in element:
+                groups.setdefault(element['file'], []).append(element)
+        return groups
+
+    @cached_property
+    def by_name(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Element name -> elements with that name, in index order."""
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for element in self.elements:
+            name = element.get('name')
+            if name:
+                groups.setdefault(name, []).append(element)
+        return groups
+
+    def type_counts(self) -> Dict[str, int]:
+        """Element type -> count."""
+        return {element_type: len(elements) for element_type, elements in self.by_type.items()}
+
+    def find(self, name: str) -> Optional[Dict[str, Any]]:
+        """First element with this exact name, or None."""
+        matches = self.by_name.get(name)
+        return matches[0] if matches else None
+
+
+def read_coderef_index(project_path: str) -> CoderefIndex:
+    """
+    Read .coderef/index.json with grouped views (by type, file, name)
+
+    Parsed once per file version and shared process-wide.
+
+    Args:
+        project_path: Absolute path to project directory
+
+    Returns:
+        CoderefIndex (read-only; do not mutate elements)
+
+    Raises:
+        FileNotFoundError: If .coderef/index.json doesn't exist
+    """
+    index_path = _output_path(project_path, 'index')
+    signature, elements = _load_cached(index_path, 'index')
+
+    key = str(index_path)
+    index = _index_cache.get(key, signature)
+    if index is None:
+        index = CoderefIndex(elements)
+        _index_cache.put(key, index, signature)
+    return index
+
+
 def read_coderef_output(project_path: str, output_type: str) -> Dict:
     """
     Read a specific .coderef/ output file
 
-    Convenience function for reading common .coderef/ outputs.
+    Convenience function for reading common .coderef/ outputs. Parsed
+    content is cached process-wide and reused until the file's mtime or
+    size changes, so the returned object is shared: treat it as read-only.
 
     Args:
         project_path: Absolute path to project directory
@@ -160,29 +289,8 @@ def read_coderef_output(project_path: str, output_type: str) -> Dict:
         >>> patterns = read_coderef_output(project_path, 'patterns')
         >>> print(patterns['common_patterns'])
     """
-    project_path = Path(project_path).resolve()
-    coderef_dir = project_path / ".coderef"
-
-    output_map = {
-        'index': coderef_dir / "index.json",
-        'graph': coderef_dir / "graph.json",
-        'context': coderef_dir / "context.json",
-        'patterns': coderef_dir / "reports" / "patterns.json",
-        'coverage': coderef_dir / "reports" / "coverage.json",
-        'drift': coderef_dir / "reports" / "drift.json",
-        'validation': coderef_dir / "reports" / "validation.json"
-    }
-
-    if output_type not in output_map:
-        valid_types = ', '.join(output_map.keys())
-        raise ValueError(f"Invalid output_type '{output_type}'. Valid: {valid_types}")
-
-    output_path = output_map[output_type]
-
-    if not output_path.exists():
-        raise FileNotFoundError(f"{output_type} not found at {output_path}")
-
-    return json.loads(output_path.read_text(encoding='utf-8'))
+    output_path = _output_path(project_path, output_type)
+    return _load_cached(output_path, output_type)[1]
 
 
 def check_coderef_available(project_path: str) -> bool:
@@ -195,20 +303,74 @@ def check_coderef_available(project_path: str) -> bool:
     Returns:
         True if .coderef/index.json exists and is non-empty
 
+    The result is cached on the file's mtime/size, and large indexes are
+    only probed at both ends (see _probe_index), never parsed in full.
+
     Example:
         >>> if check_coderef_available(project_path):
         ...     data = preprocess_index(project_path)
         ... else:
         ...     print("Run populate-coderef.py first")
     """
-    project_path = Path(project_path).resolve()
-    index_path = project_path / ".coderef" / "index.json"
+    index_path = _output_path(project_path, 'index')
 
-    if not index_path.exists():
+    signature = file_signature(index_path)
+    if signature is None:
         return False
 
+    key = str(index_path)
+    available = _availability_cache.get(key, signature)
+    if available is not None:
+        return available
+
+    parsed = _output_cache.get(key, signature)
+    if parsed is not None:
+        available = _is_populated(parsed)
+    else:
+        available = _probe_index(index_path, signature[1])
+
+    _availability_cache.put(key, available, signature)
+    return available
+
+
+def _is_populated(index: Any) -> bool:
     try:
-        index = json.loads(index_path.read_text(encoding='utf-8'))
         return len(index) > 0
-    except:
+    except TypeError:
         return False
+
+
+def _probe_index(index_path: Path, size: int) -> bool:
+    """
+    Check that index.json holds a non-empty JSON array or object without parsing it.
+
+    Small files are parsed. For larger ones only the first and last
+    PROBE_BYTES are read: the document must open with '[' or '{' followed by
+    something other than the matching close, and end with that close (which
+    also rejects a file that is still being written).
+    """
+    try:
+        if size <= 2 * PROBE_BYTES:
+            return _is_populated(json.loads(index_path.read_text(encoding='utf-8')))
+
+        with open(index_path, 'rb') as f:
+            head = f.read(PROBE_BYTES).lstrip()
+            f.seek(-PROBE_BYTES, 2)
+            tail = f.read().rstrip()
+    except (OSError, ValueError):
+        return False
+
+    closers = {ord('['): ord(']'), ord('{'): ord('}')}
+    if not head or head[0] not in closers or not tail:
+        return False
+
+    rest = head[1:].lstrip()
+    if not rest:
+        # Opening bracket followed by more than PROBE_BYTES of whitespace
+        try:
+            return _is_populated(json.loads(index_path.read_text(encoding='utf-8')))
+        except (OSError, ValueError):
+            return False
+
+    close = closers[head[0]]
+    return rest[0] != close and tail[-1] == close
@@ -0,0 +1,111 @@
+"""
+File signature caches - values derived from files, reused until the file changes.
+
+A file's signature is its (mtime_ns, size). A FileSignatureCache maps a key
+(usually the file's path) to a value and the signature it was built from,
+and hands the value back only while the signature still matches. Caches
+invalidated by something else (a git refs digest, per-check digests, ...)
+pass that as the signature, or store without one and validate the value
+themselves.
+
+Every cache registers itself, so clear_caches() resets them all.
+"""
+
+import os
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+# Worker threads for reading or parsing several changed files in parallel
+IO_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+Signature = Tuple[int, int]
+
+_caches: "weakref.WeakSet[FileSignatureCache]" = weakref.WeakSet()
+
+
+def file_signature(path: Path) -> Optional[Signature]:
+    """(mtime_ns, size) of a file, or None if it cannot be stat'ed."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class FileSignatureCache:
+    """Thread-safe key -> (signature, value) map. Treat cached values as read-only."""
+
+    def __init__(self):
+        self._entries: Dict[Hashable, Tuple[Any, Any]] = {}
+        self._lock = threading.Lock()
+        _caches.add(self)
+
+    def get(self, key: Hashable, signature: Any) -> Any:
+        """Value stored for key with this signature, or None."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        return None
+
+    def peek(self, key: Hashable) -> Any:
+        """Value stored for key whatever its signature, or None."""
+        entry = self._entries.get(key)
+        return entry[1] if entry is not None else None
+
+    def put(self, key: Hashable, value: Any, signature: Any = None) -> None:
+        """Store value for key, valid while its signature is unchanged."""
+        with self._lock:
+            self._entries[key] = (signature, value)
+
+    def discard(self, key: Hashable) -> None:
+        """Drop key's value, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def load(self, path: Path, loader: Callable[[Path], Any]) -> Tuple[Signature, Any]:
+        """
+        Value derived from a file, rebuilt by loader(path) when the file changes.
+
+        Keyed by str(path). Concurrent callers for a changed file wait for a
+        single load.
+
+        Args:
+            path: File the value is derived from
+            loader: Builds the value from the file
+
+        Returns:
+            (signature, value)
+
+        Raises:
+            OSError: If the file cannot be stat'ed (FileNotFoundError if missing)
+        """
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        key = str(path)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == signature:
+            return entry
+
+        with self._lock:
+            # Another thread may have loaded it while we waited
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                return entry
+
+            entry = (signature, loader(path))
+            self._entries[key] = entry
+            return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def clear_caches() -> None:
+    """Clear every FileSignatureCache (useful for testing)."""
+    for cache in list(_caches):
+        cache.clear()